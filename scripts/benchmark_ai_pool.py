@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Benchmark script for StrictAIPoolManager task throughput.
+
+Runs tasks against the in-process LocalStubProvider, one at a time through
+execute_ai_task_with_limits and queued through submit_ai_task, and checks
+that token accounting matches what the provider charged.
+
+Usage:
+    python scripts/benchmark_ai_pool.py [tasks] [latency_ms] [concurrency]
+
+Example:
+    python scripts/benchmark_ai_pool.py 200 50 8
+"""
+
+import logging
+import os
+import sys
+import tempfile
+import time
+from unittest.mock import Mock
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from xai.core.security.ai_pool_with_strict_limits import (
+    AIProvider,
+    LocalStubProvider,
+    StrictAIPoolManager,
+)
+
+NUM_KEYS = 20
+TOKENS_PER_KEY = 1_000_000
+PROMPT = "review the pull request and summarize the findings"
+
+
+def _pool(stub: LocalStubProvider, concurrency: int) -> StrictAIPoolManager:
+    key_manager = Mock()
+    key_manager.submit_api_key.side_effect = lambda **kwargs: {
+        "success": True,
+        "key_id": f"key_{key_manager.submit_api_key.call_count}",
+    }
+    key_manager.get_api_key_for_task.return_value = ("key", "sk-stub", TOKENS_PER_KEY)
+
+    state_path = os.path.join(tempfile.mkdtemp(prefix="xai_ai_pool_bench_"), "ai_pool_usage.json")
+    pool = StrictAIPoolManager(key_manager, state_path=state_path)
+    pool.provider_rate_limits[AIProvider.ANTHROPIC] = (1_000_000, 60)
+    pool.provider_concurrency_limits[AIProvider.ANTHROPIC] = concurrency
+    pool.register_provider_backend(AIProvider.ANTHROPIC, stub)
+    for i in range(NUM_KEYS):
+        pool.submit_api_key_donation(f"XAI_donor_{i}", AIProvider.ANTHROPIC, "sk-stub", TOKENS_PER_KEY)
+    return pool
+
+
+def _check(pool: StrictAIPoolManager, stub: LocalStubProvider) -> None:
+    used = sum(key.used_tokens for key in pool.donated_keys.values())
+    reserved = sum(key.reserved_tokens for key in pool.donated_keys.values())
+    assert used == stub.tokens_charged == pool.total_tokens_used, (used, stub.tokens_charged)
+    assert reserved == 0
+
+
+def main():
+    tasks = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    latency = (float(sys.argv[2]) if len(sys.argv) > 2 else 50.0) / 1000
+    concurrency = int(sys.argv[3]) if len(sys.argv) > 3 else 8
+    logging.disable(logging.CRITICAL)
+
+    print("=" * 60)
+    print("AI Pool Throughput Benchmark")
+    print("=" * 60)
+    print(f"{tasks} tasks, stub latency {latency * 1000:.0f} ms, {NUM_KEYS} donated keys")
+    print()
+
+    stub = LocalStubProvider(latency=latency)
+    pool = _pool(stub, concurrency)
+    start = time.perf_counter()
+    for _ in range(tasks):
+        assert pool.execute_ai_task_with_limits(PROMPT, 500, AIProvider.ANTHROPIC)["success"]
+    elapsed = time.perf_counter() - start
+    pool.shutdown()
+    _check(pool, stub)
+    print(f"{'sequential':>16}: {elapsed:6.2f} s   {tasks / elapsed:8.1f} tasks/s")
+
+    stub = LocalStubProvider(latency=latency)
+    pool = _pool(stub, concurrency)
+    start = time.perf_counter()
+    futures = [pool.submit_ai_task(PROMPT, 500, AIProvider.ANTHROPIC) for _ in range(tasks)]
+    assert all(future.result()["success"] for future in futures)
+    elapsed = time.perf_counter() - start
+    pool.shutdown()
+    _check(pool, stub)
+    label = f"queued x{concurrency}"
+    print(f"{label:>16}: {elapsed:6.2f} s   {tasks / elapsed:8.1f} tasks/s")
+    print()
+    print("Token accounting matches provider charges in both modes")
+
+
+if __name__ == "__main__":
+    main()
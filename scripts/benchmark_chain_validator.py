@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Benchmark script for startup chain validation.
+
+Generates a chain of signed transfers and measures ChainValidator throughput
+in blocks per second, validating inline and with a pool of worker processes.
+
+Usage:
+    python scripts/benchmark_chain_validator.py [num_blocks] [workers]
+
+Example:
+    python scripts/benchmark_chain_validator.py 10000 4
+"""
+
+import hashlib
+import json
+import logging
+import os
+import random
+import sys
+import time
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from xai.core.config import NETWORK
+from xai.core.consensus.chain_validator import ChainValidator
+from xai.core.security.crypto_utils import deterministic_keypair_from_seed, sign_message_hex
+
+TRANSFERS_PER_BLOCK = 2
+NUM_ACCOUNTS = 50
+DIFFICULTY = 1
+
+
+def _address(public_key: str) -> str:
+    prefix = "XAI" if NETWORK.lower() == "mainnet" else "TXAI"
+    return f"{prefix}{hashlib.sha256(bytes.fromhex(public_key)).hexdigest()[:40]}"
+
+
+def _merkle_root(txids: list[str]) -> str:
+    if not txids:
+        return hashlib.sha256(b"").hexdigest()
+    while len(txids) > 1:
+        if len(txids) % 2:
+            txids.append(txids[-1])
+        txids = [
+            hashlib.sha256((txids[i] + txids[i + 1]).encode()).hexdigest()
+            for i in range(0, len(txids), 2)
+        ]
+    return txids[0]
+
+
+def _transaction(sender: str, recipient: str, amount: float, timestamp: float, keys=None) -> dict:
+    tx = {
+        "sender": sender,
+        "recipient": recipient,
+        "amount": amount,
+        "fee": 0.01 if keys else 0.0,
+        "timestamp": timestamp,
+        "nonce": None,
+    }
+    tx_hash = hashlib.sha256(json.dumps(tx, sort_keys=True).encode()).hexdigest()
+    tx["txid"] = tx_hash
+    tx["public_key"] = keys[1] if keys else None
+    tx["signature"] = sign_message_hex(keys[0], tx_hash.encode()) if keys else None
+    return tx
+
+
+def _mine(block: dict) -> dict:
+    header = {key: block[key] for key in ("index", "timestamp", "transactions", "previous_hash", "merkle_root")}
+    target = "0" * block["difficulty"]
+    nonce = 0
+    while True:
+        header["nonce"] = nonce
+        block_hash = hashlib.sha256(json.dumps(header, sort_keys=True).encode()).hexdigest()
+        if block_hash.startswith(target):
+            block["nonce"] = nonce
+            block["hash"] = block_hash
+            return block
+        nonce += 1
+
+
+def generate_chain(num_blocks: int, seed: int = 1) -> list[dict]:
+    """Mined chain with a coinbase and signed transfers in every block."""
+    rng = random.Random(seed)
+    accounts = [deterministic_keypair_from_seed(f"bench-{i}".encode()) for i in range(NUM_ACCOUNTS)]
+    addresses = [_address(public) for _, public in accounts]
+
+    chain = []
+    previous_hash = "0"
+    for index in range(num_blocks):
+        timestamp = 1_700_000_000.0 + index * 120
+        transactions = [_transaction("COINBASE", addresses[index % NUM_ACCOUNTS], 12.0, timestamp)]
+        if index >= NUM_ACCOUNTS:
+            for _ in range(TRANSFERS_PER_BLOCK):
+                sender, recipient = rng.sample(range(NUM_ACCOUNTS), 2)
+                transactions.append(_transaction(
+                    addresses[sender], addresses[recipient], round(rng.uniform(0.1, 1.0), 4),
+                    timestamp, accounts[sender],
+                ))
+        block = {
+            "index": index,
+            "timestamp": timestamp,
+            "transactions": transactions,
+            "previous_hash": previous_hash,
+            "merkle_root": _merkle_root([tx["txid"] for tx in transactions]),
+            "difficulty": DIFFICULTY,
+        }
+        chain.append(_mine(block))
+        previous_hash = block["hash"]
+    return chain
+
+
+def main():
+    num_blocks = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    workers = int(sys.argv[2]) if len(sys.argv) > 2 else (os.cpu_count() or 1)
+    logging.disable(logging.CRITICAL)
+
+    print("=" * 60)
+    print("Chain Validator Benchmark")
+    print("=" * 60)
+    start = time.perf_counter()
+    chain = generate_chain(num_blocks)
+    tx_count = sum(len(block["transactions"]) for block in chain)
+    print(f"Generated {num_blocks:,} blocks / {tx_count:,} transactions "
+          f"in {time.perf_counter() - start:.1f} s")
+    print()
+
+    for label, count in (("inline", 1), (f"{workers} workers", workers)):
+        validator = ChainValidator(verbose=False, workers=count)
+        start = time.perf_counter()
+        report = validator.validate_chain({"chain": chain})
+        elapsed = time.perf_counter() - start
+        assert report.success, report.to_dict()["issue_details"][:5]
+        print(f"{label:>12}: {elapsed:7.2f} s   {num_blocks / elapsed:9,.0f} blocks/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Benchmark script for per-IP rate limiting under a distributed flood.
+
+Simulates a flood of distinct source IPs, each sending a few requests, and
+measures decisions per second and memory held by the limiter. Compares a
+replica of the legacy per-IP timestamp deques (plus last-activity map) with
+GCRALimiter, which keeps one timestamp per IP in a bounded LRU table.
+
+Usage:
+    python scripts/benchmark_ddos_limiter.py [flood_ips] [requests_per_ip] [max_tracked_ips]
+
+Example:
+    python scripts/benchmark_ddos_limiter.py 1000000 3 100000
+"""
+
+import logging
+import os
+import sys
+import time
+import tracemalloc
+from collections import defaultdict, deque
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from xai.network.gcra_limiter import GCRALimiter
+
+RATE = 10
+WINDOW = 1.0
+# The legacy structures grow without bound, so they are run on a smaller flood
+LEGACY_MAX_IPS = 200_000
+
+
+class LegacyLimiter:
+    """Replica of the deque-per-IP sliding window the protector used to keep."""
+
+    def __init__(self, rate: int, window: float):
+        self.rate = rate
+        self.window = window
+        self.request_timestamps = defaultdict(deque)
+        self.last_activity = {}
+
+    def allow(self, ip: str, now: float) -> bool:
+        self.last_activity[ip] = now
+        timestamps = self.request_timestamps[ip]
+        while timestamps and timestamps[0] < now - self.window:
+            timestamps.popleft()
+        if len(timestamps) >= self.rate:
+            return False
+        timestamps.append(now)
+        return True
+
+
+def _flood(ips: int, per_ip: int):
+    """Yield (ip, now) pairs: every IP sends per_ip requests, interleaved."""
+    addresses = [f"{10 + (i >> 24)}.{(i >> 16) & 255}.{(i >> 8) & 255}.{i & 255}" for i in range(ips)]
+    now = 0.0
+    for _ in range(per_ip):
+        for address in addresses:
+            now += 1e-6
+            yield address, now
+
+
+def bench(label: str, limiter_factory, ips: int, per_ip: int) -> None:
+    requests = list(_flood(ips, per_ip))
+
+    limiter = limiter_factory()
+    allow = limiter.allow
+    start = time.perf_counter()
+    admitted = sum(allow(ip, now=now) for ip, now in requests)
+    elapsed = time.perf_counter() - start
+
+    # Memory is measured on a separate run since tracing slows every allocation
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    limiter = limiter_factory()
+    for ip, now in requests:
+        limiter.allow(ip, now=now)
+    held = tracemalloc.get_traced_memory()[0] - baseline
+    tracemalloc.stop()
+
+    print(f"{label:>8}  {ips:>10,}  {len(requests) / elapsed:>12,.0f}/s  "
+          f"{held / 2**20:>9.1f} MiB  {held / ips:>7.0f} B/IP  {admitted:>10,}")
+
+
+def main():
+    flood_ips = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    per_ip = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+    max_tracked = int(sys.argv[3]) if len(sys.argv) > 3 else 100_000
+    logging.disable(logging.CRITICAL)
+
+    print("=" * 72)
+    print("DDoS Limiter Benchmark")
+    print("=" * 72)
+    print(f"{RATE} requests/{WINDOW:g}s per IP, {per_ip} requests per flooding IP, "
+          f"GCRA table bounded at {max_tracked:,} IPs")
+    print()
+    print(f"{'':>8}  {'flood IPs':>10}  {'decisions':>14}  {'memory':>13}  {'':>9}  {'admitted':>10}")
+
+    legacy_ips = min(flood_ips, LEGACY_MAX_IPS)
+    bench("legacy", lambda: LegacyLimiter(RATE, WINDOW), legacy_ips, per_ip)
+    gcra = lambda: GCRALimiter(rate=RATE, period=WINDOW, max_keys=max_tracked)
+    bench("gcra", gcra, legacy_ips, per_ip)
+    if flood_ips > legacy_ips:
+        bench("gcra", gcra, flood_ips, per_ip)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Benchmark script for memoized elliptic-curve precompiles.
+
+Models a rollup bridge contract under the precompile rules in force: each
+transaction folds a public input in with ECMUL/ECADD and checks a blob
+with a KZG POINT_EVALUATION proof. Each transaction is executed three
+times, as it is by estimate_gas, call_static and block validation, with
+the precompile caches disabled and enabled.
+
+ECPAIRING is not included: with the current rules it raises for any
+finite G1 point, so real verifier inputs never produce a result to cache.
+
+Usage:
+    python scripts/benchmark_evm_precompile_cache.py [transactions]
+
+Example:
+    python scripts/benchmark_evm_precompile_cache.py 5
+"""
+
+import os
+import random
+import sys
+import time
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from py_ecc.bls.point_compression import compress_G1
+from py_ecc.optimized_bls12_381 import G1 as BLS_G1
+from py_ecc.optimized_bls12_381 import multiply as bls_multiply
+from py_ecc.optimized_bn128 import G1, curve_order, multiply, normalize
+
+from xai.core.vm.evm.executor import EVMPrecompiles
+
+EXECUTIONS_PER_TRANSACTION = 3  # estimate_gas, call_static, block validation
+GAS = 10_000_000
+POINT_AT_INFINITY = bytes.fromhex("c0" + "0" * 94)
+
+
+def g1_bytes(point) -> bytes:
+    x, y = normalize(point)
+    return int(x).to_bytes(32, "big") + int(y).to_bytes(32, "big")
+
+
+def point_evaluation_input(value: int, z: int) -> bytes:
+    """
+    Build a valid POINT_EVALUATION input for a constant-polynomial blob.
+
+    The commitment to p(X) = value is value*G1 and p(z) = value at every z,
+    so the proof is the point at infinity.
+    """
+    commitment = compress_G1(bls_multiply(BLS_G1, value)).to_bytes(48, "big")
+    return (
+        EVMPrecompiles._kzg_to_versioned_hash(commitment)
+        + z.to_bytes(32, "big")
+        + value.to_bytes(32, "big")
+        + commitment
+        + POINT_AT_INFINITY
+    )
+
+
+def make_transactions(count: int, rng: random.Random) -> list[dict[str, bytes]]:
+    """Build precompile inputs that succeed under the current rules."""
+    transactions = []
+    for _ in range(count):
+        public_input = rng.randrange(1, curve_order)
+        transactions.append({
+            "ecmul": g1_bytes(G1) + public_input.to_bytes(32, "big"),
+            "ecadd": g1_bytes(multiply(G1, public_input)) + g1_bytes(G1),
+            "point_evaluation": point_evaluation_input(rng.randrange(1, 2**64), rng.randrange(1, 2**128)),
+        })
+    return transactions
+
+
+def execute(transaction: dict[str, bytes]) -> int:
+    """Run the precompile calls of one execution; returns gas charged."""
+    gas_used = 0
+    gas_used += EVMPrecompiles.execute_precompile(EVMPrecompiles.ECMUL, transaction["ecmul"], GAS)[1]
+    gas_used += EVMPrecompiles.execute_precompile(EVMPrecompiles.ECADD, transaction["ecadd"], GAS)[1]
+    output, evaluation_gas = EVMPrecompiles.execute_precompile(
+        EVMPrecompiles.POINT_EVALUATION, transaction["point_evaluation"], GAS
+    )
+    assert output[32:] == EVMPrecompiles._KZG_BLS_MODULUS.to_bytes(32, "big"), "blob proof rejected"
+    return gas_used + evaluation_gas
+
+
+def run(transactions: list[dict[str, bytes]], cache_size: int | None) -> tuple[list[list[float]], int]:
+    """Execute each transaction EXECUTIONS_PER_TRANSACTION times; returns per-run latencies and total gas."""
+    EVMPrecompiles.clear_caches()
+    saved = EVMPrecompiles._result_cache.max_size
+    if cache_size is not None:
+        EVMPrecompiles._result_cache.max_size = cache_size
+    try:
+        latencies = []
+        total_gas = 0
+        for transaction in transactions:
+            runs = []
+            for _ in range(EXECUTIONS_PER_TRANSACTION):
+                start = time.perf_counter()
+                total_gas += execute(transaction)
+                runs.append(time.perf_counter() - start)
+            latencies.append(runs)
+        return latencies, total_gas
+    finally:
+        EVMPrecompiles._result_cache.max_size = saved
+
+
+def main():
+    transaction_count = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+
+    print(f"Building {transaction_count} transactions (ECMUL, ECADD, POINT_EVALUATION)...")
+    transactions = make_transactions(transaction_count, random.Random(7))
+
+    print(f"\n{'Mode':<12} {'first run (ms)':>16} {'repeat runs (ms)':>18} {'total (s)':>10} {'gas':>12}")
+    print("-" * 72)
+    results = {}
+    for mode, size in (("uncached", 0), ("cached", None)):
+        latencies, gas = run(transactions, size)
+        first = sum(r[0] for r in latencies) / len(latencies) * 1000
+        repeat = sum(sum(r[1:]) for r in latencies) / (len(latencies) * (EXECUTIONS_PER_TRANSACTION - 1)) * 1000
+        total = sum(map(sum, latencies))
+        results[mode] = (first, repeat, total, gas)
+        print(f"{mode:<12} {first:>16.1f} {repeat:>18.3f} {total:>10.2f} {gas:>12,}")
+
+    assert results["cached"][3] == results["uncached"][3], "gas charged differs"
+    print(f"\nRepeated execution: {results['uncached'][1] / results['cached'][1]:,.0f}x faster; "
+          f"gas charged identical")
+    print(f"Cache stats: {EVMPrecompiles.get_cache_stats()}")
+
+if __name__ == "__main__":
+    main()
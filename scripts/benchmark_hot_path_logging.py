@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Benchmark script for hot-path logging during block connect.
+
+Replays the log calls made while connecting a block (per-UTXO debug events,
+per-transaction info events) against a real StructuredLogger writing to a
+temporary directory at INFO level, and compares the legacy direct calls
+(f-strings and field dicts built unconditionally, every info line written)
+with HotPathLogger (level checked first, per-event caps, one summary line
+per block).
+
+Usage:
+    python scripts/benchmark_hot_path_logging.py [transactions_per_block] [blocks]
+
+Example:
+    python scripts/benchmark_hot_path_logging.py 2000 5
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from xai.core.api.structured_logger import HotPathLogger, StructuredLogger
+
+ADDRESS = "XAI" + "ab" * 20
+
+
+def connect_legacy(logger: StructuredLogger, txids: list[str]) -> None:
+    for txid in txids:
+        for vout in range(2):
+            logger.debug(
+                f"Added UTXO: {txid}:{vout} for {ADDRESS} with 1.5 XAI",
+                address=ADDRESS, txid=txid, vout=vout, amount=1.5,
+            )
+        logger.info(f"Processed outputs for transaction {txid[:10]}...", txid=txid)
+        logger.debug(f"Marked UTXO: {txid}:0 for {ADDRESS} as spent", address=ADDRESS, txid=txid, vout=0)
+        logger.info(f"Processed inputs for transaction {txid[:10]}...", txid=txid)
+
+
+def connect_hot_path(hot: HotPathLogger, txids: list[str], block_index: int) -> None:
+    for txid in txids:
+        for vout in range(2):
+            if hot.enabled("DEBUG", "utxo.added"):
+                hot.emit(
+                    "DEBUG", "utxo.added", "Added UTXO: %s:%s for %s with %s XAI",
+                    txid, vout, ADDRESS, 1.5, address=ADDRESS, txid=txid, vout=vout, amount=1.5,
+                )
+        hot.info("utxo.tx_outputs_processed", "Processed outputs for transaction %.10s...", txid, txid=txid)
+        if hot.enabled("DEBUG", "utxo.spent"):
+            hot.emit("DEBUG", "utxo.spent", "Marked UTXO: %s:0 for %s as spent", txid, ADDRESS,
+                     address=ADDRESS, txid=txid, vout=0)
+        hot.info("utxo.tx_inputs_processed", "Processed inputs for transaction %.10s...", txid, txid=txid)
+    hot.flush_suppressed(block_index=block_index)
+
+
+def _log_bytes(log_dir: str) -> int:
+    return sum(os.path.getsize(os.path.join(log_dir, name)) for name in os.listdir(log_dir))
+
+
+def main():
+    per_block = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    blocks = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    txids = [f"{i:064x}" for i in range(per_block)]
+
+    print("=" * 60)
+    print("Hot-Path Logging Benchmark")
+    print("=" * 60)
+    print(f"{blocks} blocks x {per_block:,} transactions, logger at INFO")
+    print()
+    print(f"{'':>10}  {'per block':>12}  {'per tx':>10}  {'log bytes':>12}")
+
+    for label in ("legacy", "hot path"):
+        with tempfile.TemporaryDirectory() as log_dir:
+            logger = StructuredLogger(name=f"Bench_{label.replace(' ', '_')}", log_dir=log_dir)
+            hot = HotPathLogger(logger)
+            start = time.perf_counter()
+            for block_index in range(blocks):
+                if label == "legacy":
+                    connect_legacy(logger, txids)
+                else:
+                    connect_hot_path(hot, txids, block_index)
+            elapsed = time.perf_counter() - start
+            for handler in logger.logger.handlers:
+                handler.flush()
+            written = _log_bytes(log_dir)
+            for handler in list(logger.logger.handlers):
+                handler.close()
+                logger.logger.removeHandler(handler)
+
+        print(f"{label:>10}  {elapsed / blocks * 1000:9.1f} ms  {elapsed / (blocks * per_block) * 1e6:7.1f} us  "
+              f"{written:>12,}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Benchmark script for the lending pool liquidation index.
+
+Builds a pool with N synthetic ETH-collateral / USDC-debt positions, moves
+the ETH price down and compares a full health-factor scan with the
+indexed get_liquidatable_positions() query.
+
+Usage:
+    python scripts/benchmark_liquidation_index.py [num_positions]
+
+Example:
+    python scripts/benchmark_liquidation_index.py 100000
+"""
+
+import logging
+import os
+import random
+import sys
+import time
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from xai.core.defi.lending import AssetConfig, LendingPool, UserPosition
+
+OWNER = "owner"
+
+
+def build_pool(num_positions: int, seed: int = 1) -> LendingPool:
+    """Create a pool and populate synthetic positions directly."""
+    pool = LendingPool(name="Benchmark Pool", owner=OWNER)
+    pool.add_asset(OWNER, AssetConfig(
+        symbol="ETH", address="0xETH", ltv=7500, liquidation_threshold=8000, liquidation_bonus=500,
+    ))
+    pool.add_asset(OWNER, AssetConfig(
+        symbol="USDC", address="0xUSDC", ltv=8000, liquidation_threshold=8500, liquidation_bonus=400,
+    ))
+    pool.set_price_oracle(OWNER, "ETH", 2000 * 10**9)
+    pool.set_price_oracle(OWNER, "USDC", 10**9)
+
+    rng = random.Random(seed)
+    borrow_index = pool.pool_states["USDC"].borrow_index
+    for i in range(num_positions):
+        user = f"0x{i:040x}"
+        eth = rng.randint(1, 50) * 10**18
+        max_debt = eth * 2000 * 7500 // 10000
+        position = UserPosition(user=user)
+        position.supplied["ETH"] = eth
+        position.borrowed["USDC"] = rng.randint(max_debt // 10, max_debt)
+        position.borrow_index["USDC"] = borrow_index
+        pool.positions[user] = position
+    return pool
+
+
+def full_scan(pool: LendingPool) -> set[str]:
+    """Health-factor check of every position."""
+    return {user for user in pool.positions if pool.get_health_factor(user) < pool.RAY}
+
+
+def main():
+    num_positions = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    logging.disable(logging.CRITICAL)
+
+    print("=" * 60)
+    print("Liquidation Index Benchmark")
+    print("=" * 60)
+    print(f"Positions: {num_positions:,}")
+    print()
+
+    pool = build_pool(num_positions)
+
+    start = time.perf_counter()
+    pool.rebuild_liquidation_index()
+    print(f"Index build:            {(time.perf_counter() - start) * 1000:10.1f} ms")
+    print()
+    print(f"{'ETH price':>10} {'liquidatable':>13} {'full scan':>12} {'indexed':>12} {'speedup':>9}")
+    print("-" * 60)
+
+    for price in (1950, 1900, 1800, 1600):
+        pool.set_price_oracle(OWNER, "ETH", price * 10**9)
+
+        start = time.perf_counter()
+        expected = full_scan(pool)
+        scan_ms = (time.perf_counter() - start) * 1000
+
+        start = time.perf_counter()
+        found = pool.get_liquidatable_positions()
+        index_ms = (time.perf_counter() - start) * 1000
+
+        assert {entry["user"] for entry in found} == expected
+        print(
+            f"{price:>10} {len(found):>13,} {scan_ms:>10.1f}ms {index_ms:>10.1f}ms "
+            f"{scan_ms / max(index_ms, 1e-6):>8.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,28 @@
+#!/usr/bin/env python3
+"""
+Benchmark script for core node operations with a regression gate.
+
+Runs the scenario benchmarks in xai.performance.node_benchmarks (block
+connect, mempool admission, block template build, chain load, UTXO
+snapshot, address history query) against a deterministic synthetic chain.
+
+Usage:
+    python scripts/benchmark_node.py [--output results.json] [--baseline baseline.json] [--threshold 10]
+
+Example:
+    # Record a baseline on the reference machine
+    python scripts/benchmark_node.py --output node_baseline.json
+    # Later: exits 1 if any scenario lost more than 15% throughput
+    python scripts/benchmark_node.py --baseline node_baseline.json --threshold 15
+"""
+
+import os
+import sys
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from xai.performance.node_benchmarks import main
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Benchmark script for SecureExecutor subprocess mode.
+
+Runs a small snippet repeatedly and compares the spawn-per-call path (new
+interpreter, rlimits and seccomp per call) with the warm worker pool.
+Reports per-call latency percentiles and sequential throughput.
+
+The spawn-per-call path applies the seccomp filter before exec(), which
+kills the child wherever libseccomp is present, so it runs without the
+filter here; the pool runs with it.
+
+Usage:
+    python scripts/benchmark_secure_executor.py [calls]
+
+Example:
+    python scripts/benchmark_secure_executor.py 200
+"""
+
+import logging
+import os
+import statistics
+import sys
+import time
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from xai.sandbox.secure_executor import ExecutionContext, SecureExecutor
+
+SNIPPET = """
+def main():
+    total = 0
+    for i in range(1000):
+        total += i * i
+    return total
+"""
+
+
+def measure(label: str, executor: SecureExecutor, calls: int) -> None:
+    """Time ``calls`` sequential executions of the snippet."""
+    context = ExecutionContext(app_id="bench", code=SNIPPET)
+    executor.execute(context)  # Warm-up
+
+    latencies = []
+    failures = 0
+    start = time.perf_counter()
+    for _ in range(calls):
+        t0 = time.perf_counter()
+        failures += not executor.execute(context).success
+        latencies.append((time.perf_counter() - t0) * 1000)
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    p95 = latencies[int(len(latencies) * 0.95) - 1]
+    print(f"{label:>16}: mean {statistics.mean(latencies):7.2f} ms   "
+          f"p50 {statistics.median(latencies):7.2f} ms   p95 {p95:7.2f} ms   "
+          f"{calls / elapsed:8.1f} calls/s   failures {failures}")
+
+
+def main():
+    calls = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    logging.disable(logging.CRITICAL)
+
+    print("=" * 60)
+    print("SecureExecutor Subprocess Benchmark")
+    print("=" * 60)
+    print(f"Calls: {calls}")
+    print()
+
+    spawn = SecureExecutor(use_subprocess=True, use_worker_pool=False)
+    spawn.has_seccomp = False
+    measure("spawn per call", spawn, calls)
+
+    pooled = SecureExecutor(use_subprocess=True)
+    try:
+        measure("warm pool", pooled, calls)
+        print()
+        print(f"Pool: {pooled.worker_pool.stats()}")
+    finally:
+        pooled.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Benchmark script for the transaction verification path.
+
+A transaction is verified at mempool admission, block validation and chain
+validation. Each pass runs verify_signature() and calculate_hash() for every
+transaction, with the txid cache and the sender-address cache
+cleared before every call (the previous behaviour) and with both caches
+warm. ECDSA verification itself is not cached, so the hashing and address
+derivation share of the work is also timed separately.
+
+Usage:
+    python scripts/benchmark_transaction_verify.py [transactions] [passes]
+
+Example:
+    python scripts/benchmark_transaction_verify.py 500 3
+"""
+
+import logging
+import os
+import sys
+import time
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from xai.core.transaction import Transaction, _derive_sender_address
+from xai.core.wallet import Wallet
+
+
+def _transactions(count: int) -> list[Transaction]:
+    senders = [Wallet() for _ in range(max(1, count // 10))]
+    recipient = Wallet().address
+    txs = []
+    for i in range(count):
+        sender = senders[i % len(senders)]
+        tx = Transaction(
+            sender.address,
+            recipient,
+            1.0 + i,
+            0.01,
+            public_key=sender.public_key,
+            nonce=i,
+            inputs=[{"txid": f"{i:064x}", "vout": 0}],
+            outputs=[{"address": recipient, "amount": 1.0 + i}],
+        )
+        tx.sign_transaction(sender.private_key)
+        txs.append(tx)
+    return txs
+
+
+def _verify_pass(txs: list[Transaction], cold: bool) -> None:
+    for tx in txs:
+        if cold:
+            tx._hash_cache = None
+            _derive_sender_address.cache_clear()
+        assert tx.verify_signature()
+        if cold:
+            tx._hash_cache = None
+        tx.calculate_hash()
+
+
+def _hash_pass(txs: list[Transaction], cold: bool) -> None:
+    """The non-ECDSA part of a verification: sender derivation and two hashes."""
+    for tx in txs:
+        if cold:
+            tx._hash_cache = None
+            _derive_sender_address.cache_clear()
+        _derive_sender_address(tx.public_key, "TXAI")
+        tx.calculate_hash()
+        if cold:
+            tx._hash_cache = None
+        tx.calculate_hash()
+
+
+def _time(txs: list[Transaction], passes: int, run, cold: bool) -> float:
+    _derive_sender_address.cache_clear()
+    for tx in txs:
+        tx._hash_cache = None
+    start = time.perf_counter()
+    for _ in range(passes):
+        run(txs, cold)
+    return time.perf_counter() - start
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    passes = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+    logging.disable(logging.CRITICAL)
+
+    print("=" * 60)
+    print("Transaction Verify Path Benchmark")
+    print("=" * 60)
+    print(f"{count} transactions, {passes} verification passes (mempool, block, chain)")
+    print()
+
+    txs = _transactions(count)
+    _verify_pass(txs, cold=True)  # Warm up
+    print(f"{'':>10}  {'full verify':>16}  {'hash + sender':>16}")
+    for label, cold in (("uncached", True), ("cached", False)):
+        full = _time(txs, passes, _verify_pass, cold)
+        hashing = _time(txs, passes, _hash_pass, cold)
+        scale = 1e6 / (count * passes)
+        print(f"{label:>10}  {full * scale:13.1f} us  {hashing * scale:13.1f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Benchmark script for the WasmExecutor compiled-module cache.
+
+Builds a module with many functions and measures call latency:
+- cold: fresh executor, empty cache (compile + instantiate + execute)
+- warm (memory): repeat call on the same executor
+- warm (disk): fresh executor loading the serialized artifact
+
+Requires wasmtime or wasmer.
+
+Usage:
+    python scripts/benchmark_wasm_cache.py [num_functions] [calls]
+
+Example:
+    python scripts/benchmark_wasm_cache.py 3000 50
+"""
+
+import logging
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from xai.sandbox.wasm_executor import WasmExecutor
+
+
+def build_module(num_functions: int) -> bytes:
+    """Module with ``num_functions`` internal functions and an exported entry."""
+    import wasmtime
+
+    functions = "".join(
+        f"(func $f{i} (param i32) (result i32) local.get 0 i32.const {i} i32.add i32.const 3 i32.mul)"
+        for i in range(num_functions)
+    )
+    return wasmtime.wat2wasm(
+        f'(module {functions} (func (export "run") (param i32) (result i32) local.get 0 call $f0))'
+    )
+
+
+def timed_call(executor: WasmExecutor, wasm: bytes) -> float:
+    """Latency of one call in milliseconds."""
+    start = time.perf_counter()
+    result = executor.execute(wasm, "run", [7])
+    elapsed = (time.perf_counter() - start) * 1000
+    assert result.success, result.error
+    return elapsed
+
+
+def report(label: str, samples: list[float]) -> None:
+    print(f"{label:>14}: median {statistics.median(samples):9.3f} ms   "
+          f"min {min(samples):9.3f} ms   ({len(samples)} calls)")
+
+
+def main():
+    num_functions = int(sys.argv[1]) if len(sys.argv) > 1 else 3000
+    calls = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    logging.disable(logging.CRITICAL)
+
+    wasm = build_module(num_functions)
+    print("=" * 60)
+    print("WASM Compiled-Module Cache Benchmark")
+    print("=" * 60)
+    print(f"Module: {num_functions} functions, {len(wasm):,} bytes")
+    print()
+
+    cache_dir = tempfile.mkdtemp(prefix="wasm_cache_bench_")
+    try:
+        cold = []
+        for _ in range(max(3, calls // 10)):
+            shutil.rmtree(cache_dir, ignore_errors=True)
+            cold.append(timed_call(WasmExecutor(cache_dir=cache_dir), wasm))
+
+        executor = WasmExecutor(cache_dir=cache_dir)
+        timed_call(executor, wasm)
+        warm_memory = [timed_call(executor, wasm) for _ in range(calls)]
+
+        warm_disk = [timed_call(WasmExecutor(cache_dir=cache_dir), wasm) for _ in range(max(3, calls // 10))]
+
+        print(f"Runtime: {executor.module_cache.stats()['runtime']}")
+        report("cold", cold)
+        report("warm (memory)", warm_memory)
+        report("warm (disk)", warm_disk)
+        print()
+        print(f"Speedup (memory): {statistics.median(cold) / statistics.median(warm_memory):.0f}x")
+    finally:
+        shutil.rmtree(cache_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
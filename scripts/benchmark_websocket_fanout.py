@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Benchmark script for WebSocket broadcast fan-out.
+
+Simulates thousands of subscribed clients, a few of them stalled, and
+measures how long the broadcasting thread is blocked per message and how
+long until every healthy client has received it. Compares the legacy
+per-client json.dumps + synchronous send loop with WebSocketSubscriptionHub.
+
+Usage:
+    python scripts/benchmark_websocket_fanout.py [subscribers] [messages] [stall_ms]
+
+Example:
+    python scripts/benchmark_websocket_fanout.py 5000 20 50
+"""
+
+import json
+import logging
+import os
+import sys
+import threading
+import time
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from xai.core.api.websocket_hub import WebSocketSubscriptionHub
+
+SLOW_CLIENTS = 5
+MESSAGE = {
+    "channel": "blocks",
+    "event": "new_block",
+    "data": {"index": 123456, "hash": "ab" * 32, "transactions": [{"txid": "cd" * 32}] * 20},
+}
+
+
+class SimulatedSocket:
+    """Counts deliveries; slow sockets sleep in send()."""
+
+    def __init__(self, delay: float, delivered: threading.Semaphore):
+        self.delay = delay
+        self.delivered = delivered
+
+    def send(self, payload: str) -> None:
+        if self.delay:
+            time.sleep(self.delay)
+        else:
+            self.delivered.release()
+
+    def close(self) -> None:
+        pass
+
+
+def _sockets(count: int, stall: float, delivered: threading.Semaphore) -> list[SimulatedSocket]:
+    return [SimulatedSocket(stall if i < SLOW_CLIENTS else 0.0, delivered) for i in range(count)]
+
+
+def _wait_delivered(delivered: threading.Semaphore, count: int) -> None:
+    for _ in range(count):
+        delivered.acquire()
+
+
+def bench_legacy(subscribers: int, messages: int, stall: float) -> tuple[float, float]:
+    """Legacy loop: every client scanned, serialized and sent inline."""
+    delivered = threading.Semaphore(0)
+    clients = [{"id": str(i), "ws": ws} for i, ws in enumerate(_sockets(subscribers, stall, delivered))]
+    subscriptions = {client["id"]: ["blocks"] for client in clients}
+
+    blocked = []
+    healthy = subscribers - SLOW_CLIENTS
+    start = time.perf_counter()
+    for _ in range(messages):
+        t0 = time.perf_counter()
+        for client in clients:
+            if MESSAGE["channel"] in subscriptions.get(client["id"], []):
+                client["ws"].send(json.dumps(MESSAGE))
+        blocked.append(time.perf_counter() - t0)
+    _wait_delivered(delivered, healthy * messages)
+    return sum(blocked) / messages, time.perf_counter() - start
+
+
+def bench_hub(subscribers: int, messages: int, stall: float) -> tuple[float, float]:
+    """Hub: serialize once, enqueue per subscriber, per-client writers send."""
+    delivered = threading.Semaphore(0)
+    hub = WebSocketSubscriptionHub(max_queue_size=messages)
+    for i, ws in enumerate(_sockets(subscribers, stall, delivered)):
+        hub.register(str(i), ws, "127.0.0.1")
+        hub.subscribe(str(i), "blocks")
+
+    blocked = []
+    healthy = subscribers - SLOW_CLIENTS
+    start = time.perf_counter()
+    for _ in range(messages):
+        t0 = time.perf_counter()
+        hub.publish(MESSAGE)
+        blocked.append(time.perf_counter() - t0)
+    _wait_delivered(delivered, healthy * messages)
+    elapsed = time.perf_counter() - start
+    hub.close()
+    return sum(blocked) / messages, elapsed
+
+
+def main():
+    subscribers = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    messages = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    stall = (float(sys.argv[3]) if len(sys.argv) > 3 else 50.0) / 1000
+    logging.disable(logging.CRITICAL)
+
+    print("=" * 60)
+    print("WebSocket Fan-out Benchmark")
+    print("=" * 60)
+    print(f"{subscribers:,} subscribers ({SLOW_CLIENTS} stalled {stall * 1000:.0f} ms/send), "
+          f"{messages} messages of {len(json.dumps(MESSAGE)):,} bytes")
+    print()
+    print(f"{'':>8}  {'broadcaster blocked/msg':>24}  {'all healthy delivered':>22}")
+    for label, bench in (("legacy", bench_legacy), ("hub", bench_hub)):
+        blocked, total = bench(subscribers, messages, stall)
+        print(f"{label:>8}  {blocked * 1000:21.2f} ms  {total * 1000:19.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,7 +4,7 @@ import logging
 import time
 
 from ..security.circuit_breaker import CircuitBreaker
-from .twap_oracle import TWAPOracle
+from .twap_oracle import InsufficientHistoryError, TWAPOracle
 
 logger = logging.getLogger("xai.blockchain.oracle_manipulation_detector")
 
@@ -69,7 +69,11 @@ class OracleManipulationDetector:
                     return True
 
         # 2. Check deviation against TWAP
-        twap_price = self.twap_oracle.get_twap(current_timestamp)
+        try:
+            twap_price = self.twap_oracle.get_twap(current_timestamp)
+        except InsufficientHistoryError as exc:
+            logger.warning("Skipping TWAP check: %s", exc)
+            twap_price = 0.0
         if twap_price > 0:
             for source, price in current_prices.items():
                 deviation_from_twap = abs((price - twap_price) / twap_price) * 100
@@ -2,16 +2,50 @@ from __future__ import annotations
 
 import logging
 import time
+from typing import Iterable
 
 logger = logging.getLogger("xai.blockchain.twap_oracle")
 
+class InsufficientHistoryError(ValueError):
+    """Raised when a TWAP window starts before the oldest retained observation."""
+    pass
+
 class TWAPOracle:
-    def __init__(self, window_size_seconds: int = 3600):  # Default to 1 hour
+    """
+    Time-weighted average price oracle backed by a cumulative-price ring buffer.
+
+    Each observation stores the price-time accumulator at its timestamp
+    (Uniswap-style), so the TWAP over any window covered by the buffer is
+    the difference of two accumulators found by binary search.
+    """
+
+    DEFAULT_MAX_OBSERVATIONS = 8192
+
+    def __init__(self, window_size_seconds: int = 3600, max_observations: int = DEFAULT_MAX_OBSERVATIONS):  # Default to 1 hour
         if not isinstance(window_size_seconds, int) or window_size_seconds <= 0:
             raise ValueError("Window size must be a positive integer.")
+        if not isinstance(max_observations, int) or max_observations < 2:
+            raise ValueError("max_observations must be an integer of at least 2.")
         self.window_size_seconds = window_size_seconds
-        # Stores (timestamp, price) tuples, ordered by timestamp
-        self.price_data: list[tuple[int, float]] = []
+        self.max_observations = max_observations
+
+        # Ring buffer of observations ordered by timestamp; slot = (head + i) % capacity
+        self._timestamps: list[int] = [0] * max_observations
+        self._prices: list[float] = [0] * max_observations
+        # Sum of price * duration from the oldest retained observation up to this one
+        self._cumulative: list[float] = [0] * max_observations
+        self._head = 0
+        self._count = 0
+        # Set once an observation has been overwritten or dropped
+        self._evicted = False
+
+    @property
+    def price_data(self) -> list[tuple[int, float]]:
+        """Retained (timestamp, price) observations, oldest first."""
+        return [(self._timestamp_at(i), self._price_at(i)) for i in range(self._count)]
+
+    def __len__(self) -> int:
+        return self._count
 
     def record_price(self, price: float, timestamp: int = None):
         """
@@ -25,54 +59,153 @@ class TWAPOracle:
         if not isinstance(current_timestamp, int) or current_timestamp <= 0:
             raise ValueError("Timestamp must be a positive integer.")
 
-        # Remove old data points outside the window
-        self._clean_old_data(current_timestamp)
-        self.price_data.append((current_timestamp, price))
-        # Keep data sorted by timestamp
-        self.price_data.sort(key=lambda x: x[0])
-        logger.debug("Recorded price %.4f at %s (total points %d)", price, current_timestamp, len(self.price_data))
+        if self._count == 0:
+            self._append(current_timestamp, price, 0)
+        else:
+            last = self._count - 1
+            last_timestamp = self._timestamp_at(last)
+            if current_timestamp > last_timestamp:
+                cumulative = self._cumulative_at(last) + self._price_at(last) * (current_timestamp - last_timestamp)
+                self._append(current_timestamp, price, cumulative)
+            elif current_timestamp == last_timestamp:
+                # A later report for the same second supersedes the earlier one
+                self._prices[self._slot(last)] = price
+            else:
+                self._insert_out_of_order(current_timestamp, price)
 
-    def _clean_old_data(self, current_timestamp: int):
-        """Removes price data points older than the window size."""
-        cutoff_time = current_timestamp - self.window_size_seconds
-        self.price_data = [data for data in self.price_data if data[0] >= cutoff_time]
+        logger.debug("Recorded price %.4f at %s (total points %d)", price, current_timestamp, self._count)
 
-    def get_twap(self, current_timestamp: int = None) -> float:
+    def get_twap(self, current_timestamp: int = None, window_seconds: int | None = None) -> float:
         """
         Calculates the Time-Weighted Average Price over the defined window.
         If current_timestamp is None, uses the current UTC timestamp.
+
+        The average runs from the first observation inside the window to
+        ``current_timestamp``; observations after ``current_timestamp`` are
+        ignored. Returns 0.0 when no observation falls inside the window.
+
+        Args:
+            current_timestamp: End of the window
+            window_seconds: Window length (defaults to window_size_seconds)
+
+        Raises:
+            InsufficientHistoryError: If the window starts before the oldest
+                observation still in the buffer and older ones were evicted
         """
         current_timestamp = current_timestamp if current_timestamp is not None else int(time.time())
-        self._clean_old_data(current_timestamp)  # Ensure only relevant data is considered
-
-        if not self.price_data:
+        window = window_seconds if window_seconds is not None else self.window_size_seconds
+        if self._count == 0:
             return 0.0  # Or raise an error, depending on desired behavior
 
-        total_weighted_price = 0.0
-        total_time_weight = 0.0
+        oldest = self._timestamp_at(0)
+        if self._evicted and current_timestamp - window < oldest:
+            raise InsufficientHistoryError(
+                f"TWAP window of {window}s from {current_timestamp} starts before the oldest "
+                f"retained observation at {oldest} (buffer holds {self.max_observations})"
+            )
 
-        # Iterate through sorted price data
-        for i in range(len(self.price_data)):
-            timestamp_i, price_i = self.price_data[i]
+        first = self._bisect_left(current_timestamp - window)
+        last = self._bisect_right(current_timestamp) - 1
+        if first > last:
+            return 0.0  # No valid data points within the window
 
-            # The effective start time for this price segment is the timestamp of the current data point
-            # The effective end time is the timestamp of the next data point, or the current_timestamp if it's the last one
+        start = self._timestamp_at(first)
+        total_time_weight = current_timestamp - start
+        if total_time_weight <= 0:
+            return 0.0
 
-            if i < len(self.price_data) - 1:
-                timestamp_j = self.price_data[i + 1][0]
-            else:
-                timestamp_j = current_timestamp  # Use current time for the last segment
+        end_cumulative = self._cumulative_at(last) + self._price_at(last) * (
+            current_timestamp - self._timestamp_at(last)
+        )
+        return (end_cumulative - self._cumulative_at(first)) / total_time_weight
 
-            # Ensure the segment is within the window and valid
-            segment_start = max(timestamp_i, current_timestamp - self.window_size_seconds)
-            segment_end = min(timestamp_j, current_timestamp)
+    def get_twaps(self, windows: Iterable[int], current_timestamp: int = None) -> dict[int, float]:
+        """
+        Calculates TWAPs for several windows ending at the same timestamp.
 
-            if segment_end > segment_start:
-                time_duration = segment_end - segment_start
-                total_weighted_price += price_i * time_duration
-                total_time_weight += time_duration
+        Args:
+            windows: Window lengths in seconds (e.g. 300, 3600, 86400)
+            current_timestamp: End of every window (defaults to now)
 
-        if total_time_weight == 0:
-            return 0.0  # No valid data points within the window
+        Returns:
+            Mapping of window length to TWAP
 
-        return total_weighted_price / total_time_weight
+        Raises:
+            InsufficientHistoryError: If any window exceeds the retained history
+        """
+        current_timestamp = current_timestamp if current_timestamp is not None else int(time.time())
+        return {window: self.get_twap(current_timestamp, window) for window in windows}
+
+    # --- ring buffer helpers ---
+
+    def _slot(self, index: int) -> int:
+        return (self._head + index) % self.max_observations
+
+    def _timestamp_at(self, index: int) -> int:
+        return self._timestamps[self._slot(index)]
+
+    def _price_at(self, index: int) -> float:
+        return self._prices[self._slot(index)]
+
+    def _cumulative_at(self, index: int) -> float:
+        return self._cumulative[self._slot(index)]
+
+    def _append(self, timestamp: int, price: float, cumulative: float) -> None:
+        if self._count < self.max_observations:
+            slot = self._slot(self._count)
+            self._count += 1
+        else:
+            # Overwrite the oldest observation
+            slot = self._head
+            self._head = (self._head + 1) % self.max_observations
+            self._evicted = True
+        self._timestamps[slot] = timestamp
+        self._prices[slot] = price
+        self._cumulative[slot] = cumulative
+
+    def _bisect_left(self, timestamp: int) -> int:
+        """First logical index whose timestamp is >= ``timestamp``."""
+        lo, hi = 0, self._count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._timestamp_at(mid) < timestamp:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def _bisect_right(self, timestamp: int) -> int:
+        """First logical index whose timestamp is > ``timestamp``."""
+        lo, hi = 0, self._count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._timestamp_at(mid) <= timestamp:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def _insert_out_of_order(self, timestamp: int, price: float) -> None:
+        """Insert a late observation and rebuild the accumulators (rare, O(n))."""
+        observations = self.price_data
+        position = self._bisect_right(timestamp)
+        if position > 0 and observations[position - 1][0] == timestamp:
+            observations[position - 1] = (timestamp, price)
+        elif position == 0 and self._count == self.max_observations:
+            logger.debug("Dropped price at %s older than the oldest retained observation", timestamp)
+            self._evicted = True
+            return
+        else:
+            observations.insert(position, (timestamp, price))
+
+        if len(observations) > self.max_observations:
+            self._evicted = True
+            observations = observations[-self.max_observations:]
+        self._head = 0
+        self._count = 0
+        cumulative = 0
+        for i, (ts, p) in enumerate(observations):
+            if i:
+                prev_ts, prev_price = observations[i - 1]
+                cumulative += prev_price * (ts - prev_ts)
+            self._append(ts, p, cumulative)
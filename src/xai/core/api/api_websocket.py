@@ -15,14 +15,16 @@ import json
 import logging
 import threading
 import time
-from collections import defaultdict, deque
+from collections import defaultdict
 from typing import Any
 
 from flask import Flask, request
 from flask_sock import Sock
 
 from xai.core.api.api_auth import APIAuthManager
+from xai.core.api.websocket_hub import WebSocketSubscriptionHub
 from xai.core.security.security_validation import log_security_event
+from xai.network.gcra_limiter import GCRALimiter
 
 logger = logging.getLogger(__name__)
 ATTACHMENT_SAFE = True
@@ -38,7 +40,6 @@ class WebSocketLimiter:
         """Initialize WebSocket limiter with default limits."""
         self.connections_per_ip: dict[str, int] = defaultdict(int)
         self.total_connections: int = 0
-        self.last_message_time: dict[str, deque] = defaultdict(lambda: deque(maxlen=100))
         self.connection_times: dict[str, float] = {}
 
         # Limits (configurable)
@@ -48,6 +49,13 @@ class WebSocketLimiter:
         self.MESSAGE_SIZE_LIMIT = 1_048_576  # 1 MB
         self.MESSAGE_RATE_LIMIT = 100  # per minute
 
+        # Per-client message rate: one GCRA timestamp per client
+        self.message_limiter = GCRALimiter(
+            rate=self.MESSAGE_RATE_LIMIT,
+            period=60,
+            max_keys=self.MAX_GLOBAL_CONNECTIONS,
+        )
+
     def can_connect(self, ip_address: str) -> tuple[bool, str | None]:
         """Check if new connection is allowed.
 
@@ -90,8 +98,7 @@ class WebSocketLimiter:
 
         if client_id in self.connection_times:
             del self.connection_times[client_id]
-        if client_id in self.last_message_time:
-            del self.last_message_time[client_id]
+        self.message_limiter.forget(client_id)
 
     def check_message_rate(self, client_id: str) -> tuple[bool, str | None]:
         """Check if client is within message rate limit.
@@ -102,17 +109,14 @@ class WebSocketLimiter:
         Returns:
             Tuple of (within_limit, error_message)
         """
-        now = time.time()
-        messages = self.last_message_time[client_id]
-
-        # Count messages in last minute
-        one_minute_ago = now - 60
-        recent_messages = sum(1 for msg_time in messages if msg_time > one_minute_ago)
+        # Pick up limits changed after construction
+        if self.message_limiter.rate != self.MESSAGE_RATE_LIMIT:
+            self.message_limiter.set_rate(self.MESSAGE_RATE_LIMIT)
+        if self.message_limiter.max_keys != self.MAX_GLOBAL_CONNECTIONS:
+            self.message_limiter.max_keys = self.MAX_GLOBAL_CONNECTIONS
 
-        if recent_messages >= self.MESSAGE_RATE_LIMIT:
+        if not self.message_limiter.allow(client_id):
             return False, "Message rate limit exceeded"
-
-        messages.append(now)
         return True, None
 
     def validate_message_size(self, message: str) -> tuple[bool, str | None]:
@@ -189,22 +193,34 @@ class WebSocketLimiter:
 class WebSocketAPIHandler:
     """Handles all WebSocket-related API endpoints and functionality."""
 
-    def __init__(self, node: Any, app: Flask, api_auth: APIAuthManager | None = None):
+    def __init__(
+        self,
+        node: Any,
+        app: Flask,
+        api_auth: APIAuthManager | None = None,
+        max_queue_size: int = 256,
+        slow_client_policy: str = "drop_oldest",
+    ):
         """
         Initialize WebSocket API Handler.
 
         Args:
             node: BlockchainNode instance
             app: Flask application instance
+            api_auth: API key manager (default: the node's)
+            max_queue_size: Outbound messages buffered per client
+            slow_client_policy: "drop_oldest", "drop_newest" or "disconnect" when a
+                client's queue is full
         """
         self.node = node
         self.app = app
         self.api_auth = api_auth or getattr(getattr(node, "api_routes", None), "api_auth", None)
 
-        # WebSocket support
+        # WebSocket support; clients and subscriptions live in the hub
         self.sock = Sock(self.app)
-        self.ws_clients: list[dict[str, Any]] = []  # Connected WebSocket clients
-        self.ws_subscriptions: dict[str, list[str]] = {}  # client_id -> [channels]
+        self.hub = WebSocketSubscriptionHub(
+            max_queue_size=max_queue_size, slow_client_policy=slow_client_policy
+        )
 
         # WebSocket limiter (Task 66)
         self.limiter = WebSocketLimiter()
@@ -216,6 +232,16 @@ class WebSocketAPIHandler:
         # Register routes
         self._register_routes()
 
+    @property
+    def ws_clients(self) -> list[dict[str, Any]]:
+        """Connected WebSocket clients."""
+        return [{"id": c.id, "ws": c.ws, "ip": c.ip} for c in self.hub.clients()]
+
+    @property
+    def ws_subscriptions(self) -> dict[str, list[str]]:
+        """client_id -> [channels]"""
+        return {c.id: list(c.channels) for c in self.hub.clients()}
+
     def _register_routes(self) -> None:
         """Register WebSocket route."""
 
@@ -259,8 +285,7 @@ class WebSocketAPIHandler:
 
         # Register connection
         self.limiter.register_connection(client_id, ip_address)
-        self.ws_clients.append({"id": client_id, "ws": ws, "ip": ip_address})
-        self.ws_subscriptions[client_id] = []
+        self.hub.register(client_id, ws, ip_address)
 
         logger.info(f"WebSocket client {client_id} connected from {ip_address}")
 
@@ -274,13 +299,13 @@ class WebSocketAPIHandler:
                 # Check message size (Task 66)
                 valid_size, size_error = self.limiter.validate_message_size(message)
                 if not valid_size:
-                    ws.send(json.dumps({"error": size_error}))
+                    self.hub.send(client_id, {"error": size_error})
                     continue
 
                 # Check rate limit (Task 66)
                 within_limit, rate_error = self.limiter.check_message_rate(client_id)
                 if not within_limit:
-                    ws.send(json.dumps({"error": rate_error}))
+                    self.hub.send(client_id, {"error": rate_error})
                     continue
 
                 # Update activity timestamp
@@ -296,9 +321,7 @@ class WebSocketAPIHandler:
         finally:
             # Cleanup
             self.limiter.unregister_connection(client_id, ip_address)
-            self.ws_clients = [c for c in self.ws_clients if c["id"] != client_id]
-            if client_id in self.ws_subscriptions:
-                del self.ws_subscriptions[client_id]
+            self.hub.unregister(client_id)
             logger.info(f"WebSocket client {client_id} disconnected")
 
     def _authenticate_ws_request(self) -> tuple[bool, str | None]:
@@ -364,6 +387,8 @@ class WebSocketAPIHandler:
         """
         Handle WebSocket message from client.
 
+        Replies go through the client's queue so they stay ordered with broadcasts.
+
         Args:
             client_id: Client identifier
             ws: WebSocket connection object
@@ -373,37 +398,26 @@ class WebSocketAPIHandler:
         channel = data.get("channel")
 
         if action == "subscribe" and channel:
-            if client_id not in self.ws_subscriptions:
-                self.ws_subscriptions[client_id] = []
-
-            if channel not in self.ws_subscriptions[client_id]:
-                self.ws_subscriptions[client_id].append(channel)
-                ws.send(json.dumps({"success": True, "message": f"Subscribed to {channel}"}))
+            if self.hub.subscribe(client_id, channel):
+                self.hub.send(client_id, {"success": True, "message": f"Subscribed to {channel}"})
 
         elif action == "unsubscribe" and channel:
-            if client_id in self.ws_subscriptions:
-                if channel in self.ws_subscriptions[client_id]:
-                    self.ws_subscriptions[client_id].remove(channel)
-                    ws.send(
-                        json.dumps({"success": True, "message": f"Unsubscribed from {channel}"})
-                    )
+            if self.hub.unsubscribe(client_id, channel):
+                self.hub.send(
+                    client_id, {"success": True, "message": f"Unsubscribed from {channel}"}
+                )
 
     def broadcast_ws(self, message: dict[str, Any]) -> None:
         """
         Broadcast message to subscribed WebSocket clients.
 
+        The message is serialized once and queued for each subscriber; it
+        never waits on a client's socket.
+
         Args:
             message: Message to broadcast (must include 'channel' key)
         """
-        channel = message.get("channel")
-
-        for client in self.ws_clients:
-            client_id = client["id"]
-            if channel in self.ws_subscriptions.get(client_id, []):
-                try:
-                    client["ws"].send(json.dumps(message))
-                except (OSError, IOError, ValueError, TypeError, RuntimeError, KeyError, AttributeError) as e:
-                    logger.error(f"Failed to send to client {client_id}: {e}")
+        self.hub.publish(message)
 
     def _cleanup_loop(self) -> None:
         """Periodic cleanup of stale connections (Task 66)."""
@@ -412,22 +426,11 @@ class WebSocketAPIHandler:
 
             stale_clients = self.limiter.cleanup_stale_connections()
             for client_id in stale_clients:
-                # Find and close stale client
-                for client in self.ws_clients[:]:
-                    if client["id"] == client_id:
-                        try:
-                            client["ws"].close()
-                        except (OSError, IOError, ValueError, TypeError, RuntimeError, KeyError, AttributeError) as e:
-                            logger.debug(f"Failed to close stale client {client_id}: {type(e).__name__}")
-
-                        ip = client.get("ip", "unknown")
-                        self.limiter.unregister_connection(client_id, ip)
-                        self.ws_clients.remove(client)
-
-                        if client_id in self.ws_subscriptions:
-                            del self.ws_subscriptions[client_id]
-
-                        logger.info(f"Closed stale connection: {client_id}")
+                # Close stale client; its writer closes the socket
+                client = self.hub.unregister(client_id)
+                if client is not None:
+                    self.limiter.unregister_connection(client_id, client.ip)
+                    logger.info(f"Closed stale connection: {client_id}")
 
     def broadcast_sync_progress(self, progress_data: dict[str, Any]) -> None:
         """
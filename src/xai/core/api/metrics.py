@@ -335,6 +335,13 @@ class BlockchainMetrics:
             registry=self.registry,
         )
 
+        self.api_cache_requests = Counter(
+            "xai_api_cache_requests_total",
+            "API response cache lookups by route and result",
+            ["route", "result"],
+            registry=self.registry,
+        )
+
         # ==================== WALLET METRICS ====================
         self.wallet_balance = Gauge(
             "xai_wallet_balance_xai",
@@ -693,6 +700,11 @@ class BlockchainMetrics:
             self.api_errors.labels(endpoint=endpoint, error_type=error_type).inc()
             self.logger.error("API error", extra={"endpoint": endpoint, "error_type": error_type})
 
+    def record_api_cache(self, route: str, hit: bool) -> None:
+        """Record API response cache hit or miss"""
+        with self._lock:
+            self.api_cache_requests.labels(route=route, result="hit" if hit else "miss").inc()
+
     def update_mining_hashrate(self, hashrate: float) -> None:
         """Update mining hashrate"""
         with self._lock:
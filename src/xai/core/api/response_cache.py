@@ -0,0 +1,257 @@
+"""
+Tip-keyed response cache for hot read endpoints.
+
+Read endpoints such as ``/stats``, ``/blocks``, ``/mempool`` and balance or
+contract lookups are polled far more often than the underlying state changes.
+Every cached entry is keyed by ``(route, params)`` and is only valid for the
+chain tip hash it was built against; entries that also read the mempool are
+valid for one mempool generation. A tip change (block connect, reorg) drops
+the whole cache on the next lookup, a mempool change (admission/eviction)
+only the mempool-dependent entries, so no explicit wiring into the consensus
+paths is required beyond bumping the mempool generation.
+
+Responses carry a weak ETag derived from the cache key so clients can use
+``If-None-Match`` and receive ``304 Not Modified`` between blocks.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass, field
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+CacheVersion = tuple[str, int, int]
+
+
+@dataclass
+class CachedResponse:
+    """A cached payload together with its validator and build time."""
+
+    payload: Any
+    etag: str
+    version: CacheVersion
+    built_at: float = field(default_factory=time.time)
+    _body: bytes | None = field(default=None, repr=False)
+
+    def age(self, now: float | None = None) -> float:
+        """Seconds since the payload was built."""
+        return max(0.0, (time.time() if now is None else now) - self.built_at)
+
+    def body(self) -> bytes:
+        """Serialized JSON body, encoded once per cache entry."""
+        if self._body is None:
+            self._body = json.dumps(self.payload, default=str).encode("utf-8")
+        return self._body
+
+
+class TipKeyedResponseCache:
+    """
+    LRU cache of API payloads keyed by route, params and chain state version.
+
+    The chain state version is ``(tip_hash, mempool_generation, pending_count)``.
+    The pending count is included defensively so that code paths which replace
+    ``pending_transactions`` wholesale still invalidate the cache even if they
+    do not bump the generation counter. Entries built with
+    ``depends_on_mempool=False`` only depend on the tip hash and survive
+    mempool changes.
+    """
+
+    DEFAULT_MAX_ENTRIES = 4096
+
+    def __init__(
+        self,
+        blockchain: Any,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        metrics: Any | None = None,
+        use_global_metrics: bool = True,
+    ) -> None:
+        """
+        Initialize the response cache.
+
+        Args:
+            blockchain: Blockchain instance providing ``chain`` and mempool state
+            max_entries: Maximum number of cached responses (LRU eviction)
+            metrics: Optional BlockchainMetrics instance for hit/miss counters
+            use_global_metrics: Resolve the process-wide BlockchainMetrics lazily
+                when no explicit metrics instance is supplied
+        """
+        if max_entries <= 0:
+            raise ValueError("max_entries must be positive")
+        self.blockchain = blockchain
+        self.max_entries = max_entries
+        self._metrics = metrics
+        self._use_global_metrics = use_global_metrics and metrics is None
+        self._entries: OrderedDict[tuple[str, Hashable], CachedResponse] = OrderedDict()
+        # Keys of entries invalidated by mempool changes as well as tip changes
+        self._mempool_keys: set[tuple[str, Hashable]] = set()
+        self._version: CacheVersion | None = None
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    # ==================== STATE VERSION ====================
+
+    def current_version(self) -> CacheVersion:
+        """Return the (tip hash, mempool generation, pending count) tuple."""
+        blockchain = self.blockchain
+        chain = getattr(blockchain, "chain", None)
+        tip_hash = ""
+        if chain:
+            try:
+                tip_hash = str(chain[-1].hash)
+            except (IndexError, AttributeError, TypeError):
+                tip_hash = ""
+        get_generation = getattr(blockchain, "get_mempool_generation", None)
+        try:
+            generation = int(get_generation()) if callable(get_generation) else 0
+        except (TypeError, ValueError):
+            generation = 0
+        pending = getattr(blockchain, "pending_transactions", None)
+        try:
+            pending_count = len(pending) if pending is not None else 0
+        except TypeError:
+            pending_count = 0
+        return (tip_hash, generation, pending_count)
+
+    def _sync_version(self, version: CacheVersion) -> None:
+        """Drop every entry when the tip moved, mempool entries when the mempool moved."""
+        if self._version == version:
+            return
+        if self._version is None or self._version[0] != version[0]:
+            if self._entries:
+                self.invalidations += 1
+                self._entries = OrderedDict()
+            self._mempool_keys = set()
+        elif self._mempool_keys:
+            self.invalidations += 1
+            for key in self._mempool_keys:
+                self._entries.pop(key, None)
+            self._mempool_keys = set()
+        self._version = version
+
+    # ==================== LOOKUPS ====================
+
+    @staticmethod
+    def make_etag(route: str, params: Hashable, version: tuple) -> str:
+        """Build a weak ETag for a route/params pair at a given state version."""
+        material = "|".join([route, repr(params), *map(str, version)])
+        digest = hashlib.sha256(material.encode("utf-8")).hexdigest()[:32]
+        return f'W/"{digest}"'
+
+    def get_or_compute(
+        self,
+        route: str,
+        params: Hashable,
+        builder: Callable[[], Any],
+        depends_on_mempool: bool = True,
+    ) -> CachedResponse:
+        """
+        Return the cached payload for ``(route, params)`` or build it.
+
+        Args:
+            route: Logical route name (used for metrics labels)
+            params: Hashable request parameters that affect the payload
+            builder: Zero-argument callable producing a JSON-serializable payload
+            depends_on_mempool: False if the payload only reads confirmed
+                state, so mempool changes do not invalidate it
+
+        Returns:
+            CachedResponse for the current chain state version
+        """
+        version = self.current_version()
+        validity = version if depends_on_mempool else version[:1]
+        key = (route, params)
+        with self._lock:
+            self._sync_version(version)
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                self._record(route, hit=True)
+                return entry
+
+        payload = builder()
+        entry = CachedResponse(
+            payload=payload,
+            etag=self.make_etag(route, params, validity),
+            version=version,
+        )
+        with self._lock:
+            self.misses += 1
+            self._record(route, hit=False)
+            # Only store if the state the entry depends on did not move while we were building.
+            current = self.current_version()
+            if self._version is not None and self._version[:len(validity)] == validity == current[:len(validity)]:
+                self._entries[key] = entry
+                self._entries.move_to_end(key)
+                if depends_on_mempool:
+                    self._mempool_keys.add(key)
+                else:
+                    self._mempool_keys.discard(key)
+                while len(self._entries) > self.max_entries:
+                    evicted, _ = self._entries.popitem(last=False)
+                    self._mempool_keys.discard(evicted)
+        return entry
+
+    def invalidate(self) -> None:
+        """Explicitly drop all cached responses."""
+        with self._lock:
+            if self._entries:
+                self.invalidations += 1
+            self._entries = OrderedDict()
+            self._mempool_keys = set()
+            self._version = None
+
+    @staticmethod
+    def etag_matches(if_none_match: str | None, etag: str) -> bool:
+        """Evaluate an If-None-Match header against an ETag (weak comparison)."""
+        if not if_none_match:
+            return False
+        if if_none_match.strip() == "*":
+            return True
+        target = etag[2:] if etag.startswith("W/") else etag
+        for candidate in if_none_match.split(","):
+            candidate = candidate.strip()
+            if candidate.startswith("W/"):
+                candidate = candidate[2:]
+            if candidate == target:
+                return True
+        return False
+
+    def get_stats(self) -> dict[str, Any]:
+        """Return cache statistics for diagnostics."""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": (self.hits / total) if total else 0.0,
+                "invalidations": self.invalidations,
+            }
+
+    # ==================== METRICS ====================
+
+    def _record(self, route: str, hit: bool) -> None:
+        metrics = self._metrics
+        if metrics is None and self._use_global_metrics:
+            try:
+                from xai.core.api.metrics import get_metrics
+
+                metrics = self._metrics = get_metrics()
+            except (ImportError, ValueError) as exc:
+                logger.debug("Response cache metrics unavailable: %s", exc)
+                self._use_global_metrics = False
+                return
+        if metrics is not None and hasattr(metrics, "record_api_cache"):
+            metrics.record_api_cache(route, hit)
@@ -18,6 +18,7 @@ import logging
 import os
 import threading
 import time
+import weakref
 from contextvars import ContextVar
 from datetime import datetime, timezone
 from logging.handlers import TimedRotatingFileHandler
@@ -26,6 +27,20 @@ from typing import Any
 # Context variable for correlation ID (thread-safe)
 correlation_id: ContextVar[str | None] = ContextVar("correlation_id", default=None)
 
+_LEVELS = {
+    "DEBUG": logging.DEBUG,
+    "INFO": logging.INFO,
+    "WARN": logging.WARNING,
+    "WARNING": logging.WARNING,
+    "ERROR": logging.ERROR,
+    "CRITICAL": logging.CRITICAL,
+}
+
+# Hot-path logging defaults: messages per event name between summaries, and
+# the longest a summary is deferred when no block arrives to trigger it
+HOT_PATH_MAX_PER_BLOCK = 100
+HOT_PATH_WINDOW_SECONDS = 60.0
+
 class JSONFormatter(logging.Formatter):
     """
     Custom formatter that outputs logs in JSON format
@@ -174,9 +189,15 @@ class StructuredLogger:
 
         return sanitized
 
+    def is_enabled_for(self, level: str) -> bool:
+        """Return True if messages at ``level`` would be written"""
+        return self.logger.isEnabledFor(_LEVELS[level.upper()])
+
     def _log(self, level: str, message: str, **kwargs):
         """Internal logging method"""
         self.log_counts[level] += 1
+        if not self.logger.isEnabledFor(_LEVELS[level]):
+            return
 
         # Sanitize extra fields
         if kwargs:
@@ -392,6 +413,225 @@ class PerformanceTimer:
         duration = (time.time() - self.start_time) * 1000  # Convert to ms
         self.logger.performance_event(self.operation_name, duration, "ms")
 
+class HotPathLogger:
+    """
+    Sampled, rate-capped logging for per-transaction and per-UTXO events
+
+    Block connect and bulk sync emit the same few events thousands of times
+    per block. Each event name is checked against the logger level before any
+    message or fields are built, then sampled (every Nth occurrence) and
+    capped per block. Suppressed occurrences are counted and summarised in a
+    single line by flush_suppressed(), called once per connected block.
+
+    Works with a StructuredLogger or a standard ``logging.Logger``.
+
+    Usage:
+        hot = get_hot_path_logger(logger)
+        hot.info("mempool.added", "Transaction %s added", txid, sender=sender)
+
+        # Guard payloads that are expensive to build
+        if hot.enabled("DEBUG", "utxo.added"):
+            hot.emit("DEBUG", "utxo.added", "Added UTXO %s:%s", txid, vout, amount=amount)
+    """
+
+    def __init__(
+        self,
+        logger: StructuredLogger | logging.Logger,
+        max_per_block: int | None = HOT_PATH_MAX_PER_BLOCK,
+        sample_every: int = 1,
+        window_seconds: float = HOT_PATH_WINDOW_SECONDS,
+    ):
+        """
+        Initialize hot-path logger
+
+        Args:
+            logger: Logger that receives emitted events and summaries
+            max_per_block: Default cap per event name between summaries (None: no cap)
+            sample_every: Default sampling interval; 1 emits every occurrence
+            window_seconds: Summarise anyway once this long has passed since the last summary
+        """
+        if sample_every < 1:
+            raise ValueError("sample_every must be at least 1")
+
+        self.target = logger
+        self.window_seconds = window_seconds
+        self._stdlib = isinstance(logger, logging.Logger)
+        inner = logger if self._stdlib else getattr(logger, "logger", None)
+        # Loggers without a standard logger to consult (e.g. test doubles) see every event
+        self._level_source = inner if isinstance(inner, logging.Logger) else None
+        self._default_limits = (sample_every, max_per_block)
+        self._limits: dict[str, tuple[int, int | None]] = {}
+        # event -> [occurrences, emitted, suppressed] since the last summary
+        self._events: dict[str, list[int]] = {}
+        self._window_start = time.monotonic()
+        self._lock = threading.Lock()
+
+    def configure(
+        self, event: str, *, sample_every: int | None = None, max_per_block: int | None = None
+    ) -> None:
+        """
+        Override sampling and the per-block cap for one event name
+
+        Args:
+            event: Event name
+            sample_every: Emit every Nth occurrence (default: logger default)
+            max_per_block: Cap between summaries (default: logger default)
+        """
+        default_sample, default_cap = self._default_limits
+        sample_every = default_sample if sample_every is None else sample_every
+        if sample_every < 1:
+            raise ValueError("sample_every must be at least 1")
+        with self._lock:
+            self._limits[event] = (sample_every, default_cap if max_per_block is None else max_per_block)
+
+    def enabled(self, level: str, event: str) -> bool:
+        """
+        Decide whether this occurrence of ``event`` should be logged
+
+        Counts the occurrence, so call it once per occurrence and only build
+        the payload when it returns True.
+
+        Args:
+            level: Log level name (DEBUG, INFO, WARN, ...)
+            event: Event name
+
+        Returns:
+            True if the caller should emit the event
+        """
+        if self._level_source is not None and not self._level_source.isEnabledFor(_LEVELS[level]):
+            return False
+
+        with self._lock:
+            state = self._events.get(event)
+            if state is None:
+                state = self._events[event] = [0, 0, 0]
+            sample_every, cap = self._limits.get(event, self._default_limits)
+            seen = state[0]
+            state[0] = seen + 1
+            if seen % sample_every == 0 and (cap is None or state[1] < cap):
+                state[1] += 1
+                return True
+            state[2] += 1
+            window_expired = time.monotonic() - self._window_start >= self.window_seconds
+
+        if window_expired:
+            self.flush_suppressed()
+        return False
+
+    def emit(self, level: str, event: str, message: str, *args: Any, **fields: Any) -> None:
+        """
+        Write an event unconditionally (after enabled() returned True)
+
+        Args:
+            level: Log level name
+            event: Event name, added to the fields
+            message: Message, %-formatted with ``args``
+            *args: Message arguments
+            **fields: Structured fields
+        """
+        if self._stdlib:
+            fields["event"] = event
+            self.target.log(_LEVELS[level], message, *args, extra=fields)
+            return
+        if args:
+            message = message % args
+        log_func = getattr(self.target, "warn" if level == "WARNING" else level.lower())
+        log_func(message, event=event, **fields)
+
+    def log(self, level: str, event: str, message: str, *args: Any, **fields: Any) -> None:
+        """Log an event subject to level, sampling and cap; see emit()"""
+        if self.enabled(level, event):
+            self.emit(level, event, message, *args, **fields)
+
+    def debug(self, event: str, message: str, *args: Any, **fields: Any) -> None:
+        """Log a hot-path debug event"""
+        self.log("DEBUG", event, message, *args, **fields)
+
+    def info(self, event: str, message: str, *args: Any, **fields: Any) -> None:
+        """Log a hot-path info event"""
+        self.log("INFO", event, message, *args, **fields)
+
+    def warn(self, event: str, message: str, *args: Any, **fields: Any) -> None:
+        """Log a hot-path warning event"""
+        self.log("WARN", event, message, *args, **fields)
+
+    def flush_suppressed(self, **context: Any) -> dict[str, int]:
+        """
+        Summarise suppressed events and start a new block window
+
+        Args:
+            **context: Fields added to the summary (e.g. block_index)
+
+        Returns:
+            Suppressed occurrences per event name since the last summary
+        """
+        with self._lock:
+            suppressed = {event: state[2] for event, state in self._events.items() if state[2]}
+            self._events.clear()
+            self._window_start = time.monotonic()
+
+        if suppressed:
+            self.emit(
+                "INFO",
+                "logging.hot_path_suppressed",
+                "Suppressed %d hot-path log events",
+                sum(suppressed.values()),
+                suppressed=suppressed,
+                **context,
+            )
+        return suppressed
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get per-event counters since the last summary"""
+        with self._lock:
+            return {
+                event: {"occurrences": seen, "emitted": emitted, "suppressed": suppressed}
+                for event, (seen, emitted, suppressed) in self._events.items()
+            }
+
+
+# Hot-path loggers, one per underlying logger so components sharing a logger share caps
+_hot_path_loggers: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+_hot_path_lock = threading.Lock()
+
+
+def get_hot_path_logger(logger: StructuredLogger | logging.Logger | None = None) -> HotPathLogger:
+    """
+    Get the hot-path logger wrapping ``logger``
+
+    Args:
+        logger: Underlying logger (default: global structured logger)
+
+    Returns:
+        HotPathLogger instance shared by all callers of the same logger
+    """
+    if logger is None:
+        logger = get_structured_logger()
+    hot = _hot_path_loggers.get(logger)
+    if hot is None:
+        with _hot_path_lock:
+            hot = _hot_path_loggers.get(logger)
+            if hot is None:
+                hot = _hot_path_loggers[logger] = HotPathLogger(logger)
+    return hot
+
+
+def flush_hot_path_logs(**context: Any) -> dict[str, int]:
+    """
+    Summarise suppressed events of every hot-path logger (call once per block)
+
+    Args:
+        **context: Fields added to each summary (e.g. block_index)
+
+    Returns:
+        Suppressed occurrences per event name across all hot-path loggers
+    """
+    totals: dict[str, int] = {}
+    for hot in list(_hot_path_loggers.values()):
+        for event, count in hot.flush_suppressed(**context).items():
+            totals[event] = totals.get(event, 0) + count
+    return totals
+
 # Global logger instance
 _global_structured_logger = None
 
@@ -0,0 +1,795 @@
+"""
+Webhook Delivery Engine - Shared batched, connection-pooled delivery pipeline
+
+Replaces one-executor-task-per-delivery with:
+- Per-endpoint keep-alive HTTP sessions (connection pooling)
+- Per-endpoint FIFO queues with bounded in-flight concurrency, so a slow
+  subscriber can occupy at most its own concurrency slots
+- Optional event batching per endpoint
+- Retry scheduling on a hashed timer wheel (no sleeping worker threads)
+- Durable append-only outbox replayed on restart for crash recovery
+  (on by default for the shared engine)
+- Delivery latency and queue depth metrics
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import queue
+import secrets
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Callable
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class DeliveryJob:
+    """A single webhook payload destined for one endpoint URL."""
+
+    url: str
+    event_type: str
+    payload: dict[str, Any]
+    headers: dict[str, str] = field(default_factory=dict)
+    job_id: str = field(default_factory=lambda: secrets.token_hex(8))
+    attempt: int = 0
+    max_attempts: int = 3
+    created_at: float = field(default_factory=time.time)
+    # Queue/pool identity; defaults to the URL. Producers that sign with
+    # per-subscriber secrets use the subscription id so batches never mix.
+    endpoint_id: str | None = None
+    # Explicit retry delays in seconds; exponential backoff when empty
+    retry_delays: tuple[float, ...] = ()
+
+    def to_record(self) -> dict[str, Any]:
+        """Serialize for the durable outbox."""
+        return {
+            "job_id": self.job_id,
+            "url": self.url,
+            "event_type": self.event_type,
+            "payload": self.payload,
+            "headers": self.headers,
+            "attempt": self.attempt,
+            "max_attempts": self.max_attempts,
+            "created_at": self.created_at,
+            "endpoint_id": self.endpoint_id,
+            "retry_delays": list(self.retry_delays),
+        }
+
+    @classmethod
+    def from_record(cls, record: dict[str, Any]) -> "DeliveryJob":
+        """Restore a job from an outbox record."""
+        return cls(
+            url=record["url"],
+            event_type=record["event_type"],
+            payload=record["payload"],
+            headers=record.get("headers", {}),
+            job_id=record["job_id"],
+            attempt=record.get("attempt", 0),
+            max_attempts=record.get("max_attempts", 3),
+            created_at=record.get("created_at", time.time()),
+            endpoint_id=record.get("endpoint_id"),
+            retry_delays=tuple(record.get("retry_delays", ())),
+        )
+
+
+@dataclass
+class DeliveryResult:
+    """Outcome of a delivery attempt for one job."""
+
+    job: DeliveryJob
+    success: bool
+    status_code: int | None = None
+    error: str | None = None
+    latency: float = 0.0
+    final: bool = True
+    response_body: str | None = None
+    # Seconds until the scheduled retry (None when final)
+    retry_delay: float | None = None
+
+
+ResultCallback = Callable[[DeliveryResult], None]
+BatchSigner = Callable[[bytes], dict[str, str]]
+JobSigner = Callable[[DeliveryJob], dict[str, str]]
+
+
+def default_outbox_path() -> str | None:
+    """Outbox location for the shared engine; XAI_WEBHOOK_OUTBOX_PATH="" disables it."""
+    path = os.getenv("XAI_WEBHOOK_OUTBOX_PATH")
+    if path is None:
+        path = os.path.join(os.getenv("XAI_DATA_DIR", "data"), "webhook_outbox.jsonl")
+    return path or None
+
+
+class TimerWheel:
+    """
+    Hashed timing wheel for retry scheduling.
+
+    Scheduling and expiry are O(1) amortized per item; the wheel is advanced
+    by a single scheduler thread instead of parking one thread per retry.
+    """
+
+    def __init__(self, tick_seconds: float = 0.5, slots: int = 512):
+        if tick_seconds <= 0 or slots <= 0:
+            raise ValueError("tick_seconds and slots must be positive")
+        self.tick_seconds = tick_seconds
+        self.slots = slots
+        self._wheel: list[list[tuple[int, Any]]] = [[] for _ in range(slots)]
+        self._current_tick = 0
+        self._origin = time.monotonic()
+        self._lock = threading.Lock()
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def schedule(self, delay: float, item: Any) -> None:
+        """Schedule ``item`` to expire after ``delay`` seconds."""
+        ticks = max(1, int(delay / self.tick_seconds + 0.999999))
+        with self._lock:
+            target = self._current_tick + ticks
+            rounds = (ticks - 1) // self.slots
+            self._wheel[target % self.slots].append((rounds, item))
+            self._size += 1
+
+    def advance(self, now: float | None = None) -> list[Any]:
+        """Advance the wheel to ``now`` and return expired items."""
+        now = time.monotonic() if now is None else now
+        target_tick = int((now - self._origin) / self.tick_seconds)
+        expired: list[Any] = []
+        with self._lock:
+            while self._current_tick < target_tick:
+                self._current_tick += 1
+                slot = self._wheel[self._current_tick % self.slots]
+                if not slot:
+                    continue
+                keep: list[tuple[int, Any]] = []
+                for rounds, item in slot:
+                    if rounds == 0:
+                        expired.append(item)
+                    else:
+                        keep.append((rounds - 1, item))
+                self._wheel[self._current_tick % self.slots] = keep
+            self._size -= len(expired)
+        return expired
+
+
+class DeliveryOutbox:
+    """
+    Append-only journal of enqueued and completed jobs.
+
+    Every enqueue writes an ``add`` record and every terminal outcome writes
+    a ``done`` record. On startup the journal is replayed and any job without
+    a ``done`` record is redelivered. The file is compacted once the number
+    of completed records dominates.
+    """
+
+    COMPACT_THRESHOLD = 10_000
+
+    def __init__(self, path: str, fsync: bool = True):
+        self.path = path
+        self.fsync = fsync
+        self._lock = threading.Lock()
+        self._pending: dict[str, dict[str, Any]] = {}
+        self._done_since_compact = 0
+        self._handle = None
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def load_pending(self) -> list[DeliveryJob]:
+        """Replay the journal and return undelivered jobs."""
+        pending: dict[str, dict[str, Any]] = {}
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        # Torn final write after a crash
+                        logger.warning("Skipping corrupt webhook outbox record")
+                        continue
+                    if record.get("op") == "add":
+                        pending[record["job"]["job_id"]] = record["job"]
+                    elif record.get("op") == "done":
+                        pending.pop(record.get("job_id"), None)
+        except FileNotFoundError:
+            pass
+        with self._lock:
+            self._pending = pending
+        self.compact()
+        return [DeliveryJob.from_record(r) for r in pending.values()]
+
+    def _append(self, record: dict[str, Any]) -> None:
+        if self._handle is None:
+            self._handle = open(self.path, "a", encoding="utf-8")
+        self._handle.write(json.dumps(record, sort_keys=True) + "\n")
+        self._handle.flush()
+        if self.fsync:
+            os.fsync(self._handle.fileno())
+
+    def add(self, job: DeliveryJob) -> None:
+        """Record a newly enqueued job."""
+        record = job.to_record()
+        with self._lock:
+            self._pending[job.job_id] = record
+            self._append({"op": "add", "job": record})
+
+    def done(self, job_id: str) -> None:
+        """Record a job as terminal (delivered or abandoned)."""
+        with self._lock:
+            if self._pending.pop(job_id, None) is None:
+                return
+            self._append({"op": "done", "job_id": job_id})
+            self._done_since_compact += 1
+            should_compact = self._done_since_compact >= self.COMPACT_THRESHOLD
+        if should_compact:
+            self.compact()
+
+    def compact(self) -> None:
+        """Rewrite the journal with only pending jobs."""
+        with self._lock:
+            if self._handle is not None:
+                self._handle.close()
+                self._handle = None
+            tmp_path = f"{self.path}.tmp"
+            try:
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    for record in self._pending.values():
+                        f.write(json.dumps({"op": "add", "job": record}, sort_keys=True) + "\n")
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_path, self.path)
+                self._done_since_compact = 0
+            except OSError as e:
+                logger.error("Failed to compact webhook outbox: %s", e)
+
+    def pending_count(self) -> int:
+        with self._lock:
+            return len(self._pending)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._handle is not None:
+                self._handle.close()
+                self._handle = None
+
+
+class _Endpoint:
+    """Per-endpoint queue, session and accounting."""
+
+    def __init__(
+        self,
+        key: str,
+        max_concurrency: int,
+        batch_size: int,
+        batch_signer: BatchSigner | None,
+        configured: bool = False,
+        signer: JobSigner | None = None,
+    ):
+        self.key = key
+        self.max_concurrency = max(1, max_concurrency)
+        self.batch_size = max(1, batch_size)
+        self.batch_signer = batch_signer
+        self.signer = signer
+        self.configured = configured
+        self.enabled = True
+        self.queue: deque[tuple[DeliveryJob, ResultCallback | None]] = deque()
+        self.in_flight = 0
+        self.retries_pending = 0
+        self.last_used = time.monotonic()
+        self._session: requests.Session | None = None
+        self.delivered = 0
+        self.failed = 0
+        self.retried = 0
+
+    @property
+    def session(self) -> requests.Session:
+        """Keep-alive session, opened on first use after creation or release."""
+        if self._session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.max_concurrency)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            self._session = session
+        return self._session
+
+    @session.setter
+    def session(self, session: requests.Session) -> None:
+        self._session = session
+
+    def is_idle(self, now: float, idle_seconds: float) -> bool:
+        return (
+            not self.queue
+            and self.in_flight == 0
+            and self.retries_pending == 0
+            and now - self.last_used >= idle_seconds
+        )
+
+    def release_session(self) -> requests.Session | None:
+        """Detach the session so the caller can close it outside the engine lock."""
+        session, self._session = self._session, None
+        return session
+
+
+class WebhookDeliveryEngine:
+    """
+    Shared delivery engine used by WebhookManager and merchant processors.
+
+    Thread-safe; ``enqueue`` never blocks on network I/O.
+    """
+
+    # Default delivery timeout in seconds
+    DELIVERY_TIMEOUT = 10
+    # Base delay between retries (exponential backoff)
+    RETRY_BASE_DELAY = 5.0
+    # Maximum retry delay
+    RETRY_MAX_DELAY = 6 * 3600.0
+    # Number of latency samples kept for percentile metrics
+    LATENCY_WINDOW = 1024
+    # Endpoints with no queued, in-flight or scheduled work for this long are
+    # evicted (ad-hoc URLs) or have their session closed (configured endpoints)
+    ENDPOINT_IDLE_SECONDS = 300.0
+
+    def __init__(
+        self,
+        workers: int = 4,
+        outbox_path: str | None = None,
+        timeout: float | None = None,
+        retry_base_delay: float | None = None,
+        tick_seconds: float = 0.5,
+        endpoint_idle_seconds: float | None = None,
+    ):
+        self.workers = max(1, workers)
+        self.timeout = timeout if timeout is not None else self.DELIVERY_TIMEOUT
+        self.retry_base_delay = retry_base_delay if retry_base_delay is not None else self.RETRY_BASE_DELAY
+        self.endpoint_idle_seconds = (
+            endpoint_idle_seconds if endpoint_idle_seconds is not None else self.ENDPOINT_IDLE_SECONDS
+        )
+        self._endpoints: dict[str, _Endpoint] = {}
+        self._endpoints_evicted = 0
+        self._ready: queue.Queue[str | None] = queue.Queue()
+        self._lock = threading.RLock()
+        self._timer = TimerWheel(tick_seconds=tick_seconds)
+        self._outbox = DeliveryOutbox(outbox_path) if outbox_path else None
+        self._latencies: deque[float] = deque(maxlen=self.LATENCY_WINDOW)
+        self._threads: list[threading.Thread] = []
+        self._running = False
+        self._stop_event = threading.Event()
+
+    # ==================== LIFECYCLE ====================
+
+    def start(self, on_recovered: ResultCallback | None = None) -> int:
+        """
+        Start worker and scheduler threads and replay the outbox.
+
+        Args:
+            on_recovered: Result callback for jobs recovered from the outbox
+
+        Returns:
+            Number of recovered jobs
+        """
+        with self._lock:
+            if self._running:
+                return 0
+            self._running = True
+            self._stop_event.clear()
+            for i in range(self.workers):
+                thread = threading.Thread(target=self._worker_loop, name=f"webhook-delivery-{i}", daemon=True)
+                thread.start()
+                self._threads.append(thread)
+            scheduler = threading.Thread(target=self._scheduler_loop, name="webhook-retry-wheel", daemon=True)
+            scheduler.start()
+            self._threads.append(scheduler)
+
+        recovered = 0
+        if self._outbox:
+            for job in self._outbox.load_pending():
+                self._push(job, on_recovered, persist=False)
+                recovered += 1
+            if recovered:
+                logger.info("Recovered %d webhook deliveries from outbox", recovered)
+        return recovered
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Stop threads; undelivered jobs remain in the outbox."""
+        with self._lock:
+            if not self._running:
+                return
+            self._running = False
+            self._stop_event.set()
+            threads, self._threads = self._threads, []
+        for _ in range(self.workers):
+            self._ready.put(None)
+        for thread in threads:
+            thread.join(timeout=timeout)
+        with self._lock:
+            sessions = [endpoint.release_session() for endpoint in self._endpoints.values()]
+        for session in sessions:
+            if session is not None:
+                session.close()
+        if self._outbox:
+            self._outbox.close()
+
+    @property
+    def running(self) -> bool:
+        return self._running
+
+    # ==================== ENDPOINTS ====================
+
+    @staticmethod
+    def endpoint_key(url: str) -> str:
+        """Default endpoint key: the URL without query string."""
+        parsed = urlparse(url)
+        return f"{parsed.scheme}://{parsed.netloc}{parsed.path}"
+
+    @classmethod
+    def _job_endpoint_key(cls, job: DeliveryJob) -> str:
+        return job.endpoint_id or cls.endpoint_key(job.url)
+
+    def configure_endpoint(
+        self,
+        endpoint_id: str,
+        max_concurrency: int = 1,
+        batch_size: int = 1,
+        batch_signer: BatchSigner | None = None,
+        signer: JobSigner | None = None,
+    ) -> None:
+        """
+        Configure concurrency, batching and signing for an endpoint.
+
+        Args:
+            endpoint_id: Endpoint identifier (``DeliveryJob.endpoint_id`` or URL)
+            max_concurrency: Maximum in-flight requests to this endpoint
+            batch_size: Maximum events per POST (1 disables batching)
+            batch_signer: Produces signature headers for a batch body
+            signer: Produces signature headers for a single job; called on
+                every attempt so timestamps are never stale on retries
+        """
+        key = endpoint_id if "://" not in endpoint_id else self.endpoint_key(endpoint_id)
+        with self._lock:
+            endpoint = self._endpoints.get(key)
+            if endpoint is None:
+                self._endpoints[key] = _Endpoint(
+                    key, max_concurrency, batch_size, batch_signer, configured=True, signer=signer
+                )
+            else:
+                endpoint.max_concurrency = max(1, max_concurrency)
+                endpoint.batch_size = max(1, batch_size)
+                endpoint.batch_signer = batch_signer
+                endpoint.signer = signer
+                endpoint.configured = True
+
+    def set_endpoint_enabled(self, endpoint_id: str, enabled: bool) -> int:
+        """
+        Enable or disable delivery to an endpoint.
+
+        Disabling abandons the endpoint's queued jobs at once, and its
+        scheduled retries and new jobs as they come due, each reported to
+        its callback as a final failure.
+
+        Args:
+            endpoint_id: Endpoint identifier (``DeliveryJob.endpoint_id`` or URL)
+            enabled: Whether deliveries may be attempted
+
+        Returns:
+            Number of queued jobs abandoned
+        """
+        key = endpoint_id if "://" not in endpoint_id else self.endpoint_key(endpoint_id)
+        with self._lock:
+            endpoint = self._endpoint_for(key)
+            endpoint.enabled = enabled
+            abandoned = [] if enabled else list(endpoint.queue)
+            if abandoned:
+                endpoint.queue.clear()
+        for job, callback in abandoned:
+            self._abandon(job, callback)
+        return len(abandoned)
+
+    def remove_endpoint(self, endpoint_id: str) -> bool:
+        """
+        Drop an endpoint's configuration and close its session.
+
+        Queued and scheduled jobs still run; they fall back to an ad-hoc
+        endpoint that is evicted once idle.
+
+        Args:
+            endpoint_id: Endpoint identifier (``DeliveryJob.endpoint_id`` or URL)
+
+        Returns:
+            True if the endpoint existed
+        """
+        key = endpoint_id if "://" not in endpoint_id else self.endpoint_key(endpoint_id)
+        with self._lock:
+            endpoint = self._endpoints.get(key)
+            if endpoint is None:
+                return False
+            if endpoint.queue or endpoint.in_flight or endpoint.retries_pending:
+                endpoint.configured = False
+                return True
+            del self._endpoints[key]
+            session = endpoint.release_session()
+        if session is not None:
+            session.close()
+        return True
+
+    def _endpoint_for(self, key: str) -> _Endpoint:
+        endpoint = self._endpoints.get(key)
+        if endpoint is None:
+            endpoint = _Endpoint(key, 1, 1, None)
+            self._endpoints[key] = endpoint
+        endpoint.last_used = time.monotonic()
+        return endpoint
+
+    def evict_idle_endpoints(self, now: float | None = None) -> int:
+        """
+        Release resources of endpoints that have been idle for endpoint_idle_seconds.
+
+        Ad-hoc endpoints (created from a job URL) are dropped; configured
+        endpoints keep their settings and reopen a session on next use.
+
+        Returns:
+            Number of endpoints dropped
+        """
+        now = time.monotonic() if now is None else now
+        sessions: list[requests.Session] = []
+        evicted = 0
+        with self._lock:
+            for key, endpoint in list(self._endpoints.items()):
+                if not endpoint.is_idle(now, self.endpoint_idle_seconds):
+                    continue
+                session = endpoint.release_session()
+                if session is not None:
+                    sessions.append(session)
+                if not endpoint.configured:
+                    del self._endpoints[key]
+                    evicted += 1
+            self._endpoints_evicted += evicted
+        for session in sessions:
+            try:
+                session.close()
+            except Exception as e:
+                logger.debug("Closing idle webhook session failed: %s", e)
+        return evicted
+
+    def session_for(self, url: str) -> requests.Session:
+        """Return the pooled keep-alive session for an endpoint."""
+        with self._lock:
+            return self._endpoint_for(self.endpoint_key(url)).session
+
+    # ==================== ENQUEUE / SCHEDULING ====================
+
+    def enqueue(self, job: DeliveryJob, callback: ResultCallback | None = None) -> str:
+        """
+        Queue a job for delivery.
+
+        Args:
+            job: Delivery job
+            callback: Invoked with a DeliveryResult after every attempt
+
+        Returns:
+            Job ID
+        """
+        self._push(job, callback, persist=True)
+        return job.job_id
+
+    def _push(self, job: DeliveryJob, callback: ResultCallback | None, persist: bool) -> None:
+        if persist and self._outbox:
+            self._outbox.add(job)
+        self._requeue(job, callback)
+
+    def _requeue(self, job: DeliveryJob, callback: ResultCallback | None) -> None:
+        """Queue a new or retried job, abandoning it if its endpoint is disabled."""
+        with self._lock:
+            endpoint = self._endpoint_for(self._job_endpoint_key(job))
+            if endpoint.enabled:
+                endpoint.queue.append((job, callback))
+                self._signal(endpoint)
+                return
+        self._abandon(job, callback)
+
+    def _abandon(self, job: DeliveryJob, callback: ResultCallback | None) -> None:
+        """Finish a job without attempting it because its endpoint is disabled."""
+        if self._outbox:
+            self._outbox.done(job.job_id)
+        self._report(callback, DeliveryResult(job=job, success=False, error="endpoint disabled"))
+
+    @staticmethod
+    def _report(callback: ResultCallback | None, result: DeliveryResult) -> None:
+        if callback is None:
+            return
+        try:
+            callback(result)
+        except Exception as e:
+            logger.error("Webhook result callback failed: %s", e)
+
+    def _signal(self, endpoint: _Endpoint) -> None:
+        """Hand the endpoint to a worker if it has queued work and free slots."""
+        if endpoint.queue and endpoint.in_flight < endpoint.max_concurrency:
+            endpoint.in_flight += 1
+            self._ready.put(endpoint.key)
+
+    def _retry_delay(self, job: DeliveryJob) -> float:
+        """Delay before the next attempt after ``job.attempt`` failed attempts."""
+        if job.retry_delays:
+            return job.retry_delays[min(job.attempt - 1, len(job.retry_delays) - 1)]
+        return min(self.retry_base_delay * (2 ** (job.attempt - 1)), self.RETRY_MAX_DELAY)
+
+    def _scheduler_loop(self) -> None:
+        reap_interval = max(self._timer.tick_seconds, self.endpoint_idle_seconds / 4)
+        next_reap = time.monotonic() + reap_interval
+        while not self._stop_event.wait(self._timer.tick_seconds):
+            for job, callback in self._timer.advance():
+                with self._lock:
+                    endpoint = self._endpoint_for(self._job_endpoint_key(job))
+                    endpoint.retries_pending = max(0, endpoint.retries_pending - 1)
+                self._requeue(job, callback)
+            now = time.monotonic()
+            if now >= next_reap:
+                self.evict_idle_endpoints(now)
+                next_reap = now + reap_interval
+
+    # ==================== DELIVERY ====================
+
+    def _worker_loop(self) -> None:
+        while True:
+            key = self._ready.get()
+            if key is None:
+                return
+            with self._lock:
+                endpoint = self._endpoints.get(key)
+                batch: list[tuple[DeliveryJob, ResultCallback | None]] = []
+                if endpoint is not None:
+                    while endpoint.queue and len(batch) < endpoint.batch_size:
+                        batch.append(endpoint.queue.popleft())
+            if endpoint is None:
+                continue
+            try:
+                if batch:
+                    self._deliver(endpoint, batch)
+            except Exception as e:  # Never let a worker die
+                logger.error("Webhook delivery worker error: %s", e, exc_info=True)
+            finally:
+                with self._lock:
+                    endpoint.in_flight -= 1
+                    self._signal(endpoint)
+
+    def _deliver(self, endpoint: _Endpoint, batch: list[tuple[DeliveryJob, ResultCallback | None]]) -> None:
+        jobs = [job for job, _ in batch]
+        for job in jobs:
+            job.attempt += 1
+
+        started = time.monotonic()
+        status_code: int | None = None
+        error: str | None = None
+        response_body: str | None = None
+        try:
+            # Headers are built per attempt so signatures and timestamps are fresh
+            if len(jobs) == 1:
+                job = jobs[0]
+                body = json.dumps(job.payload).encode("utf-8")
+                headers = {"Content-Type": "application/json", **job.headers}
+                if endpoint.signer is not None:
+                    headers.update(endpoint.signer(job))
+            else:
+                body = json.dumps({"batch": True, "events": [job.payload for job in jobs]}).encode("utf-8")
+                headers = {
+                    "Content-Type": "application/json",
+                    "X-Webhook-Batch-Size": str(len(jobs)),
+                }
+                if endpoint.batch_signer is not None:
+                    headers.update(endpoint.batch_signer(body))
+            response = endpoint.session.post(jobs[0].url, data=body, headers=headers, timeout=self.timeout)
+            status_code = response.status_code
+            response_body = response.text[:1000]
+            success = 200 <= status_code < 300
+            if not success:
+                error = f"HTTP {status_code}"
+        except requests.RequestException as e:
+            success = False
+            error = str(e)
+        except Exception as e:
+            # Any other failure still counts as an attempt, so the job is retried
+            logger.error("Webhook delivery attempt raised: %s", e, exc_info=True)
+            success = False
+            error = f"{type(e).__name__}: {e}"
+        latency = time.monotonic() - started
+
+        with self._lock:
+            self._latencies.append(latency)
+            endpoint.last_used = time.monotonic()
+            if success:
+                endpoint.delivered += len(jobs)
+            else:
+                endpoint.failed += len(jobs)
+
+        for job, callback in batch:
+            final = success or job.attempt >= job.max_attempts
+            retry_delay: float | None = None
+            if not final:
+                retry_delay = self._retry_delay(job)
+                with self._lock:
+                    endpoint.retried += 1
+                    endpoint.retries_pending += 1
+                self._timer.schedule(retry_delay, (job, callback))
+            elif self._outbox:
+                self._outbox.done(job.job_id)
+            self._report(
+                callback,
+                DeliveryResult(
+                    job=job,
+                    success=success,
+                    status_code=status_code,
+                    error=error,
+                    latency=latency,
+                    final=final,
+                    response_body=response_body,
+                    retry_delay=retry_delay,
+                ),
+            )
+
+    # ==================== METRICS ====================
+
+    def get_metrics(self) -> dict[str, Any]:
+        """Return queue depth and latency metrics."""
+        with self._lock:
+            latencies = sorted(self._latencies)
+            endpoints = {
+                key: {
+                    "queue_depth": len(ep.queue),
+                    "in_flight": ep.in_flight,
+                    "delivered": ep.delivered,
+                    "failed_attempts": ep.failed,
+                    "retries_scheduled": ep.retried,
+                    "batch_size": ep.batch_size,
+                }
+                for key, ep in self._endpoints.items()
+            }
+            queue_depth = sum(len(ep.queue) for ep in self._endpoints.values())
+
+        def _pct(p: float) -> float:
+            if not latencies:
+                return 0.0
+            return latencies[min(len(latencies) - 1, int(p * len(latencies)))]
+
+        return {
+            "running": self._running,
+            "queue_depth": queue_depth,
+            "retry_pending": len(self._timer),
+            "endpoints_evicted": self._endpoints_evicted,
+            "outbox_pending": self._outbox.pending_count() if self._outbox else 0,
+            "latency_avg_seconds": (sum(latencies) / len(latencies)) if latencies else 0.0,
+            "latency_p50_seconds": _pct(0.50),
+            "latency_p95_seconds": _pct(0.95),
+            "endpoints": endpoints,
+        }
+
+
+# Module-level shared engine
+_delivery_engine: WebhookDeliveryEngine | None = None
+_engine_lock = threading.Lock()
+
+
+def get_delivery_engine(outbox_path: str | None = None, create: bool = True) -> WebhookDeliveryEngine | None:
+    """Get the process-wide delivery engine, starting it on first use."""
+    global _delivery_engine
+
+    with _engine_lock:
+        if _delivery_engine is None and create:
+            if outbox_path is None:
+                outbox_path = default_outbox_path()
+            _delivery_engine = WebhookDeliveryEngine(outbox_path=outbox_path)
+            _delivery_engine.start()
+        return _delivery_engine
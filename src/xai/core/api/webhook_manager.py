@@ -4,13 +4,12 @@ Webhook Manager - Event Notification System for XAI Blockchain
 Provides webhook registration, event dispatch, and delivery management:
 - Webhook registration and management
 - Event subscription by type
-- Delivery with retry logic
+- Delivery with retry logic via the shared WebhookDeliveryEngine
 - Webhook verification via signature
 """
 
 from __future__ import annotations
 
-import asyncio
 import hashlib
 import hmac
 import json
@@ -18,7 +17,6 @@ import logging
 import secrets
 import threading
 import time
-from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any, Callable
@@ -26,6 +24,13 @@ from urllib.parse import urlparse
 
 import requests
 
+from xai.core.api.webhook_delivery import (
+    DeliveryJob,
+    DeliveryResult,
+    WebhookDeliveryEngine,
+    get_delivery_engine,
+)
+
 logger = logging.getLogger(__name__)
 
 
@@ -42,6 +47,9 @@ class WebhookEvent(str, Enum):
     CONTRACT_CALLED = "contract_called"
     MINING_REWARD = "mining_reward"
     AI_TASK_COMPLETED = "ai_task_completed"
+    PAYMENT_SEEN = "payment_seen"
+    PAYMENT_CONFIRMED = "payment_confirmed"
+    PAYMENT_REORGED = "payment_reorged"
 
 
 @dataclass
@@ -93,7 +101,12 @@ class WebhookManager:
     """
     Manages webhook registrations and event delivery.
 
-    Thread-safe implementation with async delivery and retry logic.
+    Thread-safe implementation. Background deliveries go through a
+    WebhookDeliveryEngine (per-endpoint keep-alive pools and queues, optional
+    batching via ``metadata["batch_size"]``, timer-wheel retries and a durable
+    outbox). With ``storage_path`` the manager runs its own engine with the
+    outbox beside the registrations; otherwise it uses the process-wide
+    engine, whose outbox is on by default.
     """
 
     # Maximum retries for failed deliveries
@@ -113,19 +126,36 @@ class WebhookManager:
         self,
         max_workers: int = 4,
         storage_path: str | None = None,
+        delivery_engine: WebhookDeliveryEngine | None = None,
     ):
         self._webhooks: dict[str, WebhookRegistration] = {}
         self._event_subscriptions: dict[str, list[str]] = {}
         self._lock = threading.RLock()
-        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="webhook")
         self._delivery_history: list[WebhookDelivery] = []
         self._storage_path = storage_path
         self._running = True
 
+        self._owns_engine = delivery_engine is None and storage_path is not None
+        if delivery_engine is not None:
+            self._engine = delivery_engine
+        elif storage_path:
+            self._engine = WebhookDeliveryEngine(
+                workers=max_workers,
+                outbox_path=f"{storage_path}.outbox",
+                timeout=self.DELIVERY_TIMEOUT,
+                retry_base_delay=self.RETRY_BASE_DELAY,
+            )
+        else:
+            # One engine, and so one outbox file, per process
+            self._engine = get_delivery_engine()
+
         # Load persisted webhooks if storage path provided
         if storage_path:
             self._load_webhooks()
 
+        if not self._engine.running:
+            self._engine.start(on_recovered=self._on_delivery_result)
+
         logger.info(
             "WebhookManager initialized",
             extra={"max_workers": max_workers, "storage": storage_path},
@@ -211,6 +241,7 @@ class WebhookManager:
             )
 
             self._webhooks[webhook_id] = registration
+            self._configure_endpoint(registration)
 
             # Update event subscriptions
             for event in events:
@@ -281,6 +312,8 @@ class WebhookManager:
             del self._webhooks[webhook_id]
             self._save_webhooks()
 
+        self._engine.remove_endpoint(webhook_id)
+
         logger.info(
             "Webhook unregistered",
             extra={"webhook_id": webhook_id, "owner": owner},
@@ -353,6 +386,7 @@ class WebhookManager:
                 webhook.active = active
                 if active:
                     webhook.failure_count = 0  # Reset on re-enable
+                self._engine.set_endpoint_enabled(webhook_id, active)
 
             self._save_webhooks()
 
@@ -420,14 +454,122 @@ class WebhookManager:
 
         for webhook in active_webhooks:
             if async_delivery and self._running:
-                self._executor.submit(
-                    self._deliver_webhook, webhook, event_type, event_envelope
+                self._engine.enqueue(
+                    DeliveryJob(
+                        url=webhook.url,
+                        event_type=event_type,
+                        payload=event_envelope,
+                        headers=self._static_headers(webhook, event_type),
+                        max_attempts=self.MAX_RETRIES,
+                        endpoint_id=webhook.id,
+                    ),
+                    self._on_delivery_result,
                 )
             else:
                 self._deliver_webhook(webhook, event_type, event_envelope)
 
         return len(active_webhooks)
 
+    def _configure_endpoint(self, webhook: WebhookRegistration) -> None:
+        """Apply per-webhook batching settings to the delivery engine."""
+        try:
+            batch_size = int(webhook.metadata.get("batch_size", 1))
+        except (TypeError, ValueError):
+            batch_size = 1
+        secret = webhook.secret
+
+        def _sign_batch(body: bytes) -> dict[str, str]:
+            digest = hmac.new(secret.encode("utf-8"), body, hashlib.sha256).hexdigest()
+            return {
+                "X-Webhook-Signature": f"sha256={digest}",
+                "X-Webhook-ID": webhook.id,
+                "X-Webhook-Timestamp": str(int(time.time())),
+            }
+
+        def _sign_job(job: DeliveryJob) -> dict[str, str]:
+            return self._signature_headers(secret, job.payload)
+
+        self._engine.configure_endpoint(
+            webhook.id,
+            batch_size=max(1, batch_size),
+            batch_signer=_sign_batch,
+            signer=_sign_job,
+        )
+        self._engine.set_endpoint_enabled(webhook.id, webhook.active)
+
+    @staticmethod
+    def _static_headers(webhook: WebhookRegistration, event_type: str) -> dict[str, str]:
+        """Headers that stay the same on every attempt of a delivery."""
+        return {
+            "Content-Type": "application/json",
+            "X-Webhook-Event": event_type,
+            "X-Webhook-ID": webhook.id,
+        }
+
+    def _signature_headers(self, secret: str, payload: dict[str, Any]) -> dict[str, str]:
+        """Signature and timestamp headers, built for each delivery attempt."""
+        return {
+            "X-Webhook-Signature": self._generate_signature(secret, payload),
+            "X-Webhook-Timestamp": str(int(time.time())),
+        }
+
+    def _build_headers(
+        self, webhook: WebhookRegistration, event_type: str, payload: dict[str, Any]
+    ) -> dict[str, str]:
+        """Build signed delivery headers for a single attempt."""
+        return {
+            **self._static_headers(webhook, event_type),
+            **self._signature_headers(webhook.secret, payload),
+        }
+
+    def _on_delivery_result(self, result: DeliveryResult) -> None:
+        """Update webhook health and history from an engine delivery attempt."""
+        job = result.job
+        with self._lock:
+            webhook = self._webhooks.get(job.endpoint_id or "")
+            if webhook is not None:
+                if result.success:
+                    webhook.last_delivery = time.time()
+                    webhook.failure_count = 0
+                    webhook.last_error = None
+                elif webhook.active:
+                    webhook.failure_count += 1
+                    webhook.last_error = result.error
+                    if webhook.failure_count >= self.MAX_FAILURE_COUNT and webhook.active:
+                        webhook.active = False
+                        logger.error(
+                            "Webhook disabled due to failures",
+                            extra={"webhook_id": webhook.id},
+                        )
+                        # Pending retries and queued events are abandoned
+                        self._engine.set_endpoint_enabled(webhook.id, False)
+
+            if result.final:
+                self._delivery_history.append(
+                    WebhookDelivery(
+                        webhook_id=job.endpoint_id or "",
+                        event_type=job.event_type,
+                        payload=job.payload,
+                        attempt=job.attempt,
+                        success=result.success,
+                        status_code=result.status_code,
+                        error=result.error,
+                    )
+                )
+                if len(self._delivery_history) > 1000:
+                    self._delivery_history = self._delivery_history[-500:]
+
+        if not result.success:
+            logger.warning(
+                "Webhook delivery failed",
+                extra={
+                    "webhook_id": job.endpoint_id,
+                    "attempt": job.attempt,
+                    "final": result.final,
+                    "error": result.error,
+                },
+            )
+
     def _deliver_webhook(
         self,
         webhook: WebhookRegistration,
@@ -455,18 +597,10 @@ class WebhookManager:
         )
 
         try:
-            # Generate signature
-            signature = self._generate_signature(webhook.secret, payload)
-
-            headers = {
-                "Content-Type": "application/json",
-                "X-Webhook-Signature": signature,
-                "X-Webhook-Event": event_type,
-                "X-Webhook-ID": webhook.id,
-                "X-Webhook-Timestamp": str(int(time.time())),
-            }
+            headers = self._build_headers(webhook, event_type, payload)
 
-            response = requests.post(
+            # Synchronous path (test deliveries) still reuses the pooled session
+            response = self._engine.session_for(webhook.url).post(
                 webhook.url,
                 json=payload,
                 headers=headers,
@@ -519,8 +653,8 @@ class WebhookManager:
                         extra={"webhook_id": webhook.id},
                     )
 
-            # Retry with exponential backoff
-            if attempt < self.MAX_RETRIES:
+            # Retry with exponential backoff, unless the webhook was just disabled
+            if attempt < self.MAX_RETRIES and webhook.active:
                 delay = self.RETRY_BASE_DELAY * (2 ** (attempt - 1))
                 time.sleep(delay)
                 return self._deliver_webhook(webhook, event_type, payload, attempt + 1)
@@ -564,12 +698,17 @@ class WebhookManager:
 
         total = len(history)
         successful = sum(1 for d in history if d.success)
+        engine_metrics = self._engine.get_metrics()
 
         return {
             "total_deliveries": total,
             "successful": successful,
             "failed": total - successful,
             "success_rate": (successful / total * 100) if total > 0 else 0.0,
+            "queue_depth": engine_metrics["queue_depth"],
+            "retry_pending": engine_metrics["retry_pending"],
+            "latency_avg_seconds": engine_metrics["latency_avg_seconds"],
+            "latency_p95_seconds": engine_metrics["latency_p95_seconds"],
         }
 
     def _save_webhooks(self) -> None:
@@ -619,6 +758,7 @@ class WebhookManager:
                     metadata=wdata.get("metadata", {}),
                 )
                 self._webhooks[wid] = registration
+                self._configure_endpoint(registration)
 
                 # Rebuild subscriptions
                 for event in registration.events:
@@ -636,7 +776,8 @@ class WebhookManager:
     def shutdown(self) -> None:
         """Shutdown the webhook manager."""
         self._running = False
-        self._executor.shutdown(wait=True)
+        if self._owns_engine:
+            self._engine.stop()
         self._save_webhooks()
         logger.info("WebhookManager shutdown complete")
 
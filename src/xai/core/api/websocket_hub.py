@@ -0,0 +1,269 @@
+"""
+WebSocket Subscription Hub
+
+Fans broadcast messages out to subscribed WebSocket clients:
+- Clients are indexed by channel, so a broadcast only visits its subscribers
+- Each message is serialized once and the same payload is queued for every
+  subscriber
+- Every client has a bounded outbound queue drained by its own writer
+  thread, so a slow or stalled subscriber never blocks the broadcaster or
+  other clients
+
+When a client's queue is full the slow-client policy decides what happens:
+- "drop_oldest": discard the oldest queued message (default)
+- "drop_newest": discard the message being broadcast
+- "disconnect": close the client's connection
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import threading
+from collections import deque
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+SLOW_CLIENT_POLICIES = ("drop_oldest", "drop_newest", "disconnect")
+
+# Errors a WebSocket send or close may raise
+_SEND_ERRORS = (OSError, IOError, ValueError, TypeError, RuntimeError, KeyError, AttributeError)
+
+
+class WebSocketClient:
+    """
+    A connected client with its own bounded outbound queue
+
+    Payloads are sent in queue order by a dedicated writer thread.
+    """
+
+    def __init__(self, client_id: str, ws: Any, ip: str, max_queue_size: int, policy: str):
+        self.id = client_id
+        self.ws = ws
+        self.ip = ip
+        self.channels: list[str] = []
+        self.max_queue_size = max_queue_size
+        self.policy = policy
+
+        self._queue: deque[str] = deque()
+        self._cond = threading.Condition()
+        self._closed = False
+        self.sent = 0
+        self.dropped = 0
+        self._writer = threading.Thread(
+            target=self._drain, name=f"ws-writer-{client_id}", daemon=True
+        )
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def start(self) -> None:
+        self._writer.start()
+
+    def enqueue(self, payload: str) -> bool:
+        """
+        Queue a payload for sending
+
+        Returns:
+            False if the payload was not queued (dropped, or client closed)
+        """
+        with self._cond:
+            if self._closed:
+                return False
+            if len(self._queue) >= self.max_queue_size:
+                if self.policy == "disconnect":
+                    logger.warning(
+                        f"Disconnecting slow WebSocket client {self.id}",
+                        extra={"event": "ws.slow_client_disconnected", "client_id": self.id},
+                    )
+                    self._close_locked()
+                    return False
+                self.dropped += 1
+                if self.policy == "drop_newest":
+                    return False
+                self._queue.popleft()
+            self._queue.append(payload)
+            self._cond.notify()
+            return True
+
+    def queued(self) -> int:
+        with self._cond:
+            return len(self._queue)
+
+    def close(self) -> None:
+        """Stop the writer and close the connection"""
+        with self._cond:
+            self._close_locked()
+
+    def _close_locked(self) -> None:
+        if not self._closed:
+            self._closed = True
+            self._queue.clear()
+            self._cond.notify()
+
+    def _drain(self) -> None:
+        """Writer loop: send queued payloads until the client is closed"""
+        while True:
+            with self._cond:
+                while not self._queue and not self._closed:
+                    self._cond.wait()
+                if self._closed:
+                    break
+                payload = self._queue.popleft()
+            try:
+                self.ws.send(payload)
+                self.sent += 1
+            except _SEND_ERRORS as e:
+                logger.error(f"Failed to send to client {self.id}: {e}")
+                self.close()
+                break
+
+        try:
+            self.ws.close()
+        except _SEND_ERRORS as e:
+            logger.debug(f"Failed to close WebSocket client {self.id}: {type(e).__name__}")
+
+
+class WebSocketSubscriptionHub:
+    """
+    Channel-indexed registry of WebSocket clients
+
+    Thread-safe. Broadcasting only serializes and enqueues; all socket
+    writes happen on the clients' writer threads.
+    """
+
+    def __init__(self, max_queue_size: int = 256, slow_client_policy: str = "drop_oldest"):
+        """
+        Initialize hub
+
+        Args:
+            max_queue_size: Outbound messages buffered per client
+            slow_client_policy: One of SLOW_CLIENT_POLICIES, applied when a queue is full
+        """
+        if max_queue_size < 1:
+            raise ValueError("max_queue_size must be at least 1")
+        if slow_client_policy not in SLOW_CLIENT_POLICIES:
+            raise ValueError(
+                f"Unknown slow client policy: {slow_client_policy}. "
+                f"Use one of {', '.join(SLOW_CLIENT_POLICIES)}"
+            )
+        self.max_queue_size = max_queue_size
+        self.slow_client_policy = slow_client_policy
+
+        self._lock = threading.Lock()
+        self._clients: dict[str, WebSocketClient] = {}
+        self._channels: dict[str, dict[str, WebSocketClient]] = {}
+        self.messages_published = 0
+
+    def register(self, client_id: str, ws: Any, ip: str) -> WebSocketClient:
+        """Add a client and start its writer"""
+        client = WebSocketClient(client_id, ws, ip, self.max_queue_size, self.slow_client_policy)
+        with self._lock:
+            self._clients[client_id] = client
+        client.start()
+        return client
+
+    def unregister(self, client_id: str) -> WebSocketClient | None:
+        """Remove a client from all channels and stop its writer"""
+        with self._lock:
+            client = self._clients.pop(client_id, None)
+            if client is None:
+                return None
+            for channel in client.channels:
+                subscribers = self._channels.get(channel)
+                if subscribers is not None:
+                    subscribers.pop(client_id, None)
+                    if not subscribers:
+                        del self._channels[channel]
+        client.close()
+        return client
+
+    def subscribe(self, client_id: str, channel: str) -> bool:
+        """Subscribe a client to a channel; False if unknown or already subscribed"""
+        with self._lock:
+            client = self._clients.get(client_id)
+            if client is None or channel in client.channels:
+                return False
+            client.channels.append(channel)
+            self._channels.setdefault(channel, {})[client_id] = client
+            return True
+
+    def unsubscribe(self, client_id: str, channel: str) -> bool:
+        """Unsubscribe a client from a channel; False if it was not subscribed"""
+        with self._lock:
+            client = self._clients.get(client_id)
+            if client is None or channel not in client.channels:
+                return False
+            client.channels.remove(channel)
+            subscribers = self._channels.get(channel, {})
+            subscribers.pop(client_id, None)
+            if not subscribers:
+                self._channels.pop(channel, None)
+            return True
+
+    def send(self, client_id: str, message: dict[str, Any]) -> bool:
+        """Queue a message for one client, in order with its broadcasts"""
+        with self._lock:
+            client = self._clients.get(client_id)
+        return client is not None and client.enqueue(json.dumps(message))
+
+    def publish(self, message: dict[str, Any]) -> int:
+        """
+        Queue a message for every subscriber of its channel
+
+        Args:
+            message: Message to broadcast (must include 'channel' key)
+
+        Returns:
+            Number of clients the message was queued for
+        """
+        with self._lock:
+            subscribers = self._channels.get(message.get("channel"))
+            if not subscribers:
+                return 0
+            clients = list(subscribers.values())
+            self.messages_published += 1
+
+        payload = json.dumps(message)
+        queued = 0
+        disconnected = []
+        for client in clients:
+            if client.enqueue(payload):
+                queued += 1
+            elif client.closed:
+                disconnected.append(client.id)
+
+        for client_id in disconnected:
+            self.unregister(client_id)
+        return queued
+
+    def clients(self) -> list[WebSocketClient]:
+        with self._lock:
+            return list(self._clients.values())
+
+    def get_client(self, client_id: str) -> WebSocketClient | None:
+        with self._lock:
+            return self._clients.get(client_id)
+
+    def close(self) -> None:
+        """Disconnect every client"""
+        for client in self.clients():
+            self.unregister(client.id)
+
+    def stats(self) -> dict[str, Any]:
+        """Hub statistics"""
+        clients = self.clients()
+        with self._lock:
+            channels = {channel: len(subscribers) for channel, subscribers in self._channels.items()}
+        return {
+            "clients": len(clients),
+            "channels": channels,
+            "messages_published": self.messages_published,
+            "messages_sent": sum(client.sent for client in clients),
+            "messages_dropped": sum(client.dropped for client in clients),
+            "queued": sum(client.queued() for client in clients),
+            "max_queue_size": self.max_queue_size,
+            "slow_client_policy": self.slow_client_policy,
+        }
@@ -395,12 +395,21 @@ def register_contract_routes(routes: "NodeAPIRoutes", sanitizer: Type["InputSani
             return routes._error_response(
                 str(exc), status=400, code="invalid_address", event_type="contracts.invalid_address"
             )
-        state = blockchain.get_contract_state(normalized)
-        if not state:
+        entry = routes.response_cache.get_or_compute(
+            "contract_state",
+            (normalized,),
+            lambda: {
+                "success": True,
+                "contract_address": normalized,
+                "state": blockchain.get_contract_state(normalized),
+            },
+            depends_on_mempool=False,
+        )
+        if not entry.payload["state"]:
             return routes._error_response(
                 "Contract not found", status=404, code="contract_not_found"
             )
-        return routes._success_response({"contract_address": normalized, "state": state})
+        return routes._cached_entry_response(entry)
 
     @app.route("/contracts/<address>/abi", methods=["GET"])
     def contract_abi(address: str) -> tuple[dict[str, Any], int]:
@@ -32,16 +32,16 @@ def register_wallet_routes(routes: "NodeAPIRoutes") -> None:
                 - address (str): The queried address
                 - balance (float): Current balance in XAI tokens
         """
-        balance = blockchain.get_balance(address)
-        balance_base_units = to_base_units(balance)
-        return jsonify(
-            {
+        def _build_balance() -> dict[str, Any]:
+            balance = blockchain.get_balance(address)
+            return {
                 "address": address,
                 "balance": balance,
                 "balance_xai": format_xai(balance),
-                "balance_base_units": str(balance_base_units),
+                "balance_base_units": str(to_base_units(balance)),
             }
-        )
+
+        return routes._cached_json_response("balance", (address,), _build_balance, depends_on_mempool=False)
 
     @app.route("/address/<address>/nonce", methods=["GET"])
     def get_address_nonce(address: str) -> tuple[dict[str, Any], int]:
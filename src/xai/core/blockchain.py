@@ -33,6 +33,7 @@ from xai.core.chain.block_header import BlockHeader, canonical_json
 from xai.core.blockchain_components.block import Block
 from xai.core.blockchain_components.consensus_mixin import BlockchainConsensusMixin
 from xai.core.blockchain_components.governance_mixin import BlockchainGovernanceMixin
+from xai.core.blockchain_components.mempool_index import MempoolFeeIndex
 from xai.core.blockchain_components.mempool_mixin import BlockchainMempoolMixin
 from xai.core.blockchain_components.mining_mixin import BlockchainMiningMixin
 from xai.core.blockchain_components.orphan_mixin import BlockchainOrphanMixin
@@ -76,7 +77,11 @@ from xai.core.governance.governance_transactions import (
 from xai.core.p2p.node_identity import load_or_create_identity
 from xai.core.transactions.nonce_tracker import NonceTracker
 from xai.core.security.security_validation import SecurityEventRouter
-from xai.core.api.structured_logger import StructuredLogger, get_structured_logger
+from xai.core.api.structured_logger import (
+    StructuredLogger,
+    flush_hot_path_logs,
+    get_structured_logger,
+)
 from xai.core.transactions.trading import SwapOrderType
 from xai.core.transaction import Transaction, TransactionValidationError
 from xai.core.consensus.transaction_validator import TransactionValidator
@@ -308,6 +313,7 @@ class Blockchain(
         checkpoint_interval: int = 1000,
         max_checkpoints: int = 10,
         compact_on_startup: bool = False,
+        full_checkpoint_every: int | None = None,
     ) -> None:
         # Initialize logger first so it's available throughout __init__
         self.logger = get_structured_logger()
@@ -352,10 +358,12 @@ class Blockchain(
             compact_on_startup=compact_on_startup,
             checkpoint_interval=checkpoint_interval,
             max_checkpoints=max_checkpoints,
+            full_checkpoint_every=full_checkpoint_every,
         )
         self._init_consensus()
         self._init_mining()
         self._finality_vote_callback: Callable[[Block], None] | None = None
+        self._chain_observers: list[Any] = []
 
         # Initialize manager components for god class refactoring
         # These managers encapsulate specific areas of blockchain functionality
@@ -420,6 +428,7 @@ class Blockchain(
         compact_on_startup: bool,
         checkpoint_interval: int,
         max_checkpoints: int,
+        full_checkpoint_every: int | None = None,
     ) -> None:
         """Initialize storage, disk-backed components, and supporting services."""
         if os.environ.get("PYTEST_CURRENT_TEST") and data_dir == "data":
@@ -449,10 +458,13 @@ class Blockchain(
             self.node_identity = {"private_key": "", "public_key": ""}
 
         # Checkpoints and indexes
+        if full_checkpoint_every is None:
+            full_checkpoint_every = int(getattr(Config, "CHECKPOINT_FULL_EVERY", 1))
         self.checkpoint_manager = CheckpointManager(
             data_dir=data_dir,
             checkpoint_interval=checkpoint_interval,
             max_checkpoints=max_checkpoints,
+            full_checkpoint_every=full_checkpoint_every,
         )
         address_index_path = os.path.join(data_dir, "address_index.db")
         self.address_index = AddressTransactionIndex(address_index_path)
@@ -645,6 +657,10 @@ class Blockchain(
         self._mempool_stats_cache: dict[str, Any] = {}
         self._mempool_stats_cache_time: float = 0.0
         self._mempool_stats_cache_ttl: float = 5.0
+        # Monotonic counter bumped on every mempool change (API response cache key)
+        self._mempool_generation: int = 0
+        # P2 Performance: Fee-rate/package index used for block template assembly
+        self._mempool_index = MempoolFeeIndex()
 
     def _init_governance(self) -> None:
         """Initialize governance state once the chain is loaded."""
@@ -978,6 +994,38 @@ class Blockchain(
                 error_type=type(exc).__name__,
             )
 
+    def add_chain_observer(self, observer: Any) -> None:
+        """
+        Register an observer for mempool admissions and tip changes.
+
+        Observers may implement ``on_transaction_admitted(tx)`` and/or
+        ``on_tip_changed(blockchain)``; missing hooks are skipped.
+        """
+        if observer not in self._chain_observers:
+            self._chain_observers.append(observer)
+
+    def remove_chain_observer(self, observer: Any) -> None:
+        """Unregister a previously added chain observer."""
+        if observer in self._chain_observers:
+            self._chain_observers.remove(observer)
+
+    def _notify_chain_observers(self, hook: str, *args: Any) -> None:
+        """Invoke ``hook`` on every registered observer safely."""
+        for observer in list(getattr(self, "_chain_observers", ())):
+            handler = getattr(observer, hook, None)
+            if handler is None:
+                continue
+            try:
+                handler(*args)
+            except (OSError, RuntimeError, ValueError, TypeError, KeyError, AttributeError) as exc:
+                self.logger.warning(
+                    "Chain observer failed",
+                    hook=hook,
+                    observer=type(observer).__name__,
+                    error=str(exc),
+                    error_type=type(exc).__name__,
+                )
+
     def get_finality_certificate(
         self,
         *,
@@ -1224,6 +1272,7 @@ class Blockchain(
             try:
                 # Restore UTXO set from checkpoint
                 self.utxo_manager.restore(checkpoint.utxo_snapshot)
+                self.checkpoint_manager.resume_delta_chain(checkpoint, self.utxo_manager)
 
                 # Load chain blocks up to checkpoint
                 self.chain = []
@@ -2942,6 +2991,7 @@ class Blockchain(
                     "blocks_reorganized": len(old_chain) - (fork_point + 1) if fork_point is not None else 0,
                 }
             )
+            self._notify_chain_observers("on_tip_changed", self)
 
             return True
 
@@ -3427,6 +3477,10 @@ class Blockchain(
 
         # Submit validator finality vote (if configured)
         self._emit_finality_vote_callback(block)
+        self._notify_chain_observers("on_tip_changed", self)
+
+        # One summary line per block for sampled per-transaction logging
+        flush_hot_path_logs(block_index=block.index)
 
         return True
 
@@ -3665,7 +3719,6 @@ class Blockchain(
         """
         mempool_size_bytes = sum(tx.get_size() for tx in self.pending_transactions) if self.pending_transactions else 0
         latest_block_hash = self.chain[-1].hash if self.chain else ""
-        now = time.time()
 
         return {
             "chain_height": len(self.chain),
@@ -3676,6 +3729,16 @@ class Blockchain(
             "difficulty": self.difficulty,
             "mempool_size_bytes": mempool_size_bytes,
             "latest_block_hash": latest_block_hash,
+            **self.get_live_stats(),
+        }
+
+    def get_live_stats(self) -> dict[str, Any]:
+        """
+        Return the get_stats() fields that change without a new block or
+        mempool change (clock, rejection counters, expiring bans).
+        """
+        now = time.time()
+        return {
             "timestamp": now,
             "mempool_rejected_invalid_total": self._mempool_rejected_invalid_total,
             "mempool_rejected_banned_total": self._mempool_rejected_banned_total,
@@ -8,6 +8,7 @@ monolithic blockchain.py file.
 from xai.core.blockchain_components.block import Block
 from xai.core.blockchain_components.consensus_mixin import BlockchainConsensusMixin
 from xai.core.blockchain_components.governance_mixin import BlockchainGovernanceMixin
+from xai.core.blockchain_components.mempool_index import MempoolFeeIndex
 from xai.core.blockchain_components.mempool_mixin import BlockchainMempoolMixin
 from xai.core.blockchain_components.mining_mixin import BlockchainMiningMixin
 from xai.core.blockchain_components.orphan_mixin import BlockchainOrphanMixin
@@ -21,4 +22,5 @@ __all__ = [
     "BlockchainMiningMixin",
     "BlockchainOrphanMixin",
     "BlockchainTradingMixin",
+    "MempoolFeeIndex",
 ]
@@ -0,0 +1,670 @@
+"""
+Fee-Rate Mempool Index for XAI Blockchain
+
+Incrementally maintained index over pending transactions used for block
+template assembly:
+- Per-sender nonce chains and in-mempool UTXO parent links
+- Ancestor-package fee rates, so a high-fee child pulls its low-fee parents
+  into the block with it (child-pays-for-parent), kept as prefix sums along
+  each sender's nonce chain and recomputed lazily from the first changed
+  position
+- A persistent max-heap keyed by package fee rate; taking the top N
+  transactions costs O(N log M) instead of re-sorting the whole mempool
+"""
+
+from __future__ import annotations
+
+import bisect
+import heapq
+import itertools
+import threading
+from typing import TYPE_CHECKING, Any, Iterable, Iterator
+
+if TYPE_CHECKING:
+    from xai.core.transaction import Transaction
+
+
+class _Entry:
+    """Index node for one pending transaction."""
+
+    __slots__ = (
+        "tx", "txid", "sender", "nonce", "fee", "size", "seq",
+        "utxo_parents", "nonce_parent", "children", "anc_fee", "anc_size", "version",
+        "chain_fee", "chain_size", "linked",
+    )
+
+    def __init__(self, tx: "Transaction", seq: int):
+        self.tx = tx
+        self.txid: str = tx.txid
+        sender = getattr(tx, "sender", None)
+        self.sender: str | None = sender if sender and sender != "COINBASE" else None
+        nonce = getattr(tx, "nonce", None)
+        self.nonce: int = nonce if nonce is not None else 0
+        self.fee: float = float(getattr(tx, "fee", 0.0) or 0.0)
+        get_size = getattr(tx, "get_size", None)
+        self.size: int = int(get_size()) if callable(get_size) else 0
+        self.seq = seq
+        self.utxo_parents: set[str] = set()
+        self.nonce_parent: str | None = None
+        self.children: set[str] = set()
+        # Totals over this transaction and all of its in-mempool ancestors
+        self.anc_fee = self.fee
+        self.anc_size = self.size
+        self.version = 0
+        # Prefix sums over the sender's nonce chain up to and including this
+        # transaction, and whether any transaction in that prefix has parents
+        # outside the chain (then the package is not just the prefix)
+        self.chain_fee = self.fee
+        self.chain_size = self.size
+        self.linked = False
+
+    @property
+    def key(self) -> tuple[int, int, str]:
+        return (self.nonce, self.seq, self.txid)
+
+    def parents(self) -> set[str]:
+        if self.nonce_parent is None:
+            return self.utxo_parents
+        return self.utxo_parents | {self.nonce_parent}
+
+
+def _score(fee: float, size: int) -> float:
+    return fee / size if size > 0 else 0.0
+
+
+class MempoolFeeIndex:
+    """
+    Fee-rate index with per-sender nonce chains and ancestor packages.
+
+    Transactions are linked to their in-mempool parents: the transactions
+    whose outputs they spend, and the same sender's transaction with the
+    next-lower nonce. Every entry tracks the fee and size of its ancestor
+    package, and the heap orders entries by package fee rate. Stale heap
+    items are discarded lazily when popped.
+
+    For a transaction whose nonce chain prefix spends no outputs of other
+    senders' pending transactions (the common case), the ancestor package is
+    exactly that prefix, so its totals are the chain's prefix sums. Changes
+    only record the first affected position per sender; the suffix from
+    there is recomputed once, before the next selection. Inserting a
+    thousand nonces in shuffled order therefore costs one pass over the
+    chain instead of one per insertion. Only prefixes with cross-sender
+    parents fall back to walking the ancestor graph.
+
+    Thread-safe; all public methods take the index lock.
+    """
+
+    def __init__(self) -> None:
+        self._entries: dict[str, _Entry] = {}
+        self._by_sender: dict[str, list[tuple[int, int, str]]] = {}
+        # Children whose inputs reference a txid that is not (yet) indexed
+        self._waiting: dict[str, set[str]] = {}
+        self._heap: list[tuple[float, int, int, str]] = []
+        # First changed chain key per sender, and changed sender-less entries
+        self._dirty: dict[str, tuple[int, int, str]] = {}
+        self._dirty_loose: set[str] = set()
+        self._seq = itertools.count()
+        self._lock = threading.RLock()
+        self._generation = 0
+        self._template_key: tuple[int, int | None] | None = None
+        self._template: list["Transaction"] = []
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, txid: str) -> bool:
+        return txid in self._entries
+
+    @property
+    def generation(self) -> int:
+        """Counter bumped whenever the indexed set changes."""
+        return self._generation
+
+    # ==================== MAINTENANCE ====================
+
+    def add(self, tx: "Transaction") -> bool:
+        """
+        Index a transaction.
+
+        Returns:
+            True if the transaction was added, False if already indexed
+        """
+        txid = getattr(tx, "txid", None)
+        with self._lock:
+            if not txid or txid in self._entries:
+                return False
+            entry = _Entry(tx, next(self._seq))
+            self._entries[txid] = entry
+            self._generation += 1
+
+            for tx_input in getattr(tx, "inputs", None) or []:
+                parent_txid = tx_input.get("txid") if isinstance(tx_input, dict) else None
+                if not parent_txid:
+                    continue
+                parent = self._entries.get(parent_txid)
+                if parent is not None and parent is not entry:
+                    entry.utxo_parents.add(parent_txid)
+                    parent.children.add(txid)
+                else:
+                    self._waiting.setdefault(parent_txid, set()).add(txid)
+
+            if entry.sender is not None:
+                chain = self._by_sender.setdefault(entry.sender, [])
+                key = (entry.nonce, entry.seq, txid)
+                pos = bisect.bisect(chain, key)
+                if pos > 0:
+                    pred = self._entries[chain[pos - 1][2]]
+                    entry.nonce_parent = pred.txid
+                    pred.children.add(txid)
+                if pos < len(chain):
+                    # Inserted below an existing transaction: relink the successor
+                    succ = self._entries[chain[pos][2]]
+                    if succ.nonce_parent is not None and succ.nonce_parent not in succ.utxo_parents:
+                        self._entries[succ.nonce_parent].children.discard(succ.txid)
+                    succ.nonce_parent = txid
+                    entry.children.add(succ.txid)
+                chain.insert(pos, key)
+            # Package totals of this entry and everything after it in its
+            # chain are recomputed by the next _flush()
+            self._mark_dirty(entry)
+
+            # Transactions that arrived before this parent
+            for child_txid in self._waiting.pop(txid, ()):
+                child = self._entries.get(child_txid)
+                if child is not None:
+                    child.utxo_parents.add(txid)
+                    entry.children.add(child_txid)
+                    self._mark_dirty(child)
+            return True
+
+    def remove(self, txid: str) -> bool:
+        """
+        Remove a transaction from the index (mined, evicted or replaced).
+
+        Returns:
+            True if the transaction was indexed
+        """
+        with self._lock:
+            entry = self._entries.get(txid)
+            if entry is None:
+                return False
+
+            del self._entries[txid]
+            self._generation += 1
+            self._dirty_loose.discard(txid)
+
+            for parent_txid in entry.parents():
+                parent = self._entries.get(parent_txid)
+                if parent is not None:
+                    parent.children.discard(txid)
+            for tx_input in getattr(entry.tx, "inputs", None) or []:
+                parent_txid = tx_input.get("txid") if isinstance(tx_input, dict) else None
+                waiting = self._waiting.get(parent_txid) if parent_txid else None
+                if waiting is not None:
+                    waiting.discard(txid)
+                    if not waiting:
+                        del self._waiting[parent_txid]
+            for child_txid in entry.children:
+                child = self._entries[child_txid]
+                if txid in child.utxo_parents:
+                    child.utxo_parents.discard(txid)
+                    self._waiting.setdefault(txid, set()).add(child_txid)
+                if child.nonce_parent == txid:
+                    child.nonce_parent = None
+                self._mark_dirty(child)
+
+            if entry.sender is not None:
+                chain = self._by_sender[entry.sender]
+                pos = bisect.bisect_left(chain, (entry.nonce, entry.seq, txid))
+                del chain[pos]
+                if 0 < pos < len(chain):
+                    # Close the gap; the predecessor was already an ancestor
+                    pred = self._entries[chain[pos - 1][2]]
+                    succ = self._entries[chain[pos][2]]
+                    succ.nonce_parent = pred.txid
+                    pred.children.add(succ.txid)
+                if chain:
+                    self._mark_dirty(entry)  # Suffix from the removed position
+                else:
+                    del self._by_sender[entry.sender]
+                    self._dirty.pop(entry.sender, None)
+
+            if len(self._heap) > 2 * len(self._entries) + 64:
+                self._rebuild_heap()
+            return True
+
+    def sync(self, transactions: Iterable["Transaction"]) -> None:
+        """
+        Reconcile the index with an authoritative transaction list.
+
+        Only the difference is applied, so the cost is a set comparison plus
+        O(log M) per changed transaction. This keeps the index correct even
+        when callers replace the pending list wholesale (reorgs, restores).
+        """
+        current: dict[str, "Transaction"] = {}
+        for tx in transactions:
+            txid = getattr(tx, "txid", None)
+            if txid:
+                current.setdefault(txid, tx)
+        with self._lock:
+            for txid in [t for t, e in self._entries.items() if current.get(t) is not e.tx]:
+                self.remove(txid)
+            if len(current) != len(self._entries):
+                for txid, tx in current.items():
+                    if txid not in self._entries:
+                        self.add(tx)
+
+    def clear(self) -> None:
+        """Drop every indexed transaction."""
+        with self._lock:
+            self._entries.clear()
+            self._by_sender.clear()
+            self._waiting.clear()
+            self._dirty.clear()
+            self._dirty_loose.clear()
+            self._heap = []
+            self._generation += 1
+
+    # ==================== TEMPLATE ASSEMBLY ====================
+
+    def select(self, max_count: int | None = None, max_bytes: int | None = None) -> list["Transaction"]:
+        """
+        Pick transactions for a block by ancestor-package fee rate.
+
+        Collects iter_select() into a list. The result for a given
+        ``max_count`` is reused until the indexed set changes.
+
+        Args:
+            max_count: Maximum number of transactions (None = all)
+            max_bytes: Maximum combined transaction size (None = unlimited)
+
+        Returns:
+            Ordered list of transactions
+        """
+        with self._lock:
+            if max_bytes is None:
+                key = (self._generation, max_count)
+                if self._template_key == key:
+                    return list(self._template)
+            selection = self.iter_select(max_count=max_count, max_bytes=max_bytes)
+            try:
+                result = list(selection)
+            finally:
+                selection.close()
+            if max_bytes is None:
+                self._template_key = (self._generation, max_count)
+                self._template = list(result)
+            return result
+
+    def iter_select(self, max_count: int | None = None, max_bytes: int | None = None) -> Iterator["Transaction"]:
+        """
+        Yield transactions for a block by ancestor-package fee rate, lazily.
+
+        A transaction is only yielded after all of its in-mempool ancestors,
+        so the sequence is already topologically ordered (UTXO parents first,
+        nonces ascending per sender). Packages are chosen only as the caller
+        consumes them, so a caller that stops once its block is full pays
+        O(N log M) for the N transactions it took, not for the whole pool.
+
+        Once a package is chosen, its remaining descendants are re-scored
+        without it:
+        - Plain nonce-chain descendants (no cross-sender parents in their
+          prefix) are re-scored lazily, as the difference of two prefix sums,
+          when their stale heap item reaches the top. Choosing the best
+          package can only lower their rate, so a stale item never sorts too
+          low. Packages spanning several chains can raise it; those chains
+          are re-scored eagerly.
+        - Other descendants are found with one walk per package that skips
+          chain stretches with no such descendants below them, and lose the
+          totals of exactly those package members that are their ancestors.
+
+        The index lock is held until the iterator is exhausted or closed;
+        close it (e.g. with contextlib.closing) when stopping early.
+
+        Args:
+            max_count: Maximum number of transactions (None = all)
+            max_bytes: Maximum combined transaction size (None = unlimited)
+
+        Yields:
+            Transactions in block order
+        """
+        with self._lock:
+            self._flush()
+
+            limit = len(self._entries) if max_count is None else min(max_count, len(self._entries))
+            heap = self._heap
+            selected: set[str] = set()
+            skipped: set[str] = set()
+            # Package totals of descendants re-scored eagerly
+            modified: dict[str, tuple[float, int]] = {}
+            mod_heap: list[tuple[float, int, int, str]] = []
+            # Prefix totals of the selected part of each sender's chain
+            chain_selected: dict[str, tuple[tuple[int, int, str], float, int]] = {}
+            # Chain entries with descendants outside plain chain prefixes
+            reaches_linked: dict[str, bool] = {}
+            popped: list[tuple[float, int, int, str]] = []
+            count = 0
+            total_bytes = 0
+
+            def current(entry: _Entry) -> tuple[float, int]:
+                """Package totals of ``entry`` without the selected transactions."""
+                totals = modified.get(entry.txid)
+                if totals is not None:
+                    return totals
+                if entry.sender is not None and not entry.linked:
+                    base = chain_selected.get(entry.sender)
+                    if base is not None:
+                        return (entry.chain_fee - base[1], entry.chain_size - base[2])
+                return (entry.anc_fee, entry.anc_size)
+
+            try:
+                while count < limit:
+                    while heap:
+                        item = heap[0]
+                        entry = self._entries.get(item[3])
+                        if entry is None or entry.version != item[2]:
+                            heapq.heappop(heap)
+                            continue
+                        if item[3] in selected or item[3] in skipped:
+                            popped.append(heapq.heappop(heap))
+                            continue
+                        break
+                    while mod_heap and (mod_heap[0][3] in selected or mod_heap[0][3] in skipped):
+                        heapq.heappop(mod_heap)
+
+                    if heap and (not mod_heap or heap[0] < mod_heap[0]):
+                        item = heapq.heappop(heap)
+                        popped.append(item)
+                    elif mod_heap:
+                        item = heapq.heappop(mod_heap)
+                    else:
+                        break
+
+                    entry = self._entries[item[3]]
+                    score = -_score(*current(entry))
+                    if score != item[0]:
+                        # Stale: eagerly re-scored entries already have a
+                        # current item; chain entries are re-queued now
+                        if entry.txid not in modified:
+                            heapq.heappush(mod_heap, (score, entry.seq, 0, entry.txid))
+                        continue
+
+                    package = self._ancestors_in_order(entry, selected)
+                    package.append(entry)
+                    package_bytes = sum(e.size for e in package)
+                    if count + len(package) > limit or (
+                        max_bytes is not None and total_bytes + package_bytes > max_bytes
+                    ):
+                        skipped.add(entry.txid)
+                        continue
+
+                    senders: set[str] = set()
+                    for member in package:
+                        selected.add(member.txid)
+                        modified.pop(member.txid, None)
+                        if member.sender is not None:
+                            senders.add(member.sender)
+                            last = chain_selected.get(member.sender)
+                            if last is None or member.key > last[0]:
+                                chain_selected[member.sender] = (member.key, member.chain_fee, member.chain_size)
+                    count += len(package)
+                    total_bytes += package_bytes
+
+                    if entry.sender is None or entry.linked:
+                        # The package spans chains, so plain chain members
+                        # after it may now rate higher: re-score them now
+                        for sender in senders:
+                            chain = self._by_sender[sender]
+                            for _, _, txid in chain[bisect.bisect_right(chain, chain_selected[sender][0]):]:
+                                desc = self._entries[txid]
+                                if desc.linked:
+                                    break
+                                heapq.heappush(mod_heap, (-_score(*current(desc)), desc.seq, 0, txid))
+                    for desc, fee, size in self._linked_descendants(package, selected, reaches_linked):
+                        fee, size = (t - d for t, d in zip(current(desc), (fee, size)))
+                        modified[desc.txid] = (fee, size)
+                        heapq.heappush(mod_heap, (-_score(fee, size), desc.seq, 0, desc.txid))
+
+                    for member in package:
+                        yield member.tx
+            finally:
+                for item in popped:
+                    entry = self._entries.get(item[3])
+                    if entry is not None and entry.version == item[2]:
+                        heapq.heappush(heap, item)
+
+    def prioritize(self, transactions: Iterable["Transaction"], max_count: int | None = None) -> list["Transaction"]:
+        """Reconcile with ``transactions`` and select from them atomically."""
+        with self._lock:
+            self.sync(transactions)
+            return self.select(max_count=max_count)
+
+    def get_statistics(self) -> dict[str, Any]:
+        """Return index size and heap health."""
+        with self._lock:
+            return {
+                "transactions": len(self._entries),
+                "senders": len(self._by_sender),
+                "heap_size": len(self._heap),
+                "waiting_parents": len(self._waiting),
+                "dirty_senders": len(self._dirty),
+                "generation": self._generation,
+            }
+
+    # ==================== INTERNALS ====================
+
+    def _push(self, entry: _Entry) -> None:
+        entry.version += 1
+        heapq.heappush(self._heap, (-_score(entry.anc_fee, entry.anc_size), entry.seq, entry.version, entry.txid))
+
+    def _rebuild_heap(self) -> None:
+        self._heap = [
+            (-_score(e.anc_fee, e.anc_size), e.seq, e.version, e.txid) for e in self._entries.values()
+        ]
+        heapq.heapify(self._heap)
+
+    def _mark_dirty(self, entry: _Entry) -> None:
+        """Schedule package totals of ``entry`` (and its chain suffix) for recomputation."""
+        if entry.sender is None:
+            self._dirty_loose.add(entry.txid)
+            return
+        current = self._dirty.get(entry.sender)
+        key = entry.key
+        if current is None or key < current:
+            self._dirty[entry.sender] = key
+
+    def _flush(self) -> None:
+        """
+        Recompute package totals for every change since the last flush.
+
+        Each dirty chain is walked once from its first changed position,
+        extending the prefix sums of the entry before it. When an entry's
+        totals change, children in other chains (which spend its outputs)
+        are marked dirty in turn; recomputation is idempotent, so this stops
+        once totals settle, even on dependency cycles.
+        """
+        while self._dirty or self._dirty_loose:
+            dirty, self._dirty = self._dirty, {}
+            loose, self._dirty_loose = self._dirty_loose, set()
+
+            for sender, start_key in dirty.items():
+                chain = self._by_sender.get(sender)
+                if not chain:
+                    continue
+                pos = bisect.bisect_left(chain, start_key)
+                if pos > 0:
+                    prev = self._entries[chain[pos - 1][2]]
+                    fee, size, linked = prev.chain_fee, prev.chain_size, prev.linked
+                else:
+                    fee, size, linked = 0.0, 0, False
+                for _, _, txid in chain[pos:]:
+                    entry = self._entries[txid]
+                    fee += entry.fee
+                    size += entry.size
+                    linked = linked or self._has_external_parents(entry)
+                    entry.chain_fee, entry.chain_size, entry.linked = fee, size, linked
+                    if linked:
+                        changed = self._refresh(entry)
+                    else:
+                        changed = self._set_package(entry, fee, size)
+                    if changed:
+                        self._mark_external_children(entry)
+
+            for txid in loose:
+                entry = self._entries.get(txid)
+                if entry is not None and self._refresh(entry):
+                    self._mark_external_children(entry)
+
+    def _has_external_parents(self, entry: _Entry) -> bool:
+        """True if ``entry`` spends outputs of pending transactions outside its chain prefix."""
+        for parent_txid in entry.utxo_parents:
+            parent = self._entries.get(parent_txid)
+            if parent is not None and (parent.sender != entry.sender or parent.key > entry.key):
+                return True
+        return False
+
+    def _mark_external_children(self, entry: _Entry) -> None:
+        """Mark children not covered by the walk along ``entry``'s own chain."""
+        for child_txid in entry.children:
+            child = self._entries.get(child_txid)
+            if child is not None and (
+                entry.sender is None or child.sender != entry.sender or child.key < entry.key
+            ):
+                self._mark_dirty(child)
+
+    def _set_package(self, entry: _Entry, fee: float, size: int) -> bool:
+        """Store package totals; push a heap item if they changed (or were never pushed)."""
+        if entry.version and entry.anc_fee == fee and entry.anc_size == size:
+            return False
+        entry.anc_fee = fee
+        entry.anc_size = size
+        self._push(entry)
+        return True
+
+    def _refresh(self, entry: _Entry) -> bool:
+        """Recompute ancestor package totals by walking the ancestor graph."""
+        fee = entry.fee
+        size = entry.size
+        for ancestor in self._ancestors(entry):
+            fee += ancestor.fee
+            size += ancestor.size
+        return self._set_package(entry, fee, size)
+
+    def _ancestors(self, entry: _Entry) -> list[_Entry]:
+        seen: set[str] = {entry.txid}
+        stack = list(entry.parents())
+        found: list[_Entry] = []
+        while stack:
+            txid = stack.pop()
+            if txid in seen:
+                continue
+            seen.add(txid)
+            parent = self._entries.get(txid)
+            if parent is None:
+                continue
+            found.append(parent)
+            stack.extend(parent.parents())
+        return found
+
+    def _linked_descendants(
+        self, package: list[_Entry], exclude: set[str], reaches_linked: dict[str, bool]
+    ) -> list[tuple[_Entry, float, int]]:
+        """
+        Descendants of ``package`` that are not plain nonce-chain entries.
+
+        Plain chain entries are passed through only if something below them
+        qualifies; ``reaches_linked`` memoizes that per entry, computed once
+        per chain suffix, so long chains are not re-walked per package.
+
+        Returns:
+            (descendant, fee, size) with the totals of the package members
+            among its ancestors. These are found in one topological pass
+            that carries a bitmask of package members per transaction.
+        """
+        bits = {member.txid: 1 << i for i, member in enumerate(package)}
+        masks: dict[str, int] = {}
+        for member in package:  # Already in dependency order
+            mask = bits[member.txid]
+            for parent_txid in member.parents():
+                mask |= masks.get(parent_txid, 0)
+            masks[member.txid] = mask
+
+        reached: dict[str, _Entry] = {}
+        stack = [txid for member in package for txid in member.children]
+        while stack:
+            txid = stack.pop()
+            if txid in reached or txid in exclude:
+                continue
+            child = self._entries.get(txid)
+            if child is None:
+                continue
+            reached[txid] = child
+            if child.sender is None or child.linked or self._reaches_linked(child, reaches_linked):
+                stack.extend(child.children)
+
+        pending = {
+            txid: sum(1 for parent_txid in entry.parents() if parent_txid in reached)
+            for txid, entry in reached.items()
+        }
+        ready = [txid for txid, count in pending.items() if count == 0]
+        found: list[tuple[_Entry, float, int]] = []
+        while ready:
+            txid = ready.pop()
+            entry = reached[txid]
+            mask = 0
+            for parent_txid in entry.parents():
+                mask |= masks.get(parent_txid, 0)
+            masks[txid] = mask
+            if entry.sender is None or entry.linked:
+                fee, size = 0.0, 0
+                for i, member in enumerate(package):
+                    if mask >> i & 1:
+                        fee += member.fee
+                        size += member.size
+                found.append((entry, fee, size))
+            for child_txid in entry.children:
+                if child_txid in pending:
+                    pending[child_txid] -= 1
+                    if pending[child_txid] == 0:
+                        ready.append(child_txid)
+        return found
+
+    def _reaches_linked(self, entry: _Entry, memo: dict[str, bool]) -> bool:
+        """True if a plain chain entry has descendants outside plain chain prefixes."""
+        if entry.txid not in memo:
+            # Memoized entries form a tail of the chain; fill in the rest up to it
+            chain = self._by_sender[entry.sender]
+            start = end = bisect.bisect_left(chain, entry.key)
+            while end < len(chain) and chain[end][2] not in memo:
+                end += 1
+            below = memo[chain[end][2]] if end < len(chain) else False
+            for _, _, txid in reversed(chain[start:end]):
+                member = self._entries[txid]
+                for child_txid in member.children:
+                    child = self._entries.get(child_txid)
+                    if child is not None and (child.sender != member.sender or child.linked):
+                        below = True
+                memo[txid] = below
+        return memo[entry.txid]
+
+    def _ancestors_in_order(self, entry: _Entry, exclude: set[str]) -> list[_Entry]:
+        """Ancestors of ``entry`` not in ``exclude``, in dependency order (parents first)."""
+        ordered: list[_Entry] = []
+        done: set[str] = {entry.txid}
+        visiting: set[str] = set()
+        stack: list[tuple[_Entry, bool]] = [(entry, False)]
+        while stack:
+            node, expanded = stack.pop()
+            if expanded:
+                done.add(node.txid)
+                if node is not entry:
+                    ordered.append(node)
+                continue
+            if node.txid in visiting or (node is not entry and node.txid in done):
+                continue
+            visiting.add(node.txid)
+            stack.append((node, True))
+            parents = [self._entries[t] for t in node.parents() if t in self._entries and t not in exclude]
+            parents.sort(key=lambda e: e.seq, reverse=True)
+            stack.extend((parent, False) for parent in parents if parent.txid not in done)
+        return ordered
@@ -8,17 +8,123 @@ pruning, RBF handling, fee prioritization, and mempool statistics.
 
 from __future__ import annotations
 
+import copy
 import statistics
 import threading
 import time
 from collections import defaultdict
-from typing import TYPE_CHECKING, Any
+from collections.abc import Callable, Iterable, Iterator
+from typing import TYPE_CHECKING, Any, SupportsIndex
 
+from xai.core.api.structured_logger import HotPathLogger, get_hot_path_logger
+from xai.core.blockchain_components.mempool_index import MempoolFeeIndex
 from xai.core.constants import MINIMUM_TRANSACTION_AMOUNT
 
 if TYPE_CHECKING:
     from xai.core.transaction import Transaction
 
+PendingChangeCallback = Callable[[Iterable["Transaction"], Iterable["Transaction"], bool], None]
+
+
+class PendingTransactionList(list):
+    """
+    List of pending transactions that reports every mutation to its owner.
+
+    ``pending_transactions`` is appended to, filtered and reassigned from many
+    places (mining, reorgs, orphan handling, persistence, P2P). Reporting the
+    changes from the list itself keeps derived mempool state, such as the
+    generation counter used to key API responses, in step with all of them.
+
+    The callback receives ``(added, removed, reordered_only)``. Copies and
+    pickles are plain lists, so snapshots never carry the owner along.
+    """
+
+    __slots__ = ("_on_change",)
+
+    def __init__(self, iterable: Iterable["Transaction"] = (), on_change: PendingChangeCallback | None = None):
+        super().__init__(iterable)
+        self._on_change = on_change
+
+    def detach(self) -> None:
+        """Stop reporting changes (the owner has replaced this list)."""
+        self._on_change = None
+
+    def _changed(self, added: Iterable["Transaction"] = (), removed: Iterable["Transaction"] = (), reordered: bool = False) -> None:
+        if self._on_change is not None:
+            self._on_change(added, removed, reordered)
+
+    def append(self, tx: "Transaction") -> None:
+        super().append(tx)
+        self._changed(added=(tx,))
+
+    def extend(self, txs: Iterable["Transaction"]) -> None:
+        items = list(txs)
+        super().extend(items)
+        self._changed(added=items)
+
+    def insert(self, index: SupportsIndex, tx: "Transaction") -> None:
+        super().insert(index, tx)
+        self._changed(added=(tx,))
+
+    def remove(self, tx: "Transaction") -> None:
+        super().remove(tx)
+        self._changed(removed=(tx,))
+
+    def pop(self, index: SupportsIndex = -1) -> "Transaction":
+        tx = super().pop(index)
+        self._changed(removed=(tx,))
+        return tx
+
+    def clear(self) -> None:
+        removed = list(self)
+        super().clear()
+        self._changed(removed=removed)
+
+    def __setitem__(self, index, value) -> None:
+        if isinstance(index, slice):
+            removed = super().__getitem__(index)
+            value = list(value)
+            super().__setitem__(index, value)
+            self._changed(added=value, removed=removed)
+        else:
+            removed = super().__getitem__(index)
+            super().__setitem__(index, value)
+            self._changed(added=(value,), removed=(removed,))
+
+    def __delitem__(self, index) -> None:
+        removed = super().__getitem__(index)
+        super().__delitem__(index)
+        self._changed(removed=removed if isinstance(index, slice) else (removed,))
+
+    def __iadd__(self, txs: Iterable["Transaction"]) -> PendingTransactionList:
+        self.extend(txs)
+        return self
+
+    def __imul__(self, count: SupportsIndex) -> PendingTransactionList:
+        if int(count) <= 0:
+            self.clear()
+        else:
+            self.extend(list(self) * (int(count) - 1))
+        return self
+
+    def sort(self, *args: Any, **kwargs: Any) -> None:
+        super().sort(*args, **kwargs)
+        self._changed(reordered=True)
+
+    def reverse(self) -> None:
+        super().reverse()
+        self._changed(reordered=True)
+
+    def __copy__(self) -> list["Transaction"]:
+        return list(self)
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> list["Transaction"]:
+        return copy.deepcopy(list(self), memo)
+
+    def __reduce_ex__(self, protocol: SupportsIndex) -> tuple[Any, ...]:
+        return (list, (list(self),))
+
+
 class BlockchainMempoolMixin:
     """
     Mixin providing mempool management functionality for the Blockchain class.
@@ -33,7 +139,7 @@ class BlockchainMempoolMixin:
     - Mempool statistics and overview
 
     Required attributes on the implementing class:
-    - pending_transactions: list[Transaction]
+    - pending_transactions: list[Transaction]  # Stored as a PendingTransactionList
     - orphan_transactions: list[Transaction]
     - seen_txids: set[str]
     - _sender_pending_count: dict[str, int]
@@ -56,12 +162,50 @@ class BlockchainMempoolMixin:
     - _mempool_stats_cache: dict[str, Any]  # Cached stats for O(1) lookups
     - _mempool_stats_cache_time: float  # Last cache update time
     - _mempool_stats_cache_ttl: float  # Cache TTL in seconds
+    - _mempool_generation: int  # Bumped on every mempool change
+    - _mempool_index: MempoolFeeIndex  # Fee-rate index for block templates (created lazily)
+    - _mempool_index_synced: bool  # Index mirrors pending_transactions (set lazily)
     - utxo_manager: UTXOManager
     - transaction_validator: TransactionValidator
     - nonce_tracker: NonceTracker
     - logger: StructuredLogger
     """
 
+    @property
+    def pending_transactions(self) -> PendingTransactionList:
+        """Pending transactions; every mutation bumps the mempool generation."""
+        return self._pending_transactions
+
+    @pending_transactions.setter
+    def pending_transactions(self, transactions: Iterable[Transaction]) -> None:
+        previous = getattr(self, "_pending_transactions", None)
+        if isinstance(previous, PendingTransactionList):
+            previous.detach()
+        self._pending_transactions = PendingTransactionList(transactions, self._pending_transactions_changed)
+        # Reconciled with the new list on the next _prioritize_transactions()
+        self._mempool_index_synced = False
+        self._pending_transactions_changed((), (), False)
+
+    def _pending_transactions_changed(
+        self,
+        added: Iterable[Transaction],
+        removed: Iterable[Transaction],
+        reordered: bool,
+    ) -> None:
+        """Keep derived mempool state in step with ``pending_transactions``."""
+        self._invalidate_mempool_stats_cache()
+        if getattr(self, "_mempool_index_synced", False):
+            index = self._get_mempool_index()
+            for tx in removed:
+                index.remove(tx.txid)
+            for tx in added:
+                index.add(tx)
+
+    @property
+    def _hot_log(self) -> HotPathLogger:
+        """Sampled logger for per-transaction admission events."""
+        return get_hot_path_logger(self.logger)
+
     def _prune_expired_mempool(self, current_time: float) -> int:
         """
         Expire old transactions and rebuild mempool indexes to keep counters accurate.
@@ -338,7 +482,7 @@ class BlockchainMempoolMixin:
             self.logger.warn("Attempted to add a None transaction")
             return False
 
-        self.logger.info("Attempting to add new transaction", txid=transaction.txid)
+        self._hot_log.info("mempool.add_attempt", "Attempting to add new transaction", txid=transaction.txid)
         # Periodically clean up old transactions from mempool and orphan pool
         current_time = time.time()
         self._prune_expired_mempool(current_time)
@@ -365,7 +509,8 @@ class BlockchainMempoolMixin:
                 return False
 
             if self._is_sender_banned(getattr(transaction, "sender", None), current_time):
-                self.logger.warn(
+                self._hot_log.warn(
+                    "mempool.rejected_banned",
                     "Transaction rejected: sender temporarily banned for repeated invalid submissions",
                     sender=getattr(transaction, "sender", None),
                     txid=transaction.txid,
@@ -435,7 +580,11 @@ class BlockchainMempoolMixin:
                         # Check if transaction is not already in orphan pool
                         if not any(orphan.txid == transaction.txid for orphan in self.orphan_transactions):
                             self.orphan_transactions.append(transaction)
-                            self.logger.info(f"Transaction {transaction.txid[:10]}... added to orphan pool (missing UTXOs)")
+                            self._hot_log.info(
+                                "mempool.orphaned",
+                                "Transaction %.10s... added to orphan pool (missing UTXOs)",
+                                transaction.txid, txid=transaction.txid,
+                            )
                     # Unlock UTXOs since transaction not accepted to mempool
                     if transaction.inputs:
                         utxo_keys = [(inp["txid"], inp["vout"]) for inp in transaction.inputs]
@@ -443,7 +592,11 @@ class BlockchainMempoolMixin:
                     return False
                 else:
                     # Validation failed for other reasons, reject transaction
-                    self.logger.warn(f"Transaction {transaction.txid[:10]}... rejected (validation failed for other reasons)")
+                    self._hot_log.warn(
+                        "mempool.rejected_invalid",
+                        "Transaction %.10s... rejected (validation failed for other reasons)",
+                        transaction.txid, txid=transaction.txid,
+                    )
                     self._record_invalid_sender_attempt(transaction.sender, current_time)
                     self._mempool_rejected_invalid_total += 1
                     # Unlock UTXOs since transaction rejected
@@ -464,7 +617,8 @@ class BlockchainMempoolMixin:
             # Double-spend detection: O(1) check using spent_inputs set
             # This check is atomic with validation - prevents TOCTOU race
             if self._check_double_spend(transaction):
-                self.logger.warn(
+                self._hot_log.warn(
+                    "mempool.double_spend",
                     "Double-spend detected: Transaction inputs already spent in mempool",
                     txid=transaction.txid,
                     sender=transaction.sender,
@@ -485,7 +639,11 @@ class BlockchainMempoolMixin:
             # Enforce per-sender cap
             if transaction.sender and transaction.sender != "COINBASE":
                 if self._sender_pending_count.get(transaction.sender, 0) >= getattr(self, "_mempool_max_per_sender", 100):
-                    self.logger.warn(f"Transaction {transaction.txid[:10]}... rejected (sender cap exceeded)")
+                    self._hot_log.warn(
+                        "mempool.rejected_sender_cap",
+                        "Transaction %.10s... rejected (sender cap exceeded)",
+                        transaction.txid, txid=transaction.txid,
+                    )
                     self._mempool_rejected_sender_cap_total += 1
                     return False
 
@@ -512,7 +670,11 @@ class BlockchainMempoolMixin:
                                 )
                             self._mempool_evicted_low_fee_total += 1
                             eviction_performed = True
-                            self.logger.info(f"Evicted transaction {lowest.txid[:10]}... from mempool (low fee rate)")
+                            self._hot_log.info(
+                                "mempool.evicted_low_fee",
+                                "Evicted transaction %.10s... from mempool (low fee rate)",
+                                lowest.txid, txid=lowest.txid,
+                            )
                         except ValueError as exc:
                             self.logger.error(
                                 "Failed to evict low-fee transaction due to inconsistent mempool state",
@@ -521,13 +683,19 @@ class BlockchainMempoolMixin:
                                 extra={"event": "mempool.eviction_failed"},
                             )
                         if not eviction_performed:
-                            self.logger.warn(
-                                f"Transaction {transaction.txid[:10]}... rejected (mempool full, eviction failed)"
+                            self._hot_log.warn(
+                                "mempool.rejected_low_fee",
+                                "Transaction %.10s... rejected (mempool full, eviction failed)",
+                                transaction.txid, txid=transaction.txid,
                             )
                             self._mempool_rejected_low_fee_total += 1
                             return False
                     else:
-                        self.logger.warn(f"Transaction {transaction.txid[:10]}... rejected (mempool full, low fee rate)")
+                        self._hot_log.warn(
+                            "mempool.rejected_low_fee",
+                            "Transaction %.10s... rejected (mempool full, low fee rate)",
+                            transaction.txid, txid=transaction.txid,
+                        )
                         self._mempool_rejected_low_fee_total += 1
                         return False
 
@@ -555,7 +723,8 @@ class BlockchainMempoolMixin:
                 validation = sponsor_processor.validate_sponsored_transaction(transaction)
                 if validation.result == SponsorshipResult.APPROVED:
                     sponsor_processor.deduct_sponsor_fee(transaction)
-                    self.logger.info(
+                    self._hot_log.info(
+                        "mempool.added_sponsored",
                         "Sponsored transaction added to mempool",
                         txid=transaction.txid,
                         sender=transaction.sender,
@@ -565,17 +734,25 @@ class BlockchainMempoolMixin:
                 else:
                     # Sponsorship validation failed - log but don't reject
                     # The transaction can still be processed if sender has funds
-                    self.logger.warn(
-                        f"Sponsorship validation failed: {validation.message}",
+                    self._hot_log.warn(
+                        "mempool.sponsorship_failed",
+                        "Sponsorship validation failed: %s",
+                        validation.message,
                         txid=transaction.txid,
                         sender=transaction.sender,
                         sponsor=transaction.gas_sponsor
                     )
             else:
-                self.logger.info("Transaction added to mempool", txid=transaction.txid, sender=transaction.sender)
+                self._hot_log.info(
+                    "mempool.added", "Transaction added to mempool",
+                    txid=transaction.txid, sender=transaction.sender,
+                )
 
             # P2 Performance: Invalidate mempool stats cache on add
             self._invalidate_mempool_stats_cache()
+            notify_observers = getattr(self, "_notify_chain_observers", None)
+            if notify_observers is not None:
+                notify_observers("on_transaction_admitted", transaction)
 
             return True
         # End of atomic lock section
@@ -656,17 +833,32 @@ class BlockchainMempoolMixin:
                 self._pending_nonces.discard((original_tx.sender, original_tx.nonce))
         return True
 
+    def _get_mempool_index(self) -> MempoolFeeIndex:
+        """Return the fee-rate index, creating it on first use."""
+        index = getattr(self, "_mempool_index", None)
+        if index is None:
+            index = self._mempool_index = MempoolFeeIndex()
+        return index
+
     def _prioritize_transactions(self, transactions: list["Transaction"], max_count: int | None = None) -> list["Transaction"]:
         """
         Prioritize transactions by fee rate (fee-per-byte) while maintaining nonce order per sender.
 
         This implements a proper fee market where:
-        1. Transactions are ordered by fee rate (fee-per-byte, highest first) to maximize miner revenue
+        1. Transactions are ordered by ancestor-package fee rate (highest first) to maximize
+           miner revenue; a high-fee child pulls its low-fee parents in with it (CPFP)
         2. Within each sender's transactions, nonce order is maintained for validity
-        3. Optional limit on number of transactions to include in block
-        4. This prevents large transactions with high absolute fees but low fee rates from
+        3. Transactions spending outputs of other pending transactions follow their parents
+        4. Optional limit on number of transactions to include in block
+        5. This prevents large transactions with high absolute fees but low fee rates from
            crowding out smaller transactions with better fee rates
 
+        Selection runs on the incrementally maintained MempoolFeeIndex. When
+        ``transactions`` is ``pending_transactions`` itself, the index already
+        mirrors it (every mutation is applied as it happens), so picking the top N
+        costs O(N log M) rather than re-sorting the whole mempool. Any other list is
+        reconciled first by diffing it against the index.
+
         Args:
             transactions: List of pending transactions
             max_count: Maximum number of transactions to return (None = all)
@@ -677,36 +869,31 @@ class BlockchainMempoolMixin:
         if not transactions:
             return []
 
-        # Group transactions by sender
-        by_sender: dict[str, list["Transaction"]] = defaultdict(list)
-        for tx in transactions:
-            by_sender[tx.sender].append(tx)
-
-        # Sort each sender's transactions by nonce (ascending) to maintain validity
-        for sender, sender_txs in by_sender.items():
-            # Sort by nonce if present, otherwise by timestamp
-            sender_txs.sort(key=lambda tx: (tx.nonce if tx.nonce is not None else 0, tx.timestamp))
-
-        # Flatten back to a single list with fee rate priority
-        all_txs = []
-        for sender_txs in by_sender.values():
-            all_txs.extend(sender_txs)
+        index = self._get_mempool_index()
+        is_pending = transactions is getattr(self, "_pending_transactions", None)
+        if is_pending and getattr(self, "_mempool_index_synced", False):
+            return index.select(max_count=max_count)
+        selected = index.prioritize(transactions, max_count=max_count)
+        self._mempool_index_synced = is_pending
+        return selected
 
-        # Sort by fee rate (descending) - this is more fair than absolute fee
-        # Transactions with higher fee-per-byte get priority
-        # This prevents large transactions from crowding out smaller ones
-        all_txs.sort(key=lambda tx: tx.get_fee_rate(), reverse=True)
-
-        # Limit to max_count if specified
-        if max_count is not None:
-            all_txs = all_txs[:max_count]
+    def _iter_prioritized_transactions(self) -> Iterator["Transaction"]:
+        """
+        Yield pending transactions in _prioritize_transactions() order, lazily.
 
-        # Topologically sort to ensure intra-block dependencies are respected
-        # (transactions spending outputs from other transactions in the same block
-        # must come after the creating transaction)
-        all_txs = self._topological_sort_transactions(all_txs)
+        For block assembly that filters candidates as it goes: packages are
+        only ranked as they are consumed, so stopping once the block is full
+        costs O(N log M) for the N transactions taken. The iterator holds the
+        fee index lock until exhausted or closed.
 
-        return all_txs
+        Returns:
+            Closable iterator over pending transactions
+        """
+        index = self._get_mempool_index()
+        if not getattr(self, "_mempool_index_synced", False):
+            index.sync(self.pending_transactions)
+            self._mempool_index_synced = True
+        return index.iter_select()
 
     def _topological_sort_transactions(self, transactions: list["Transaction"]) -> list["Transaction"]:
         """
@@ -814,11 +1001,20 @@ class BlockchainMempoolMixin:
         """
         Invalidate the mempool stats cache.
 
-        Called when transactions are added or removed from mempool.
+        Called whenever ``pending_transactions`` changes.
         P2 Performance optimization.
         """
         self._mempool_stats_cache = {}
         self._mempool_stats_cache_time = 0.0
+        self._mempool_generation = getattr(self, "_mempool_generation", 0) + 1
+
+    def get_mempool_generation(self) -> int:
+        """
+        Return a counter that changes whenever the mempool contents change.
+
+        Used together with the chain tip hash to key cached API responses.
+        """
+        return getattr(self, "_mempool_generation", 0)
 
     def get_mempool_overview(self, limit: int = 100) -> dict[str, Any]:
         """
@@ -959,3 +1155,25 @@ class BlockchainMempoolMixin:
 
         overview["transactions_returned"] = len(overview["transactions"])
         return overview
+
+    @staticmethod
+    def age_mempool_overview(overview: dict[str, Any], elapsed: float) -> dict[str, Any]:
+        """
+        Return a copy of a get_mempool_overview() result aged by ``elapsed`` seconds.
+
+        Lets callers that keep an overview around (the API response cache)
+        serve current ``timestamp`` and age fields without rebuilding it.
+        """
+        aged = dict(overview)
+        aged["timestamp"] = float(overview.get("timestamp") or time.time()) + elapsed
+        for key in ("cache_age_seconds", "oldest_transaction_age_seconds", "newest_transaction_age_seconds"):
+            if isinstance(overview.get(key), (int, float)) and overview.get("pending_count", 1):
+                aged[key] = overview[key] + elapsed
+        transactions = overview.get("transactions")
+        if transactions:
+            aged["transactions"] = [
+                {**summary, "age_seconds": summary["age_seconds"] + elapsed}
+                if isinstance(summary.get("age_seconds"), (int, float)) else summary
+                for summary in transactions
+            ]
+        return aged
@@ -9,8 +9,10 @@ and gamification processing.
 from __future__ import annotations
 
 import time
+from contextlib import closing
 from typing import TYPE_CHECKING, Any
 
+from xai.core.api.structured_logger import flush_hot_path_logs
 from xai.core.chain.blockchain_exceptions import (
     DatabaseError,
     MiningAbortedError,
@@ -184,7 +186,9 @@ class BlockchainMiningMixin:
         # Note: _prioritize_transactions now includes topological sorting to handle
         # intra-block dependencies. We must NOT re-sort here as that would undo
         # the topological order. Nonce sequencing is enforced during selection below.
-        prioritized_txs = self._prioritize_transactions(self.pending_transactions)
+        # Candidates are ranked lazily, only as many as the loop below consumes:
+        # transactions dropped by the nonce/validation filter leave room for the
+        # next ones, and ranking stops once the block is full.
 
         # Enforce strict in-block nonce sequencing per sender
         sender_next_nonce: dict[str, int] = {}
@@ -193,52 +197,53 @@ class BlockchainMiningMixin:
         selected_txs: list["Transaction"] = []
         current_block_size = 0
 
-        for tx in prioritized_txs:
-            if len(selected_txs) + 1 >= max_transactions_per_block:
-                self.logger.info(
-                    "Transaction limit reached for block assembly",
-                    limit=max_transactions_per_block,
-                )
-                break
-            # Re-validate transaction against current state before inclusion
-            if tx.sender != "COINBASE":
-                confirmed_nonce = self.nonce_tracker.get_nonce(tx.sender)
-                expected = sender_next_nonce.get(tx.sender, confirmed_nonce + 1)
-                tx.nonce = tx.nonce if tx.nonce is not None else expected
-                if tx.nonce != expected:
-                    self.logger.warn(
-                        "Transaction skipped due to nonce mismatch during block assembly",
-                        txid=tx.txid,
-                        sender=tx.sender,
-                        expected_nonce=expected,
-                        got_nonce=tx.nonce,
+        with closing(self._iter_prioritized_transactions()) as candidates:
+            for tx in candidates:
+                if len(selected_txs) + 1 >= max_transactions_per_block:
+                    self.logger.info(
+                        "Transaction limit reached for block assembly",
+                        limit=max_transactions_per_block,
                     )
-                    continue
-                # Align nonce tracker state so validation enforces strict sequencing
-                self.nonce_tracker.nonces[tx.sender] = expected - 1
-                # Temporarily reserve previous nonce so validate_nonce expects `expected`
-                self.nonce_tracker.pending_nonces[tx.sender] = expected - 1
-                if not self.validate_transaction(tx):
-                    txid_display = (tx.txid or tx.calculate_hash() or "")[:10]
-                    self.logger.warn(
-                        f"Transaction {txid_display}... failed validation and was excluded from block."
-                    )
-                    self.nonce_tracker.pending_nonces.pop(tx.sender, None)
-                    continue
-                # Reserve this nonce for subsequent txs in the block
-                self.nonce_tracker.pending_nonces[tx.sender] = expected
-                sender_next_nonce[tx.sender] = expected + 1
-
-            # Calculate transaction size using canonical JSON
-            tx_size = len(canonical_json(tx.to_dict()).encode("utf-8"))
-
-            # Check if adding this transaction would exceed block size limit
-            if current_block_size + tx_size <= max_block_size_bytes:
-                selected_txs.append(tx)
-                current_block_size += tx_size
-            else:
-                # Block is full, skip remaining transactions
-                break
+                    break
+                # Re-validate transaction against current state before inclusion
+                if tx.sender != "COINBASE":
+                    confirmed_nonce = self.nonce_tracker.get_nonce(tx.sender)
+                    expected = sender_next_nonce.get(tx.sender, confirmed_nonce + 1)
+                    tx.nonce = tx.nonce if tx.nonce is not None else expected
+                    if tx.nonce != expected:
+                        self.logger.warn(
+                            "Transaction skipped due to nonce mismatch during block assembly",
+                            txid=tx.txid,
+                            sender=tx.sender,
+                            expected_nonce=expected,
+                            got_nonce=tx.nonce,
+                        )
+                        continue
+                    # Align nonce tracker state so validation enforces strict sequencing
+                    self.nonce_tracker.nonces[tx.sender] = expected - 1
+                    # Temporarily reserve previous nonce so validate_nonce expects `expected`
+                    self.nonce_tracker.pending_nonces[tx.sender] = expected - 1
+                    if not self.validate_transaction(tx):
+                        txid_display = (tx.txid or tx.calculate_hash() or "")[:10]
+                        self.logger.warn(
+                            f"Transaction {txid_display}... failed validation and was excluded from block."
+                        )
+                        self.nonce_tracker.pending_nonces.pop(tx.sender, None)
+                        continue
+                    # Reserve this nonce for subsequent txs in the block
+                    self.nonce_tracker.pending_nonces[tx.sender] = expected
+                    sender_next_nonce[tx.sender] = expected + 1
+
+                # Calculate transaction size using canonical JSON
+                tx_size = len(canonical_json(tx.to_dict()).encode("utf-8"))
+
+                # Check if adding this transaction would exceed block size limit
+                if current_block_size + tx_size <= max_block_size_bytes:
+                    selected_txs.append(tx)
+                    current_block_size += tx_size
+                else:
+                    # Block is full, skip remaining transactions
+                    break
 
         # Use selected transactions instead of all prioritized transactions
         prioritized_txs = selected_txs
@@ -442,6 +447,7 @@ class BlockchainMiningMixin:
                 block_hash=new_block.hash[:16],
                 nonce_updates=len(nonce_changes),
             )
+            flush_hot_path_logs(block_index=new_block.index)
 
             # Record post-mining metrics
             _mining_duration = time.time() - _mining_start_time
@@ -184,6 +184,7 @@ class BlockchainSerializer:
             try:
                 # Restore UTXO set from checkpoint
                 self.blockchain.utxo_manager.restore(checkpoint.utxo_snapshot)
+                self.blockchain.checkpoint_manager.resume_delta_chain(checkpoint, self.blockchain.utxo_manager)
 
                 # Load chain blocks up to checkpoint
                 self.blockchain.chain = []
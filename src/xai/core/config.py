@@ -74,6 +74,8 @@ NETWORK = os.getenv("XAI_NETWORK", "testnet")  # Default to testnet for safety
 NODE_MODE = os.getenv("XAI_NODE_MODE", "full").strip().lower()
 PRUNE_BLOCKS = int(os.getenv("XAI_PRUNE_BLOCKS", "0"))
 CHECKPOINT_SYNC_ENABLED = bool(int(os.getenv("XAI_CHECKPOINT_SYNC", "1")))
+# Write a full UTXO snapshot every N checkpoints; the ones in between store deltas
+CHECKPOINT_FULL_EVERY = max(1, int(os.getenv("XAI_CHECKPOINT_FULL_EVERY", "10")))
 
 # Pruning configuration
 PRUNE_MODE = os.getenv("XAI_PRUNE_MODE", "none").strip().lower()
@@ -551,6 +553,7 @@ class TestnetConfig:
     NODE_MODE = NODE_MODE
     PRUNE_BLOCKS = PRUNE_BLOCKS
     CHECKPOINT_SYNC_ENABLED = CHECKPOINT_SYNC_ENABLED
+    CHECKPOINT_FULL_EVERY = CHECKPOINT_FULL_EVERY
     PRUNE_MODE = PRUNE_MODE
     PRUNE_KEEP_BLOCKS = PRUNE_KEEP_BLOCKS
     PRUNE_KEEP_DAYS = PRUNE_KEEP_DAYS
@@ -724,6 +727,7 @@ class MainnetConfig:
     NODE_MODE = NODE_MODE
     PRUNE_BLOCKS = PRUNE_BLOCKS
     CHECKPOINT_SYNC_ENABLED = CHECKPOINT_SYNC_ENABLED
+    CHECKPOINT_FULL_EVERY = CHECKPOINT_FULL_EVERY
     PRUNE_MODE = PRUNE_MODE
     PRUNE_KEEP_BLOCKS = PRUNE_KEEP_BLOCKS
     PRUNE_KEEP_DAYS = PRUNE_KEEP_DAYS
@@ -933,6 +937,7 @@ __all__ = [
     "NODE_MODE",
     "PRUNE_BLOCKS",
     "CHECKPOINT_SYNC_ENABLED",
+    "CHECKPOINT_FULL_EVERY",
     "reload_runtime",
     "get_runtime_config",
     "validate_config",
@@ -11,20 +11,35 @@ Comprehensive blockchain validation performed on startup to ensure:
 - Merkle root validation
 - Genesis block verification
 
+Validation is a single pass over the chain: stateless per-block checks
+(hashes, proof-of-work, merkle roots, signatures) run on a process pool in
+batches while the UTXO set is rebuilt in block order on the calling thread.
+
 This validator detects corruption and provides detailed diagnostics.
 """
 
 import hashlib
 import json
 import logging
+import os
 import time
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
+from itertools import islice
+from typing import Any, Iterator
 
 from xai.core.security.crypto_utils import verify_signature_hex
 
 logger = logging.getLogger(__name__)
 
+# Blocks per unit of work sent to a validation worker
+VALIDATION_BATCH_SIZE = 64
+
+# Shorter chains are validated inline; starting the pool would dominate
+PARALLEL_MIN_BLOCKS = 512
+
 @dataclass
 class ValidationIssue:
     """Represents a validation issue found during chain validation"""
@@ -134,16 +149,27 @@ class ChainValidator:
     7. Merkle root validation
     """
 
-    def __init__(self, max_supply: float = 121000000.0, verbose: bool = True):
+    # Per-block checks, in report order; keys match ValidationReport fields
+    BLOCK_CHECKS = ("chain_integrity", "pow_valid", "signatures_valid", "merkle_roots_valid")
+
+    def __init__(
+        self,
+        max_supply: float = 121000000.0,
+        verbose: bool = True,
+        workers: int | None = None,
+    ):
         """
         Initialize chain validator
 
         Args:
             max_supply: Maximum supply cap (default: 121M XAI)
             verbose: Print detailed progress during validation
+            workers: Processes for stateless block checks (default: CPU count;
+                1 = validate inline)
         """
         self.max_supply = max_supply
         self.verbose = verbose
+        self.workers = max(1, workers if workers is not None else (os.cpu_count() or 1))
         self.report = None
 
     def _ensure_report(self):
@@ -191,38 +217,55 @@ class ChainValidator:
             return self.report
 
         # Step 1: Validate genesis block
-        logger.info("[1/7] Validating genesis block")
+        logger.info("[1/3] Validating genesis block")
         self.report.genesis_valid = self._validate_genesis_block(chain[0], expected_genesis_hash)
 
-        # Step 2: Validate chain integrity (hashes, previous_hash links)
-        logger.info("[2/7] Validating chain integrity (block hashes)")
-        self.report.chain_integrity = self._validate_chain_integrity(chain)
+        # Step 2: One pass over the blocks. Stateless checks come back in
+        # block order and the UTXO set is rebuilt as they arrive.
+        logger.info(
+            "[2/3] Validating blocks and rebuilding UTXO set",
+            extra={"workers": self.workers},
+        )
+        issues: dict[str, list[tuple]] = {check: [] for check in self.BLOCK_CHECKS}
+        utxo_set: dict[str, list[dict]] = {}
+        total_supply = 0.0
+        total_transactions = 0
+        for i, block, (tx_count, block_issues) in self._iter_block_checks(chain):
+            total_transactions += tx_count
+            for check, *issue in block_issues:
+                issues[check].append(issue)
+            total_supply = self._apply_block_utxos(utxo_set, block, i, total_supply)
 
-        # Step 3: Validate proof-of-work for all blocks
-        logger.info("[3/7] Validating proof-of-work")
-        self.report.pow_valid = self._validate_proof_of_work(chain)
+            if i % 1000 == 0 and i > 0:
+                logger.debug("Validation progress", extra={"validated": i, "total": len(chain)})
 
-        # Step 4: Validate all transaction signatures
-        logger.info("[4/7] Validating transaction signatures")
-        self.report.signatures_valid = self._validate_transaction_signatures(chain)
+        # Issues are reported in the order of the original per-check passes
+        self.report.chain_integrity = self._record_issues(issues["chain_integrity"])
+        if self.report.chain_integrity:
+            logger.info("Chain integrity verified", extra={"block_count": len(chain)})
+        self.report.pow_valid = self._record_issues(issues["pow_valid"])
+        if self.report.pow_valid:
+            logger.info("Proof-of-work verified for all blocks")
+        self.report.signatures_valid = self._record_issues(issues["signatures_valid"])
+        if self.report.signatures_valid:
+            logger.info("All transaction signatures verified", extra={"tx_count": total_transactions})
 
-        # Step 5: Rebuild UTXO set and validate balances
-        logger.info("[5/7] Rebuilding UTXO set and validating balances")
-        utxo_set, total_supply = self._rebuild_utxo_set(chain)
+        logger.info(
+            "UTXO set rebuilt",
+            extra={"address_count": len(utxo_set), "total_supply": total_supply},
+        )
         self.report.utxo_count = len(utxo_set)
         self.report.total_supply = total_supply
-        self.report.balances_consistent = self._validate_balance_consistency(chain, utxo_set)
+        self.report.total_transactions = total_transactions
 
-        # Step 6: Validate supply cap
-        logger.info("[6/7] Validating supply cap", extra={"max_supply": self.max_supply})
+        # Step 3: Whole-chain state checks
+        logger.info("[3/3] Validating balances and supply cap", extra={"max_supply": self.max_supply})
+        self.report.balances_consistent = self._validate_balance_consistency(chain, utxo_set)
         self.report.supply_cap_valid = self._validate_supply_cap(total_supply)
 
-        # Step 7: Validate merkle roots
-        logger.info("[7/7] Validating merkle roots")
-        self.report.merkle_roots_valid = self._validate_merkle_roots(chain)
-
-        # Count total transactions
-        self.report.total_transactions = sum(len(block.get("transactions", [])) for block in chain)
+        self.report.merkle_roots_valid = self._record_issues(issues["merkle_roots_valid"])
+        if self.report.merkle_roots_valid:
+            logger.info("All merkle roots verified")
 
         # Determine overall success
         self.report.success = (
@@ -308,170 +351,154 @@ class ChainValidator:
 
         return valid
 
-    def _validate_chain_integrity(self, chain: list[dict]) -> bool:
+    def _iter_block_checks(self, chain: list[dict]) -> Iterator[tuple[int, dict, tuple]]:
         """
-        Validate chain integrity (hash links)
+        Run the stateless checks for every block, yielding results in order.
 
         Args:
             chain: List of blocks
 
-        Returns:
-            bool: True if valid
+        Yields:
+            tuple: (index, block, (tx_count, issues)) as returned by _check_block
         """
-        valid = True
-
-        for i in range(1, len(chain)):
-            current_block = chain[i]
-            previous_block = chain[i - 1]
-
-            # Check block index sequence
-            if current_block.get("index") != i:
-                self.report.add_issue(
-                    "critical",
-                    i,
-                    "block_index",
-                    f"Block has invalid index: {current_block.get('index')}, expected: {i}",
-                )
-                valid = False
-
-            # Check previous_hash link
-            if current_block.get("previous_hash") != previous_block.get("hash"):
-                self.report.add_issue(
-                    "critical",
-                    i,
-                    "previous_hash",
-                    f"Block previous_hash doesn't match previous block hash",
-                    {
-                        "expected": previous_block.get("hash"),
-                        "actual": current_block.get("previous_hash"),
-                    },
-                )
-                valid = False
-
-            # Validate hash calculation
-            calculated_hash = self._calculate_block_hash(current_block)
-            if current_block.get("hash") != calculated_hash:
-                self.report.add_issue(
-                    "critical",
-                    i,
-                    "block_hash",
-                    f"Block hash is incorrect",
-                    {"expected": calculated_hash, "actual": current_block.get("hash")},
-                )
-                valid = False
-
-            # Progress indicator
-            if i % 1000 == 0:
-                logger.debug("Validation progress", extra={"validated": i, "total": len(chain)})
-
-        if valid:
-            logger.info("Chain integrity verified", extra={"block_count": len(chain)})
-
-        return valid
+        items = (
+            (i, block, chain[i - 1].get("hash") if i > 0 else None)
+            for i, block in enumerate(chain)
+        )
+        executor = self._create_executor(len(chain))
+        if executor is None:
+            for item in items:
+                yield item[0], item[1], self._check_block(*item)
+            return
+
+        with executor:
+            # Bounded look-ahead keeps workers busy while the caller applies
+            # UTXO changes for earlier blocks
+            pending: deque = deque()
+            max_in_flight = self.workers * 2
+            while True:
+                batch = list(islice(items, VALIDATION_BATCH_SIZE))
+                if batch:
+                    pending.append((batch, executor.submit(_check_block_batch, batch)))
+                while pending and (len(pending) >= max_in_flight or not batch):
+                    done, future = pending.popleft()
+                    for (i, block, _), result in zip(done, future.result()):
+                        yield i, block, result
+                if not batch:
+                    return
+
+    def _create_executor(self, block_count: int) -> Executor | None:
+        """Process pool for block checks, or None to check inline."""
+        if self.workers <= 1 or block_count < PARALLEL_MIN_BLOCKS:
+            return None
+        try:
+            return ProcessPoolExecutor(max_workers=self.workers)
+        except (OSError, NotImplementedError, ValueError) as e:
+            logger.warning(
+                "Validation workers unavailable, validating inline",
+                extra={"error_type": type(e).__name__, "error": str(e)},
+            )
+            return None
 
-    def _validate_proof_of_work(self, chain: list[dict]) -> bool:
+    def _record_issues(self, issues: list[tuple]) -> bool:
         """
-        Validate proof-of-work for all blocks
+        Add collected issues to the report
 
         Args:
-            chain: List of blocks
+            issues: add_issue() argument tuples
 
         Returns:
-            bool: True if valid
+            bool: True if there were none
         """
-        valid = True
-
-        for i, block in enumerate(chain):
-            difficulty = block.get("difficulty", 4)
-            block_hash = block.get("hash", "")
-            target = "0" * difficulty
-
-            if not block_hash.startswith(target):
-                self.report.add_issue(
-                    "critical",
-                    i,
-                    "proof_of_work",
-                    f"Block doesn't meet difficulty requirement",
-                    {"difficulty": difficulty, "hash": block_hash, "required_prefix": target},
-                )
-                valid = False
-
-            # Progress indicator
-            if i % 1000 == 0 and i > 0:
-                logger.debug("PoW validation progress", extra={"validated": i, "total": len(chain)})
-
-        if valid:
-            logger.info("Proof-of-work verified for all blocks")
+        for issue in issues:
+            self.report.add_issue(*issue)
+        return not issues
 
-        return valid
-
-    def _validate_transaction_signatures(self, chain: list[dict]) -> bool:
+    def _check_block(
+        self, i: int, block: dict, previous_hash: str | None
+    ) -> tuple[int, list[tuple]]:
         """
-        Validate all transaction signatures
+        Stateless checks for one block: hash links, proof-of-work,
+        transaction signatures and merkle root
+
+        Needs nothing but the block and its predecessor's stored hash, so it
+        can run in a worker process.
 
         Args:
-            chain: List of blocks
+            i: Block position in the chain
+            block: Block data
+            previous_hash: Stored hash of the previous block (None for genesis)
 
         Returns:
-            bool: True if valid
+            tuple: (transaction count, issues as (check, *add_issue args))
         """
-        valid = True
-        tx_count = 0
-
-        for i, block in enumerate(chain):
-            transactions = block.get("transactions", [])
-
-            for tx in transactions:
-                tx_count += 1
-
-                # Skip coinbase transactions (no signature required)
-                if tx.get("sender") == "COINBASE":
-                    continue
-
-                # Validate signature exists
-                if not tx.get("signature"):
-                    self.report.add_issue(
-                        "error",
-                        i,
-                        "missing_signature",
-                        f"Transaction {tx.get('txid', 'unknown')[:16]}... missing signature",
-                    )
-                    valid = False
-                    continue
-
-                # Validate public key exists
-                if not tx.get("public_key"):
-                    self.report.add_issue(
-                        "error",
-                        i,
-                        "missing_public_key",
-                        f"Transaction {tx.get('txid', 'unknown')[:16]}... missing public key",
-                    )
-                    valid = False
-                    continue
-
-                # Verify signature
-                if not self._verify_transaction_signature(tx):
-                    self.report.add_issue(
-                        "critical",
-                        i,
-                        "invalid_signature",
-                        f"Transaction {tx.get('txid', 'unknown')[:16]}... has invalid signature",
-                        {"sender": tx.get("sender"), "txid": tx.get("txid")},
-                    )
-                    valid = False
-
-            # Progress indicator
-            if i % 1000 == 0 and i > 0:
-                logger.debug(
-                    "Signature validation progress",
-                    extra={"tx_count": tx_count, "validated_blocks": i, "total_blocks": len(chain)},
-                )
-
-        if valid:
-            logger.info("All transaction signatures verified", extra={"tx_count": tx_count})
-
-        return valid
+        issues: list[tuple] = []
+
+        # Chain integrity (genesis is covered by _validate_genesis_block)
+        if i > 0:
+            if block.get("index") != i:
+                issues.append((
+                    "chain_integrity", "critical", i, "block_index",
+                    f"Block has invalid index: {block.get('index')}, expected: {i}",
+                ))
+            if block.get("previous_hash") != previous_hash:
+                issues.append((
+                    "chain_integrity", "critical", i, "previous_hash",
+                    f"Block previous_hash doesn't match previous block hash",
+                    {"expected": previous_hash, "actual": block.get("previous_hash")},
+                ))
+            calculated_hash = self._calculate_block_hash(block)
+            if block.get("hash") != calculated_hash:
+                issues.append((
+                    "chain_integrity", "critical", i, "block_hash",
+                    f"Block hash is incorrect",
+                    {"expected": calculated_hash, "actual": block.get("hash")},
+                ))
+
+        # Proof-of-work
+        difficulty = block.get("difficulty", 4)
+        block_hash = block.get("hash", "")
+        target = "0" * difficulty
+        if not block_hash.startswith(target):
+            issues.append((
+                "pow_valid", "critical", i, "proof_of_work",
+                f"Block doesn't meet difficulty requirement",
+                {"difficulty": difficulty, "hash": block_hash, "required_prefix": target},
+            ))
+
+        # Transaction signatures (coinbase transactions are unsigned)
+        transactions = block.get("transactions", [])
+        for tx in transactions:
+            if tx.get("sender") == "COINBASE":
+                continue
+            if not tx.get("signature"):
+                issues.append((
+                    "signatures_valid", "error", i, "missing_signature",
+                    f"Transaction {tx.get('txid', 'unknown')[:16]}... missing signature",
+                ))
+            elif not tx.get("public_key"):
+                issues.append((
+                    "signatures_valid", "error", i, "missing_public_key",
+                    f"Transaction {tx.get('txid', 'unknown')[:16]}... missing public key",
+                ))
+            elif not self._verify_transaction_signature(tx):
+                issues.append((
+                    "signatures_valid", "critical", i, "invalid_signature",
+                    f"Transaction {tx.get('txid', 'unknown')[:16]}... has invalid signature",
+                    {"sender": tx.get("sender"), "txid": tx.get("txid")},
+                ))
+
+        # Merkle root
+        stored_merkle_root = block.get("merkle_root")
+        calculated_merkle_root = self._calculate_merkle_root(transactions)
+        if stored_merkle_root != calculated_merkle_root:
+            issues.append((
+                "merkle_roots_valid", "error", i, "merkle_root",
+                f"Block merkle root mismatch",
+                {"expected": calculated_merkle_root, "actual": stored_merkle_root},
+            ))
+
+        return len(transactions), issues
 
     def _rebuild_utxo_set(self, chain: list[dict]) -> tuple[dict[str, list[dict]], float]:
         """
@@ -487,40 +514,7 @@ class ChainValidator:
         total_supply = 0.0
 
         for i, block in enumerate(chain):
-            transactions = block.get("transactions", [])
-
-            for tx in transactions:
-                recipient = tx.get("recipient")
-                amount = tx.get("amount", 0.0)
-                sender = tx.get("sender")
-                fee = tx.get("fee", 0.0)
-
-                # Add new UTXO
-                if recipient not in utxo_set:
-                    utxo_set[recipient] = []
-
-                utxo_set[recipient].append(
-                    {"txid": tx.get("txid"), "amount": amount, "spent": False, "block": i}
-                )
-
-                total_supply += amount
-
-                # Mark sender's UTXOs as spent
-                if sender != "COINBASE" and sender in utxo_set:
-                    spent_amount = amount + fee
-                    remaining = spent_amount
-
-                    for utxo in utxo_set[sender]:
-                        if not utxo["spent"] and remaining > 0:
-                            if utxo["amount"] <= remaining:
-                                utxo["spent"] = True
-                                total_supply -= utxo["amount"]
-                                remaining -= utxo["amount"]
-                            else:
-                                # Partial spend
-                                utxo["amount"] -= remaining
-                                total_supply -= remaining
-                                remaining = 0
+            total_supply = self._apply_block_utxos(utxo_set, block, i, total_supply)
 
             # Progress indicator
             if i % 1000 == 0 and i > 0:
@@ -536,6 +530,56 @@ class ChainValidator:
 
         return utxo_set, total_supply
 
+    def _apply_block_utxos(
+        self, utxo_set: dict[str, list[dict]], block: dict, i: int, total_supply: float
+    ) -> float:
+        """
+        Apply one block's transactions to the UTXO set in place
+
+        Args:
+            utxo_set: UTXO set built from the preceding blocks
+            block: Block data
+            i: Block position in the chain
+            total_supply: Supply before this block
+
+        Returns:
+            float: Supply after this block
+        """
+        for tx in block.get("transactions", []):
+            recipient = tx.get("recipient")
+            amount = tx.get("amount", 0.0)
+            sender = tx.get("sender")
+            fee = tx.get("fee", 0.0)
+
+            # Add new UTXO
+            if recipient not in utxo_set:
+                utxo_set[recipient] = []
+
+            utxo_set[recipient].append(
+                {"txid": tx.get("txid"), "amount": amount, "spent": False, "block": i}
+            )
+
+            total_supply += amount
+
+            # Mark sender's UTXOs as spent
+            if sender != "COINBASE" and sender in utxo_set:
+                spent_amount = amount + fee
+                remaining = spent_amount
+
+                for utxo in utxo_set[sender]:
+                    if not utxo["spent"] and remaining > 0:
+                        if utxo["amount"] <= remaining:
+                            utxo["spent"] = True
+                            total_supply -= utxo["amount"]
+                            remaining -= utxo["amount"]
+                        else:
+                            # Partial spend
+                            utxo["amount"] -= remaining
+                            total_supply -= remaining
+                            remaining = 0
+
+        return total_supply
+
     def _validate_balance_consistency(
         self, chain: list[dict], utxo_set: dict[str, list[dict]]
     ) -> bool:
@@ -614,44 +658,6 @@ class ChainValidator:
 
         return valid
 
-    def _validate_merkle_roots(self, chain: list[dict]) -> bool:
-        """
-        Validate merkle roots for all blocks
-
-        Args:
-            chain: List of blocks
-
-        Returns:
-            bool: True if valid
-        """
-        valid = True
-
-        for i, block in enumerate(chain):
-            transactions = block.get("transactions", [])
-            stored_merkle_root = block.get("merkle_root")
-
-            # Calculate expected merkle root
-            calculated_merkle_root = self._calculate_merkle_root(transactions)
-
-            if stored_merkle_root != calculated_merkle_root:
-                self.report.add_issue(
-                    "error",
-                    i,
-                    "merkle_root",
-                    f"Block merkle root mismatch",
-                    {"expected": calculated_merkle_root, "actual": stored_merkle_root},
-                )
-                valid = False
-
-            # Progress indicator
-            if i % 1000 == 0 and i > 0:
-                logger.debug("Merkle root validation progress", extra={"validated": i, "total": len(chain)})
-
-        if valid:
-            logger.info("All merkle roots verified")
-
-        return valid
-
     def _calculate_block_hash(self, block: dict) -> str:
         """
         Calculate block hash
@@ -824,11 +830,22 @@ class ChainValidator:
                 if len(errors) > 5:
                     logger.error(f"... and {len(errors) - 5} more errors")
 
+# Per-process validator used by pool workers
+_worker_validator: ChainValidator | None = None
+
+def _check_block_batch(batch: list[tuple[int, dict, Any]]) -> list[tuple[int, list[tuple]]]:
+    """Worker entry point: ChainValidator._check_block for each (i, block, previous_hash)."""
+    global _worker_validator
+    if _worker_validator is None:
+        _worker_validator = ChainValidator(verbose=False, workers=1)
+    return [_worker_validator._check_block(*item) for item in batch]
+
 def validate_blockchain_on_startup(
     blockchain_data: dict,
     max_supply: float = 121000000.0,
     expected_genesis_hash: str | None = None,
     verbose: bool = True,
+    workers: int | None = None,
 ) -> tuple[bool, ValidationReport]:
     """
     Validate blockchain on startup
@@ -841,11 +858,12 @@ def validate_blockchain_on_startup(
         max_supply: Maximum supply cap
         expected_genesis_hash: Expected genesis hash (optional)
         verbose: Print detailed progress
+        workers: Processes for stateless block checks (default: CPU count)
 
     Returns:
         tuple: (success: bool, report: ValidationReport)
     """
-    validator = ChainValidator(max_supply=max_supply, verbose=verbose)
+    validator = ChainValidator(max_supply=max_supply, verbose=verbose, workers=workers)
     report = validator.validate_chain(blockchain_data, expected_genesis_hash)
 
     return report.success, report
@@ -9,9 +9,16 @@ Provides checkpoint/snapshot functionality for the blockchain to:
 
 A checkpoint includes:
 - Block height and hash
-- Complete UTXO set snapshot
+- Complete UTXO set snapshot, or for delta checkpoints only the UTXOs
+  created and spent since the previous checkpoint
 - Timestamp and difficulty
 - Chain metadata
+
+With full_checkpoint_every > 1, only every Nth checkpoint stores the full
+UTXO set (a base); the checkpoints in between store deltas and the full
+state is rebuilt from the nearest base plus the deltas after it. Deltas
+come from the changes the UTXO manager records after each checkpoint, so
+writing one costs time proportional to the changes, not to the UTXO set.
 """
 
 from __future__ import annotations
@@ -125,7 +132,11 @@ class Checkpoint:
         """Create checkpoint from dictionary.
 
         SECURITY: Automatically decrypts encrypted UTXO data if present.
+        Delta checkpoint data yields a DeltaCheckpoint.
         """
+        if cls is Checkpoint and "utxo_delta" in data:
+            return DeltaCheckpoint.from_dict(data)
+
         # SECURITY: Decrypt UTXO snapshot if encrypted
         utxo_data = data["utxo_snapshot"]
         if isinstance(utxo_data, dict) and utxo_data.get("_encrypted"):
@@ -157,6 +168,165 @@ class Checkpoint:
         """Verify checkpoint integrity"""
         return self.checkpoint_hash == self._calculate_checkpoint_hash()
 
+class DeltaCheckpoint(Checkpoint):
+    """
+    Checkpoint storing only the UTXO changes since the previous checkpoint.
+
+    ``utxo_delta`` holds the entries created (or changed) and the outpoints
+    spent relative to the checkpoint at ``parent_height``; ``base_height`` is
+    the full checkpoint the delta chain starts from. ``utxo_snapshot`` is
+    None until the manager rebuilds the full state on load. The checkpoint
+    hash covers the same header fields as a full checkpoint, so peers agree
+    on it regardless of how each stores its checkpoints.
+    """
+
+    def __init__(
+        self,
+        height: int,
+        block_hash: str,
+        previous_hash: str,
+        utxo_delta: dict[str, Any],
+        parent_height: int,
+        base_height: int,
+        timestamp: float,
+        difficulty: int,
+        total_supply: float,
+        merkle_root: str,
+        nonce: int = 0,
+        utxo_snapshot: dict[str, Any] | None = None,
+    ):
+        super().__init__(
+            height=height,
+            block_hash=block_hash,
+            previous_hash=previous_hash,
+            utxo_snapshot=utxo_snapshot,
+            timestamp=timestamp,
+            difficulty=difficulty,
+            total_supply=total_supply,
+            merkle_root=merkle_root,
+            nonce=nonce,
+        )
+        self.utxo_delta = utxo_delta
+        self.parent_height = parent_height
+        self.base_height = base_height
+        self.delta_root = utxo_delta_root(utxo_delta)
+
+    def to_dict(self, encrypt: bool = True) -> dict[str, Any]:
+        """Convert delta checkpoint to dictionary for serialization.
+
+        Args:
+            encrypt: If True, encrypt the UTXO delta (default: True)
+
+        Returns:
+            Serialized checkpoint dictionary
+        """
+        data = super().to_dict(encrypt=False)
+        del data["utxo_snapshot"]
+
+        # SECURITY: Deltas reveal address balances just like full snapshots
+        delta_data = self.utxo_delta
+        if encrypt and CHECKPOINT_ENCRYPTION_AVAILABLE:
+            delta_data = encrypt_utxo_snapshot(self.utxo_delta)
+
+        data.update({
+            "utxo_delta": delta_data,
+            "delta_root": self.delta_root,
+            "parent_height": self.parent_height,
+            "base_height": self.base_height,
+        })
+        return data
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "DeltaCheckpoint":
+        """Create delta checkpoint from dictionary, verifying its delta root."""
+        delta = data["utxo_delta"]
+        if isinstance(delta, dict) and delta.get("_encrypted"):
+            delta = decrypt_utxo_snapshot(delta)
+
+        checkpoint = cls(
+            height=data["height"],
+            block_hash=data["block_hash"],
+            previous_hash=data["previous_hash"],
+            utxo_delta=delta,
+            parent_height=data["parent_height"],
+            base_height=data["base_height"],
+            timestamp=data["timestamp"],
+            difficulty=data["difficulty"],
+            total_supply=data["total_supply"],
+            merkle_root=data["merkle_root"],
+            nonce=data.get("nonce", 0),
+        )
+
+        if checkpoint.delta_root != data.get("delta_root"):
+            raise ValueError(
+                f"Checkpoint delta root mismatch at height {data['height']}: "
+                f"expected {data.get('delta_root')}, got {checkpoint.delta_root}"
+            )
+        if "checkpoint_hash" in data and checkpoint.checkpoint_hash != data["checkpoint_hash"]:
+            raise ValueError(
+                f"Checkpoint hash mismatch at height {data['height']}: "
+                f"expected {data['checkpoint_hash']}, got {checkpoint.checkpoint_hash}"
+            )
+
+        return checkpoint
+
+# ==================== UTXO Deltas ====================
+
+def _index_utxo_set(utxo_set: dict[str, list[dict[str, Any]]]) -> dict[str, tuple[str, dict[str, Any]]]:
+    """Map "txid:vout" to (address, utxo), preserving set order."""
+    return {
+        f"{utxo['txid']}:{utxo['vout']}": (address, utxo)
+        for address, utxos in utxo_set.items()
+        for utxo in utxos
+    }
+
+def apply_utxo_delta(
+    index: dict[str, tuple[str, dict[str, Any]]],
+    delta: dict[str, Any],
+) -> None:
+    """Apply a delta to an indexed UTXO set in place."""
+    for outpoint in delta["spent"]:
+        index.pop(outpoint, None)
+    for outpoint, address, utxo in delta["created"]:
+        existing = index.get(outpoint)
+        if existing is not None and existing[0] != address:
+            # Keep list order per address: re-append under the new address
+            del index[outpoint]
+        index[outpoint] = (address, utxo)
+
+def _utxo_set_from_index(index: dict[str, tuple[str, dict[str, Any]]]) -> dict[str, list[dict[str, Any]]]:
+    utxo_set: dict[str, list[dict[str, Any]]] = {}
+    for address, utxo in index.values():
+        utxo_set.setdefault(address, []).append(utxo)
+    return utxo_set
+
+def utxo_delta_root(delta: dict[str, Any]) -> str:
+    """
+    Merkle root over a UTXO delta's created entries and spent outpoints.
+
+    Leaves are sorted, so the root does not depend on entry order.
+    """
+    leaves = [
+        f"+{outpoint}:{address}:{json.dumps(utxo, sort_keys=True, separators=(',', ':'))}"
+        for outpoint, address, utxo in delta.get("created", [])
+    ]
+    leaves.extend(f"-{outpoint}" for outpoint in delta.get("spent", []))
+    leaves.sort()
+
+    if not leaves:
+        return hashlib.sha256(b"").hexdigest()
+
+    hashes = [hashlib.sha256(leaf.encode()).hexdigest() for leaf in leaves]
+    while len(hashes) > 1:
+        # If odd number, duplicate last hash
+        if len(hashes) % 2 != 0:
+            hashes.append(hashes[-1])
+        hashes = [
+            hashlib.sha256((hashes[i] + hashes[i + 1]).encode()).hexdigest()
+            for i in range(0, len(hashes), 2)
+        ]
+    return hashes[0]
+
 class CheckpointManager:
     """
     Manages blockchain checkpoints for fast recovery and long-range attack protection.
@@ -166,6 +336,7 @@ class CheckpointManager:
     - Manual checkpoint creation
     - Atomic checkpoint writes with backup
     - Automatic cleanup of old checkpoints
+    - Optional delta checkpoints between periodic full (base) checkpoints
     - Fast blockchain recovery on startup
     - Protection against reorganization before last checkpoint
     """
@@ -175,6 +346,7 @@ class CheckpointManager:
         data_dir: str = "data",
         checkpoint_interval: int = 1000,
         max_checkpoints: int = 10,
+        full_checkpoint_every: int = 1,
     ):
         """
         Initialize checkpoint manager.
@@ -183,10 +355,20 @@ class CheckpointManager:
             data_dir: Base directory for blockchain data
             checkpoint_interval: Create checkpoint every N blocks (default: 1000)
             max_checkpoints: Maximum number of checkpoints to keep (default: 10)
+            full_checkpoint_every: Store the full UTXO set every N checkpoints
+                and only the UTXO delta in between (default: 1, always full)
         """
+        if full_checkpoint_every < 1:
+            raise ValueError("full_checkpoint_every must be at least 1")
         self.data_dir = data_dir
         self.checkpoint_interval = checkpoint_interval
         self.max_checkpoints = max_checkpoints
+        self.full_checkpoint_every = full_checkpoint_every
+
+        # Latest checkpoint the UTXO manager tracks changes from, the parent of the next delta
+        self._state_height: int | None = None
+        self._state_base_height: int | None = None
+        self._state_chain_length = 0  # Deltas since the base
 
         # Create checkpoints directory
         self.checkpoints_dir = os.path.join(data_dir, "checkpoints")
@@ -248,25 +430,46 @@ class CheckpointManager:
         try:
             logger.info(f"Creating checkpoint at height {block.index}")
 
-            # Create UTXO snapshot (thread-safe)
-            utxo_snapshot = utxo_manager.snapshot()
+            # Take the changes since the previous checkpoint, or a full UTXO
+            # snapshot (thread-safe); either way change tracking restarts here
+            track_changes = self.full_checkpoint_every > 1
+            delta = utxo_manager.take_changes() if self._can_write_delta(block.index) else None
 
             # Create checkpoint object
-            checkpoint = Checkpoint(
-                height=block.index,
-                block_hash=block.hash,
-                previous_hash=block.previous_hash,
-                utxo_snapshot=utxo_snapshot,
-                timestamp=block.timestamp,
-                difficulty=block.difficulty,
-                total_supply=total_supply,
-                merkle_root=block.merkle_root,
-                nonce=block.nonce,
-            )
+            if delta is not None:
+                delta["total_utxos"] = utxo_manager.total_utxos
+                delta["total_value"] = utxo_manager.total_value
+                checkpoint = DeltaCheckpoint(
+                    height=block.index,
+                    block_hash=block.hash,
+                    previous_hash=block.previous_hash,
+                    utxo_delta=delta,
+                    parent_height=self._state_height,
+                    base_height=self._state_base_height,
+                    timestamp=block.timestamp,
+                    difficulty=block.difficulty,
+                    total_supply=total_supply,
+                    merkle_root=block.merkle_root,
+                    nonce=block.nonce,
+                )
+            else:
+                checkpoint = Checkpoint(
+                    height=block.index,
+                    block_hash=block.hash,
+                    previous_hash=block.previous_hash,
+                    utxo_snapshot=utxo_manager.snapshot(mark_changes=track_changes),
+                    timestamp=block.timestamp,
+                    difficulty=block.difficulty,
+                    total_supply=total_supply,
+                    merkle_root=block.merkle_root,
+                    nonce=block.nonce,
+                )
 
             # Save checkpoint atomically
             if self._save_checkpoint_atomic(checkpoint):
                 self.latest_checkpoint_height = block.index
+                if track_changes:
+                    self._remember_state(checkpoint)
                 logger.info(
                     f"Checkpoint created successfully at height {block.index}, "
                     f"hash: {checkpoint.checkpoint_hash[:16]}..."
@@ -277,13 +480,26 @@ class CheckpointManager:
 
                 return checkpoint
             else:
+                # Tracking restarted at a checkpoint that was never written
+                self._state_height = None
                 logger.error(f"Failed to save checkpoint at height {block.index}")
                 return None
 
         except (OSError, IOError, ValueError, TypeError, RuntimeError, KeyError, AttributeError) as e:
+            self._state_height = None
             logger.error(f"Error creating checkpoint at height {block.index}: {e}")
             return None
 
+    def resume_delta_chain(self, checkpoint: Checkpoint, utxo_manager: "UTXOManager") -> None:
+        """
+        Continue the delta chain after restoring a loaded checkpoint.
+
+        Call right after ``utxo_manager.restore(checkpoint.utxo_snapshot)``
+        so the next checkpoint can be a delta against this one.
+        """
+        if self.full_checkpoint_every > 1 and checkpoint.height == self._state_height:
+            utxo_manager.mark_changes()
+
     def _save_checkpoint_atomic(self, checkpoint: Checkpoint) -> bool:
         """
         Save checkpoint atomically to prevent corruption.
@@ -296,9 +512,7 @@ class CheckpointManager:
         Returns:
             True if successful, False otherwise
         """
-        checkpoint_file = os.path.join(
-            self.checkpoints_dir, f"cp_{checkpoint.height}.json"
-        )
+        checkpoint_file = os.path.join(self.checkpoints_dir, self._checkpoint_filename(checkpoint))
         temp_file = checkpoint_file + ".tmp"
 
         try:
@@ -332,6 +546,11 @@ class CheckpointManager:
             if os.path.exists(backup_file):
                 os.remove(backup_file)
 
+            # A height has one checkpoint: drop one stored in the other format
+            stale = self._checkpoint_files().get(checkpoint.height)
+            if stale and stale[0] != os.path.basename(checkpoint_file):
+                os.remove(os.path.join(self.checkpoints_dir, stale[0]))
+
             logger.debug(f"Checkpoint saved atomically: {checkpoint_file}")
             return True
 
@@ -349,30 +568,60 @@ class CheckpointManager:
         """
         Load a checkpoint from disk.
 
+        A delta checkpoint is returned with its full UTXO snapshot rebuilt
+        from the base checkpoint and every delta up to ``height``.
+
         Args:
             height: Block height of the checkpoint to load
 
         Returns:
             Checkpoint object if found and valid, None otherwise
         """
-        checkpoint_file = os.path.join(self.checkpoints_dir, f"cp_{height}.json")
-
-        if not os.path.exists(checkpoint_file):
+        files = self._checkpoint_files()
+        if height not in files:
             logger.debug(f"Checkpoint not found at height {height}")
             return None
 
         try:
-            with open(checkpoint_file, "r") as f:
-                data = json.load(f)
+            # Walk back to the base checkpoint
+            chain = [height]
+            while files[chain[-1]][1] is not None:
+                parent = files[chain[-1]][1]
+                if parent not in files or parent >= chain[-1]:
+                    logger.error(
+                        f"Checkpoint at height {height} depends on missing checkpoint {parent}"
+                    )
+                    return None
+                chain.append(parent)
 
-            checkpoint = Checkpoint.from_dict(data)
+            checkpoint = None
+            index = None
+            for chain_height in reversed(chain):
+                with open(os.path.join(self.checkpoints_dir, files[chain_height][0]), "r") as f:
+                    checkpoint = Checkpoint.from_dict(json.load(f))
 
-            # Verify checkpoint integrity
-            if not checkpoint.verify_integrity():
-                logger.error(
-                    f"Checkpoint integrity verification failed for height {height}"
-                )
-                return None
+                # Verify checkpoint integrity
+                if not checkpoint.verify_integrity():
+                    logger.error(
+                        f"Checkpoint integrity verification failed for height {chain_height}"
+                    )
+                    return None
+
+                if isinstance(checkpoint, DeltaCheckpoint):
+                    apply_utxo_delta(index, checkpoint.utxo_delta)
+                else:
+                    index = _index_utxo_set(checkpoint.utxo_snapshot.get("utxo_set", {}))
+
+            if isinstance(checkpoint, DeltaCheckpoint):
+                checkpoint.utxo_snapshot = {
+                    "utxo_set": _utxo_set_from_index(index),
+                    "total_utxos": checkpoint.utxo_delta.get("total_utxos", 0),
+                    "total_value": checkpoint.utxo_delta.get("total_value", 0.0),
+                }
+
+            if height == self.latest_checkpoint_height and self.full_checkpoint_every > 1:
+                # Next delta can extend this chain once the state is restored
+                self._remember_state(checkpoint, chain_length=len(chain) - 1)
 
             logger.info(f"Loaded checkpoint at height {height}")
             return checkpoint
@@ -413,16 +662,74 @@ class CheckpointManager:
         if not os.path.exists(self.checkpoints_dir):
             return []
 
-        checkpoints = []
+        return sorted(self._checkpoint_files())
+
+    def _checkpoint_filename(self, checkpoint: Checkpoint) -> str:
+        if isinstance(checkpoint, DeltaCheckpoint):
+            return f"cpd_{checkpoint.height}_{checkpoint.parent_height}.json"
+        return f"cp_{checkpoint.height}.json"
+
+    def _checkpoint_files(self) -> dict[int, tuple[str, int | None]]:
+        """
+        Map checkpoint height to (filename, parent height).
+
+        Full checkpoints are "cp_HEIGHT.json" (parent None); delta
+        checkpoints are "cpd_HEIGHT_PARENT.json".
+        """
+        if not os.path.exists(self.checkpoints_dir):
+            return {}
+
+        files: dict[int, tuple[str, int | None]] = {}
         for filename in os.listdir(self.checkpoints_dir):
-            if filename.startswith("cp_") and filename.endswith(".json"):
-                try:
+            if not filename.endswith(".json"):
+                continue
+            try:
+                if filename.startswith("cp_"):
                     height = int(filename[3:-5])  # Extract height from "cp_HEIGHT.json"
-                    checkpoints.append(height)
-                except ValueError:
-                    continue
+                    files[height] = (filename, None)
+                elif filename.startswith("cpd_"):
+                    height, parent = (int(part) for part in filename[4:-5].split("_"))
+                    files.setdefault(height, (filename, parent))
+            except ValueError:
+                continue
+
+        return files
+
+    def _required_checkpoints(self, heights: list[int]) -> set[int]:
+        """Heights plus every checkpoint their delta chains depend on."""
+        files = self._checkpoint_files()
+        required: set[int] = set()
+        for height in heights:
+            while height in files and height not in required:
+                required.add(height)
+                parent = files[height][1]
+                if parent is None:
+                    break
+                height = parent
+        return required
+
+    def _can_write_delta(self, height: int) -> bool:
+        """True if the next checkpoint can be a delta against the tracked state."""
+        return (
+            self.full_checkpoint_every > 1
+            and self._state_height is not None
+            and self._state_height == self.latest_checkpoint_height
+            and self._state_height < height
+            and self._state_chain_length + 1 < self.full_checkpoint_every
+            and self._state_height in self._checkpoint_files()
+        )
 
-        return sorted(checkpoints)
+    def _remember_state(self, checkpoint: Checkpoint, chain_length: int | None = None) -> None:
+        """Record a checkpoint as the parent of the next delta."""
+        self._state_height = checkpoint.height
+        if isinstance(checkpoint, DeltaCheckpoint):
+            self._state_base_height = checkpoint.base_height
+            self._state_chain_length = (
+                chain_length if chain_length is not None else self._state_chain_length + 1
+            )
+        else:
+            self._state_base_height = checkpoint.height
+            self._state_chain_length = 0
 
     def _cleanup_old_checkpoints(self) -> None:
         """
@@ -434,20 +741,24 @@ class CheckpointManager:
         if len(checkpoints) <= self.max_checkpoints:
             return
 
-        # Keep only the newest max_checkpoints
-        checkpoints_to_keep = sorted(checkpoints, reverse=True)[: self.max_checkpoints]
+        # Keep only the newest max_checkpoints, plus the checkpoints their deltas need
+        checkpoints_to_keep = self._required_checkpoints(
+            sorted(checkpoints, reverse=True)[: self.max_checkpoints]
+        )
         checkpoints_to_remove = [h for h in checkpoints if h not in checkpoints_to_keep]
+        files = self._checkpoint_files()
 
         # Prune old checkpoints
         pruned_count = 0
         for height in checkpoints_to_remove:
             if self._should_prune_checkpoint(height):
-                checkpoint_file = os.path.join(self.checkpoints_dir, f"cp_{height}.json")
+                filename = files[height][0]
+                checkpoint_file = os.path.join(self.checkpoints_dir, filename)
                 try:
                     # Create backup before deletion (optional safety measure)
                     backup_dir = os.path.join(self.checkpoints_dir, "pruned")
                     os.makedirs(backup_dir, exist_ok=True)
-                    backup_file = os.path.join(backup_dir, f"cp_{height}.json")
+                    backup_file = os.path.join(backup_dir, filename)
 
                     if os.path.exists(checkpoint_file):
                         # Move to pruned directory instead of deleting (for recovery)
@@ -466,6 +777,7 @@ class CheckpointManager:
             shutil.rmtree(self.checkpoints_dir, ignore_errors=True)
             os.makedirs(self.checkpoints_dir, exist_ok=True)
             self.latest_checkpoint_height = None
+            self._state_height = None
             logger.info("All checkpoints removed; ledger will rebuild from genesis.")
         except (OSError, IOError) as exc:
             logger.error("Failed to reset checkpoint directory", error=str(exc))
@@ -485,9 +797,11 @@ class CheckpointManager:
         if height == 0:
             return False
 
-        # Don't prune if it's one of the keep candidates
+        # Don't prune if it's one of the keep candidates or a delta depends on it
         checkpoints = self.list_checkpoints()
-        checkpoints_to_keep = sorted(checkpoints, reverse=True)[: self.max_checkpoints]
+        checkpoints_to_keep = self._required_checkpoints(
+            sorted(checkpoints, reverse=True)[: self.max_checkpoints]
+        )
 
         return height not in checkpoints_to_keep
 
@@ -521,6 +835,7 @@ class CheckpointManager:
             "latest_checkpoint_height": self.latest_checkpoint_height,
             "checkpoint_interval": self.checkpoint_interval,
             "max_checkpoints": self.max_checkpoints,
+            "full_checkpoint_every": self.full_checkpoint_every,
             "checkpoints_dir": self.checkpoints_dir,
             "available_checkpoints": checkpoints,
         }
@@ -535,12 +850,19 @@ class CheckpointManager:
         Returns:
             True if successful, False otherwise
         """
-        checkpoint_file = os.path.join(self.checkpoints_dir, f"cp_{height}.json")
-
-        if not os.path.exists(checkpoint_file):
+        files = self._checkpoint_files()
+        if height not in files:
             logger.warn(f"Checkpoint at height {height} does not exist")
             return False
 
+        dependents = [h for h, (_, parent) in files.items() if parent == height]
+        if dependents:
+            logger.warning(
+                f"Checkpoint at height {height} is required by delta checkpoints {sorted(dependents)}"
+            )
+            return False
+
+        checkpoint_file = os.path.join(self.checkpoints_dir, files[height][0])
         try:
             os.remove(checkpoint_file)
             logger.info(f"Deleted checkpoint at height {height}")
@@ -17,7 +17,12 @@ import time
 from xai.core.config import Config
 from xai.core.transactions.nonce_tracker import NonceTracker, get_nonce_tracker
 from xai.core.security.security_validation import SecurityValidator, ValidationError
-from xai.core.api.structured_logger import StructuredLogger, get_structured_logger
+from xai.core.api.structured_logger import (
+    HotPathLogger,
+    StructuredLogger,
+    get_hot_path_logger,
+    get_structured_logger,
+)
 from xai.core.transactions.utxo_manager import UTXOManager, get_utxo_manager
 from xai.core.consensus.validation import validate_address, validate_amount, validate_fee, MonetaryAmount
 from xai.core.constants import MINIMUM_TRANSACTION_AMOUNT
@@ -53,6 +58,11 @@ class TransactionValidator:
         self.security_validator = SecurityValidator()
         self.utxo_manager = utxo_manager or get_utxo_manager()
 
+    @property
+    def _hot_log(self) -> HotPathLogger:
+        """Sampled logger for per-transaction validation outcomes."""
+        return get_hot_path_logger(self.logger)
+
     def validate_transaction(
         self, transaction: "Transaction", is_mempool_check: bool = True
     ) -> bool:
@@ -415,22 +425,22 @@ class TransactionValidator:
 
     def _log_valid_transaction(self, transaction: "Transaction") -> None:
         """Log successful transaction validation."""
-        txid_str = str(transaction.txid)
-        txid_short = txid_str[:10] if len(txid_str) >= 10 else txid_str
-        self.logger.debug(
-            f"Transaction {txid_short}... is valid.", txid=transaction.txid
-        )
+        hot = self._hot_log
+        if hot.enabled("DEBUG", "tx.valid"):
+            hot.emit(
+                "DEBUG", "tx.valid", "Transaction %.10s... is valid.",
+                str(transaction.txid), txid=transaction.txid,
+            )
 
     def _log_validation_error(self, transaction: "Transaction", error: ValidationError) -> None:
         """Log validation error."""
-        txid = getattr(transaction, "txid", "UNKNOWN")
-        txid_str = str(txid)
-        txid_short = txid_str[:10] if txid and len(txid_str) >= 10 else txid_str
-        self.logger.warn(
-            f"Transaction validation failed for {txid_short}...: {error}",
-            txid=txid,
-            error=str(error),
-        )
+        hot = self._hot_log
+        if hot.enabled("WARN", "tx.invalid"):
+            txid = getattr(transaction, "txid", "UNKNOWN")
+            hot.emit(
+                "WARN", "tx.invalid", "Transaction validation failed for %.10s...: %s",
+                str(txid), error, txid=txid, error=str(error),
+            )
 
     def _log_unexpected_error(self, transaction: "Transaction", error: Exception) -> None:
         """Log unexpected error during validation."""
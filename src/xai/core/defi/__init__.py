@@ -29,6 +29,7 @@ from .concentrated_liquidity import (
 from .concentrated_liquidity import Position as CLPosition
 from .flash_loans import FlashLoanProvider
 from .lending import CollateralManager, LendingFactory, LendingPool
+from .liquidation_index import LiquidationIndex
 from .liquidity_mining import (
     FarmFactory,
     LiquidityFarm,
@@ -37,7 +38,7 @@ from .liquidity_mining import (
 )
 from .oracle import OracleAggregator, PriceOracle
 from .staking import DelegationManager, StakingPool
-from .swap_router import LimitOrder, PoolInfo, SwapPath, SwapRouter
+from .swap_router import LimitOrder, PoolInfo, SplitRoute, SwapPath, SwapRouter
 from .vesting import (
     VestingCurve,
     VestingCurveType,
@@ -50,6 +51,7 @@ __all__ = [
     "LendingPool",
     "LendingFactory",
     "CollateralManager",
+    "LiquidationIndex",
     # Flash Loans
     "FlashLoanProvider",
     # Staking
@@ -62,6 +64,7 @@ __all__ = [
     "SwapRouter",
     "LimitOrder",
     "SwapPath",
+    "SplitRoute",
     "PoolInfo",
     # Vesting
     "VestingVault",
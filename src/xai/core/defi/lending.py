@@ -27,6 +27,7 @@ from enum import Enum
 from typing import TYPE_CHECKING
 
 from ..vm.exceptions import VMExecutionError
+from .liquidation_index import LiquidationIndex
 from .safe_math import (
     MAX_COLLATERAL,
     MAX_DEBT,
@@ -177,6 +178,10 @@ class LendingPool:
     # Protocol parameters
     close_factor: int = 5000  # 50% max liquidation per tx (basis points)
 
+    # Liquidation index (positions bucketed by accrual-independent health ratio)
+    liquidation_index: LiquidationIndex = field(default_factory=LiquidationIndex, repr=False)
+    liquidation_tolerance_bps: int = 100  # Rounding slack when selecting index candidates
+
     # Pause state
     paused: bool = False
 
@@ -295,6 +300,7 @@ class LendingPool:
 
         # Verify invariant
         assert_supply_debt_invariant(state.total_supplied, state.total_borrowed)
+        self._index_position(position.user)
 
         logger.info(
             "Asset supplied to lending pool",
@@ -369,6 +375,7 @@ class LendingPool:
 
         # Verify invariant
         assert_supply_debt_invariant(state.total_supplied, state.total_borrowed)
+        self._index_position(position.user)
 
         logger.info(
             "Asset withdrawn from lending pool",
@@ -594,6 +601,7 @@ class LendingPool:
         # Verify invariant
         assert_supply_debt_invariant(state.total_supplied, state.total_borrowed)
         assert_utilization_in_bounds(state.total_supplied, state.total_borrowed)
+        self._index_position(position.user)
 
         logger.info(
             "Asset borrowed from lending pool",
@@ -660,6 +668,7 @@ class LendingPool:
 
         # Verify invariant
         assert_supply_debt_invariant(state.total_supplied, state.total_borrowed)
+        self._index_position(position.user)
 
         logger.info(
             "Debt repaid to lending pool",
@@ -775,6 +784,8 @@ class LendingPool:
 
         # Verify invariant
         assert_supply_debt_invariant(debt_state.total_supplied, debt_state.total_borrowed)
+        self._index_position(position.user)
+        self._index_position(liquidator_position.user)
 
         logger.warning(
             "Position liquidated",
@@ -889,6 +900,62 @@ class LendingPool:
             "ltv": (total_debt * self.BASIS_POINTS // total_collateral) if total_collateral > 0 else 0,
         }
 
+    def get_liquidatable_positions(
+        self,
+        asset: str | None = None,
+        limit: int | None = None,
+    ) -> list[dict]:
+        """
+        Get all positions below health factor 1.0.
+
+        Uses the liquidation index to select candidates whose health ratio
+        is below the current threshold of their (collateral, debt) pair,
+        then confirms each with the exact health factor. Thresholds are
+        derived from the current indices and prices, so neither interest
+        accrual nor oracle updates require re-indexing.
+
+        Args:
+            asset: Only consider positions collateralized by this asset
+            limit: Maximum number of positions to return
+
+        Returns:
+            List of {"user", "health_factor"} sorted by health factor (lowest first)
+        """
+        index = self.liquidation_index
+        candidates = index.unbucketed()
+        widen = 1 + self.liquidation_tolerance_bps / self.BASIS_POINTS
+        for collateral_asset, debt_asset in index.pairs(asset):
+            threshold = self._liquidation_threshold_ratio(collateral_asset, debt_asset)
+            candidates |= index.candidates(collateral_asset, debt_asset, threshold * widen)
+
+        liquidatable = []
+        for user in candidates:
+            position = self.positions.get(user)
+            if position is None:
+                continue
+            if asset is not None and not position.supplied.get(asset):
+                continue
+            health_factor = self._calculate_health_factor(position)
+            if health_factor < self.RAY:
+                liquidatable.append({"user": user, "health_factor": health_factor})
+
+        liquidatable.sort(key=lambda entry: entry["health_factor"])
+        if limit is not None:
+            liquidatable = liquidatable[:limit]
+        return liquidatable
+
+    def rebuild_liquidation_index(self) -> int:
+        """
+        Re-index every position (e.g. after changing asset configuration).
+
+        Returns:
+            Number of positions indexed
+        """
+        self.liquidation_index.clear()
+        for user in self.positions:
+            self._index_position(user)
+        return len(self.liquidation_index)
+
     def get_reserve_data(self, asset: str) -> dict:
         """Get reserve/pool data for an asset."""
         self._require_asset(asset)
@@ -1089,6 +1156,60 @@ class LendingPool:
 
         return health_factor
 
+    def _index_position(self, user: str) -> None:
+        """Refresh a position's entry in the liquidation index."""
+        index = self.liquidation_index
+        position = self.positions.get(user)
+        if position is None:
+            index.remove(user)
+            return
+
+        debt = [asset for asset, principal in position.borrowed.items() if principal > 0]
+        if not debt:
+            index.remove(user)
+            return
+
+        collateral = [
+            asset for asset, a_tokens in position.supplied.items()
+            if a_tokens > 0 and asset in self.assets
+        ]
+        if len(collateral) != 1 or len(debt) != 1:
+            index.update_unbucketed(user)
+            return
+
+        collateral_asset, debt_asset = collateral[0], debt[0]
+        a_tokens = position.supplied[collateral_asset]
+        principal = position.borrowed[debt_asset]
+        user_index = position.borrow_index.get(debt_asset)
+        threshold = self.assets[collateral_asset].liquidation_threshold
+        tolerance = self.liquidation_tolerance_bps
+
+        # The health factor rounds collateral down and debt up; small
+        # amounts can push it further from the ratio than the tolerance.
+        if (
+            not user_index
+            or a_tokens * threshold * tolerance < 4 * self.BASIS_POINTS * self.BASIS_POINTS
+            or principal * tolerance < 2 * self.BASIS_POINTS
+        ):
+            index.update_unbucketed(user)
+            return
+
+        index.update(
+            user, collateral_asset, debt_asset,
+            a_tokens * threshold * user_index / principal,
+        )
+
+    def _liquidation_threshold_ratio(self, collateral_asset: str, debt_asset: str) -> float:
+        """Health ratio below which a (collateral, debt) position is liquidatable."""
+        numerator = (
+            self.pool_states[debt_asset].borrow_index
+            * self._get_price(debt_asset)
+            * self.RAY
+            * self.BASIS_POINTS
+        )
+        denominator = self.pool_states[collateral_asset].supply_index * self._get_price(collateral_asset)
+        return numerator / denominator
+
     # ==================== Oracle Integration ====================
 
     def _get_price(self, asset: str) -> int:
@@ -0,0 +1,187 @@
+"""
+Liquidation Index for Lending Pools.
+
+Groups borrowing positions by a health ratio that neither interest accrual
+nor price updates change. For a position with a single collateral asset C
+and a single debt asset D:
+
+    ratio = a_tokens(C) * liquidation_threshold(C) * user_borrow_index(D) / principal(D)
+
+Its health factor falls below 1.0 exactly when
+
+    ratio < borrow_index(D) * price(D) * RAY * BASIS_POINTS / (supply_index(C) * price(C))
+
+(up to the pool's integer rounding). The right-hand side is one threshold
+per (collateral, debt) pair, computed at query time from the current
+indices and prices, so "every position liquidatable now" is a range query
+over logarithmic ratio buckets. Entries change only when the position
+itself changes (supply, withdraw, borrow, repay, liquidate).
+
+Positions that do not reduce to one ratio (several collateral or debt
+assets, legacy debt without a borrow index snapshot, amounts small enough
+for rounding to matter) are kept unbucketed and checked exactly by the
+caller on every query.
+"""
+
+from __future__ import annotations
+
+import bisect
+import math
+from collections import defaultdict
+
+Pair = tuple[str, str]  # (collateral asset, debt asset)
+
+
+class LiquidationIndex:
+    """
+    Bucketed health ratios per (collateral, debt) asset pair.
+
+    Bucket ``b`` of a pair holds positions whose ratio lies in
+    ``[base**b, base**(b+1))`` with ``base = 1 + bucket_bps / 10000``.
+    """
+
+    BASIS_POINTS = 10000
+
+    def __init__(self, bucket_bps: int = 50) -> None:
+        """
+        Initialize the index.
+
+        Args:
+            bucket_bps: Relative width of a ratio bucket (basis points)
+        """
+        if bucket_bps <= 0:
+            raise ValueError("bucket_bps must be positive")
+        self._log_base = math.log1p(bucket_bps / self.BASIS_POINTS)
+
+        # pair -> bucket -> {user: ratio}
+        self._buckets: dict[Pair, dict[int, dict[str, float]]] = defaultdict(dict)
+        # pair -> sorted bucket ids present in _buckets[pair]
+        self._bucket_ids: dict[Pair, list[int]] = defaultdict(list)
+        # user -> (pair, bucket)
+        self._entries: dict[str, tuple[Pair, int]] = {}
+        # Positions the caller checks exactly on every query
+        self._unbucketed: set[str] = set()
+
+    def __len__(self) -> int:
+        return len(self._entries) + len(self._unbucketed)
+
+    def __contains__(self, user: str) -> bool:
+        return user in self._entries or user in self._unbucketed
+
+    # ==================== Maintenance ====================
+
+    def update(self, user: str, collateral_asset: str, debt_asset: str, ratio: float) -> None:
+        """
+        Index a single-collateral, single-debt position.
+
+        Args:
+            user: Position owner
+            collateral_asset: The position's only collateral asset
+            debt_asset: The position's only debt asset
+            ratio: a_tokens * liquidation_threshold * user_borrow_index / principal
+        """
+        if ratio <= 0:
+            raise ValueError("ratio must be positive")
+        self.remove(user)
+
+        pair = (collateral_asset, debt_asset)
+        bucket = self._bucket_of(ratio)
+        buckets = self._buckets[pair]
+        members = buckets.get(bucket)
+        if members is None:
+            members = buckets[bucket] = {}
+            bisect.insort(self._bucket_ids[pair], bucket)
+        members[user] = ratio
+        self._entries[user] = (pair, bucket)
+
+    def update_unbucketed(self, user: str) -> None:
+        """Track a position that must be checked exactly on every query."""
+        self.remove(user)
+        self._unbucketed.add(user)
+
+    def remove(self, user: str) -> None:
+        """Drop a position from the index."""
+        self._unbucketed.discard(user)
+
+        entry = self._entries.pop(user, None)
+        if entry is None:
+            return
+        pair, bucket = entry
+        members = self._buckets[pair][bucket]
+        del members[user]
+        if not members:
+            del self._buckets[pair][bucket]
+            ids = self._bucket_ids[pair]
+            ids.pop(bisect.bisect_left(ids, bucket))
+            if not ids:
+                del self._buckets[pair]
+                del self._bucket_ids[pair]
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        self._buckets.clear()
+        self._bucket_ids.clear()
+        self._entries.clear()
+        self._unbucketed.clear()
+
+    # ==================== Queries ====================
+
+    def candidates(self, collateral_asset: str, debt_asset: str, threshold: float) -> set[str]:
+        """
+        Positions of a pair whose ratio is below ``threshold``.
+
+        Args:
+            collateral_asset: Collateral asset of the pair
+            debt_asset: Debt asset of the pair
+            threshold: Pair threshold, already widened by any rounding tolerance
+
+        Returns:
+            Set of candidate users
+        """
+        pair = (collateral_asset, debt_asset)
+        buckets = self._buckets.get(pair)
+        if not buckets or threshold <= 0:
+            return set()
+
+        ids = self._bucket_ids[pair]
+        last = self._bucket_of(threshold)
+        result: set[str] = set()
+        for bucket in ids[:bisect.bisect_right(ids, last)]:
+            members = buckets[bucket]
+            if bucket == last:
+                result.update(user for user, ratio in members.items() if ratio < threshold)
+            else:
+                result.update(members)
+        return result
+
+    def unbucketed(self) -> set[str]:
+        """Positions checked exactly on every query."""
+        return set(self._unbucketed)
+
+    def pairs(self, collateral_asset: str | None = None) -> list[Pair]:
+        """(collateral, debt) pairs that currently have indexed positions."""
+        return [
+            pair for pair in self._buckets
+            if collateral_asset is None or pair[0] == collateral_asset
+        ]
+
+    def ratio(self, user: str) -> float | None:
+        """Indexed health ratio of a position, or None if it is not bucketed."""
+        entry = self._entries.get(user)
+        if entry is None:
+            return None
+        pair, bucket = entry
+        return self._buckets[pair][bucket][user]
+
+    def get_stats(self) -> dict:
+        """Get index statistics."""
+        return {
+            "positions": len(self),
+            "unbucketed": len(self._unbucketed),
+            "buckets": {f"{c}/{d}": len(ids) for (c, d), ids in self._bucket_ids.items()},
+        }
+
+    # ==================== Internals ====================
+
+    def _bucket_of(self, ratio: float) -> int:
+        return math.floor(math.log(ratio) / self._log_base)
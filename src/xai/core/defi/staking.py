@@ -23,6 +23,7 @@ from dataclasses import dataclass, field
 from enum import Enum
 from typing import TYPE_CHECKING
 
+from ..api.structured_logger import get_hot_path_logger
 from ..vm.exceptions import VMExecutionError
 from .access_control import AccessControl, Role, RoleBasedAccessControl, SignedRequest
 
@@ -30,6 +31,11 @@ if TYPE_CHECKING:
     from ..blockchain import Blockchain
 
 logger = logging.getLogger(__name__)
+hot_logger = get_hot_path_logger(logger)
+
+# Accumulator scale; larger than any delegation amount so that truncating
+# the per-share increment costs a delegation less than one unit per distribution
+REWARD_PRECISION = 10**36
 
 class ValidatorStatus(Enum):
     """Validator status."""
@@ -62,6 +68,14 @@ class Validator:
     # Rewards
     accumulated_rewards: int = 0
 
+    # Delegator reward accumulator
+    acc_reward_per_share: int = 0  # Scaled by REWARD_PRECISION
+    reward_stake: int = 0  # Delegated stake currently earning from the accumulator
+    reward_remainder: int = 0  # Scaled rewards not yet divisible into the accumulator
+    reward_dust: int = 0  # Scaled rounding dust from settlements, owed to the validator
+    # Rewards credited to the accumulator but not yet settled into delegations
+    outstanding_delegator_rewards: int = 0
+
     @property
     def total_stake(self) -> int:
         """Total stake (self + delegated)."""
@@ -87,7 +101,23 @@ class Delegation:
     unbonding_completion: float = 0.0
 
     # Rewards tracking
-    accumulated_rewards: int = 0  # Unclaimed delegator rewards
+    settled_rewards: int = 0  # Rewards realised from the validator accumulator
+    reward_amount: int = 0  # Stake earning from the accumulator since last settlement
+    reward_debt: int = 0  # reward_amount * acc_reward_per_share at last settlement
+    validator_ref: Validator | None = field(default=None, repr=False, compare=False)
+
+    @property
+    def pending_rewards(self) -> int:
+        """Whole rewards accrued on the validator accumulator since the last settlement."""
+        if self.validator_ref is None:
+            return 0
+        accrued = self.reward_amount * self.validator_ref.acc_reward_per_share - self.reward_debt
+        return accrued // REWARD_PRECISION
+
+    @property
+    def accumulated_rewards(self) -> int:
+        """Unclaimed delegator rewards (settled + pending)."""
+        return self.settled_rewards + self.pending_rewards
 
 @dataclass
 class StakingPool:
@@ -285,16 +315,21 @@ class StakingPool:
         if validator_norm in self.delegations[caller_norm]:
             # Add to existing delegation
             delegation = self.delegations[caller_norm][validator_norm]
+            self._settle_rewards(delegation)
             delegation.amount += amount
             delegation.shares += shares
+            self._track_rewards(delegation)
         else:
             # New delegation
-            self.delegations[caller_norm][validator_norm] = Delegation(
+            delegation = Delegation(
                 delegator=caller_norm,
                 validator=validator_norm,
                 amount=amount,
                 shares=shares,
+                validator_ref=val,
             )
+            self._track_rewards(delegation)
+            self.delegations[caller_norm][validator_norm] = delegation
 
         # Update validator
         val.delegated_stake += amount
@@ -350,8 +385,10 @@ class StakingPool:
         shares_to_remove = (amount * delegation.shares) // delegation.amount
 
         # Update delegation
+        self._settle_rewards(delegation)
         delegation.amount -= amount
         delegation.shares -= shares_to_remove
+        self._track_rewards(delegation)
 
         # Start unbonding
         delegation.unbonding_amount += amount
@@ -456,10 +493,13 @@ class StakingPool:
             raise VMExecutionError("Destination validator not active")
 
         # Remove from source
+        src_val = self.validators[src_norm]
         shares_removed = (amount * delegation.shares) // delegation.amount
+        self._settle_rewards(delegation)
         delegation.amount -= amount
         delegation.shares -= shares_removed
-        self.validators[src_norm].delegated_stake -= amount
+        self._track_rewards(delegation)
+        src_val.delegated_stake -= amount
 
         # Add to destination
         if caller_norm not in self.delegations:
@@ -467,15 +507,20 @@ class StakingPool:
 
         if dst_norm in self.delegations[caller_norm]:
             dst_delegation = self.delegations[caller_norm][dst_norm]
+            self._settle_rewards(dst_delegation)
             dst_delegation.amount += amount
             dst_delegation.shares += shares_removed
+            self._track_rewards(dst_delegation)
         else:
-            self.delegations[caller_norm][dst_norm] = Delegation(
+            dst_delegation = Delegation(
                 delegator=caller_norm,
                 validator=dst_norm,
                 amount=amount,
                 shares=shares_removed,
+                validator_ref=dst_val,
             )
+            self._track_rewards(dst_delegation)
+            self.delegations[caller_norm][dst_norm] = dst_delegation
 
         dst_val.delegated_stake += amount
 
@@ -565,6 +610,12 @@ class StakingPool:
         """
         Distribute rewards to delegators of a specific validator.
 
+        Rewards are added to the validator's per-share accumulator in O(1);
+        delegations realise their share lazily when they are claimed or
+        their amount changes. The scaled remainder of the division is
+        carried into the next distribution, and the fractional rewards
+        left when delegations settle are paid to the validator as dust.
+
         Args:
             validator_addr: Validator address
             validator: Validator object
@@ -573,55 +624,29 @@ class StakingPool:
         Returns:
             Total amount actually distributed
         """
-        if validator.delegated_stake == 0:
+        if validator.reward_stake == 0:
+            # Nobody earns from the accumulator; keep the rewards with the validator
+            validator.accumulated_rewards += total_rewards
             return 0
 
-        distributed = 0
-        dust = 0
-
-        # Iterate through all delegations to this validator
-        for delegator_addr, del_map in self.delegations.items():
-            if validator_addr not in del_map:
-                continue
-
-            delegation = del_map[validator_addr]
-
-            # Calculate proportional share
-            delegator_share = (total_rewards * delegation.amount) // validator.delegated_stake
-
-            # Credit the delegator
-            delegation.accumulated_rewards += delegator_share
-            distributed += delegator_share
-
-        # Handle dust (remaining rewards due to integer division)
-        dust = total_rewards - distributed
-
-        if dust > 0:
-            # Add dust to validator's rewards to prevent loss
-            validator.accumulated_rewards += dust
-            logger.debug(
-                "Reward distribution dust added to validator",
-                extra={
-                    "validator": validator_addr[:10],
-                    "dust_amount": dust,
-                }
+        scaled = total_rewards * REWARD_PRECISION + validator.reward_remainder
+        increment, validator.reward_remainder = divmod(scaled, validator.reward_stake)
+        validator.acc_reward_per_share += increment
+        validator.outstanding_delegator_rewards += total_rewards
+
+        # Once per validator per distribution: sampled and capped per block
+        if hot_logger.enabled("INFO", "staking.delegator_rewards_distributed"):
+            hot_logger.emit(
+                "INFO",
+                "staking.delegator_rewards_distributed",
+                "Delegator rewards distributed",
+                validator=validator_addr[:10],
+                total_rewards=total_rewards,
+                reward_stake=validator.reward_stake,
+                acc_reward_per_share=validator.acc_reward_per_share,
             )
 
-        logger.info(
-            "Delegator rewards distributed",
-            extra={
-                "event": "staking.delegator_rewards_distributed",
-                "validator": validator_addr[:10],
-                "total_rewards": total_rewards,
-                "distributed": distributed,
-                "dust": dust,
-                "num_delegators": sum(
-                    1 for dm in self.delegations.values() if validator_addr in dm
-                ),
-            }
-        )
-
-        return distributed
+        return total_rewards
 
     def claim_rewards(self, caller: str, validator: str) -> int:
         """
@@ -644,8 +669,10 @@ class StakingPool:
         if not delegation:
             raise VMExecutionError("No delegation found")
 
-        # Get accumulated rewards from reward distribution
-        reward_amount = delegation.accumulated_rewards
+        # Realise rewards from the validator accumulator
+        self._settle_rewards(delegation)
+        self._track_rewards(delegation)
+        reward_amount = delegation.settled_rewards
 
         if reward_amount == 0:
             logger.debug(
@@ -658,7 +685,7 @@ class StakingPool:
             return 0
 
         # Reset accumulated rewards
-        delegation.accumulated_rewards = 0
+        delegation.settled_rewards = 0
 
         logger.info(
             "Rewards claimed",
@@ -770,7 +797,9 @@ class StakingPool:
                         del_slash = (
                             remaining * delegation.amount
                         ) // val.delegated_stake
+                        self._settle_rewards(delegation)
                         delegation.amount -= del_slash
+                        self._track_rewards(delegation)
 
                 val.delegated_stake -= remaining
 
@@ -904,7 +933,9 @@ class StakingPool:
                         del_slash = (
                             remaining * delegation.amount
                         ) // val.delegated_stake
+                        self._settle_rewards(delegation)
                         delegation.amount -= del_slash
+                        self._track_rewards(delegation)
 
                 val.delegated_stake -= remaining
 
@@ -1227,6 +1258,51 @@ class StakingPool:
             return None
         return self.delegations[delegator].get(validator)
 
+    def _settle_rewards(self, delegation: Delegation) -> None:
+        """Realise accrued rewards and stop a delegation earning before it changes."""
+        if delegation.validator_ref is None:
+            delegation.validator_ref = self.validators.get(delegation.validator)
+        val = delegation.validator_ref
+        if val is None or delegation.reward_amount == 0:
+            return
+        accrued = delegation.reward_amount * val.acc_reward_per_share - delegation.reward_debt
+        reward, dust = divmod(accrued, REWARD_PRECISION)
+        if reward > 0:
+            delegation.settled_rewards += reward
+            val.outstanding_delegator_rewards -= reward
+        val.reward_dust += dust
+        val.reward_stake -= delegation.reward_amount
+        delegation.reward_amount = 0
+        delegation.reward_debt = 0
+
+        if val.reward_stake == 0:
+            # Every delegation has settled: what is left is remainder and dust
+            dust_rewards = val.outstanding_delegator_rewards
+            val.reward_remainder = 0
+            val.reward_dust = 0
+            val.outstanding_delegator_rewards = 0
+        else:
+            dust_rewards, val.reward_dust = divmod(val.reward_dust, REWARD_PRECISION)
+            val.outstanding_delegator_rewards -= dust_rewards
+        if dust_rewards > 0:
+            val.accumulated_rewards += dust_rewards
+            logger.debug(
+                "Reward distribution dust added to validator",
+                extra={
+                    "validator": val.address[:10],
+                    "dust_amount": dust_rewards,
+                }
+            )
+
+    def _track_rewards(self, delegation: Delegation) -> None:
+        """Start a settled delegation earning on its current amount."""
+        val = delegation.validator_ref
+        if val is None or delegation.amount <= 0:
+            return
+        delegation.reward_amount = delegation.amount
+        delegation.reward_debt = delegation.amount * val.acc_reward_per_share
+        val.reward_stake += delegation.amount
+
     def _get_validator_total_shares(self, validator: str) -> int:
         total = 0
         for del_map in self.delegations.values():
@@ -1253,6 +1329,7 @@ class StakingPool:
                     "status": v.status.value,
                     "jailed_until": v.jailed_until,
                     "accumulated_rewards": v.accumulated_rewards,
+                    "outstanding_delegator_rewards": v.outstanding_delegator_rewards,
                 }
                 for k, v in self.validators.items()
             },
@@ -3,7 +3,8 @@ Swap Router with Multi-Hop Aggregation.
 
 Provides optimal path finding and execution across multiple liquidity pools:
 - Multi-hop routing (A->B->C->D)
-- Path optimization
+- Path optimization with cached candidate paths and memoized quotes
+- Split routing across pool-disjoint paths
 - Slippage protection
 - Signature-based limit orders
 - MEV-resistant execution
@@ -17,11 +18,12 @@ Security features:
 
 from __future__ import annotations
 
+import bisect
 import hashlib
 import heapq
 import logging
 import time
-from collections import defaultdict
+from collections import defaultdict, deque
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import TYPE_CHECKING, Any
@@ -50,6 +52,18 @@ class SwapPath:
     price_impact: int = 0  # Basis points
     gas_estimate: int = 0
 
+
+@dataclass
+class SplitRoute:
+    """A swap divided across several pool-disjoint paths."""
+    paths: list[SwapPath]
+    amounts: list[int]  # Input routed through each path
+    expected_output: int = 0
+
+    @property
+    def gas_estimate(self) -> int:
+        return sum(path.gas_estimate for path in self.paths)
+
 @dataclass
 class LimitOrder:
     """
@@ -225,6 +239,35 @@ class SwapRouter:
     # User nonces for limit orders
     user_nonces: dict[str, int] = field(default_factory=dict)
 
+    # Open-order book: (token_in, token_out) -> [(-effective_price, seq, order_id)] kept sorted
+    _order_book: dict[tuple[str, str], list[tuple[float, int, str]]] = field(default_factory=dict, repr=False)
+    # order_id -> (pair, book entry) for orders currently in the book
+    _book_entries: dict[str, tuple[tuple[str, str], tuple[float, int, str]]] = field(default_factory=dict, repr=False)
+    # (expiry, order_id) min-heap for evicting expired orders
+    _expiry_heap: list[tuple[int, str]] = field(default_factory=list, repr=False)
+    _indexed_orders: set[str] = field(default_factory=set, repr=False)
+    _order_seq: int = 0
+
+    # Route caches. Candidate paths per (token_in, token_out, max_hops) only
+    # change when a pool is registered; quotes per (route, amount) and best
+    # routes per (token_in, token_out, amount, max_hops) are dropped when a
+    # pool they were computed from changes reserves.
+    _route_candidates: dict[tuple[str, str, int], list[tuple[tuple[str, ...], tuple[str, ...]]]] = field(
+        default_factory=dict, repr=False
+    )
+    _quote_cache: dict[tuple[tuple[str, ...], tuple[str, ...]], dict[int, int]] = field(default_factory=dict, repr=False)
+    _routes_by_pool: dict[str, set[tuple[tuple[str, ...], tuple[str, ...]]]] = field(
+        default_factory=lambda: defaultdict(set), repr=False
+    )
+    _best_route_cache: dict[tuple[str, str, int, int], tuple[tuple[tuple[str, ...], tuple[str, ...]], int] | None] = field(
+        default_factory=dict, repr=False
+    )
+    # Best-route key -> pools on its candidate routes, and the reverse
+    _best_route_pools: dict[tuple[str, str, int, int], frozenset[str]] = field(default_factory=dict, repr=False)
+    _best_routes_by_pool: dict[str, set[tuple[str, str, int, int]]] = field(
+        default_factory=lambda: defaultdict(set), repr=False
+    )
+
     # Reentrancy guard
     _in_swap: bool = False
 
@@ -233,6 +276,8 @@ class SwapRouter:
     MAX_SLIPPAGE: int = 1000  # 10% max slippage
     MAX_AMOUNT: int = 2**128 - 1  # Maximum amount to prevent overflow
     MIN_AMOUNT: int = 1  # Minimum amount for meaningful swap
+    QUOTE_CACHE_SIZE: int = 4096  # Max memoized amounts per route / best-route entries
+    SPLIT_STEPS: int = 20  # Granularity of split routing
 
     # Statistics
     total_swaps: int = 0
@@ -282,6 +327,10 @@ class SwapRouter:
         self.token_to_pools[token0.upper()].append(pool_address)
         self.token_to_pools[token1.upper()].append(pool_address)
 
+        # New pools change the route graph
+        self._route_candidates.clear()
+        self._clear_best_routes()
+
         logger.info(
             "Pool registered with router",
             extra={
@@ -306,6 +355,7 @@ class SwapRouter:
         pool = self.pools[pool_address]
         pool.reserve0 = reserve0
         pool.reserve1 = reserve1
+        self._invalidate_pool_quotes(pool_address)
 
         return True
 
@@ -321,8 +371,9 @@ class SwapRouter:
         """
         Find the optimal swap path from token_in to token_out.
 
-        Uses modified Dijkstra's algorithm to find path with
-        maximum output amount.
+        Evaluates every cached candidate path up to max_hops and returns the
+        one with maximum output. Results are memoized until the reserves of
+        a pool on one of the candidate paths change.
 
         Args:
             token_in: Input token
@@ -337,106 +388,209 @@ class SwapRouter:
         token_out = token_out.upper()
         max_hops = max_hops or self.MAX_HOPS
 
-        # Direct path check
-        direct_path = self._find_direct_path(token_in, token_out, amount_in)
-
-        # Multi-hop search
-        all_paths = self._find_all_paths(
-            token_in, token_out, amount_in, max_hops
-        )
-
-        if direct_path:
-            all_paths.append(direct_path)
-
-        if not all_paths:
+        key = (token_in, token_out, amount_in, max_hops)
+        if key in self._best_route_cache:
+            best = self._best_route_cache[key]
+        else:
+            best = None
+            pools: set[str] = set()
+            for route in self._candidate_routes(token_in, token_out, max_hops):
+                pools.update(route[0])
+                output = self._route_output(route, amount_in)
+                # First path with the highest output wins ties
+                if output > 0 and (best is None or output > best[1]):
+                    best = (route, output)
+            if len(self._best_route_cache) >= self.QUOTE_CACHE_SIZE:
+                self._clear_best_routes()
+            self._best_route_cache[key] = best
+            self._best_route_pools[key] = frozenset(pools)
+            for pool_addr in pools:
+                self._best_routes_by_pool[pool_addr].add(key)
+
+        if best is None:
             return None
+        return self._build_path(best[0], amount_in, best[1])
 
-        # Return path with highest output
-        return max(all_paths, key=lambda p: p.expected_output)
-
-    def _find_direct_path(
+    def find_split_route(
         self,
         token_in: str,
         token_out: str,
         amount_in: int,
-    ) -> SwapPath | None:
-        """Find direct single-hop path."""
-        for pool_addr in self.token_to_pools.get(token_in, []):
-            pool = self.pools[pool_addr]
-            if token_out in (pool.token0, pool.token1):
-                output = pool.get_output(token_in, amount_in)
-                if output > 0:
-                    return SwapPath(
-                        pools=[pool_addr],
-                        tokens=[token_in, token_out],
-                        expected_output=output,
-                        price_impact=self._calculate_price_impact(pool, amount_in, token_in),
-                        gas_estimate=100_000,
-                    )
-        return None
+        max_paths: int = 3,
+        max_hops: int | None = None,
+    ) -> SplitRoute | None:
+        """
+        Divide a swap across pool-disjoint paths to maximize total output.
+
+        Picks up to max_paths pool-disjoint paths (best single-path output
+        first), then allocates the input in SPLIT_STEPS equal chunks, each to
+        the path with the largest marginal output. Because the paths share no
+        pool, each leg's output is exact. Falls back to the single best path
+        when splitting does not help.
+
+        Args:
+            token_in: Input token
+            token_out: Output token
+            amount_in: Input amount
+            max_paths: Maximum number of paths to split across
+            max_hops: Maximum number of hops per path (default: MAX_HOPS)
+
+        Returns:
+            SplitRoute or None if no path exists
+        """
+        token_in = token_in.upper()
+        token_out = token_out.upper()
+        max_hops = max_hops or self.MAX_HOPS
 
-    def _find_all_paths(
+        best = self.find_best_path(token_in, token_out, amount_in, max_hops)
+        if best is None:
+            return None
+
+        ranked = []
+        for route in self._candidate_routes(token_in, token_out, max_hops):
+            output = self._route_output(route, amount_in)
+            if output > 0:
+                ranked.append((output, route))
+        ranked.sort(key=lambda item: item[0], reverse=True)
+
+        routes = []
+        used_pools: set[str] = set()
+        for _, route in ranked:
+            if used_pools.isdisjoint(route[0]):
+                routes.append(route)
+                used_pools.update(route[0])
+                if len(routes) >= max_paths:
+                    break
+
+        steps = min(self.SPLIT_STEPS, amount_in)
+        chunk, remainder = divmod(amount_in, steps)
+        allocations = [0] * len(routes)
+        outputs = [0] * len(routes)
+        for step in range(steps):
+            size = chunk + (remainder if step == 0 else 0)
+            best_gain, best_index = -1, 0
+            for i, route in enumerate(routes):
+                gain = self._route_output(route, allocations[i] + size) - outputs[i]
+                if gain > best_gain:
+                    best_gain, best_index = gain, i
+            allocations[best_index] += size
+            outputs[best_index] += best_gain
+
+        if sum(outputs) <= best.expected_output:
+            return SplitRoute(paths=[best], amounts=[amount_in], expected_output=best.expected_output)
+
+        legs = [
+            (self._build_path(route, amount, output), amount)
+            for route, amount, output in zip(routes, allocations, outputs)
+            if amount > 0
+        ]
+        return SplitRoute(
+            paths=[path for path, _ in legs],
+            amounts=[amount for _, amount in legs],
+            expected_output=sum(outputs),
+        )
+
+    def _candidate_routes(
         self,
         token_in: str,
         token_out: str,
-        amount_in: int,
         max_hops: int,
-    ) -> list[SwapPath]:
-        """Find all valid paths up to max_hops."""
-        paths = []
-
-        # BFS with amount tracking
-        # State: (current_token, current_amount, path_pools, path_tokens, visited_pools)
-        queue = [(token_in, amount_in, [], [token_in], set())]
-
+    ) -> list[tuple[tuple[str, ...], tuple[str, ...]]]:
+        """All (pools, tokens) paths up to max_hops, in breadth-first order."""
+        key = (token_in, token_out, max_hops)
+        routes = self._route_candidates.get(key)
+        if routes is not None:
+            return routes
+
+        routes = []
+        # State: (current_token, path_pools, path_tokens)
+        queue = deque([(token_in, (), (token_in,))])
         while queue:
-            current_token, current_amount, path_pools, path_tokens, visited = queue.pop(0)
+            current_token, path_pools, path_tokens = queue.popleft()
 
             if len(path_pools) >= max_hops:
                 continue
 
             for pool_addr in self.token_to_pools.get(current_token, []):
-                if pool_addr in visited:
+                if pool_addr in path_pools:
                     continue
 
-                pool = self.pools[pool_addr]
-                next_token = pool.get_other_token(current_token)
+                next_token = self.pools[pool_addr].get_other_token(current_token)
 
                 # Avoid cycles (except to destination)
                 if next_token in path_tokens and next_token != token_out:
                     continue
 
-                output = pool.get_output(current_token, current_amount)
-                if output <= 0:
-                    continue
+                new_pools = path_pools + (pool_addr,)
+                new_tokens = path_tokens + (next_token,)
+                if next_token == token_out:
+                    routes.append((new_pools, new_tokens))
+                else:
+                    queue.append((next_token, new_pools, new_tokens))
 
-                new_pools = path_pools + [pool_addr]
-                new_tokens = path_tokens + [next_token]
-                new_visited = visited | {pool_addr}
+        self._route_candidates[key] = routes
+        return routes
 
-                if next_token == token_out:
-                    # Found complete path
-                    total_impact = sum(
-                        self._calculate_price_impact(
-                            self.pools[p], amount_in // (i + 1), path_tokens[i]
-                        )
-                        for i, p in enumerate(new_pools)
-                    )
+    def _route_output(
+        self,
+        route: tuple[tuple[str, ...], tuple[str, ...]],
+        amount_in: int,
+    ) -> int:
+        """Output of swapping amount_in along a route (0 if any hop yields nothing)."""
+        if amount_in <= 0:
+            return 0
 
-                    paths.append(SwapPath(
-                        pools=new_pools,
-                        tokens=new_tokens,
-                        expected_output=output,
-                        price_impact=total_impact,
-                        gas_estimate=100_000 * len(new_pools),
-                    ))
-                else:
-                    # Continue searching
-                    queue.append((
-                        next_token, output, new_pools, new_tokens, new_visited
-                    ))
+        cache = self._quote_cache.get(route)
+        if cache is None:
+            cache = self._quote_cache[route] = {}
+            for pool_addr in route[0]:
+                self._routes_by_pool[pool_addr].add(route)
+
+        output = cache.get(amount_in)
+        if output is None:
+            output = amount_in
+            for pool_addr, token in zip(route[0], route[1]):
+                output = self.pools[pool_addr].get_output(token, output)
+                if output <= 0:
+                    output = 0
+                    break
+            if len(cache) >= self.QUOTE_CACHE_SIZE:
+                cache.clear()
+            cache[amount_in] = output
+        return output
+
+    def _build_path(
+        self,
+        route: tuple[tuple[str, ...], tuple[str, ...]],
+        amount_in: int,
+        output: int,
+    ) -> SwapPath:
+        pools, tokens = route
+        return SwapPath(
+            pools=list(pools),
+            tokens=list(tokens),
+            expected_output=output,
+            price_impact=sum(
+                self._calculate_price_impact(self.pools[p], amount_in // (i + 1), tokens[i])
+                for i, p in enumerate(pools)
+            ),
+            gas_estimate=100_000 * len(pools),
+        )
 
-        return paths
+    def _invalidate_pool_quotes(self, pool_address: str) -> None:
+        """Drop memoized quotes that depend on a pool's reserves."""
+        for route in self._routes_by_pool.pop(pool_address, ()):
+            self._quote_cache.pop(route, None)
+        for key in self._best_routes_by_pool.pop(pool_address, ()):
+            self._best_route_cache.pop(key, None)
+            for pool_addr in self._best_route_pools.pop(key, ()):
+                if pool_addr != pool_address:
+                    self._best_routes_by_pool[pool_addr].discard(key)
+
+    def _clear_best_routes(self) -> None:
+        self._best_route_cache.clear()
+        self._best_route_pools.clear()
+        self._best_routes_by_pool.clear()
 
     def _calculate_price_impact(
         self,
@@ -486,6 +640,7 @@ class SwapRouter:
         min_amount_out: int,
         deadline: float,
         path: list[str] | None = None,
+        split: bool = False,
     ) -> int:
         """
         Swap exact input amount for maximum output.
@@ -498,6 +653,8 @@ class SwapRouter:
             min_amount_out: Minimum acceptable output (slippage protection)
             deadline: Transaction deadline timestamp
             path: Optional explicit path (pool addresses)
+            split: Divide the trade across several paths when no explicit
+                path is given (see find_split_route)
 
         Returns:
             Actual output amount
@@ -523,37 +680,28 @@ class SwapRouter:
             token_in = token_in.upper()
             token_out = token_out.upper()
 
-            # Find path if not provided
-            if not path:
+            # Find path(s) if not provided
+            if path:
+                legs = [(path, amount_in)]
+            elif split:
+                route = self.find_split_route(token_in, token_out, amount_in)
+                if not route:
+                    raise VMExecutionError(
+                        f"No path found from {token_in} to {token_out}"
+                    )
+                legs = [(p.pools, amount) for p, amount in zip(route.paths, route.amounts)]
+            else:
                 best_path = self.find_best_path(token_in, token_out, amount_in)
                 if not best_path:
                     raise VMExecutionError(
                         f"No path found from {token_in} to {token_out}"
                     )
-                path = best_path.pools
-
-            # Execute swaps along path
-            current_amount = amount_in
-            current_token = token_in
-
-            for pool_addr in path:
-                pool = self.pools.get(pool_addr)
-                if not pool:
-                    raise VMExecutionError(f"Pool {pool_addr} not found")
+                legs = [(best_path.pools, amount_in)]
 
-                output = pool.get_output(current_token, current_amount)
-
-                # Update reserves (simplified - real impl would call pool)
-                if current_token == pool.token0:
-                    pool.reserve0 += current_amount
-                    pool.reserve1 -= output
-                    current_token = pool.token1
-                else:
-                    pool.reserve1 += current_amount
-                    pool.reserve0 -= output
-                    current_token = pool.token0
-
-                current_amount = output
+            # Execute swaps along each path
+            current_amount = 0
+            for leg_pools, leg_amount in legs:
+                current_amount += self._execute_path(token_in, leg_pools, leg_amount)
 
             # Verify output meets minimum
             if current_amount < min_amount_out:
@@ -575,7 +723,8 @@ class SwapRouter:
                     "path": f"{token_in}->{token_out}",
                     "amount_in": amount_in,
                     "amount_out": current_amount,
-                    "hops": len(path),
+                    "hops": sum(len(leg_pools) for leg_pools, _ in legs),
+                    "splits": len(legs),
                 }
             )
 
@@ -584,6 +733,33 @@ class SwapRouter:
         finally:
             self._in_swap = False
 
+    def _execute_path(self, token_in: str, path: list[str], amount_in: int) -> int:
+        """Apply a swap along a pool path to the tracked reserves."""
+        current_amount = amount_in
+        current_token = token_in
+
+        for pool_addr in path:
+            pool = self.pools.get(pool_addr)
+            if not pool:
+                raise VMExecutionError(f"Pool {pool_addr} not found")
+
+            output = pool.get_output(current_token, current_amount)
+
+            # Update reserves (simplified - real impl would call pool)
+            if current_token == pool.token0:
+                pool.reserve0 += current_amount
+                pool.reserve1 -= output
+                current_token = pool.token1
+            else:
+                pool.reserve1 += current_amount
+                pool.reserve0 -= output
+                current_token = pool.token0
+            self._invalidate_pool_quotes(pool_addr)
+
+            current_amount = output
+
+        return current_amount
+
     def swap_exact_output(
         self,
         caller: str,
@@ -715,6 +891,7 @@ class SwapRouter:
             raise VMExecutionError("Invalid order signature")
 
         self.orders[order.id] = order
+        self._index_order(order)
 
         logger.info(
             "Limit order created",
@@ -767,6 +944,7 @@ class SwapRouter:
 
         if time.time() > order.expiry:
             order.status = OrderStatus.EXPIRED
+            self._evict_order(order_id)
             raise VMExecutionError("Order expired")
 
         remaining = order.remaining_amount()
@@ -799,6 +977,7 @@ class SwapRouter:
 
         if order.amount_filled >= order.amount_in:
             order.status = OrderStatus.FILLED
+            self._evict_order(order_id)
         else:
             order.status = OrderStatus.PARTIALLY_FILLED
 
@@ -830,6 +1009,7 @@ class SwapRouter:
             raise VMExecutionError(f"Order already {order.status.value}")
 
         order.status = OrderStatus.CANCELLED
+        self._evict_order(order_id)
 
         logger.info(
             "Limit order cancelled",
@@ -847,23 +1027,87 @@ class SwapRouter:
         token_out: str,
         limit: int = 100,
     ) -> list[LimitOrder]:
-        """Get all fillable orders for a token pair."""
+        """
+        Get all fillable orders for a token pair, best price first.
+
+        Reads the pair's price-ordered book, so the cost is proportional to
+        the number of orders returned rather than to all orders ever placed.
+        """
         token_in = token_in.upper()
         token_out = token_out.upper()
         current_time = time.time()
 
+        self._sync_order_index()
+        self._evict_expired_orders(current_time)
+
         fillable = []
-        for order in self.orders.values():
-            if (order.token_in == token_in and
-                order.token_out == token_out and
-                order.status in (OrderStatus.OPEN, OrderStatus.PARTIALLY_FILLED) and
-                current_time <= order.expiry):
-                fillable.append(order)
+        stale = []
+        for _, _, order_id in self._order_book.get((token_in, token_out), ()):
+            if len(fillable) >= limit:
+                break
+            order = self.orders.get(order_id)
+            if (order is None or
+                order.status not in (OrderStatus.OPEN, OrderStatus.PARTIALLY_FILLED) or
+                current_time > order.expiry):
+                stale.append(order_id)
+                continue
+            fillable.append(order)
+
+        for order_id in stale:
+            self._evict_order(order_id)
+
+        return fillable
 
-        # Sort by best price (highest min_amount_out / amount_in)
-        fillable.sort(key=lambda o: o.effective_price(), reverse=True)
+    def _index_order(self, order: LimitOrder) -> None:
+        """Add an open order to its pair's book and the expiry heap."""
+        self._indexed_orders.add(order.id)
+        if order.status not in (OrderStatus.OPEN, OrderStatus.PARTIALLY_FILLED):
+            return
+
+        self._order_seq += 1
+        pair = (order.token_in, order.token_out)
+        entry = (-order.effective_price(), self._order_seq, order.id)
+        bisect.insort(self._order_book.setdefault(pair, []), entry)
+        self._book_entries[order.id] = (pair, entry)
+        heapq.heappush(self._expiry_heap, (order.expiry, order.id))
+
+    def _evict_order(self, order_id: str) -> None:
+        """Remove a filled, cancelled or expired order from the book."""
+        indexed = self._book_entries.pop(order_id, None)
+        if indexed is None:
+            return
+
+        pair, entry = indexed
+        book = self._order_book[pair]
+        pos = bisect.bisect_left(book, entry)
+        if pos < len(book) and book[pos] == entry:
+            book.pop(pos)
+        if not book:
+            del self._order_book[pair]
+
+    def _evict_expired_orders(self, current_time: float) -> None:
+        heap = self._expiry_heap
+        while heap and heap[0][0] < current_time:
+            expiry, order_id = heapq.heappop(heap)
+            order = self.orders.get(order_id)
+            if order is not None and order.expiry != expiry and order_id in self._book_entries:
+                # Expiry changed since indexing; re-queue under the new time
+                heapq.heappush(heap, (order.expiry, order_id))
+                if order.expiry >= current_time:
+                    continue
+            self._evict_order(order_id)
+
+    def _sync_order_index(self) -> None:
+        """Index orders added to ``self.orders`` without create_limit_order()."""
+        if len(self._indexed_orders) == len(self.orders):
+            return
 
-        return fillable[:limit]
+        for order_id in self._indexed_orders - self.orders.keys():
+            self._indexed_orders.discard(order_id)
+            self._evict_order(order_id)
+        for order_id, order in self.orders.items():
+            if order_id not in self._indexed_orders:
+                self._index_order(order)
 
     # ==================== MEV Protection ====================
 
@@ -909,6 +1153,7 @@ class SwapRouter:
         token_in: str,
         token_out: str,
         amount_in: int,
+        split: bool = False,
     ) -> dict:
         """
         Get quote for a swap without executing.
@@ -917,10 +1162,14 @@ class SwapRouter:
             token_in: Input token
             token_out: Output token
             amount_in: Input amount
+            split: Quote the trade divided across several paths
 
         Returns:
             Quote details including path, output, and price impact
         """
+        if split:
+            return self._get_split_quote(token_in, token_out, amount_in)
+
         path = self.find_best_path(token_in, token_out, amount_in)
 
         if not path:
@@ -942,6 +1191,34 @@ class SwapRouter:
             "gas_estimate": path.gas_estimate,
         }
 
+    def _get_split_quote(self, token_in: str, token_out: str, amount_in: int) -> dict:
+        route = self.find_split_route(token_in, token_out, amount_in)
+
+        if not route:
+            return {
+                "success": False,
+                "error": "No path found",
+            }
+
+        return {
+            "success": True,
+            "token_in": token_in,
+            "token_out": token_out,
+            "amount_in": amount_in,
+            "expected_output": route.expected_output,
+            "price_impact_bps": max(path.price_impact for path in route.paths),
+            "splits": [
+                {
+                    "amount_in": amount,
+                    "expected_output": path.expected_output,
+                    "path": path.tokens,
+                    "pools": path.pools,
+                }
+                for path, amount in zip(route.paths, route.amounts)
+            ],
+            "gas_estimate": route.gas_estimate,
+        }
+
     def get_amounts_out(
         self,
         amount_in: int,
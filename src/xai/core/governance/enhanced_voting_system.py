@@ -92,9 +92,25 @@ class ProjectTimeline:
     min_review_period: int = 3  # 3 days for code review
     min_final_vote: int = 2  # 2 days for final vote
 
+# Proposal total for each vote choice
+VOTE_TOTAL_KEYS = {"for": "votes_for", "against": "votes_against", "abstain": "votes_abstain"}
+
+def _field(obj, name: str):
+    """Read ``name`` from a block/transaction object or its dict form"""
+    if isinstance(obj, dict):
+        return obj.get(name)
+    return getattr(obj, name, None)
+
 class EnhancedVotingSystem:
     """
     Voting system that incentivizes coin holding + donations
+
+    Each proposal pins a snapshot height when it opens. Voting power is
+    computed once per vote from the voter's balance at that height, and
+    proposal totals are running sums adjusted as votes change or are
+    invalidated. Verification sweeps re-check only voters who are new since
+    the last sweep or who sent coins in a block mined since then, since a
+    balance can only drop by spending.
     """
 
     def __init__(self, blockchain):
@@ -106,6 +122,13 @@ class EnhancedVotingSystem:
             {}
         )  # proposal_id -> {address -> snapshot}
 
+        # Balances at each proposal's snapshot height
+        self.balance_snapshots: dict[str, dict[str, float]] = {}  # proposal_id -> {address -> balance}
+
+        # Incremental verification state
+        self._last_sweep: dict[str, tuple[int, str | None]] = {}  # proposal_id -> (height, block hash)
+        self._unverified_voters: dict[str, set[str]] = {}  # proposal_id -> voters since last sweep
+
         # Weight configuration
         self.coin_weight = 0.70  # 70% from coins held
         self.donation_weight = 0.30  # 30% from donations
@@ -117,17 +140,75 @@ class EnhancedVotingSystem:
         self.min_coins_to_vote = 1.0  # Must hold at least 1 XAI
         self.min_timeline_days = 7  # 1 week minimum
 
+    def open_proposal(self, proposal_id: str, snapshot_height: int | None = None) -> int:
+        """
+        Open a proposal for voting and pin its balance snapshot height
+
+        Proposals are opened implicitly by their first vote; call this when
+        the proposal is created so the snapshot precedes any vote buying.
+
+        Args:
+            proposal_id: Proposal identifier
+            snapshot_height: Block height for voting power (default: current height)
+
+        Returns:
+            The proposal's snapshot height
+        """
+        if proposal_id not in self.proposals:
+            if snapshot_height is None:
+                snapshot_height = self.blockchain.get_height()
+            self.proposals[proposal_id] = {
+                "votes_for": 0,
+                "votes_against": 0,
+                "votes_abstain": 0,
+                "voters": {},
+                "created_at": time.time(),
+                "snapshot_height": snapshot_height,
+            }
+            self.voter_snapshots.setdefault(proposal_id, {})
+            self.balance_snapshots[proposal_id] = {}
+            self._unverified_voters[proposal_id] = set()
+        return self.proposals[proposal_id]["snapshot_height"]
+
+    def get_snapshot_balance(self, proposal_id: str, address: str) -> float:
+        """
+        Balance of an address at the proposal's snapshot height
+
+        Looked up once per proposal and address. Chains without historical
+        balances (no get_balance_at_height) are read live on first lookup.
+
+        Args:
+            proposal_id: Proposal identifier (opened if new)
+            address: Voter address
+
+        Returns:
+            Snapshot balance
+        """
+        snapshot_height = self.open_proposal(proposal_id)
+        balances = self.balance_snapshots[proposal_id]
+        if address not in balances:
+            if hasattr(self.blockchain, "get_balance_at_height"):
+                balances[address] = self.blockchain.get_balance_at_height(address, snapshot_height)
+            else:
+                balances[address] = self.blockchain.get_balance(address)
+        return balances[address]
+
     def calculate_voting_power(
-        self, address: str, ai_donation_history: dict
+        self, address: str, ai_donation_history: dict, xai_balance: float | None = None
     ) -> tuple[float, float, float]:
         """
         Calculate combined voting power from coins + donations
 
+        Args:
+            address: Voter address
+            ai_donation_history: Donation totals
+            xai_balance: Balance to weigh (default: current balance)
+
         Returns: (coin_power, donation_power, total_power)
         """
 
-        # Get current XAI balance
-        xai_balance = self.blockchain.get_balance(address)
+        if xai_balance is None:
+            xai_balance = self.blockchain.get_balance(address)
 
         # Coin voting power (70% weight)
         coin_power = xai_balance * self.coin_weight
@@ -165,30 +246,34 @@ class EnhancedVotingSystem:
     ) -> dict:
         """
         Submit vote with combined coin + donation power
+
+        Coin power comes from the balance at the proposal's snapshot height.
         """
 
+        snapshot_height = self.open_proposal(proposal_id)
+
         # Check minimum coin requirement
-        current_balance = self.blockchain.get_balance(voter_address)
+        snapshot_balance = self.get_snapshot_balance(proposal_id, voter_address)
 
-        if current_balance < self.min_coins_to_vote:
+        if snapshot_balance < self.min_coins_to_vote:
             return {
                 "success": False,
                 "error": "INSUFFICIENT_COINS",
                 "message": f"Must hold at least {self.min_coins_to_vote} XAI to vote",
-                "current_balance": current_balance,
+                "current_balance": snapshot_balance,
             }
 
         # Calculate voting power
         coin_power, donation_power, total_power = self.calculate_voting_power(
-            voter_address, ai_donation_history
+            voter_address, ai_donation_history, xai_balance=snapshot_balance
         )
 
         # Create voter snapshot
         snapshot = VoterSnapshot(
             address=voter_address,
             vote_time=time.time(),
-            xai_balance=current_balance,
-            xai_balance_block=self.blockchain.get_height(),
+            xai_balance=snapshot_balance,
+            xai_balance_block=snapshot_height,
             total_ai_minutes_donated=ai_donation_history.get("total_minutes_donated", 0),
             total_ai_tokens_donated=ai_donation_history.get("total_tokens_donated", 0),
             ai_usd_value=ai_donation_history.get("total_usd_value", 0),
@@ -199,36 +284,18 @@ class EnhancedVotingSystem:
             is_valid=True,
         )
 
-        # Store snapshot
-        if proposal_id not in self.voter_snapshots:
-            self.voter_snapshots[proposal_id] = {}
-
+        # Store snapshot; it is verified on the next sweep
         self.voter_snapshots[proposal_id][voter_address] = snapshot
-
-        # Record vote
-        if proposal_id not in self.proposals:
-            self.proposals[proposal_id] = {
-                "votes_for": 0,
-                "votes_against": 0,
-                "votes_abstain": 0,
-                "voters": {},
-                "created_at": time.time(),
-            }
+        self._unverified_voters[proposal_id].add(voter_address)
 
         # Remove old vote if re-voting
-        if voter_address in self.proposals[proposal_id]["voters"]:
-            old_vote = self.proposals[proposal_id]["voters"][voter_address]
-            old_power = old_vote["voting_power"]
-
-            if old_vote["vote"] == "for":
-                self.proposals[proposal_id]["votes_for"] -= old_power
-            elif old_vote["vote"] == "against":
-                self.proposals[proposal_id]["votes_against"] -= old_power
-            elif old_vote["vote"] == "abstain":
-                self.proposals[proposal_id]["votes_abstain"] -= old_power
+        voters = self.proposals[proposal_id]["voters"]
+        if voter_address in voters:
+            old_vote = voters[voter_address]
+            self._adjust_totals(proposal_id, old_vote["vote"], -old_vote["voting_power"])
 
         # Add new vote
-        self.proposals[proposal_id]["voters"][voter_address] = {
+        voters[voter_address] = {
             "vote": vote,
             "voting_power": total_power,
             "coin_power": coin_power,
@@ -237,12 +304,7 @@ class EnhancedVotingSystem:
         }
 
         # Update totals
-        if vote == "for":
-            self.proposals[proposal_id]["votes_for"] += total_power
-        elif vote == "against":
-            self.proposals[proposal_id]["votes_against"] += total_power
-        elif vote == "abstain":
-            self.proposals[proposal_id]["votes_abstain"] += total_power
+        self._adjust_totals(proposal_id, vote, total_power)
 
         return {
             "success": True,
@@ -252,7 +314,8 @@ class EnhancedVotingSystem:
                 "total": total_power,
             },
             "breakdown": {
-                "xai_balance": current_balance,
+                "xai_balance": snapshot_balance,
+                "snapshot_height": snapshot_height,
                 "ai_minutes_donated": ai_donation_history.get("total_minutes_donated", 0),
                 "ai_tokens_donated": ai_donation_history.get("total_tokens_donated", 0),
                 "ai_usd_value": ai_donation_history.get("total_usd_value", 0),
@@ -278,6 +341,16 @@ class EnhancedVotingSystem:
 
         snapshot = self.voter_snapshots[proposal_id][voter_address]
 
+        if not snapshot.is_valid:
+            # Power was already removed from the totals
+            return {
+                "success": True,
+                "valid": False,
+                "invalidated": False,
+                "reason": snapshot.invalidation_reason,
+                "message": "Vote already invalidated",
+            }
+
         # Get current balance
         current_balance = self.blockchain.get_balance(voter_address)
 
@@ -293,14 +366,7 @@ class EnhancedVotingSystem:
 
             # Remove vote power
             voter_data = self.proposals[proposal_id]["voters"][voter_address]
-            vote_type = voter_data["vote"]
-
-            if vote_type == "for":
-                self.proposals[proposal_id]["votes_for"] -= old_power
-            elif vote_type == "against":
-                self.proposals[proposal_id]["votes_against"] -= old_power
-            elif vote_type == "abstain":
-                self.proposals[proposal_id]["votes_abstain"] -= old_power
+            self._adjust_totals(proposal_id, voter_data["vote"], -voter_data["voting_power"])
 
             # Mark voter as invalidated
             voter_data["invalidated"] = True
@@ -333,22 +399,43 @@ class EnhancedVotingSystem:
         """
         Verify ALL voters for a proposal still hold their coins
 
-        Run this periodically throughout project lifecycle
+        Run this periodically throughout project lifecycle. Only voters who
+        are new since the last sweep or who have spent coins in a later
+        block are re-checked; a full sweep runs the first time, after a
+        reorg, or when the chain cannot serve blocks.
         """
 
         if proposal_id not in self.voter_snapshots:
             return {"success": False, "error": "PROPOSAL_NOT_FOUND"}
 
+        snapshots = self.voter_snapshots[proposal_id]
         results = {
             "verified": 0,
             "invalidated": 0,
-            "total_voters": len(self.voter_snapshots[proposal_id]),
+            "total_voters": len(snapshots),
             "invalid_voters": [],
             "total_power_removed": 0,
+            "checked": 0,
+            "full_sweep": False,
         }
 
-        for voter_address in list(self.voter_snapshots[proposal_id].keys()):
+        height = self.blockchain.get_height()
+        spenders = None
+        last_sweep = self._last_sweep.get(proposal_id)
+        if last_sweep is not None:
+            spenders = self._addresses_spent_since(*last_sweep, height)
+
+        if spenders is None:
+            to_check = set(snapshots)
+            results["full_sweep"] = True
+        else:
+            to_check = (spenders & snapshots.keys()) | self._unverified_voters.get(proposal_id, set())
+
+        for voter_address in to_check:
+            if not snapshots[voter_address].is_valid:
+                continue
             verification = self.verify_voter_still_holds_coins(proposal_id, voter_address)
+            results["checked"] += 1
 
             if verification.get("invalidated"):
                 results["invalidated"] += 1
@@ -360,11 +447,10 @@ class EnhancedVotingSystem:
                     }
                 )
                 results["total_power_removed"] += verification["vote_power_removed"]
-            else:
-                results["verified"] += 1
 
-        # Recalculate proposal totals after invalidations
-        self._recalculate_proposal_totals(proposal_id)
+        results["verified"] = sum(1 for snapshot in snapshots.values() if snapshot.is_valid)
+        self._last_sweep[proposal_id] = (height, self._block_hash(height))
+        self._unverified_voters[proposal_id] = set()
 
         return {
             "success": True,
@@ -373,35 +459,46 @@ class EnhancedVotingSystem:
             "message": f'Verified {results["verified"]} votes, invalidated {results["invalidated"]}',
         }
 
-    def _recalculate_proposal_totals(self, proposal_id: str):
-        """Recalculate vote totals after invalidations"""
-
-        proposal = self.proposals[proposal_id]
+    def _adjust_totals(self, proposal_id: str, vote: str, delta: float):
+        """Add ``delta`` to the running total for ``vote``"""
 
-        # Reset totals
-        votes_for = 0
-        votes_against = 0
-        votes_abstain = 0
+        key = VOTE_TOTAL_KEYS.get(vote)
+        if key is not None:
+            self.proposals[proposal_id][key] += delta
 
-        # Sum up all valid votes
-        for voter_address, voter_data in proposal["voters"].items():
-            if voter_data.get("invalidated", False):
-                continue  # Skip invalidated votes
-
-            power = voter_data["voting_power"]
-            vote = voter_data["vote"]
+    def _addresses_spent_since(
+        self, last_height: int, last_hash: str | None, height: int
+    ) -> set[str] | None:
+        """
+        Senders of transactions in blocks after ``last_height`` up to ``height``
 
-            if vote == "for":
-                votes_for += power
-            elif vote == "against":
-                votes_against += power
-            elif vote == "abstain":
-                votes_abstain += power
+        Returns None when a full sweep is needed: the chain has no block
+        access, or the block at ``last_height`` changed (reorg).
+        """
 
-        # Update proposal
-        proposal["votes_for"] = votes_for
-        proposal["votes_against"] = votes_against
-        proposal["votes_abstain"] = votes_abstain
+        if not hasattr(self.blockchain, "get_block") or height < last_height:
+            return None
+        if last_hash is None or self._block_hash(last_height) != last_hash:
+            return None
+
+        spenders: set[str] = set()
+        for index in range(last_height + 1, height + 1):
+            block = self.blockchain.get_block(index)
+            if block is None:
+                return None
+            for tx in _field(block, "transactions") or []:
+                sender = _field(tx, "sender")
+                if sender:
+                    spenders.add(sender)
+        return spenders
+
+    def _block_hash(self, height: int) -> str | None:
+        """Hash of the block at ``height``, or None if unavailable"""
+
+        if not hasattr(self.blockchain, "get_block"):
+            return None
+        block = self.blockchain.get_block(height)
+        return _field(block, "hash") if block is not None else None
 
     def create_mandatory_timeline(
         self, proposal_id: str, estimated_duration_days: int
@@ -498,7 +595,7 @@ class EnhancedVotingSystem:
 
         xai_balance = self.blockchain.get_balance(address)
         coin_power, donation_power, total_power = self.calculate_voting_power(
-            address, ai_donation_history
+            address, ai_donation_history, xai_balance=xai_balance
         )
 
         return {
@@ -95,18 +95,17 @@ class MiningManager:
 
         # Thread-safe transaction selection from mempool
         with self.blockchain._mempool_lock:
-            # Make a copy to avoid TOCTOU issues
-            pending_txs = list(self.blockchain.pending_transactions)
-
-        if not pending_txs:
-            self.logger.debug("No pending transactions to mine")
-            return None
-
-        # Prioritize transactions by fee
-        selected_txs = self.blockchain._prioritize_transactions(
-            pending_txs,
-            max_count=self.blockchain._max_transactions_per_block
-        )
+            if not self.blockchain.pending_transactions:
+                self.logger.debug("No pending transactions to mine")
+                return None
+
+            # Prioritize transactions by fee. Passing the live pending list (not a
+            # copy) lets the fee index serve it without reconciling; the result is
+            # a new list, so later mempool changes cannot affect it.
+            selected_txs = self.blockchain._prioritize_transactions(
+                self.blockchain.pending_transactions,
+                max_count=self.blockchain._max_transactions_per_block
+            )
 
         # Get current chain state
         latest_block = self.blockchain.get_latest_block()
@@ -57,6 +57,7 @@ KNOWN_TOKEN_RECEIVER_INTERFACES = {
 from xai.blockchain.emergency_pause import EmergencyPauseManager
 from xai.core.chain import node_utils
 from xai.core.api.api_auth import APIAuthManager, APIKeyStore
+from xai.core.api.response_cache import TipKeyedResponseCache
 from xai.core.api_routes import (
     register_admin_routes,
     register_algo_routes,
@@ -546,6 +547,10 @@ class NodeAPIRoutes:
         )
         self.memory_profiler = MemoryProfiler()
         self.cpu_profiler = CPUProfiler()
+        self.response_cache = TipKeyedResponseCache(
+            self.blockchain,
+            max_entries=int(getattr(Config, "API_RESPONSE_CACHE_MAX_ENTRIES", 4096)),
+        )
 
     def _install_request_size_limits(self) -> None:
         """
@@ -761,6 +766,36 @@ class NodeAPIRoutes:
         self._log_event(event_type, details, severity=severity)
         return jsonify({"success": False, "error": message, "code": code}), status
 
+    def _cached_json_response(
+        self, route: str, params: Any, builder, status: int = 200, refresh=None, depends_on_mempool: bool = True
+    ):
+        """
+        Serve a read-only payload through the tip-keyed response cache.
+
+        The payload is rebuilt only when the chain tip changes, or the mempool
+        for payloads that read it (``depends_on_mempool``).
+        Clients presenting a matching If-None-Match receive 304 Not Modified.
+        ``refresh(payload, age_seconds)`` returns a copy with wall-clock
+        fields brought up to date; it runs on every serve.
+        """
+        entry = self.response_cache.get_or_compute(route, params, builder, depends_on_mempool)
+        return self._cached_entry_response(entry, status, refresh)
+
+    def _cached_entry_response(self, entry, status: int = 200, refresh=None):
+        """Render a CachedResponse honoring conditional request headers."""
+        if self.response_cache.etag_matches(request.headers.get("If-None-Match"), entry.etag):
+            response = make_response("", 304)
+        else:
+            if refresh is None:
+                body = entry.body()
+            else:
+                body = json.dumps(refresh(entry.payload, entry.age()), default=str).encode("utf-8")
+            response = make_response(body, status)
+            response.mimetype = "application/json"
+        response.headers["ETag"] = entry.etag
+        response.headers["Cache-Control"] = "no-cache"
+        return response
+
     def _handle_exception(self, error: Exception, context: str, status: int = 500):
         """Route unexpected exceptions through the error registry with sanitized output."""
         handled, handler_message = self.error_registry.handle_error(error, context, self.blockchain)
@@ -1147,7 +1182,9 @@ class NodeAPIRoutes:
         @self.app.route("/stats", methods=["GET"])
         def get_stats() -> dict[str, Any]:
             """Get blockchain statistics."""
-            stats = self.blockchain.get_stats()
+            # Chain/mempool aggregates are tip-keyed; counters, clock and node-local fields stay live.
+            stats = dict(self.response_cache.get_or_compute("stats", (), self.blockchain.get_stats).payload)
+            stats.update(self.blockchain.get_live_stats())
             stats["miner_address"] = self.node.miner_address
             # Use p2p_manager.get_peer_count() for accurate peer counting
             p2p_manager = getattr(self.node, "p2p_manager", None)
@@ -1304,8 +1341,19 @@ class NodeAPIRoutes:
                 limit = 0
             limit = min(limit, 1000)
             try:
-                overview = self.blockchain.get_mempool_overview(limit)
-                return jsonify({"success": True, "limit": limit, "mempool": overview}), 200
+                return self._cached_json_response(
+                    "mempool",
+                    (limit,),
+                    lambda: {
+                        "success": True,
+                        "limit": limit,
+                        "mempool": self.blockchain.get_mempool_overview(limit),
+                    },
+                    refresh=lambda payload, age: {
+                        **payload,
+                        "mempool": self.blockchain.age_mempool_overview(payload["mempool"], age),
+                    },
+                )
             except AttributeError:
                 return (
                     jsonify({"success": False, "error": "Blockchain unavailable"}),
@@ -1515,17 +1563,22 @@ class NodeAPIRoutes:
                     event_type="api.invalid_paging",
                 )
 
-            blocks = [block.to_dict() for block in self.blockchain.chain]
-            blocks.reverse()  # Most recent first
-
-            return jsonify(
-                {
-                    "total": len(blocks),
+            def _build_page() -> dict[str, Any]:
+                chain = self.blockchain.chain
+                total = len(chain)
+                # Most recent first; only serialize the requested window.
+                stop = max(total - offset, 0)
+                start = max(stop - limit, 0)
+                blocks = [block.to_dict() for block in chain[start:stop]]
+                blocks.reverse()
+                return {
+                    "total": total,
                     "limit": limit,
                     "offset": offset,
-                    "blocks": blocks[offset : offset + limit],
+                    "blocks": blocks,
                 }
-            )
+
+            return self._cached_json_response("blocks", (limit, offset), _build_page, depends_on_mempool=False)
 
         @self.app.route("/blocks/<index>", methods=["GET"])
         def get_block(index: str) -> tuple[dict[str, Any], int]:
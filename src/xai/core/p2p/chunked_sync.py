@@ -9,7 +9,10 @@ Designed for:
 - Parallel chunk downloads
 
 Features:
-- 1MB default chunk size (configurable)
+- 1MB maximum chunk size (configurable)
+- Streaming serialization with content-defined chunk boundaries
+- Parallel chunk compression and reuse of unchanged chunks across snapshots
+- Retention of the most recent snapshots with chunk store garbage collection
 - SHA-256 checksum per chunk
 - Resume from last successful chunk
 - HTTP Range header support
@@ -23,14 +26,24 @@ import gzip
 import hashlib
 import json
 import os
+import shutil
 import time
+import zlib
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable
 
 from xai.core.consensus.checkpoint_payload import CheckpointPayload
 from xai.core.api.structured_logger import get_structured_logger
+from xai.core.p2p.snapshot_stream import (
+    compress_chunks,
+    content_defined_chunks,
+    iter_json_records,
+    load_json_stream,
+    state_digest,
+)
 
 
 class ChunkPriority(Enum):
@@ -111,7 +124,7 @@ class SnapshotMetadata:
         state_hash: Root hash of the state at this height
         total_chunks: Number of chunks in this snapshot
         total_size: Total size of all chunks in bytes
-        chunk_size: Size of each chunk in bytes (last may be smaller)
+        chunk_size: Maximum size of a chunk in bytes
         timestamp: When snapshot was created
         compression_enabled: Whether chunks are compressed
         priority_map: Mapping of chunk indices to priorities
@@ -244,7 +257,7 @@ class ChunkedStateSyncService:
     Service for creating and downloading chunked state snapshots.
 
     Supports:
-    - Creating snapshots split into chunks
+    - Creating snapshots split into chunks, streamed and compressed in parallel
     - Downloading chunks with resume capability
     - Verifying and applying complete snapshots
     - Priority-based chunk ordering
@@ -252,24 +265,40 @@ class ChunkedStateSyncService:
     """
 
     DEFAULT_CHUNK_SIZE = 1_000_000  # 1MB
+    DEFAULT_MAX_SNAPSHOTS = 3
 
     def __init__(
         self,
         storage_dir: str,
         chunk_size: int = DEFAULT_CHUNK_SIZE,
         enable_compression: bool = True,
+        compression_workers: int | None = None,
+        max_snapshots: int | None = DEFAULT_MAX_SNAPSHOTS,
     ):
         """
         Initialize chunked sync service.
 
         Args:
             storage_dir: Directory for storing chunks and metadata
-            chunk_size: Size of each chunk in bytes
+            chunk_size: Maximum size of each chunk in bytes
             enable_compression: Whether to compress chunks
+            compression_workers: Worker processes for chunk compression
+                (default: CPU count, capped at 8; 0 or 1 compresses inline)
+            max_snapshots: Number of most recent snapshots to keep on disk;
+                older ones are deleted after each new snapshot (None keeps all)
         """
         self.storage_dir = Path(storage_dir)
         self.chunk_size = chunk_size
         self.enable_compression = enable_compression
+        if compression_workers is None:
+            compression_workers = min(8, os.cpu_count() or 1)
+        self.compression_workers = compression_workers
+        if max_snapshots is not None and max_snapshots < 1:
+            raise ValueError("max_snapshots must be at least 1")
+        self.max_snapshots = max_snapshots
+        # Created on first use and shared by all snapshots (see close())
+        self._executor: ProcessPoolExecutor | None = None
+        self._executor_unavailable = False
         self.logger = get_structured_logger()
 
         # Ensure storage directory exists
@@ -278,6 +307,9 @@ class ChunkedStateSyncService:
         self.snapshots_dir.mkdir(exist_ok=True)
         self.progress_dir = self.storage_dir / "progress"
         self.progress_dir.mkdir(exist_ok=True)
+        # Compressed chunks by checksum, shared by snapshots at different heights
+        self.chunk_store_dir = self.storage_dir / "chunk_store"
+        self.chunk_store_dir.mkdir(exist_ok=True)
 
     def create_state_snapshot_chunks(
         self,
@@ -296,6 +328,45 @@ class ChunkedStateSyncService:
         Returns:
             Tuple of (metadata, list of chunks)
         """
+        chunks: list[SyncChunk] = []
+        metadata = self._build_snapshot(height, payload, chunks)
+        return metadata, chunks
+
+    def stream_state_snapshot(
+        self,
+        height: int,
+        payload: CheckpointPayload,
+    ) -> SnapshotMetadata:
+        """
+        Write a chunked snapshot to disk without keeping chunks in memory.
+
+        Same output as create_state_snapshot_chunks(); only the metadata is
+        returned, chunks are served from disk via get_chunk().
+
+        Args:
+            height: Block height for this snapshot
+            payload: Checkpoint payload containing state data
+
+        Returns:
+            Snapshot metadata
+        """
+        return self._build_snapshot(height, payload, None)
+
+    def _build_snapshot(
+        self,
+        height: int,
+        payload: CheckpointPayload,
+        keep_chunks: list[SyncChunk] | None,
+    ) -> SnapshotMetadata:
+        """
+        Serialize, chunk, compress and save a snapshot in one streaming pass.
+
+        The payload is serialized record by record and cut at content-defined
+        boundaries (see snapshot_stream), so memory use is bounded by the
+        chunks in flight rather than by the state size. Chunks are compressed
+        on worker processes; chunks whose checksum is already in the chunk
+        store (unchanged since an earlier snapshot) are not recompressed.
+        """
         snapshot_id = self._generate_snapshot_id(height, payload.block_hash)
 
         self.logger.info(
@@ -305,54 +376,64 @@ class ChunkedStateSyncService:
             block_hash=payload.block_hash,
         )
 
-        # Serialize payload data
-        serialized = json.dumps(payload.to_dict(), sort_keys=True).encode("utf-8")
-        total_size = len(serialized)
-
-        # Create chunks directly from serialized data
-        chunks: list[SyncChunk] = []
-        priority_map: dict[int, ChunkPriority] = {}
-
-        chunk_index = 0
-        offset = 0
-
-        while offset < len(serialized):
-            chunk_data = serialized[offset : offset + self.chunk_size]
-
-            # Calculate checksum on uncompressed data
-            checksum = hashlib.sha256(chunk_data).hexdigest()
-
-            # Store original size before compression
-            original_size = len(chunk_data)
-
-            # Compress if enabled
-            compressed = False
-            if self.enable_compression:
-                chunk_data = gzip.compress(chunk_data)
-                compressed = True
+        snapshot_dir = self.snapshots_dir / snapshot_id
+        snapshot_dir.mkdir(parents=True, exist_ok=True)
 
-            chunk = SyncChunk(
-                chunk_id=snapshot_id,
-                chunk_index=chunk_index,
-                total_chunks=0,  # Will be set later
-                data=chunk_data,
-                checksum=checksum,
-                compressed=compressed,
-                priority=ChunkPriority.MEDIUM,
-                size_bytes=original_size,
+        raw_chunks = content_defined_chunks(iter_json_records(payload.to_dict()), self.chunk_size)
+        entries: list[tuple[str, int]] = []
+        reused = 0
+        if self.enable_compression:
+            results = compress_chunks(
+                raw_chunks,
+                executor=self._get_compression_executor(),
+                lookup=self._load_stored_chunk,
+                max_in_flight=max(2, self.compression_workers * 2),
+            )
+        else:
+            results = (
+                (hashlib.sha256(data).hexdigest(), len(data), data) for data in raw_chunks
             )
 
-            chunks.append(chunk)
-            priority_map[chunk_index] = ChunkPriority.MEDIUM
-            chunk_index += 1
-            offset += self.chunk_size
-
-        # Update total_chunks in all chunks
-        total_chunks = len(chunks)
-        for chunk in chunks:
-            chunk.total_chunks = total_chunks
+        for chunk_index, (checksum, size, data) in enumerate(results):
+            chunk_path = snapshot_dir / f"chunk_{chunk_index:06d}.bin"
+            if self.enable_compression:
+                if self._store_chunk(checksum, data, chunk_path):
+                    reused += 1
+            else:
+                with open(chunk_path, "wb") as f:
+                    f.write(data)
+            entries.append((checksum, size))
+
+            if keep_chunks is not None:
+                keep_chunks.append(SyncChunk(
+                    chunk_id=snapshot_id,
+                    chunk_index=chunk_index,
+                    total_chunks=0,  # Set once all chunks are known
+                    data=data,
+                    checksum=checksum,
+                    compressed=self.enable_compression,
+                    priority=ChunkPriority.MEDIUM,
+                    size_bytes=size,
+                ))
+
+        total_chunks = len(entries)
+        total_size = sum(size for _, size in entries)
+        for chunk_index, (checksum, size) in enumerate(entries):
+            meta_path = snapshot_dir / f"chunk_{chunk_index:06d}.json"
+            with open(meta_path, "w", encoding="utf-8") as f:
+                json.dump({
+                    "chunk_id": snapshot_id,
+                    "chunk_index": chunk_index,
+                    "total_chunks": total_chunks,
+                    "checksum": checksum,
+                    "compressed": self.enable_compression,
+                    "priority": ChunkPriority.MEDIUM.value,
+                    "size_bytes": size,
+                }, f, indent=2)
+        if keep_chunks is not None:
+            for chunk in keep_chunks:
+                chunk.total_chunks = total_chunks
 
-        # Create metadata
         metadata = SnapshotMetadata(
             snapshot_id=snapshot_id,
             height=height,
@@ -363,21 +444,165 @@ class ChunkedStateSyncService:
             chunk_size=self.chunk_size,
             timestamp=time.time(),
             compression_enabled=self.enable_compression,
-            priority_map=priority_map,
+            priority_map={i: ChunkPriority.MEDIUM for i in range(total_chunks)},
         )
+        # Metadata last: a snapshot is only listed once all its chunks exist
+        with open(snapshot_dir / "metadata.json", "w", encoding="utf-8") as f:
+            json.dump(metadata.to_dict(), f, indent=2)
+
+        # Chunk files left over from an earlier, longer build of this snapshot
+        for stale in snapshot_dir.glob("chunk_*"):
+            try:
+                if int(stale.stem.split("_")[1]) >= total_chunks:
+                    stale.unlink()
+            except (ValueError, IndexError, OSError):
+                continue
 
-        # Save to disk
-        self._save_snapshot(metadata, chunks)
+        self._prune_snapshots(keep=snapshot_id)
+        removed = self.collect_chunk_store() if self.enable_compression else 0
 
         self.logger.info(
             "Snapshot created",
             snapshot_id=snapshot_id,
             total_chunks=total_chunks,
+            reused_chunks=reused,
+            collected_chunks=removed,
             total_size_mb=total_size / 1_000_000,
             compressed=self.enable_compression,
         )
 
-        return metadata, chunks
+        return metadata
+
+    def _get_compression_executor(self) -> ProcessPoolExecutor | None:
+        """Shared process pool for chunk compression, or None to compress inline."""
+        if self.compression_workers <= 1 or self._executor_unavailable:
+            return None
+        if self._executor is None:
+            try:
+                self._executor = ProcessPoolExecutor(max_workers=self.compression_workers)
+            except (OSError, NotImplementedError, ValueError) as e:
+                self._executor_unavailable = True
+                self.logger.warning(
+                    "Compression workers unavailable, compressing inline",
+                    error=str(e),
+                    error_type=type(e).__name__,
+                )
+                return None
+        return self._executor
+
+    def close(self) -> None:
+        """Shut down the compression worker pool."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def delete_snapshot(self, snapshot_id: str) -> bool:
+        """
+        Delete a snapshot's directory.
+
+        Chunk store entries it referenced are released by the next
+        collect_chunk_store().
+
+        Args:
+            snapshot_id: ID of the snapshot
+
+        Returns:
+            True if deleted (or not present)
+        """
+        snapshot_dir = self.snapshots_dir / snapshot_id
+        if not snapshot_dir.exists():
+            return True
+        try:
+            # Unlist first so a partially deleted snapshot is never served
+            (snapshot_dir / "metadata.json").unlink(missing_ok=True)
+            shutil.rmtree(snapshot_dir)
+            return True
+        except OSError as e:
+            self.logger.error(
+                "Failed to delete snapshot",
+                extra={
+                    "snapshot_id": snapshot_id,
+                    "error": str(e),
+                    "error_type": type(e).__name__,
+                }
+            )
+            return False
+
+    def collect_chunk_store(self) -> int:
+        """
+        Remove chunk store entries no snapshot references.
+
+        Returns:
+            Number of entries removed
+        """
+        referenced: set[str] = set()
+        for meta_path in self.snapshots_dir.glob("*/chunk_*.json"):
+            try:
+                with open(meta_path, "r", encoding="utf-8") as f:
+                    referenced.add(json.load(f)["checksum"])
+            except (OSError, json.JSONDecodeError, KeyError, TypeError):
+                continue
+
+        removed = 0
+        for path in self.chunk_store_dir.iterdir():
+            # Abandoned temp files from interrupted writes go too
+            if path.suffix == ".gz" and path.stem in referenced:
+                continue
+            try:
+                path.unlink()
+                removed += 1
+            except OSError:
+                continue
+        return removed
+
+    def _prune_snapshots(self, keep: str) -> None:
+        """Delete the oldest snapshots beyond max_snapshots."""
+        if self.max_snapshots is None:
+            return
+        others = []
+        for d in self.snapshots_dir.iterdir():
+            if d.name == keep:
+                continue
+            try:
+                others.append((int(d.name.split("_")[1]), d.name))
+            except (ValueError, IndexError):
+                continue
+        others.sort(reverse=True)
+        for _, snapshot_id in others[max(0, self.max_snapshots - 1):]:
+            self.delete_snapshot(snapshot_id)
+
+    def _load_stored_chunk(self, checksum: str) -> bytes | None:
+        """Compressed bytes of a chunk produced by an earlier snapshot, if any."""
+        path = self.chunk_store_dir / f"{checksum}.gz"
+        try:
+            with open(path, "rb") as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def _store_chunk(self, checksum: str, data: bytes, chunk_path: Path) -> bool:
+        """
+        Save a compressed chunk to the chunk store and link it into a snapshot.
+
+        Returns:
+            True if the chunk was already in the store
+        """
+        store_path = self.chunk_store_dir / f"{checksum}.gz"
+        existed = store_path.exists()
+        if not existed:
+            tmp_path = store_path.with_suffix(f".tmp{os.getpid()}")
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, store_path)
+
+        if chunk_path.exists():
+            chunk_path.unlink()
+        try:
+            os.link(store_path, chunk_path)
+        except OSError:
+            with open(chunk_path, "wb") as f:
+                f.write(data)
+        return existed
 
     def get_snapshot_metadata(self, snapshot_id: str) -> SnapshotMetadata | None:
         """
@@ -560,21 +785,34 @@ class ChunkedStateSyncService:
                 )
                 return False, None
 
-        # Reconstruct data
-        try:
-            data_parts = []
-            for chunk in chunks:
-                # Decompress if needed
-                if chunk.compressed:
-                    data_parts.append(chunk.decompress())
-                else:
-                    data_parts.append(chunk.data)
+        return self.apply_chunk_stream(
+            (chunk.decompress() for chunk in chunks),
+            expected_state_hash,
+            snapshot_id,
+        )
+
+    def apply_chunk_stream(
+        self,
+        chunk_data: Iterable[bytes],
+        expected_state_hash: str,
+        snapshot_id: str = "",
+    ) -> tuple[bool, CheckpointPayload | None]:
+        """
+        Reconstruct and verify a payload from uncompressed chunk data.
 
-            # Combine all chunks
-            full_data = b"".join(data_parts)
+        Chunks are parsed as they are read, so peak memory is the decoded
+        payload plus one chunk, not the concatenated snapshot.
 
-            # Parse as JSON
-            payload_dict = json.loads(full_data)
+        Args:
+            chunk_data: Uncompressed chunk bytes in chunk index order
+            expected_state_hash: Expected state hash for verification
+            snapshot_id: Snapshot ID for logging
+
+        Returns:
+            Tuple of (success, reconstructed payload)
+        """
+        try:
+            payload_dict = load_json_stream(chunk_data)
 
             # Reconstruct checkpoint payload
             payload = CheckpointPayload(
@@ -599,8 +837,8 @@ class ChunkedStateSyncService:
                 )
                 return False, None
 
-            # Verify payload integrity
-            if not payload.verify_integrity():
+            # Verify payload integrity (same digest as verify_integrity(), streamed)
+            if state_digest(payload.data) != payload.state_hash:
                 self.logger.error(
                     "Payload integrity check failed",
                     snapshot_id=snapshot_id,
@@ -615,7 +853,7 @@ class ChunkedStateSyncService:
 
             return True, payload
 
-        except (json.JSONDecodeError, ValueError, KeyError, TypeError, OSError, IOError) as e:
+        except (json.JSONDecodeError, ValueError, KeyError, TypeError, OSError, IOError, zlib.error) as e:
             self.logger.error(
                 "Failed to reconstruct payload from chunks",
                 extra={
@@ -749,36 +987,3 @@ class ChunkedStateSyncService:
         regular_bytes = json.dumps(regular_data, sort_keys=True).encode("utf-8")
 
         return priority_bytes, regular_bytes
-
-    def _save_snapshot(
-        self,
-        metadata: SnapshotMetadata,
-        chunks: list[SyncChunk],
-    ) -> None:
-        """
-        Save snapshot metadata and chunks to disk.
-
-        Args:
-            metadata: Snapshot metadata
-            chunks: List of chunks to save
-        """
-        snapshot_dir = self.snapshots_dir / metadata.snapshot_id
-        snapshot_dir.mkdir(parents=True, exist_ok=True)
-
-        # Save metadata
-        metadata_path = snapshot_dir / "metadata.json"
-        with open(metadata_path, "w", encoding="utf-8") as f:
-            json.dump(metadata.to_dict(), f, indent=2)
-
-        # Save each chunk
-        for chunk in chunks:
-            chunk_path = snapshot_dir / f"chunk_{chunk.chunk_index:06d}.bin"
-            meta_path = snapshot_dir / f"chunk_{chunk.chunk_index:06d}.json"
-
-            # Save chunk data
-            with open(chunk_path, "wb") as f:
-                f.write(chunk.data)
-
-            # Save chunk metadata
-            with open(meta_path, "w", encoding="utf-8") as f:
-                json.dump(chunk.to_dict(), f, indent=2)
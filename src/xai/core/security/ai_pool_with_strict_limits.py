@@ -12,6 +12,8 @@ Critical Security Features:
 6. Post-call verification of actual usage
 7. Automatic key destruction when depleted
 8. Multi-key pooling for large tasks
+9. Atomic token reservations so concurrent tasks cannot oversubscribe a key
+10. Append-only usage journal, compacted periodically into the state file
 
 No API key can EVER be used beyond its donated limit.
 """
@@ -21,11 +23,13 @@ import json
 import logging
 import os
 import tempfile
+import threading
 import time
 from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from enum import Enum
-from typing import Any
+from typing import Any, Callable
 
 import anthropic
 import openai
@@ -62,6 +66,9 @@ class DonatedAPIKey:
     used_tokens: int = 0
     used_minutes: float = 0.0
 
+    # Tokens held by in-flight tasks (not persisted)
+    reserved_tokens: int = 0
+
     # Status
     is_active: bool = True
     is_depleted: bool = False
@@ -80,6 +87,10 @@ class DonatedAPIKey:
         """Get remaining token balance"""
         return max(0, self.donated_tokens - self.used_tokens)
 
+    def available_tokens(self) -> int:
+        """Get remaining tokens not reserved by in-flight tasks"""
+        return max(0, self.remaining_tokens() - self.reserved_tokens)
+
     def remaining_minutes(self) -> float:
         """Get remaining minutes balance"""
         if self.donated_minutes is None:
@@ -138,15 +149,65 @@ class DonatedAPIKey:
 
         return False
 
+class LocalStubProvider:
+    """
+    In-process stand-in for an AI provider API
+
+    Charges tokens like a real provider (prompt words plus a fixed
+    completion, capped at max_tokens) after an optional simulated latency.
+    Lets task throughput and usage accounting be exercised without network
+    access; register with StrictAIPoolManager.register_provider_backend.
+    """
+
+    def __init__(self, latency: float = 0.0, output_tokens: int = 50):
+        self.latency = latency
+        self.output_tokens = output_tokens
+        self.calls = 0
+        self.tokens_charged = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, api_key: str, task: str, max_tokens: int) -> dict:
+        with self._lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            if self.latency:
+                time.sleep(self.latency)
+            input_tokens = min(max_tokens, len(task.split()))
+            output_tokens = min(max_tokens - input_tokens, self.output_tokens)
+            tokens_used = input_tokens + output_tokens
+            with self._lock:
+                self.calls += 1
+                self.tokens_charged += tokens_used
+            return {
+                "success": True,
+                "output": f"stub completion ({output_tokens} tokens)",
+                "tokens_used": tokens_used,
+                "input_tokens": input_tokens,
+                "output_tokens": output_tokens,
+            }
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
 class StrictAIPoolManager:
     """
     AI Development Pool with STRICT usage limits
     Integrates with SecureAPIKeyManager for encryption
+
+    Thread-safe. Tasks can run synchronously through
+    execute_ai_task_with_limits or be queued with submit_ai_task, which runs
+    up to provider_concurrency_limits tasks per provider in parallel. Each
+    task reserves its planned tokens against the chosen keys before calling
+    the provider, so parallel tasks never plan against the same balance.
     """
 
-    def __init__(self, secure_key_manager):
+    def __init__(self, secure_key_manager, state_path: str | None = None):
         self.key_manager = secure_key_manager
         self.donated_keys: dict[str, DonatedAPIKey] = {}
+        self._lock = threading.RLock()
 
         # Usage tracking
         self.total_tokens_donated = 0
@@ -175,15 +236,37 @@ class StrictAIPoolManager:
             AIProvider.GOOGLE: deque(),
         }
 
+        # Queued tasks: concurrent calls allowed per provider
+        self.provider_concurrency_limits: dict[AIProvider, int] = {
+            AIProvider.ANTHROPIC: 4,
+            AIProvider.OPENAI: 4,
+            AIProvider.GOOGLE: 4,
+        }
+        self._task_executors: dict[AIProvider, ThreadPoolExecutor] = {}
+
+        # Provider call overrides (e.g. LocalStubProvider)
+        self._provider_backends: dict[AIProvider, Callable[..., dict]] = {}
+
         # Persistence path under ~/.xai to avoid storing in repo
         default_path = os.path.expanduser("~/.xai/ai_pool_usage.json")
-        if os.environ.get("PYTEST_CURRENT_TEST"):
+        if state_path is not None:
+            self._state_path = state_path
+        elif os.environ.get("PYTEST_CURRENT_TEST"):
             tmp_dir = tempfile.mkdtemp(prefix="xai_ai_pool_")
             self._state_path = os.path.join(tmp_dir, "ai_pool_usage.json")
         else:
             self._state_path = default_path
         os.makedirs(os.path.dirname(self._state_path), exist_ok=True)
+
+        # Usage changes are appended to the journal and folded into the
+        # state file every journal_compact_every entries
+        self._journal_path = os.path.splitext(self._state_path)[0] + ".journal"
+        self.journal_compact_every = 1000
+        self._journal_entries = 0
+
         self._load_state()
+        if self._journal_entries:
+            self._compact_state()
         self._initialize_rotation_state()
 
     def submit_api_key_donation(
@@ -258,13 +341,15 @@ class StrictAIPoolManager:
             submitted_at=time.time(),
         )
 
-        self.donated_keys[key_id] = donated_key
-        self._register_key_for_rotation(provider, key_id)
+        with self._lock:
+            self.donated_keys[key_id] = donated_key
+            self._register_key_for_rotation(provider, key_id)
 
-        # Update totals
-        self.total_tokens_donated += donated_tokens
-        if donated_minutes:
-            self.total_minutes_donated += donated_minutes
+            # Update totals
+            self.total_tokens_donated += donated_tokens
+            if donated_minutes:
+                self.total_minutes_donated += donated_minutes
+            self._journal_state(donated_key)
 
         receipt = {
             "success": True,
@@ -277,9 +362,65 @@ class StrictAIPoolManager:
             "message": f"API key secured with STRICT limit of {donated_tokens:,} tokens",
             "validation_status": "pending",
         }
-        self._save_state()
         return receipt
 
+    def register_provider_backend(
+        self, provider: AIProvider, backend: Callable[..., dict] | None
+    ) -> None:
+        """
+        Route calls for a provider to ``backend`` instead of its API client
+
+        Args:
+            provider: AI provider
+            backend: Callable taking (api_key, task, max_tokens) and returning a
+                provider result dict; None restores the API client
+        """
+        if backend is None:
+            self._provider_backends.pop(provider, None)
+        else:
+            self._provider_backends[provider] = backend
+
+    def submit_ai_task(
+        self,
+        task_description: str,
+        estimated_tokens: int,
+        provider: AIProvider,
+        max_tokens_override: int | None = None,
+    ) -> Future:
+        """
+        Queue an AI task without blocking the caller
+
+        Tasks for a provider run in parallel up to its entry in
+        provider_concurrency_limits; further tasks wait in the queue.
+
+        Returns:
+            Future resolving to the execute_ai_task_with_limits result
+        """
+        with self._lock:
+            executor = self._task_executors.get(provider)
+            if executor is None:
+                executor = ThreadPoolExecutor(
+                    max_workers=max(1, self.provider_concurrency_limits.get(provider, 1)),
+                    thread_name_prefix=f"ai-pool-{provider.value}",
+                )
+                self._task_executors[provider] = executor
+        return executor.submit(
+            self.execute_ai_task_with_limits,
+            task_description,
+            estimated_tokens,
+            provider,
+            max_tokens_override,
+        )
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop task queues and fold the usage journal into the state file"""
+        with self._lock:
+            executors = list(self._task_executors.values())
+            self._task_executors.clear()
+        for executor in executors:
+            executor.shutdown(wait=wait)
+        self._compact_state()
+
     def execute_ai_task_with_limits(
         self,
         task_description: str,
@@ -378,149 +519,167 @@ class StrictAIPoolManager:
                     f"Request exceeds safety limit of {self.max_tokens_per_call} tokens per call",
                 )
 
-            suitable_keys = self._find_suitable_keys(provider, sanitized_estimate)
-
-            if not suitable_keys:
-                return _fail(
-                    "INSUFFICIENT_DONATED_CREDITS",
-                    f"No {provider.value} keys with {sanitized_estimate} tokens available",
-                    {
-                        "needed_tokens": sanitized_estimate,
-                        "available_tokens": self._get_available_tokens(provider),
-                    },
-                )
-
-            _safe_metrics_call(
-                lambda: task_metrics.jobs_accepted.labels(provider=provider.value).inc()
-            )
-
-            execution_plan, remaining = self._plan_key_allocations(
-                suitable_keys, sanitized_estimate, per_call_limit
-            )
-
-            if remaining > 0:
-                return _fail(
-                    "INSUFFICIENT_DONATED_CREDITS",
-                    "Unable to schedule entire request even after pooling keys",
-                    {"tokens_unallocated": remaining},
-                )
-
-            combined_output: list[str] = []
-            segment_metadata: list[dict[str, Any]] = []
-            total_tokens_used = 0
-            total_minutes_elapsed = 0.0
+            # Select keys, plan segments and reserve their tokens atomically
+            with self._lock:
+                suitable_keys = self._find_suitable_keys(provider, sanitized_estimate)
 
-            for idx, (key, segment_tokens) in enumerate(execution_plan):
-                if not self._allow_provider_call(provider):
+                if not suitable_keys:
                     return _fail(
-                        "PROVIDER_RATE_LIMIT",
-                        f"Rate limit reached for provider {provider.value}",
+                        "INSUFFICIENT_DONATED_CREDITS",
+                        f"No {provider.value} keys with {sanitized_estimate} tokens available",
                         {
-                            "segment_index": idx,
-                            "tokens_processed": total_tokens_used,
-                            "partial_output": "\n".join(combined_output).strip(),
+                            "needed_tokens": sanitized_estimate,
+                            "available_tokens": self._get_available_tokens(provider),
                         },
                     )
 
-                if idx == 0:
-                    segment_task = task_description
-                else:
-                    previous_context = "\n".join(combined_output)[-2000:]
-                    segment_task = (
-                        f"{task_description}\n\n"
-                        f"Context from previous segments:\n{previous_context}\n\n"
-                        f"Continue response segment {idx + 1} of {len(execution_plan)} "
-                        "without repeating earlier content."
-                    )
+                _safe_metrics_call(
+                    lambda: task_metrics.jobs_accepted.labels(provider=provider.value).inc()
+                )
 
-                if override_specified:
-                    segment_max_tokens = min(self.max_tokens_per_call, override_value)
-                else:
-                    segment_max_tokens = min(self.max_tokens_per_call, segment_tokens)
-
-                segment_result = self._execute_with_strict_limits(
-                    keys=[key],
-                    task_description=segment_task,
-                    estimated_tokens=segment_tokens,
-                    max_tokens=segment_max_tokens,
-                    provider=provider,
+                execution_plan, remaining = self._plan_key_allocations(
+                    suitable_keys, sanitized_estimate, per_call_limit
                 )
 
-                if not segment_result.get("success"):
-                    failure_details = {
-                        "segment_index": idx,
-                        "tokens_processed": total_tokens_used,
-                        "partial_output": "\n".join(combined_output).strip(),
-                    }
-                    failure_details.update(
+                if remaining > 0:
+                    return _fail(
+                        "INSUFFICIENT_DONATED_CREDITS",
+                        "Unable to schedule entire request even after pooling keys",
+                        {"tokens_unallocated": remaining},
+                    )
+
+                for key, segment_tokens in execution_plan:
+                    key.reserved_tokens += segment_tokens
+
+            # Reservations still held; each is released once its segment has run
+            outstanding = list(execution_plan)
+            try:
+                combined_output: list[str] = []
+                segment_metadata: list[dict[str, Any]] = []
+                total_tokens_used = 0
+                total_minutes_elapsed = 0.0
+
+                for idx, (key, segment_tokens) in enumerate(execution_plan):
+                    with self._lock:
+                        allowed = self._allow_provider_call(provider)
+                    if not allowed:
+                        return _fail(
+                            "PROVIDER_RATE_LIMIT",
+                            f"Rate limit reached for provider {provider.value}",
+                            {
+                                "segment_index": idx,
+                                "tokens_processed": total_tokens_used,
+                                "partial_output": "\n".join(combined_output).strip(),
+                            },
+                        )
+
+                    if idx == 0:
+                        segment_task = task_description
+                    else:
+                        previous_context = "\n".join(combined_output)[-2000:]
+                        segment_task = (
+                            f"{task_description}\n\n"
+                            f"Context from previous segments:\n{previous_context}\n\n"
+                            f"Continue response segment {idx + 1} of {len(execution_plan)} "
+                            "without repeating earlier content."
+                        )
+
+                    if override_specified:
+                        segment_max_tokens = min(self.max_tokens_per_call, override_value)
+                    else:
+                        segment_max_tokens = min(self.max_tokens_per_call, segment_tokens)
+
+                    try:
+                        segment_result = self._execute_with_strict_limits(
+                            keys=[key],
+                            task_description=segment_task,
+                            estimated_tokens=segment_tokens,
+                            max_tokens=segment_max_tokens,
+                            provider=provider,
+                        )
+                    finally:
+                        self._release_reservation(key, segment_tokens)
+                        outstanding.pop(0)
+
+                    if not segment_result.get("success"):
+                        failure_details = {
+                            "segment_index": idx,
+                            "tokens_processed": total_tokens_used,
+                            "partial_output": "\n".join(combined_output).strip(),
+                        }
+                        failure_details.update(
+                            {
+                                "provider_response": segment_result.get("message")
+                                or segment_result.get("error"),
+                            }
+                        )
+                        return _fail(
+                            segment_result.get("error", "API_CALL_FAILED"),
+                            segment_result.get("message", "Segment execution failed"),
+                            failure_details,
+                        )
+
+                    segment_output = segment_result.get("result")
+                    if segment_output:
+                        combined_output.append(segment_output.strip())
+
+                    segment_tokens_used = segment_result.get("tokens_used", 0)
+                    total_tokens_used += segment_tokens_used
+                    total_minutes_elapsed += segment_result.get("minutes_elapsed", 0.0)
+
+                    segment_metadata.append(
                         {
-                            "provider_response": segment_result.get("message")
-                            or segment_result.get("error"),
+                            "key_id": key.key_id,
+                            "tokens_requested": segment_tokens,
+                            "tokens_used": segment_tokens_used,
+                            "minutes_elapsed": segment_result.get("minutes_elapsed", 0.0),
                         }
                     )
-                    return _fail(
-                        segment_result.get("error", "API_CALL_FAILED"),
-                        segment_result.get("message", "Segment execution failed"),
-                        failure_details,
-                    )
 
-                segment_output = segment_result.get("result")
-                if segment_output:
-                    combined_output.append(segment_output.strip())
-
-                segment_tokens_used = segment_result.get("tokens_used", 0)
-                total_tokens_used += segment_tokens_used
-                total_minutes_elapsed += segment_result.get("minutes_elapsed", 0.0)
-
-                segment_metadata.append(
-                    {
-                        "key_id": key.key_id,
-                        "tokens_requested": segment_tokens,
-                        "tokens_used": segment_tokens_used,
-                        "minutes_elapsed": segment_result.get("minutes_elapsed", 0.0),
-                    }
+                total_duration = time.time() - job_start_time
+                _safe_metrics_call(
+                    lambda: task_metrics.jobs_completed.labels(
+                        provider=provider.value, status="success"
+                    ).inc()
                 )
+                _safe_metrics_call(
+                    lambda: task_metrics.job_execution_time.observe(total_duration)
+                )
+                _safe_metrics_call(
+                    lambda: task_metrics.task_costs.observe(total_tokens_used)
+                )
+                metrics.record_completed_task()
 
-            total_duration = time.time() - job_start_time
-            _safe_metrics_call(
-                lambda: task_metrics.jobs_completed.labels(
-                    provider=provider.value, status="success"
-                ).inc()
-            )
-            _safe_metrics_call(
-                lambda: task_metrics.job_execution_time.observe(total_duration)
-            )
-            _safe_metrics_call(
-                lambda: task_metrics.task_costs.observe(total_tokens_used)
-            )
-            metrics.record_completed_task()
-
-            self.total_minutes_used += total_minutes_elapsed
-            self._save_state()
+                with self._lock:
+                    self.total_minutes_used += total_minutes_elapsed
+                    self._journal_state()
 
-            final_output = "\n".join(combined_output).strip()
+                final_output = "\n".join(combined_output).strip()
 
-            return {
-                "success": True,
-                "output": final_output,
-                "result": final_output,
-                "tokens_used": total_tokens_used,
-                "tokens_estimated": sanitized_estimate,
-                "accuracy": (
-                    (total_tokens_used / sanitized_estimate * 100) if sanitized_estimate > 0 else 0
-                ),
-                "segments_executed": len(execution_plan),
-                "segment_details": segment_metadata,
-                "provider": provider.value,
-                "minutes_elapsed": round(total_minutes_elapsed, 2),
-            }
+                return {
+                    "success": True,
+                    "output": final_output,
+                    "result": final_output,
+                    "tokens_used": total_tokens_used,
+                    "tokens_estimated": sanitized_estimate,
+                    "accuracy": (
+                        (total_tokens_used / sanitized_estimate * 100) if sanitized_estimate > 0 else 0
+                    ),
+                    "segments_executed": len(execution_plan),
+                    "segment_details": segment_metadata,
+                    "provider": provider.value,
+                    "minutes_elapsed": round(total_minutes_elapsed, 2),
+                }
+            finally:
+                for key, segment_tokens in outstanding:
+                    self._release_reservation(key, segment_tokens)
         finally:
             if queue_recorded:
                 _safe_metrics_call(lambda: task_metrics.job_queue_size.dec())
 
     def _find_suitable_keys(self, provider: AIProvider, tokens_needed: int) -> list[DonatedAPIKey]:
         """
-        Find API key(s) with enough balance
+        Find API key(s) with enough unreserved balance
         Can combine multiple keys if one doesn't have enough
         """
 
@@ -551,31 +710,31 @@ class StrictAIPoolManager:
                 or key.provider != provider
                 or not key.is_active
                 or key.is_depleted
-                or key.remaining_tokens() <= 0
+                or key.available_tokens() <= 0
                 or key_id in selected_ids
             ):
                 continue
 
             selected.append(key)
             selected_ids.add(key_id)
-            remaining -= key.remaining_tokens()
+            remaining -= key.available_tokens()
 
             if remaining <= 0:
                 break
 
         if remaining > 0:
             for key in self._active_keys_for_provider(provider):
-                if key.key_id in selected_ids or key.remaining_tokens() <= 0:
+                if key.key_id in selected_ids or key.available_tokens() <= 0:
                     continue
                 selected.append(key)
                 selected_ids.add(key.key_id)
                 if key.key_id not in rotation_queue:
                     rotation_queue.append(key.key_id)
-                remaining -= key.remaining_tokens()
+                remaining -= key.available_tokens()
                 if remaining <= 0:
                     break
 
-        if sum(k.remaining_tokens() for k in selected) < tokens_needed:
+        if sum(k.available_tokens() for k in selected) < tokens_needed:
             return []
 
         if rotation_queue and selected:
@@ -597,7 +756,7 @@ class StrictAIPoolManager:
         if per_call_limit <= 0:
             return [], tokens_needed
 
-        key_budgets = {key.key_id: key.remaining_tokens() for key in keys}
+        key_budgets = {key.key_id: key.available_tokens() for key in keys}
         remaining = tokens_needed
         plan: list[tuple[DonatedAPIKey, int]] = []
 
@@ -647,9 +806,10 @@ class StrictAIPoolManager:
 
         # Decrypt the primary key
         primary_key = keys[0]
-        key_retrieval = self.key_manager.get_api_key_for_task(
-            provider=provider, required_tokens=estimated_tokens
-        )
+        with self._lock:
+            key_retrieval = self.key_manager.get_api_key_for_task(
+                provider=provider, required_tokens=estimated_tokens
+            )
 
         if not key_retrieval:
             return {
@@ -662,7 +822,12 @@ class StrictAIPoolManager:
 
         # Execute the actual AI call with STRICT token limit
         try:
-            if provider == AIProvider.ANTHROPIC:
+            backend = self._provider_backends.get(provider)
+            if backend is not None:
+                result = backend(
+                    api_key=decrypted_api_key, task=task_description, max_tokens=max_tokens
+                )
+            elif provider == AIProvider.ANTHROPIC:
                 result = self._call_anthropic_with_limit(
                     api_key=decrypted_api_key, task=task_description, max_tokens=max_tokens
                 )
@@ -713,12 +878,10 @@ class StrictAIPoolManager:
                 "emergency_stop_triggered": True,
             }
 
-        # Deduct tokens from donated key(s)
-        self._deduct_tokens_from_keys(keys, actual_tokens_used)
-
-        # Update global usage
-        self.total_tokens_used += actual_tokens_used
-        self._save_state()
+        # Update global usage and deduct tokens from donated key(s)
+        with self._lock:
+            self.total_tokens_used += actual_tokens_used
+            self._deduct_tokens_from_keys(keys, actual_tokens_used)
 
         elapsed_minutes = (time.time() - start_time) / 60.0
 
@@ -831,26 +994,32 @@ class StrictAIPoolManager:
 
         remaining_to_deduct = total_tokens
 
-        for key in keys:
-            available = key.remaining_tokens()
+        with self._lock:
+            for key in keys:
+                available = key.remaining_tokens()
 
-            if available >= remaining_to_deduct:
-                # This key covers the rest
-                is_depleted = key.mark_usage(remaining_to_deduct)
+                if available >= remaining_to_deduct:
+                    # This key covers the rest
+                    is_depleted = key.mark_usage(remaining_to_deduct)
 
-                if is_depleted:
-                    self._handle_depleted_key(key)
-                break
-            else:
-                # Use all of this key
-                is_depleted = key.mark_usage(available)
-                remaining_to_deduct -= available
+                    if is_depleted:
+                        self._handle_depleted_key(key)
+                    break
+                else:
+                    # Use all of this key
+                    is_depleted = key.mark_usage(available)
+                    remaining_to_deduct -= available
 
-                if is_depleted:
-                    self._handle_depleted_key(key)
+                    if is_depleted:
+                        self._handle_depleted_key(key)
 
-        # Persist usage after deduction
-        self._save_state()
+            # Persist usage after deduction
+            self._journal_state(*keys)
+
+    def _release_reservation(self, key: DonatedAPIKey, tokens: int) -> None:
+        """Return tokens reserved for a segment that has finished or will not run"""
+        with self._lock:
+            key.reserved_tokens = max(0, key.reserved_tokens - tokens)
 
     def _handle_depleted_key(self, key: DonatedAPIKey) -> None:
         """
@@ -871,9 +1040,9 @@ class StrictAIPoolManager:
         print(f"   Total tasks: {key.tasks_completed}")
 
     def _get_available_tokens(self, provider: AIProvider) -> int:
-        """Get total available tokens for a provider"""
+        """Get total unreserved tokens for a provider"""
         return sum(
-            key.remaining_tokens()
+            key.available_tokens()
             for key in self.donated_keys.values()
             if key.provider == provider and key.is_active and not key.is_depleted
         )
@@ -881,6 +1050,7 @@ class StrictAIPoolManager:
     # ===== Persistence and Rate Limiting =====
 
     def _allow_provider_call(self, provider: AIProvider) -> bool:
+        """Record a call against the provider's rate limit window (lock held)"""
         max_req, window = self.provider_rate_limits.get(provider, (60, 60))
         now = time.time()
         dq = self._provider_calls[provider]
@@ -892,84 +1062,136 @@ class StrictAIPoolManager:
         dq.append(now)
         return True
 
-    def _save_state(self) -> None:
+    def _journal_state(self, *keys: DonatedAPIKey) -> None:
+        """
+        Append changed keys and current totals to the usage journal
+
+        Entries hold absolute values, so replaying them over the state file
+        is idempotent. Called with the state lock held.
+        """
+        entry = {
+            "totals": self._totals_record(),
+            "keys": [self._key_record(k) for k in keys],
+        }
         try:
-            state = {
-                "totals": {
-                    "tokens_donated": self.total_tokens_donated,
-                    "tokens_used": self.total_tokens_used,
-                    "minutes_donated": self.total_minutes_donated,
-                    "minutes_used": self.total_minutes_used,
-                },
-                "keys": [
-                    {
-                        "key_id": k.key_id,
-                        "donor_address": k.donor_address,
-                        "provider": k.provider.value,
-                        "encrypted_key": k.encrypted_key,
-                        "donated_tokens": k.donated_tokens,
-                        "donated_minutes": k.donated_minutes,
-                        "used_tokens": k.used_tokens,
-                        "used_minutes": k.used_minutes,
-                        "is_active": k.is_active,
-                        "is_depleted": k.is_depleted,
-                        "submitted_at": k.submitted_at,
-                        "first_used_at": k.first_used_at,
-                        "last_used_at": k.last_used_at,
-                        "depleted_at": k.depleted_at,
-                        "api_calls_made": k.api_calls_made,
-                        "tasks_completed": k.tasks_completed,
-                    }
-                    for k in self.donated_keys.values()
-                ],
-            }
-            with open(self._state_path, "w", encoding="utf-8") as f:
-                json.dump(state, f)
+            with self._lock:
+                with open(self._journal_path, "a", encoding="utf-8") as f:
+                    f.write(json.dumps(entry) + "\n")
+                self._journal_entries += 1
+                if self._journal_entries >= self.journal_compact_every:
+                    self._compact_state()
+        except (OSError, IOError, ValueError, TypeError, RuntimeError, KeyError, AttributeError) as e:
+            # Persistence failures must not break runtime
+            logging.debug("AI pool journal append failed: %s", e)
+
+    def _compact_state(self) -> None:
+        """Rewrite the state file from memory and truncate the journal"""
+        try:
+            with self._lock:
+                state = {
+                    "totals": self._totals_record(),
+                    "keys": [self._key_record(k) for k in self.donated_keys.values()],
+                }
+                fd, tmp_path = tempfile.mkstemp(
+                    dir=os.path.dirname(self._state_path), suffix=".tmp"
+                )
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(state, f)
+                os.replace(tmp_path, self._state_path)
+                # The journal is only dropped once the state file holds its entries
+                open(self._journal_path, "w", encoding="utf-8").close()
+                self._journal_entries = 0
         except (OSError, IOError, ValueError, TypeError, RuntimeError, KeyError, AttributeError) as e:
             # Persistence failures must not break runtime
             logging.debug("AI pool state save failed: %s", e)
 
+    def _totals_record(self) -> dict[str, Any]:
+        return {
+            "tokens_donated": self.total_tokens_donated,
+            "tokens_used": self.total_tokens_used,
+            "minutes_donated": self.total_minutes_donated,
+            "minutes_used": self.total_minutes_used,
+        }
+
+    @staticmethod
+    def _key_record(k: DonatedAPIKey) -> dict[str, Any]:
+        return {
+            "key_id": k.key_id,
+            "donor_address": k.donor_address,
+            "provider": k.provider.value,
+            "encrypted_key": k.encrypted_key,
+            "donated_tokens": k.donated_tokens,
+            "donated_minutes": k.donated_minutes,
+            "used_tokens": k.used_tokens,
+            "used_minutes": k.used_minutes,
+            "is_active": k.is_active,
+            "is_depleted": k.is_depleted,
+            "submitted_at": k.submitted_at,
+            "first_used_at": k.first_used_at,
+            "last_used_at": k.last_used_at,
+            "depleted_at": k.depleted_at,
+            "api_calls_made": k.api_calls_made,
+            "tasks_completed": k.tasks_completed,
+        }
+
+    def _apply_state_record(self, data: dict[str, Any]) -> None:
+        """Apply totals and key records from the state file or a journal entry"""
+        totals = data.get("totals", {})
+        self.total_tokens_donated = totals.get("tokens_donated", 0)
+        self.total_tokens_used = totals.get("tokens_used", 0)
+        self.total_minutes_donated = totals.get("minutes_donated", 0.0)
+        self.total_minutes_used = totals.get("minutes_used", 0.0)
+        for item in data.get("keys", []):
+            try:
+                dk = DonatedAPIKey(
+                    key_id=item["key_id"],
+                    donor_address=item["donor_address"],
+                    provider=AIProvider(item["provider"]),
+                    encrypted_key=item["encrypted_key"],
+                    donated_tokens=int(item["donated_tokens"]),
+                    donated_minutes=item.get("donated_minutes"),
+                    used_tokens=int(item.get("used_tokens", 0)),
+                    used_minutes=float(item.get("used_minutes", 0.0)),
+                    is_active=bool(item.get("is_active", True)),
+                    is_depleted=bool(item.get("is_depleted", False)),
+                    submitted_at=item.get("submitted_at"),
+                    first_used_at=item.get("first_used_at"),
+                    last_used_at=item.get("last_used_at"),
+                    depleted_at=item.get("depleted_at"),
+                    api_calls_made=int(item.get("api_calls_made", 0)),
+                    tasks_completed=int(item.get("tasks_completed", 0)),
+                )
+                self.donated_keys[dk.key_id] = dk
+            except (OSError, IOError, ValueError, TypeError, RuntimeError, KeyError, AttributeError) as e:
+                logging.debug("Failed to load donated key: %s", e)
+                continue
+
     def _load_state(self) -> None:
         try:
-            if not os.path.exists(self._state_path):
-                return
-            with open(self._state_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-            totals = data.get("totals", {})
-            self.total_tokens_donated = totals.get("tokens_donated", 0)
-            self.total_tokens_used = totals.get("tokens_used", 0)
-            self.total_minutes_donated = totals.get("minutes_donated", 0.0)
-            self.total_minutes_used = totals.get("minutes_used", 0.0)
             self.donated_keys.clear()
-            for item in data.get("keys", []):
-                try:
-                    dk = DonatedAPIKey(
-                        key_id=item["key_id"],
-                        donor_address=item["donor_address"],
-                        provider=AIProvider(item["provider"]),
-                        encrypted_key=item["encrypted_key"],
-                        donated_tokens=int(item["donated_tokens"]),
-                        donated_minutes=item.get("donated_minutes"),
-                        used_tokens=int(item.get("used_tokens", 0)),
-                        used_minutes=float(item.get("used_minutes", 0.0)),
-                        is_active=bool(item.get("is_active", True)),
-                        is_depleted=bool(item.get("is_depleted", False)),
-                        submitted_at=item.get("submitted_at"),
-                        first_used_at=item.get("first_used_at"),
-                        last_used_at=item.get("last_used_at"),
-                        depleted_at=item.get("depleted_at"),
-                        api_calls_made=int(item.get("api_calls_made", 0)),
-                        tasks_completed=int(item.get("tasks_completed", 0)),
-                    )
-                    self.donated_keys[dk.key_id] = dk
-                except (OSError, IOError, ValueError, TypeError, RuntimeError, KeyError, AttributeError) as e:
-                    logging.debug("Failed to load donated key: %s", e)
-                    continue
+            if os.path.exists(self._state_path):
+                with open(self._state_path, "r", encoding="utf-8") as f:
+                    self._apply_state_record(json.load(f))
         except (OSError, IOError, ValueError, TypeError, RuntimeError, KeyError, AttributeError) as e:
             # Ignore load errors and start fresh
             logging.debug("AI pool state load failed: %s", e)
             self.donated_keys = self.donated_keys or {}
 
+        # Replay usage recorded since the last compaction
+        try:
+            if not os.path.exists(self._journal_path):
+                return
+            with open(self._journal_path, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        continue  # Torn final write
+                    self._apply_state_record(entry)
+                    self._journal_entries += 1
+        except (OSError, IOError) as e:
+            logging.debug("AI pool journal replay failed: %s", e)
+
     def get_pool_status(self) -> dict:
         """Get detailed pool status with strict limit tracking"""
 
@@ -20,6 +20,7 @@ import math
 import re
 import time
 from decimal import Decimal, InvalidOperation
+from functools import lru_cache
 from typing import Any
 
 import base58
@@ -62,6 +63,20 @@ MAX_METADATA_SIZE = 4096  # 4KB metadata limit
 MAX_INPUTS = 1000  # Maximum inputs per transaction
 MAX_OUTPUTS = 1000  # Maximum outputs per transaction
 ADDRESS_PATTERN = re.compile(r'^(XAI|TXAI|COINBASE)[A-Fa-f0-9]{0,64}$')
+SENDER_ADDRESS_CACHE_SIZE = 65536  # Public keys whose derived address is memoized
+
+@lru_cache(maxsize=SENDER_ADDRESS_CACHE_SIZE)
+def _derive_sender_address(public_key: str, prefix: str) -> str:
+    """Derive the checksummed address for a public key (matches wallet.py).
+
+    Memoized process-wide: the same key signs many transactions and each one
+    is verified at mempool admission, block validation and chain validation.
+    """
+    from xai.core.wallets.address_checksum import to_checksum_address
+
+    # Convert public key hex to bytes before hashing
+    pub_hash = hashlib.sha256(bytes.fromhex(public_key)).hexdigest()
+    return to_checksum_address(f"{prefix}{pub_hash[:40]}")
 
 class TransactionValidationError(ValueError):
     """Raised when transaction validation fails."""
@@ -104,6 +119,19 @@ class Transaction:
     # Domain separation context for TXID/signatures to prevent cross-network replay
     _CHAIN_CONTEXT: str = "mainnet"
 
+    # Fields covered by the TXID; assigning any of them drops the hash cache
+    _HASHED_FIELDS = frozenset(
+        {"sender", "recipient", "amount", "fee", "timestamp", "nonce", "inputs", "outputs"}
+    )
+
+    # Memoized (chain context, inputs/outputs snapshot, txid) from calculate_hash
+    _hash_cache: tuple[str, tuple, str] | None = None
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name in Transaction._HASHED_FIELDS:
+            self.__dict__.pop("_hash_cache", None)
+        object.__setattr__(self, name, value)
+
     @staticmethod
     def _validate_amount(value: Any, field_name: str, allow_zero: bool = True) -> float:
         """Validate a monetary amount using centralized validation.
@@ -383,8 +411,9 @@ class Transaction:
         if not self.outputs and self.recipient and self.amount > 0:
             self.outputs.append({"address": self.recipient, "amount": self.amount})
 
-    def calculate_hash(self) -> str:
-        """Calculate transaction hash (TXID)"""
+    @staticmethod
+    def _resolve_chain_context() -> str:
+        """Resolve the chain context used for domain separation."""
         try:
             from xai.core.config import Config
             context = getattr(Config, "CHAIN_ID", None) or getattr(
@@ -400,9 +429,23 @@ class Transaction:
                 exc,
                 extra={"event": "tx.chain_context_fallback"},
             )
+        return Transaction._CHAIN_CONTEXT
+
+    def calculate_hash(self) -> str:
+        """Calculate transaction hash (TXID)
+
+        The TXID is memoized with the chain context and a shallow snapshot
+        of the inputs and outputs it was computed from; reassigning a hashed
+        field or editing an input or output recomputes it.
+        """
+        entries = self._io_snapshot()
+        cache = self._hash_cache
+        if cache is not None and cache[0] == Transaction._CHAIN_CONTEXT and cache[1] == entries:
+            return cache[2]
 
+        chain_context = Transaction._resolve_chain_context()
         tx_data = {
-            "chain_context": Transaction._CHAIN_CONTEXT,
+            "chain_context": chain_context,
             "sender": self.sender,
             "recipient": self.recipient,
             "amount": self.amount,
@@ -412,8 +455,16 @@ class Transaction:
             "inputs": self.inputs,
             "outputs": self.outputs,
         }
-        tx_string = canonical_json(tx_data)
-        return hashlib.sha256(tx_string.encode()).hexdigest()
+        txid = hashlib.sha256(canonical_json(tx_data).encode()).hexdigest()
+        self._hash_cache = (chain_context, entries, txid)
+        return txid
+
+    def _io_snapshot(self) -> tuple:
+        """Inputs and outputs as tuples of their items, compared on a cache hit."""
+        return tuple(
+            tuple(tuple(entry.items()) if isinstance(entry, dict) else entry for entry in entries)
+            for entries in (self.inputs or (), self.outputs or ())
+        )
 
     def sign_transaction(self, private_key: str) -> None:
         """Sign transaction with sender's private key"""
@@ -443,18 +494,10 @@ class Transaction:
             return False
 
         try:
-            # Convert public key hex to bytes before hashing (matches wallet.py)
-            pub_key_bytes = bytes.fromhex(self.public_key)
-            pub_hash = hashlib.sha256(pub_key_bytes).hexdigest()
-
             # Use network-appropriate prefix (must match wallet.py)
             from xai.core.config import NETWORK
             prefix = "XAI" if NETWORK.lower() == "mainnet" else "TXAI"
-            raw_address = f"{prefix}{pub_hash[:40]}"
-
-            # Apply checksum encoding to match wallet address format
-            from xai.core.wallets.address_checksum import to_checksum_address
-            expected_address = to_checksum_address(raw_address)
+            expected_address = _derive_sender_address(self.public_key, prefix)
 
             if expected_address != self.sender:
                 logger.debug(
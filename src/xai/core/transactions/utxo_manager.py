@@ -24,7 +24,12 @@ from collections import defaultdict
 from threading import RLock
 from typing import TYPE_CHECKING, Any
 
-from xai.core.api.structured_logger import StructuredLogger, get_structured_logger
+from xai.core.api.structured_logger import (
+    HotPathLogger,
+    StructuredLogger,
+    get_hot_path_logger,
+    get_structured_logger,
+)
 from xai.core.transactions.utxo_store import UTXOStore, MemoryUTXOStore, create_utxo_store
 from xai.core.consensus.validation import validate_amount
 from xai.core.constants import MINIMUM_TRANSACTION_AMOUNT
@@ -95,6 +100,16 @@ class UTXOManager:
         # Maximum pending transactions before force cleanup of oldest (safety valve)
         self._max_pending_txs = 10000
 
+        # Changes since mark_changes(), for delta checkpoints. None when not
+        # tracking or after a bulk load made the log incomplete.
+        self._changes_created: dict[str, tuple[str, dict[str, Any]]] | None = None
+        self._changes_spent: set[str] = set()
+
+    @property
+    def _hot_log(self) -> HotPathLogger:
+        """Sampled logger for per-UTXO and per-transaction events."""
+        return get_hot_path_logger(self.logger)
+
     @property
     def utxo_set(self) -> dict[str, list[dict[str, Any]]]:
         """Legacy access to UTXO set. Prefer store methods for new code."""
@@ -105,6 +120,7 @@ class UTXOManager:
         """Legacy setter for UTXO set. Loads data into storage backend."""
         self._store.clear()
         self._store.load_from_dict(value)
+        self._drop_changes()
 
     @property
     def total_utxos(self) -> int:
@@ -137,6 +153,38 @@ class UTXOManager:
         """Legacy setter - no-op as store manages indexing internally."""
         pass  # Store manages internally
 
+    def mark_changes(self) -> None:
+        """Start recording UTXO changes, discarding any recorded so far."""
+        with self._lock:
+            self._changes_created = {}
+            self._changes_spent = set()
+
+    def take_changes(self) -> dict[str, Any] | None:
+        """
+        Return the UTXOs created and spent since the last mark and mark again.
+
+        Returns:
+            Delta with "created" [[outpoint, address, utxo], ...] and sorted
+            "spent" outpoints, or None if changes are not being tracked or a
+            bulk load replaced the set since the mark
+        """
+        with self._lock:
+            if self._changes_created is None:
+                return None
+            delta = {
+                "created": [
+                    [outpoint, address, utxo]
+                    for outpoint, (address, utxo) in self._changes_created.items()
+                ],
+                "spent": sorted(self._changes_spent),
+            }
+            self.mark_changes()
+            return delta
+
+    def _drop_changes(self) -> None:
+        self._changes_created = None
+        self._changes_spent = set()
+
     def snapshot_digest(self) -> str:
         """
         Return a deterministic hash of the current UTXO set for integrity checks.
@@ -193,21 +241,30 @@ class UTXOManager:
 
         with self._lock:
             added = self._store.add_utxo(address, txid, vout, validated_amount, script_pubkey)
-            if added:
-                self.logger.debug(
-                    f"Added UTXO: {txid}:{vout} for {address} with {validated_amount} XAI",
-                    address=address,
-                    txid=txid,
-                    vout=vout,
-                    amount=validated_amount,
-                )
-            else:
-                self.logger.debug(
-                    f"Duplicate UTXO: {txid}:{vout} for {address} already exists",
-                    address=address,
-                    txid=txid,
-                    vout=vout,
-                )
+            if added and self._changes_created is not None:
+                self._changes_created[f"{txid}:{vout}"] = (address, {
+                    "txid": txid,
+                    "vout": vout,
+                    "amount": validated_amount,
+                    "script_pubkey": script_pubkey,
+                    "address": address,
+                    "spent": False,
+                })
+            event = "utxo.added" if added else "utxo.duplicate"
+            hot = self._hot_log
+            if hot.enabled("DEBUG", event):
+                if added:
+                    hot.emit(
+                        "DEBUG", event, "Added UTXO: %s:%s for %s with %s XAI",
+                        txid, vout, address, validated_amount,
+                        address=address, txid=txid, vout=vout, amount=validated_amount,
+                    )
+                else:
+                    hot.emit(
+                        "DEBUG", event, "Duplicate UTXO: %s:%s for %s already exists",
+                        txid, vout, address,
+                        address=address, txid=txid, vout=vout,
+                    )
 
     def mark_utxo_spent(self, address: str, txid: str, vout: int) -> bool:
         """
@@ -231,43 +288,43 @@ class UTXOManager:
             # Security: Validate ownership before marking spent
             utxo = self._store.get_utxo(txid, vout)
             if utxo is None:
-                self.logger.warn(
-                    f"UTXO not found or already spent: {txid}:{vout}",
-                    address=address,
-                    txid=txid,
-                    vout=vout,
+                self._hot_log.warn(
+                    "utxo.spend_missing", "UTXO not found or already spent: %s:%s", txid, vout,
+                    address=address, txid=txid, vout=vout,
                 )
                 return False
 
             # Check ownership - UTXO must belong to the specified address
             utxo_address = utxo.get("address")
             if utxo_address and utxo_address != address:
-                self.logger.warn(
-                    f"Ownership validation failed for UTXO {txid}:{vout}: "
-                    f"expected {address}, found {utxo_address}",
-                    address=address,
-                    utxo_address=utxo_address,
-                    txid=txid,
-                    vout=vout,
+                self._hot_log.warn(
+                    "utxo.owner_mismatch",
+                    "Ownership validation failed for UTXO %s:%s: expected %s, found %s",
+                    txid, vout, address, utxo_address,
+                    address=address, utxo_address=utxo_address, txid=txid, vout=vout,
                 )
                 return False
 
             # Delegate to storage backend
             marked = self._store.mark_spent(txid, vout)
+            if marked and self._changes_created is not None:
+                outpoint = f"{txid}:{vout}"
+                if self._changes_created.pop(outpoint, None) is None:
+                    self._changes_spent.add(outpoint)
 
+            hot = self._hot_log
             if marked:
-                self.logger.debug(
-                    f"Marked UTXO: {txid}:{vout} for {address} as spent",
-                    address=address,
-                    txid=txid,
-                    vout=vout,
-                )
+                if hot.enabled("DEBUG", "utxo.spent"):
+                    hot.emit(
+                        "DEBUG", "utxo.spent", "Marked UTXO: %s:%s for %s as spent",
+                        txid, vout, address,
+                        address=address, txid=txid, vout=vout,
+                    )
             else:
-                self.logger.warn(
-                    f"Failed to mark UTXO: {txid}:{vout} for {address} as spent",
-                    address=address,
-                    txid=txid,
-                    vout=vout,
+                hot.warn(
+                    "utxo.spend_failed", "Failed to mark UTXO: %s:%s for %s as spent",
+                    txid, vout, address,
+                    address=address, txid=txid, vout=vout,
                 )
 
             return marked
@@ -330,9 +387,9 @@ class UTXOManager:
                 output["amount"],
                 f"P2PKH {output['address']}",
             )
-        txid_display = transaction.txid[:10] if transaction.txid else "<unsigned>"
-        self.logger.info(
-            f"Processed outputs for transaction {txid_display}...", txid=transaction.txid
+        self._hot_log.info(
+            "utxo.tx_outputs_processed", "Processed outputs for transaction %.10s...",
+            transaction.txid or "<unsigned>", txid=transaction.txid,
         )
 
     def process_transaction_inputs(self, transaction: "Transaction") -> bool:
@@ -390,9 +447,9 @@ class UTXOManager:
                     sender=transaction.sender,
                 )
                 return False
-        txid_display = transaction.txid[:10] if transaction.txid else "<unsigned>"
-        self.logger.info(
-            f"Processed inputs for transaction {txid_display}...", txid=transaction.txid
+        self._hot_log.info(
+            "utxo.tx_inputs_processed", "Processed inputs for transaction %.10s...",
+            transaction.txid or "<unsigned>", txid=transaction.txid,
         )
         return True
 
@@ -479,23 +536,27 @@ class UTXOManager:
                 utxo_key = (utxo["txid"], utxo["vout"])
                 if utxo_key in self._pending_utxos:
                     existing_tx = self._utxo_to_tx.get(utxo_key, "unknown")
-                    self.logger.warn(
-                        f"UTXO {utxo['txid']}:{utxo['vout']} already locked by tx {existing_tx}",
-                        extra={"event": "utxo.lock_failed", "utxo": utxo_key, "locked_by": existing_tx}
+                    self._hot_log.warn(
+                        "utxo.lock_failed", "UTXO %s:%s already locked by tx %s",
+                        utxo_key[0], utxo_key[1], existing_tx,
+                        utxo=utxo_key, locked_by=existing_tx,
                     )
                     return False
 
             # Lock all UTXOs, tied to transaction ID
             locked_keys: list[tuple] = []
+            hot = self._hot_log
             for utxo in utxos:
                 utxo_key = (utxo["txid"], utxo["vout"])
                 self._pending_utxos[utxo_key] = tx_id
                 self._utxo_to_tx[utxo_key] = tx_id
                 locked_keys.append(utxo_key)
-                self.logger.debug(
-                    f"Locked UTXO {utxo['txid']}:{utxo['vout']} for tx {tx_id}",
-                    extra={"event": "utxo.locked", "utxo": utxo_key, "tx_id": tx_id}
-                )
+                if hot.enabled("DEBUG", "utxo.locked"):
+                    hot.emit(
+                        "DEBUG", "utxo.locked", "Locked UTXO %s:%s for tx %s",
+                        utxo_key[0], utxo_key[1], tx_id,
+                        utxo=utxo_key, tx_id=tx_id,
+                    )
 
             # Track UTXOs by transaction
             if tx_id:
@@ -510,6 +571,7 @@ class UTXOManager:
         Args:
             utxos: List of UTXO dictionaries to unlock
         """
+        hot = self._hot_log
         with self._lock:
             for utxo in utxos:
                 utxo_key = (utxo["txid"], utxo["vout"])
@@ -524,10 +586,11 @@ class UTXOManager:
                         ]
                         if not self._tx_to_utxos[tx_id]:
                             del self._tx_to_utxos[tx_id]
-                    self.logger.debug(
-                        f"Unlocked UTXO {utxo['txid']}:{utxo['vout']}",
-                        extra={"event": "utxo.unlocked", "utxo": utxo_key}
-                    )
+                    if hot.enabled("DEBUG", "utxo.unlocked"):
+                        hot.emit(
+                            "DEBUG", "utxo.unlocked", "Unlocked UTXO %s:%s",
+                            utxo_key[0], utxo_key[1], utxo=utxo_key,
+                        )
 
     def unlock_utxos_by_keys(self, utxo_keys: list[tuple]) -> None:
         """
@@ -536,6 +599,7 @@ class UTXOManager:
         Args:
             utxo_keys: List of (txid, vout) tuples to unlock
         """
+        hot = self._hot_log
         with self._lock:
             for utxo_key in utxo_keys:
                 if utxo_key in self._pending_utxos:
@@ -549,10 +613,11 @@ class UTXOManager:
                         ]
                         if not self._tx_to_utxos[tx_id]:
                             del self._tx_to_utxos[tx_id]
-                    self.logger.debug(
-                        f"Unlocked UTXO {utxo_key[0]}:{utxo_key[1]}",
-                        extra={"event": "utxo.unlocked", "utxo": utxo_key}
-                    )
+                    if hot.enabled("DEBUG", "utxo.unlocked"):
+                        hot.emit(
+                            "DEBUG", "utxo.unlocked", "Unlocked UTXO %s:%s",
+                            utxo_key[0], utxo_key[1], utxo=utxo_key,
+                        )
 
     def release_utxos_for_tx(self, tx_id: str, reason: str = "unknown") -> int:
         """
@@ -585,14 +650,10 @@ class UTXOManager:
                     released_count += 1
 
             if released_count > 0:
-                self.logger.info(
-                    f"Released {released_count} UTXO locks for tx {tx_id[:16]}... ({reason})",
-                    extra={
-                        "event": "utxo.tx_locks_released",
-                        "tx_id": tx_id,
-                        "reason": reason,
-                        "count": released_count
-                    }
+                self._hot_log.info(
+                    "utxo.tx_locks_released", "Released %d UTXO locks for tx %.16s... (%s)",
+                    released_count, tx_id, reason,
+                    tx_id=tx_id, reason=reason, count=released_count,
                 )
 
             return released_count
@@ -670,6 +731,7 @@ class UTXOManager:
         """
         with self._lock:
             self._store.load_from_dict(utxo_set_data)
+            self._drop_changes()
             stats = self._store.get_stats()
             self.logger.info(f"UTXO set loaded with {stats['total_utxos']} unspent UTXOs.")
 
@@ -711,17 +773,23 @@ class UTXOManager:
             self._pending_utxos = {}
             self._utxo_to_tx = {}
             self._tx_to_utxos = {}
+            self._drop_changes()
             self.logger.info("UTXO Manager reset.")
 
-    def snapshot(self) -> dict[str, Any]:
+    def snapshot(self, mark_changes: bool = False) -> dict[str, Any]:
         """
         Creates a complete snapshot of the current UTXO state.
         Thread-safe atomic operation for chain reorganization rollback.
 
+        Args:
+            mark_changes: Also start recording changes from this snapshot
+
         Returns:
             A deep copy of the UTXO state including totals
         """
         with self._lock:
+            if mark_changes:
+                self.mark_changes()
             stats = self._store.get_stats()
             return {
                 "utxo_set": self._store.to_dict(),
@@ -742,6 +810,7 @@ class UTXOManager:
             self._store.clear()
             utxo_data = snapshot.get("utxo_set", {})
             self._store.load_from_dict(utxo_data)
+            self._drop_changes()
             stats = self._store.get_stats()
             self.logger.info(f"UTXO state restored from snapshot with {stats['total_utxos']} UTXOs.")
 
@@ -755,6 +824,7 @@ class UTXOManager:
             self._pending_utxos = {}
             self._utxo_to_tx = {}
             self._tx_to_utxos = {}
+            self._drop_changes()
 
     def compact_utxo_set(self) -> int:
         """
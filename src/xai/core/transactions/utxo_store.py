@@ -22,12 +22,17 @@ from __future__ import annotations
 
 import json
 import hashlib
+import logging
+import struct
 import time
 from abc import ABC, abstractmethod
 from collections import defaultdict
+from decimal import Context, Decimal
 from threading import RLock
 from typing import Any, Iterator
 
+from xai.core.constants import WEI_PER_TOKEN
+
 # LevelDB is optional - graceful fallback to memory
 try:
     import plyvel
@@ -36,6 +41,30 @@ except ImportError:
     plyvel = None  # type: ignore
     LEVELDB_AVAILABLE = False
 
+logger = logging.getLogger(__name__)
+
+# LevelDB value layouts: amount, address length, script length; balance in
+# base units (signed 128-bit, so sums never drift), UTXO count
+_UTXO_VALUE_HEADER = struct.Struct(">dHI")
+_BALANCE_RECORD = struct.Struct(">16sQ")
+_FORMAT_KEY = b"meta:format_version"
+_FORMAT_VERSION = b"3"
+_MIGRATION_BATCH_SIZE = 10_000
+
+# Wide enough to hold any float amount in base units exactly
+_AMOUNT_CONTEXT = Context(prec=60)
+_WEI_PER_TOKEN = Decimal(WEI_PER_TOKEN)
+
+
+def _to_base_units(amount: float) -> int:
+    """Convert an amount to integer base units, truncating below one unit."""
+    return int(_AMOUNT_CONTEXT.multiply(Decimal(str(amount)), _WEI_PER_TOKEN))
+
+
+def _from_base_units(units: int) -> float:
+    """Convert integer base units to the nearest float amount."""
+    return float(_AMOUNT_CONTEXT.divide(Decimal(units), _WEI_PER_TOKEN))
+
 
 class UTXOStore(ABC):
     """Abstract interface for UTXO storage backends."""
@@ -176,10 +205,10 @@ class MemoryUTXOStore(UTXOStore):
 
     def get_balance(self, address: str) -> float:
         with self._lock:
-            return sum(
-                utxo["amount"] for utxo in self._utxo_set.get(address, [])
+            return _from_base_units(sum(
+                _to_base_units(utxo["amount"]) for utxo in self._utxo_set.get(address, [])
                 if not utxo["spent"]
-            )
+            ))
 
     def get_stats(self) -> dict[str, Any]:
         with self._lock:
@@ -237,10 +266,17 @@ class LevelDBUTXOStore(UTXOStore):
     High-performance LevelDB-based UTXO storage.
 
     Key schema:
-    - "utxo:{txid}:{vout}" -> UTXO JSON (primary storage)
-    - "addr:{address}:{txid}:{vout}" -> "1" (address index for range scans)
+    - "utxo:{txid}:{vout}" -> UTXO value (primary storage)
+    - "addr:{address}:{txid}:{vout}" -> UTXO value (address index for range scans)
+    - "bal:{address}" -> balance record (balance in base units, UTXO count)
     - "stats:total_utxos" -> count
     - "stats:total_value" -> value
+    - "meta:format_version" -> value encoding version
+
+    Values use a fixed binary layout (see _encode_value). Spent outputs are
+    deleted, so every entry is unspent, address scans need no second lookup,
+    and balances are a single read. Databases written with the earlier JSON
+    values or float balance records are migrated on open.
 
     Thread-safe with RLock. Uses atomic batch writes for consistency.
     """
@@ -254,6 +290,7 @@ class LevelDBUTXOStore(UTXOStore):
         self._db_path = db_path
         self._db = plyvel.DB(db_path, create_if_missing=create_if_missing)
         self._lock = RLock()
+        self._migrate()
         self._load_stats()
 
     def _load_stats(self) -> None:
@@ -275,6 +312,132 @@ class LevelDBUTXOStore(UTXOStore):
         batch.put(b"stats:total_utxos", str(self._total_utxos).encode())
         batch.put(b"stats:total_value", str(self._total_value).encode())
 
+    # ==================== Value Encoding ====================
+
+    @staticmethod
+    def _encode_value(amount: float, address: str, script_pubkey: str) -> bytes:
+        """Encode a UTXO as header (amount, address length, script length) + address + script."""
+        address_bytes = address.encode()
+        script_bytes = script_pubkey.encode()
+        return (
+            _UTXO_VALUE_HEADER.pack(amount, len(address_bytes), len(script_bytes))
+            + address_bytes
+            + script_bytes
+        )
+
+    @staticmethod
+    def _decode_value(txid: str, vout: int, data: bytes) -> dict[str, Any]:
+        """Decode a UTXO value into the dict form shared with MemoryUTXOStore."""
+        amount, address_len, script_len = _UTXO_VALUE_HEADER.unpack_from(data)
+        offset = _UTXO_VALUE_HEADER.size
+        address = data[offset:offset + address_len].decode()
+        offset += address_len
+        return {
+            "txid": txid,
+            "vout": vout,
+            "amount": amount,
+            "script_pubkey": data[offset:offset + script_len].decode(),
+            "address": address,
+            "spent": False,
+        }
+
+    def _balance_record(self, address: str) -> tuple[int, int]:
+        """(balance in base units, UTXO count) for an address."""
+        data = self._db.get(f"bal:{address}".encode())
+        if not data:
+            return 0, 0
+        balance, count = _BALANCE_RECORD.unpack(data)
+        return int.from_bytes(balance, "big", signed=True), count
+
+    def _put_balance(self, batch: Any, address: str, balance: int, count: int) -> None:
+        """Write an address aggregate to the batch, removing it once empty."""
+        key = f"bal:{address}".encode()
+        if count > 0:
+            batch.put(key, _BALANCE_RECORD.pack(balance.to_bytes(16, "big", signed=True), count))
+        else:
+            batch.delete(key)
+
+    # ==================== Migration ====================
+
+    def _migrate(self) -> None:
+        """Convert a database with JSON values or float balances to the current format."""
+        if self._db.get(_FORMAT_KEY) == _FORMAT_VERSION:
+            return
+
+        with self._lock:
+            converted = removed = 0
+            batch = self._db.write_batch()
+            pending = 0
+            for key, value in self._db.iterator(prefix=b"utxo:"):
+                if not value.startswith(b"{"):
+                    continue  # Already binary: a v2 database or an interrupted migration
+                utxo = json.loads(value.decode())
+                if utxo.get("spent"):
+                    batch.delete(key)
+                    removed += 1
+                else:
+                    batch.put(key, self._encode_value(
+                        utxo.get("amount", 0.0), utxo.get("address", ""), utxo.get("script_pubkey", "")
+                    ))
+                    converted += 1
+                pending += 1
+                if pending >= _MIGRATION_BATCH_SIZE:
+                    batch.write()
+                    batch = self._db.write_batch()
+                    pending = 0
+            batch.write()
+
+            self._rebuild_indexes()
+            self._db.put(_FORMAT_KEY, _FORMAT_VERSION)
+
+        if converted or removed:
+            logger.info(
+                "Migrated LevelDB UTXO store to binary values",
+                extra={
+                    "event": "utxo_store.migrated",
+                    "converted": converted,
+                    "spent_removed": removed,
+                },
+            )
+
+    def _rebuild_indexes(self) -> None:
+        """Recreate address index, balance records and stats from primary entries."""
+        batch = self._db.write_batch()
+        for prefix in (b"addr:", b"bal:"):
+            for key in self._db.iterator(prefix=prefix, include_value=False):
+                batch.delete(key)
+        batch.write()
+
+        balances: dict[str, list] = defaultdict(lambda: [0, 0])
+        total_utxos = 0
+        total_value = 0.0
+        batch = self._db.write_batch()
+        pending = 0
+        for key, value in self._db.iterator(prefix=b"utxo:"):
+            _, txid, vout = key.decode().rsplit(":", 2)
+            utxo = self._decode_value(txid, int(vout), value)
+            address = utxo["address"]
+            amount = utxo["amount"]
+            batch.put(f"addr:{address}:{txid}:{vout}".encode(), value)
+            balances[address][0] += _to_base_units(amount)
+            balances[address][1] += 1
+            total_utxos += 1
+            total_value += amount
+            pending += 1
+            if pending >= _MIGRATION_BATCH_SIZE:
+                batch.write()
+                batch = self._db.write_batch()
+                pending = 0
+
+        for address, (balance, count) in balances.items():
+            self._put_balance(batch, address, balance, count)
+        self._total_utxos = total_utxos
+        self._total_value = total_value
+        self._save_stats(batch)
+        batch.write()
+
+    # ==================== UTXOStore API ====================
+
     def add_utxo(
         self,
         address: str,
@@ -291,19 +454,14 @@ class LevelDBUTXOStore(UTXOStore):
             if self._db.get(utxo_key):
                 return False
 
-            utxo = {
-                "txid": txid,
-                "vout": vout,
-                "amount": amount,
-                "script_pubkey": script_pubkey,
-                "address": address,
-                "spent": False,
-            }
+            value = self._encode_value(amount, address, script_pubkey)
+            balance, count = self._balance_record(address)
 
             # Atomic batch write
             batch = self._db.write_batch()
-            batch.put(utxo_key, json.dumps(utxo).encode())
-            batch.put(addr_key, b"1")
+            batch.put(utxo_key, value)
+            batch.put(addr_key, value)
+            self._put_balance(batch, address, balance + _to_base_units(amount), count + 1)
 
             self._total_utxos += 1
             self._total_value += amount
@@ -320,21 +478,19 @@ class LevelDBUTXOStore(UTXOStore):
             if not data:
                 return False
 
-            utxo = json.loads(data.decode())
-            if utxo.get("spent"):
-                return False
-
-            # Mark as spent
-            utxo["spent"] = True
-            address = utxo.get("address", "")
+            utxo = self._decode_value(txid, vout, data)
+            address = utxo["address"]
+            amount = utxo["amount"]
             addr_key = f"addr:{address}:{txid}:{vout}".encode()
+            balance, count = self._balance_record(address)
 
-            # Atomic batch write
+            # Atomic batch write; spent outputs are not kept
             batch = self._db.write_batch()
-            batch.put(utxo_key, json.dumps(utxo).encode())
-            batch.delete(addr_key)  # Remove from address index
+            batch.delete(utxo_key)
+            batch.delete(addr_key)
+            self._put_balance(batch, address, balance - _to_base_units(amount), count - 1)
 
-            self._total_value -= utxo.get("amount", 0.0)
+            self._total_value -= amount
             self._total_utxos = max(0, self._total_utxos - 1)
             self._save_stats(batch)
 
@@ -347,9 +503,7 @@ class LevelDBUTXOStore(UTXOStore):
         with self._lock:
             data = self._db.get(utxo_key)
             if data:
-                utxo = json.loads(data.decode())
-                if not utxo.get("spent"):
-                    return utxo
+                return self._decode_value(txid, vout, data)
             return None
 
     def get_utxos_for_address(self, address: str) -> list[dict[str, Any]]:
@@ -357,20 +511,16 @@ class LevelDBUTXOStore(UTXOStore):
         utxos = []
 
         with self._lock:
-            for key, _ in self._db.iterator(prefix=prefix):
-                # Extract txid:vout from key
-                parts = key.decode().split(":")
-                if len(parts) >= 4:
-                    txid = parts[2]
-                    vout = int(parts[3])
-                    utxo = self.get_utxo(txid, vout)
-                    if utxo:
-                        utxos.append(utxo)
+            for key, value in self._db.iterator(prefix=prefix):
+                # Remaining key is txid:vout
+                txid, vout = key[len(prefix):].decode().rsplit(":", 1)
+                utxos.append(self._decode_value(txid, int(vout), value))
 
         return utxos
 
     def get_balance(self, address: str) -> float:
-        return sum(utxo["amount"] for utxo in self.get_utxos_for_address(address))
+        with self._lock:
+            return _from_base_units(self._balance_record(address)[0])
 
     def get_stats(self) -> dict[str, Any]:
         with self._lock:
@@ -385,11 +535,9 @@ class LevelDBUTXOStore(UTXOStore):
         entries = []
         with self._lock:
             for key, value in self._db.iterator(prefix=b"utxo:"):
-                utxo = json.loads(value.decode())
-                addr = utxo.get("address", "")
-                entries.append(
-                    f"{addr}:{utxo['txid']}:{utxo['vout']}:{utxo['amount']}:{int(utxo.get('spent', False))}"
-                )
+                _, txid, vout = key.decode().rsplit(":", 2)
+                utxo = self._decode_value(txid, int(vout), value)
+                entries.append(f"{utxo['address']}:{txid}:{vout}:{utxo['amount']}:0")
         entries.sort()
         payload = "|".join(entries)
         return hashlib.sha256(payload.encode("utf-8")).hexdigest()
@@ -398,39 +546,33 @@ class LevelDBUTXOStore(UTXOStore):
         result: dict[str, list[dict]] = defaultdict(list)
         with self._lock:
             for key, value in self._db.iterator(prefix=b"utxo:"):
-                utxo = json.loads(value.decode())
-                address = utxo.get("address", "unknown")
-                result[address].append(utxo)
+                _, txid, vout = key.decode().rsplit(":", 2)
+                utxo = self._decode_value(txid, int(vout), value)
+                result[utxo["address"]].append(utxo)
         return dict(result)
 
     def load_from_dict(self, data: dict[str, Any]) -> None:
         with self._lock:
-            # Clear existing data
-            batch = self._db.write_batch()
-            for key, _ in self._db.iterator():
-                batch.delete(key)
-            batch.write()
-
-            # Load new data
-            self._total_utxos = 0
-            self._total_value = 0.0
+            self.clear()
 
+            # Load unspent entries; spent ones are not stored
             batch = self._db.write_batch()
             for address, utxos in data.items():
+                balance, count = 0, 0
                 for utxo in utxos:
+                    if utxo.get("spent", False):
+                        continue
                     txid = utxo["txid"]
                     vout = utxo["vout"]
-                    utxo_key = f"utxo:{txid}:{vout}".encode()
-
-                    # Ensure address is in utxo
-                    utxo["address"] = address
-                    batch.put(utxo_key, json.dumps(utxo).encode())
-
-                    if not utxo.get("spent", False):
-                        addr_key = f"addr:{address}:{txid}:{vout}".encode()
-                        batch.put(addr_key, b"1")
-                        self._total_utxos += 1
-                        self._total_value += utxo.get("amount", 0.0)
+                    amount = utxo.get("amount", 0.0)
+                    value = self._encode_value(amount, address, utxo.get("script_pubkey", ""))
+                    batch.put(f"utxo:{txid}:{vout}".encode(), value)
+                    batch.put(f"addr:{address}:{txid}:{vout}".encode(), value)
+                    balance += _to_base_units(amount)
+                    count += 1
+                    self._total_utxos += 1
+                    self._total_value += amount
+                self._put_balance(batch, address, balance, count)
 
             self._save_stats(batch)
             batch.write()
@@ -438,11 +580,12 @@ class LevelDBUTXOStore(UTXOStore):
     def clear(self) -> None:
         with self._lock:
             batch = self._db.write_batch()
-            for key, _ in self._db.iterator():
+            for key in self._db.iterator(include_value=False):
                 batch.delete(key)
             self._total_utxos = 0
             self._total_value = 0.0
             self._save_stats(batch)
+            batch.put(_FORMAT_KEY, _FORMAT_VERSION)
             batch.write()
 
     def close(self) -> None:
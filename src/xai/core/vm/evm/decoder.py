@@ -0,0 +1,159 @@
+"""
+EVM Bytecode Pre-Decoder.
+
+Translates bytecode once into an instruction array used by the interpreter's
+pre-decoded execution mode:
+- PUSH immediates are decoded to integers ahead of time
+- DUP/SWAP positions are resolved
+- Opcode handlers are resolved to plain functions
+- Static gas is summed per basic block so it is charged once per block
+
+A basic block ends at control flow (JUMP, JUMPI, halting opcodes), at
+opcodes that observe the remaining gas (GAS, CALL*, CREATE*) so that they
+see exactly the same value as in the per-instruction loop, and before every
+JUMPDEST. Jumps can only land on a JUMPDEST, so every block is entered at
+its first instruction and the pre-charged gas is always consumed.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Callable
+
+from .opcodes import OPCODE_INFO, Opcode, get_push_size, is_dup, is_push, is_swap
+
+# Instruction kinds
+KIND_OP = 0  # Call the resolved handler, then advance
+KIND_PUSH = 1  # Push pre-decoded immediate
+KIND_DUP = 2
+KIND_SWAP = 3
+KIND_JUMP = 4  # JUMP/JUMPI: validate destination, handler sets pc
+KIND_FAIL = 5  # Undefined or unimplemented opcode
+
+# Opcodes that read ``call.gas``; the block must end with them
+GAS_OBSERVING_OPCODES = frozenset(
+    {
+        Opcode.GAS,
+        Opcode.CALL,
+        Opcode.CALLCODE,
+        Opcode.DELEGATECALL,
+        Opcode.STATICCALL,
+        Opcode.CREATE,
+        Opcode.CREATE2,
+    }
+)
+
+BLOCK_TERMINATORS = frozenset(
+    {
+        Opcode.JUMP,
+        Opcode.JUMPI,
+        Opcode.STOP,
+        Opcode.RETURN,
+        Opcode.REVERT,
+        Opcode.INVALID,
+        Opcode.SELFDESTRUCT,
+    }
+)
+
+# (kind, arg, handler, pc, block_gas, block_len)
+# ``block_len`` is non-zero only on the first instruction of a basic block.
+Instruction = tuple[int, object, Callable | None, int, int, int]
+
+
+@dataclass
+class DecodedProgram:
+    """Pre-decoded bytecode for one code hash."""
+
+    instructions: list[Instruction]
+    index_of: dict[int, int]  # pc -> instruction index
+    jump_dests: set[int]
+    code_length: int
+    block_count: int = field(default=0)
+
+
+def decode_program(
+    code: bytes,
+    jump_dests: set[int],
+    resolve_handler: Callable[[int], Callable | None],
+) -> DecodedProgram:
+    """
+    Decode bytecode into an instruction array.
+
+    Args:
+        code: Contract bytecode
+        jump_dests: Valid JUMPDEST offsets for ``code``
+        resolve_handler: Maps an opcode to its handler function
+
+    Returns:
+        DecodedProgram with basic-block gas totals
+    """
+    instructions: list[list] = []
+    index_of: dict[int, int] = {}
+    code_length = len(code)
+
+    pc = 0
+    while pc < code_length:
+        opcode = code[pc]
+        info = OPCODE_INFO.get(opcode)
+        index_of[pc] = len(instructions)
+        next_pc = pc + 1
+
+        if info is None:
+            instructions.append([KIND_FAIL, f"Invalid opcode: 0x{opcode:02x}", None, pc, 0, opcode])
+        elif is_push(opcode):
+            size = get_push_size(opcode)
+            end = next_pc + size
+            value_bytes = code[next_pc:end]
+            if len(value_bytes) < size:
+                # Pad with zeros if reading past end
+                value_bytes += bytes(size - len(value_bytes))
+            instructions.append([KIND_PUSH, int.from_bytes(value_bytes, "big"), None, pc, info.gas_cost, opcode])
+            next_pc = end
+        elif is_dup(opcode):
+            instructions.append([KIND_DUP, opcode - 0x7F, None, pc, info.gas_cost, opcode])
+        elif is_swap(opcode):
+            instructions.append([KIND_SWAP, opcode - 0x8F, None, pc, info.gas_cost, opcode])
+        else:
+            handler = resolve_handler(opcode)
+            if handler is None:
+                # Base gas is charged before the legacy loop reports this
+                instructions.append(
+                    [KIND_FAIL, f"Unimplemented opcode: 0x{opcode:02x}", None, pc, info.gas_cost, opcode]
+                )
+            elif opcode in (Opcode.JUMP, Opcode.JUMPI):
+                instructions.append([KIND_JUMP, None, handler, pc, info.gas_cost, opcode])
+            else:
+                instructions.append([KIND_OP, None, handler, pc, info.gas_cost, opcode])
+        pc = next_pc
+
+    # Group into basic blocks: fold static gas into the leader
+    block_count = 0
+    leader = 0
+    total = len(instructions)
+    for i, instr in enumerate(instructions):
+        opcode = instr[5]
+        ends_block = (
+            i + 1 == total
+            or instr[0] == KIND_FAIL
+            or opcode in BLOCK_TERMINATORS
+            or opcode in GAS_OBSERVING_OPCODES
+            or instructions[i + 1][5] == Opcode.JUMPDEST
+        )
+        if not ends_block:
+            continue
+        block_gas = sum(instructions[j][4] for j in range(leader, i + 1))
+        for j in range(leader, i + 1):
+            instructions[j][4] = 0
+            instructions[j][5] = 0
+        instructions[leader][4] = block_gas
+        instructions[leader][5] = i + 1 - leader
+        block_count += 1
+        leader = i + 1
+
+    return DecodedProgram(
+        instructions=[tuple(instr) for instr in instructions],
+        index_of=index_of,
+        jump_dests=jump_dests,
+        code_length=code_length,
+        block_count=block_count,
+    )
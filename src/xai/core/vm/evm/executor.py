@@ -9,6 +9,7 @@ from __future__ import annotations
 
 import hashlib
 import logging
+import threading
 import time
 from collections import OrderedDict
 from typing import TYPE_CHECKING, Any
@@ -934,6 +935,62 @@ class EVMBytecodeExecutor(BaseExecutor):
             "data": log.data.hex(),
         }
 
+# Sentinels for PrecompileCache misses and undecodable curve points
+_MISSING = object()
+_INVALID_POINT = object()
+
+
+class PrecompileCache:
+    """
+    Bounded LRU map shared by every precompile execution in the process.
+
+    Uses OrderedDict for O(1) LRU eviction, like the contract code cache;
+    guarded by a lock since API calls and block validation execute
+    concurrently.
+    """
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._entries: OrderedDict[Any, Any] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Any) -> Any:
+        """Return the cached value, or _MISSING."""
+        with self._lock:
+            value = self._entries.get(key, _MISSING)
+            if value is _MISSING:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self._entries.move_to_end(key)
+            return value
+
+    def put(self, key: Any, value: Any) -> None:
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> dict[str, Any]:
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total > 0 else 0.0,
+            "size": len(self._entries),
+            "max_size": self.max_size,
+        }
+
+
 class EVMPrecompiles:
     """
     EVM precompiled contracts.
@@ -967,6 +1024,17 @@ class EVMPrecompiles:
     )
     _KZG_G2_TAU_POINT = None
 
+    # The elliptic-curve precompiles are pure functions of their input and
+    # cost milliseconds (ECPAIRING: hundreds of milliseconds per pair), while
+    # verifier contracts call them with the same inputs over and over: the
+    # same transaction runs under estimate_gas, call_static and again at
+    # block validation. Results are keyed by (address, sha256(input)); gas
+    # is still computed and checked from the input on every call.
+    _result_cache = PrecompileCache(max_size=1024)
+    # Decoded and curve-checked alt_bn128 G2 points, keyed by their 128-byte
+    # encoding; verification keys pair against the same few G2 points
+    _bn128_g2_cache = PrecompileCache(max_size=256)
+
     @classmethod
     def is_precompile(cls, address: str) -> bool:
         """Check if address is a precompile."""
@@ -1019,6 +1087,50 @@ class EVMPrecompiles:
         else:
             raise VMExecutionError(f"Precompile {addr_int} not implemented")
 
+    @classmethod
+    def _memoized(cls, address: str, data: bytes, compute) -> bytes:
+        """
+        Return compute(data), reusing the result of an earlier identical call.
+
+        VMExecutionErrors raised by ``compute`` depend only on the input too,
+        so their type, arguments and revert data are cached and an equal
+        error is raised again; otherwise a repeated invalid proof would be
+        re-verified on every call.
+        """
+        key = (address, hashlib.sha256(data).digest())
+        cached = cls._result_cache.get(key)
+        if cached is _MISSING:
+            try:
+                cached = compute(data)
+            except VMExecutionError as exc:
+                cached = (type(exc), exc.args, exc.revert_data)
+            cls._result_cache.put(key, cached)
+        if isinstance(cached, tuple):
+            exc_type, args, revert_data = cached
+            error = exc_type(*args)
+            error.revert_data = revert_data
+            raise error
+        return cached
+
+    @classmethod
+    def clear_caches(cls) -> None:
+        """Clear memoized precompile results and decoded points."""
+        cls._result_cache.clear()
+        cls._bn128_g2_cache.clear()
+
+    @classmethod
+    def get_cache_stats(cls) -> dict[str, Any]:
+        """
+        Get precompile cache statistics.
+
+        Returns:
+            Dictionary with stats for the result and G2 point caches
+        """
+        return {
+            "results": cls._result_cache.stats(),
+            "bn128_g2_points": cls._bn128_g2_cache.stats(),
+        }
+
     @classmethod
     def _ecrecover(cls, data: bytes, gas: int) -> tuple[bytes, int]:
         """ECRECOVER precompile."""
@@ -1109,6 +1221,11 @@ class EVMPrecompiles:
         if len(data) < 128:
             data = data + b"\x00" * (128 - len(data))
 
+        return cls._memoized(cls.ECADD, data[:128], cls._ecadd_uncached), gas_cost
+
+    @classmethod
+    def _ecadd_uncached(cls, data: bytes) -> bytes:
+        """Add two alt_bn128 points from 128 bytes of input."""
         x1 = int.from_bytes(data[0:32], "big")
         y1 = int.from_bytes(data[32:64], "big")
         x2 = int.from_bytes(data[64:96], "big")
@@ -1125,9 +1242,9 @@ class EVMPrecompiles:
 
         # Validate points (ignore infinity None)
         if p1 is not None and not is_on_curve(p1, b):
-            return (b"\x00" * 64, gas_cost)
+            return b"\x00" * 64
         if p2 is not None and not is_on_curve(p2, b):
-            return (b"\x00" * 64, gas_cost)
+            return b"\x00" * 64
 
         if p1 is None:
             result = p2
@@ -1137,11 +1254,11 @@ class EVMPrecompiles:
             result = add(p1, p2)
 
         if result is None:
-            return (b"\x00" * 64, gas_cost)
+            return b"\x00" * 64
 
         x = int(result[0])
         y = int(result[1])
-        return x.to_bytes(32, "big") + y.to_bytes(32, "big"), gas_cost
+        return x.to_bytes(32, "big") + y.to_bytes(32, "big")
 
     @classmethod
     def _ecmul(cls, data: bytes, gas: int) -> tuple[bytes, int]:
@@ -1155,6 +1272,11 @@ class EVMPrecompiles:
         if len(data) < 96:
             data = data + b"\x00" * (96 - len(data))
 
+        return cls._memoized(cls.ECMUL, data[:96], cls._ecmul_uncached), gas_cost
+
+    @classmethod
+    def _ecmul_uncached(cls, data: bytes) -> bytes:
+        """Multiply an alt_bn128 point by a scalar from 96 bytes of input."""
         x = int.from_bytes(data[0:32], "big")
         y = int.from_bytes(data[32:64], "big")
         s = int.from_bytes(data[64:96], "big")
@@ -1167,20 +1289,20 @@ class EVMPrecompiles:
         # Point at infinity
         p = None if (x == 0 and y == 0) else (FQ(x), FQ(y), FQ(1))
         if p is not None and not is_on_curve(p, b):
-            return (b"\x00" * 64, gas_cost)
+            return b"\x00" * 64
 
         # Reduce scalar mod curve order
         s = s % curve_order
         if p is None or s == 0:
-            return (b"\x00" * 64, gas_cost)
+            return b"\x00" * 64
 
         result = multiply(p, s)
         if result is None:
-            return (b"\x00" * 64, gas_cost)
+            return b"\x00" * 64
 
         rx = int(result[0])
         ry = int(result[1])
-        return rx.to_bytes(32, "big") + ry.to_bytes(32, "big"), gas_cost
+        return rx.to_bytes(32, "big") + ry.to_bytes(32, "big")
 
     @classmethod
     def _ecpairing(cls, data: bytes, gas: int) -> tuple[bytes, int]:
@@ -1197,42 +1319,32 @@ class EVMPrecompiles:
         if gas < gas_cost:
             raise VMExecutionError("Out of gas for ECPAIRING")
 
+        return cls._memoized(cls.ECPAIRING, data, cls._ecpairing_uncached), gas_cost
+
+    @classmethod
+    def _ecpairing_uncached(cls, data: bytes) -> bytes:
+        """Check a product of alt_bn128 pairings (192 bytes per pair) equals one."""
         try:
-            from py_ecc.optimized_bn128 import FQ, FQ2, b2, is_on_curve, normalize, pairing
+            from py_ecc.optimized_bn128 import FQ, FQ12, is_on_curve, pairing
         except (ImportError, AttributeError, ModuleNotFoundError) as exc:
             raise VMExecutionError(f"ECPAIRING dependency error: {exc}")
 
         # Compute product of pairings; equal to identity -> success (1), else 0
         # The py_ecc pairing(a,b) returns a value in FQ12; product equals 1 for true.
-        # We'll accumulate by multiplying pairings and check if result is one.
-        from py_ecc.fields.field_properties import field_properties as fq12_props
-        from py_ecc.optimized_bn128 import FQ12
-        from py_ecc.optimized_bn128.optimized_curve import is_inf
-
         acc = FQ12.one()
 
-        for i in range(pairs):
-            off = i * 192
+        for off in range(0, len(data), 192):
             # G1 point
             x1 = int.from_bytes(data[off : off + 32], "big")
             y1 = int.from_bytes(data[off + 32 : off + 64], "big")
             g1 = None if (x1 == 0 and y1 == 0) else (FQ(x1), FQ(y1), FQ(1))
 
-            # G2 point (x_im, x_re, y_im, y_re) 32-bytes each, big-endian
-            x2_im = int.from_bytes(data[off + 64 : off + 96], "big")
-            x2_re = int.from_bytes(data[off + 96 : off + 128], "big")
-            y2_im = int.from_bytes(data[off + 128 : off + 160], "big")
-            y2_re = int.from_bytes(data[off + 160 : off + 192], "big")
-            x2 = FQ2([x2_im, x2_re])
-            y2 = FQ2([y2_im, y2_re])
-            # Handle infinity (all zeros) for G2
-            g2 = None if (x2_im == 0 and x2_re == 0 and y2_im == 0 and y2_re == 0) else (x2, y2, FQ2.one())
-
             # Validate on-curve
             if g1 is not None and not is_on_curve(g1, b=None):
-                return (b"\x00" * 32, gas_cost)
-            if g2 is not None and not is_on_curve(g2, b2):
-                return (b"\x00" * 32, gas_cost)
+                return b"\x00" * 32
+            g2 = cls._decode_bn128_g2(data[off + 64 : off + 192])
+            if g2 is _INVALID_POINT:
+                return b"\x00" * 32
 
             if g1 is None or g2 is None:
                 # Pairing with infinity contributes neutral element (skip)
@@ -1241,8 +1353,34 @@ class EVMPrecompiles:
             acc *= pairing(g2, g1)
 
         # Success if accumulator equals one in FQ12
-        out = (1).to_bytes(32, "big") if acc == FQ12.one() else (0).to_bytes(32, "big")
-        return out, gas_cost
+        return (1).to_bytes(32, "big") if acc == FQ12.one() else (0).to_bytes(32, "big")
+
+    @classmethod
+    def _decode_bn128_g2(cls, encoded: bytes):
+        """
+        Decode a 128-byte alt_bn128 G2 point (x_im, x_re, y_im, y_re).
+
+        Returns:
+            The point, None for the point at infinity (all zeros), or
+            _INVALID_POINT if it is not on the curve
+        """
+        point = cls._bn128_g2_cache.get(encoded)
+        if point is not _MISSING:
+            return point
+
+        from py_ecc.optimized_bn128 import FQ2, b2, is_on_curve
+
+        x_im, x_re, y_im, y_re = (
+            int.from_bytes(encoded[i : i + 32], "big") for i in range(0, 128, 32)
+        )
+        if x_im == 0 and x_re == 0 and y_im == 0 and y_re == 0:
+            point = None
+        else:
+            point = (FQ2([x_im, x_re]), FQ2([y_im, y_re]), FQ2.one())
+            if not is_on_curve(point, b2):
+                point = _INVALID_POINT
+        cls._bn128_g2_cache.put(encoded, point)
+        return point
 
     # ---- Blake2f (EIP-152) and Point Evaluation (EIP-4844) placeholders ----
 
@@ -1404,6 +1542,11 @@ class EVMPrecompiles:
         if len(data) != 192:
             raise VMExecutionError("POINT_EVALUATION input must be exactly 192 bytes")
 
+        return cls._memoized(cls.POINT_EVALUATION, data, cls._point_evaluation_uncached), gas_cost
+
+    @classmethod
+    def _point_evaluation_uncached(cls, data: bytes) -> bytes:
+        """Verify a 192-byte KZG point evaluation proof."""
         versioned_hash = data[:32]
         z_bytes = data[32:64]
         y_bytes = data[64:96]
@@ -1455,8 +1598,7 @@ class EVMPrecompiles:
         if pairing(G2, p_minus_y) != pairing(x_minus_z, proof_point):
             raise VMExecutionError("POINT_EVALUATION proof verification failed")
 
-        output = (
+        return (
             cls._KZG_FIELD_ELEMENTS_PER_BLOB.to_bytes(32, "big")
             + cls._KZG_BLS_MODULUS.to_bytes(32, "big")
         )
-        return output, gas_cost
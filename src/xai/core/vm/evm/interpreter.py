@@ -18,6 +18,15 @@ from typing import TYPE_CHECKING, Callable
 from ..exceptions import VMExecutionError
 from . import interpreter_helpers
 from .context import CallContext, CallType, ExecutionContext, Log
+from .decoder import (
+    KIND_DUP,
+    KIND_FAIL,
+    KIND_JUMP,
+    KIND_PUSH,
+    KIND_SWAP,
+    DecodedProgram,
+    decode_program,
+)
 from .memory import EVMMemory
 from .opcodes import (
     OPCODE_INFO,
@@ -65,6 +74,10 @@ class EVMInterpreter:
 
     Performance features:
     - Jump destination caching by code hash
+    - Pre-decoded execution: bytecode is translated once per code hash into
+      an instruction array with resolved handlers, decoded PUSH immediates
+      and per-basic-block static gas
+    - Sampled wall-clock checks instead of one per instruction
     - LRU-style cache eviction
     - Cache hit/miss tracking for monitoring
     """
@@ -72,22 +85,34 @@ class EVMInterpreter:
     # Execution limits
     MAX_EXECUTION_TIME = 10.0  # 10 seconds
     MAX_INSTRUCTIONS = 10_000_000  # 10 million instructions
+    # Instructions between wall-clock timeout checks
+    TIME_CHECK_INTERVAL = 1024
+
+    # Use the pre-decoded instruction array by default
+    PREDECODE = True
 
     # Class-level cache shared across all interpreter instances
     # This allows multiple executions of the same contract to benefit from caching
     _jump_dest_cache: dict[str, set[int]] = {}
     _cache_stats = {"hits": 0, "misses": 0}
+    # Decoded programs keyed by (interpreter class, code hash); handlers are
+    # resolved per class so subclasses overriding handlers get their own entry
+    _program_cache: dict[tuple[type, str], DecodedProgram] = {}
+    _program_cache_stats = {"hits": 0, "misses": 0}
 
-    def __init__(self, context: ExecutionContext) -> None:
+    def __init__(self, context: ExecutionContext, predecode: bool | None = None) -> None:
         """
         Initialize interpreter with execution context.
 
         Args:
             context: Execution context
+            predecode: Use pre-decoded execution (defaults to ``PREDECODE``)
         """
         self.context = context
+        self.predecode = self.PREDECODE if predecode is None else predecode
         self._instruction_count = 0
         self._start_time = 0.0
+        self._next_time_check = 0
 
         # Opcode handlers
         self._handlers: dict[int, Callable[[CallContext], None]] = {
@@ -197,7 +222,20 @@ class EVMInterpreter:
         """
         self._start_time = time.time()
         self._instruction_count = 0
+        self._next_time_check = self.TIME_CHECK_INTERVAL
+
+        if self.predecode and call.code:
+            program = self._get_program(call.code)
+            start = program.index_of.get(call.pc)
+            # Decoded blocks must be entered at their first instruction
+            if start is not None and program.instructions[start][5]:
+                self._execute_decoded(call, program, start)
+                return
+
+        self._execute_legacy(call)
 
+    def _execute_legacy(self, call: CallContext) -> None:
+        """Per-instruction fetch/decode/dispatch loop."""
         # Pre-compute valid jump destinations
         jump_dests = self._compute_jump_destinations(call.code)
 
@@ -264,21 +302,103 @@ class EVMInterpreter:
             ):
                 call.pc += 1
 
+    def _execute_decoded(self, call: CallContext, program: DecodedProgram, index: int) -> None:
+        """
+        Run a pre-decoded program.
+
+        Static gas, the instruction count and the limit checks are applied once
+        per basic block on its first instruction; see ``decoder`` for why this
+        is observably equivalent to charging per instruction.
+        """
+        instructions = program.instructions
+        index_of = program.index_of
+        jump_dests = program.jump_dests
+        count = len(instructions)
+        stack = call.stack
+
+        while index < count and not call.halted:
+            kind, arg, handler, pc, block_gas, block_len = instructions[index]
+
+            if block_len:
+                if block_gas > call.gas:
+                    raise VMExecutionError(
+                        f"Out of gas at PC={pc}: basic block costs {block_gas}"
+                    )
+                call.gas -= block_gas
+                self._instruction_count += block_len
+                if self._instruction_count > self.MAX_INSTRUCTIONS or (
+                    self._instruction_count >= self._next_time_check
+                ):
+                    self._check_limits()
+
+            if kind == KIND_PUSH:
+                stack.push(arg)
+                index += 1
+            elif kind == KIND_DUP:
+                stack.dup(arg)
+                index += 1
+            elif kind == KIND_SWAP:
+                stack.swap(arg)
+                index += 1
+            elif kind == KIND_JUMP:
+                call.pc = pc
+                dest = stack.peek(0)
+                if dest not in jump_dests:
+                    raise VMExecutionError(f"Invalid jump destination: {dest}")
+                handler(self, call)
+                index = index_of.get(call.pc, count)
+            elif kind == KIND_FAIL:
+                call.pc = pc
+                raise VMExecutionError(arg)
+            else:
+                call.pc = pc
+                handler(self, call)
+                index += 1
+
+        if index >= count and not call.halted:
+            call.pc = program.code_length
+
+    def _get_program(self, code: bytes) -> DecodedProgram:
+        """Return the decoded program for ``code``, decoding it on first use."""
+        key = (type(self), hashlib.sha256(code).hexdigest())
+        program = self._program_cache.get(key)
+        if program is not None:
+            self._program_cache_stats["hits"] += 1
+            return program
+
+        self._program_cache_stats["misses"] += 1
+        handlers = self._handlers
+        program = decode_program(
+            code,
+            self._compute_jump_destinations(code),
+            lambda opcode: getattr(handlers.get(opcode), "__func__", None),
+        )
+
+        if len(self._program_cache) >= JUMP_DEST_CACHE_SIZE:
+            keys_to_remove = list(self._program_cache.keys())[:JUMP_DEST_CACHE_EVICTION_SIZE]
+            for stale in keys_to_remove:
+                del self._program_cache[stale]
+        self._program_cache[key] = program
+        return program
+
     def _check_limits(self) -> None:
-        """Check execution limits."""
+        """Check execution limits (wall clock sampled every TIME_CHECK_INTERVAL)."""
+        # Instruction limit
+        if self._instruction_count > self.MAX_INSTRUCTIONS:
+            raise VMExecutionError(
+                f"Instruction limit exceeded: {self._instruction_count} > {self.MAX_INSTRUCTIONS}"
+            )
+
         # Time limit
+        if self._instruction_count < self._next_time_check:
+            return
+        self._next_time_check = self._instruction_count + self.TIME_CHECK_INTERVAL
         elapsed = time.time() - self._start_time
         if elapsed > self.MAX_EXECUTION_TIME:
             raise VMExecutionError(
                 f"Execution timeout: {elapsed:.2f}s > {self.MAX_EXECUTION_TIME}s"
             )
 
-        # Instruction limit
-        if self._instruction_count > self.MAX_INSTRUCTIONS:
-            raise VMExecutionError(
-                f"Instruction limit exceeded: {self._instruction_count} > {self.MAX_INSTRUCTIONS}"
-            )
-
     def _compute_jump_destinations(self, code: bytes) -> set[int]:
         """
         Pre-compute valid JUMPDEST locations with caching.
@@ -347,7 +467,8 @@ class EVMInterpreter:
         Get jump destination cache statistics.
 
         Returns:
-            Dictionary with 'hits', 'misses', and 'size' keys
+            Dictionary with jump destination 'hits', 'misses', 'size' and
+            'hit_rate', plus decoded program cache counters
         """
         return {
             "hits": cls._cache_stats["hits"],
@@ -358,6 +479,9 @@ class EVMInterpreter:
                 if (cls._cache_stats["hits"] + cls._cache_stats["misses"]) > 0
                 else 0.0
             ),
+            "program_hits": cls._program_cache_stats["hits"],
+            "program_misses": cls._program_cache_stats["misses"],
+            "program_size": len(cls._program_cache),
         }
 
     @classmethod
@@ -369,6 +493,8 @@ class EVMInterpreter:
         """
         cls._jump_dest_cache.clear()
         cls._cache_stats = {"hits": 0, "misses": 0}
+        cls._program_cache.clear()
+        cls._program_cache_stats = {"hits": 0, "misses": 0}
 
     def _handle_push(self, call: CallContext, opcode: int) -> None:
         """Handle PUSH1-PUSH32 opcodes."""
@@ -6,8 +6,10 @@ This package provides merchant-focused tools for XAI payment processing:
 - Payment verification and validation
 - Invoice management and tracking
 - Webhook delivery and retry logic
+- Address watch-list for push-based payment detection
 """
 
+from xai.merchant.address_watcher import AddressWatchList, WatchedPayment
 from xai.merchant.payment_processor import (
     MerchantPaymentProcessor,
     PaymentStatus,
@@ -16,6 +18,8 @@ from xai.merchant.payment_processor import (
 )
 
 __all__ = [
+    "AddressWatchList",
+    "WatchedPayment",
     "MerchantPaymentProcessor",
     "PaymentStatus",
     "WebhookEvent",
@@ -0,0 +1,317 @@
+"""
+Address Watch-List Matcher
+
+Pushes "payment to address X arrived" notifications instead of requiring
+merchants to poll balances:
+- Hash index of watched addresses, matched in O(outputs) per transaction
+- Mempool admission produces ``payment.seen`` events
+- Block connect produces confirmation updates and ``payment.confirmed``
+- Chain following with fork detection so reorged payments are rolled back
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections import deque
+from dataclasses import asdict, dataclass, field
+from typing import Any, Callable, Sequence
+
+logger = logging.getLogger(__name__)
+
+PAYMENT_SEEN = "payment.seen"
+PAYMENT_CONFIRMATION = "payment.confirmation"
+PAYMENT_CONFIRMED = "payment.confirmed"
+PAYMENT_REORGED = "payment.reorged"
+
+# Events forwarded to the node-level WebhookManager
+_WEBHOOK_EVENT_NAMES = {
+    PAYMENT_SEEN: "payment_seen",
+    PAYMENT_CONFIRMED: "payment_confirmed",
+    PAYMENT_REORGED: "payment_reorged",
+}
+
+
+@dataclass
+class WatchedPayment:
+    """A transaction output paying a watched address"""
+    txid: str
+    vout: int
+    address: str
+    amount: float
+    seen_at: int = field(default_factory=lambda: int(time.time()))
+    block_hash: str | None = None
+    block_height: int | None = None
+    confirmations: int = 0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary representation"""
+        return asdict(self)
+
+
+WatchListener = Callable[[str, WatchedPayment, frozenset], None]
+
+
+class AddressWatchList:
+    """
+    Matches transaction outputs against a set of watched addresses.
+
+    Each tag may ask for its own confirmation target; a payment to an address
+    is tracked until it reaches the highest target among the tags watching
+    that address.
+
+    The matcher follows the chain by remembering the (height, hash) of recently
+    processed blocks. On every tip change it walks back until it finds a block
+    it has already processed on the current chain, disconnects anything above
+    that point (reorg) and connects the new blocks, so no explicit disconnect
+    hook is needed from the consensus code.
+    """
+
+    def __init__(
+        self,
+        confirmation_target: int = 6,
+        max_reorg_depth: int = 100,
+        webhook_manager: Any | None = None,
+    ):
+        """
+        Initialize watch list.
+
+        Args:
+            confirmation_target: Default confirmations after which a payment is
+                final and stops being tracked
+            max_reorg_depth: Number of processed block hashes retained for
+                fork detection
+            webhook_manager: Optional WebhookManager for node-level events
+        """
+        if confirmation_target < 1:
+            raise ValueError("confirmation_target must be at least 1")
+        self.confirmation_target = confirmation_target
+        self.max_reorg_depth = max_reorg_depth
+        self.webhook_manager = webhook_manager
+
+        # address -> {tag: confirmation target}
+        self._watched: dict[str, dict[str, int]] = {}
+        self._listeners: list[WatchListener] = []
+        # Payments not yet final, keyed by (txid, vout)
+        self._tracked: dict[tuple[str, int], WatchedPayment] = {}
+        # Unconfirmed-tracked payments per block hash for O(1) reorg rollback
+        self._by_block: dict[str, set[tuple[str, int]]] = {}
+        self._processed: deque[tuple[int, str]] = deque(maxlen=max_reorg_depth)
+        self._lock = threading.RLock()
+
+    # ==================== WATCH MANAGEMENT ====================
+
+    def watch(self, address: str, tag: str, confirmation_target: int | None = None) -> None:
+        """
+        Start watching an address on behalf of ``tag`` (e.g. a request ID).
+
+        Args:
+            address: Address to watch
+            tag: Identifier passed to listeners with every event
+            confirmation_target: Confirmations ``tag`` waits for (defaults to
+                the watch list's target)
+        """
+        target = self.confirmation_target if confirmation_target is None else confirmation_target
+        if target < 1:
+            raise ValueError("confirmation_target must be at least 1")
+        with self._lock:
+            self._watched.setdefault(address, {})[tag] = target
+
+    def unwatch(self, address: str, tag: str) -> None:
+        """Stop watching an address for ``tag``"""
+        with self._lock:
+            tags = self._watched.get(address)
+            if not tags:
+                return
+            tags.pop(tag, None)
+            if not tags:
+                del self._watched[address]
+                # Drop payments nobody is waiting on any more
+                for key in [k for k, p in self._tracked.items() if p.address == address]:
+                    payment = self._tracked.pop(key)
+                    keys = self._by_block.get(payment.block_hash) if payment.block_hash else None
+                    if keys is not None:
+                        keys.discard(key)
+                        if not keys:
+                            del self._by_block[payment.block_hash]
+
+    def _target_for(self, address: str) -> int:
+        """Confirmations after which payments to ``address`` stop being tracked"""
+        tags = self._watched.get(address)
+        return max(tags.values()) if tags else self.confirmation_target
+
+    def is_watched(self, address: str) -> bool:
+        """Check whether any tag watches an address"""
+        return address in self._watched
+
+    def add_listener(self, listener: WatchListener) -> None:
+        """Register a callback ``listener(event, payment, tags)``"""
+        self._listeners.append(listener)
+
+    # ==================== MATCHING ====================
+
+    @staticmethod
+    def _iter_outputs(tx: Any):
+        outputs = getattr(tx, "outputs", None)
+        if outputs:
+            for vout, output in enumerate(outputs):
+                if isinstance(output, dict):
+                    yield vout, output.get("address"), output.get("amount", 0.0)
+            return
+        recipient = getattr(tx, "recipient", None)
+        if recipient:
+            yield 0, recipient, getattr(tx, "amount", 0.0)
+
+    def on_transaction_admitted(self, tx: Any) -> int:
+        """
+        Match a transaction accepted into the mempool.
+
+        Returns:
+            Number of watched outputs found
+        """
+        if not self._watched:
+            return 0
+        txid = getattr(tx, "txid", None)
+        if not txid:
+            return 0
+        matched = 0
+        with self._lock:
+            for vout, address, amount in self._iter_outputs(tx):
+                if address not in self._watched:
+                    continue
+                key = (txid, vout)
+                if key in self._tracked:
+                    continue
+                payment = WatchedPayment(txid=txid, vout=vout, address=address, amount=float(amount))
+                self._tracked[key] = payment
+                matched += 1
+                self._emit(PAYMENT_SEEN, payment)
+        return matched
+
+    def on_tip_changed(self, blockchain: Any) -> None:
+        """Chain observer hook invoked after block connect or reorg"""
+        self.sync_to_chain(blockchain.chain)
+
+    def sync_to_chain(self, chain: Sequence[Any]) -> None:
+        """
+        Bring the matcher in line with ``chain``.
+
+        The first call anchors at the current tip without rescanning history.
+        """
+        if not chain:
+            return
+        with self._lock:
+            tip_height = len(chain) - 1
+            if not self._processed:
+                self._processed.append((tip_height, chain[tip_height].hash))
+                return
+
+            # Disconnect blocks that are no longer on the active chain
+            while self._processed:
+                height, block_hash = self._processed[-1]
+                if height <= tip_height and chain[height].hash == block_hash:
+                    break
+                self._processed.pop()
+                self._disconnect_block(block_hash)
+
+            if self._processed:
+                start = self._processed[-1][0] + 1
+            else:
+                # Fork deeper than retained history; resume from the new tip.
+                logger.warning(
+                    "Watch-list reorg exceeded retained depth",
+                    extra={"event": "watchlist.deep_reorg", "max_depth": self.max_reorg_depth},
+                )
+                start = max(0, tip_height - self.max_reorg_depth + 1)
+
+            for height in range(start, tip_height + 1):
+                self._connect_block(chain[height], height)
+
+            self._update_confirmations(tip_height)
+
+    def _connect_block(self, block: Any, height: int) -> None:
+        block_hash = block.hash
+        self._processed.append((height, block_hash))
+        if not self._watched:
+            return
+        for tx in getattr(block, "transactions", []) or []:
+            txid = getattr(tx, "txid", None)
+            if not txid:
+                continue
+            for vout, address, amount in self._iter_outputs(tx):
+                if address not in self._watched:
+                    continue
+                key = (txid, vout)
+                payment = self._tracked.get(key)
+                if payment is None:
+                    payment = WatchedPayment(txid=txid, vout=vout, address=address, amount=float(amount))
+                    self._tracked[key] = payment
+                    self._emit(PAYMENT_SEEN, payment)
+                payment.block_hash = block_hash
+                payment.block_height = height
+                self._by_block.setdefault(block_hash, set()).add(key)
+
+    def _disconnect_block(self, block_hash: str) -> None:
+        for key in self._by_block.pop(block_hash, ()):
+            payment = self._tracked.get(key)
+            if payment is None or payment.block_hash != block_hash:
+                continue
+            payment.block_hash = None
+            payment.block_height = None
+            payment.confirmations = 0
+            self._emit(PAYMENT_REORGED, payment)
+
+    def _update_confirmations(self, tip_height: int) -> None:
+        finalized: list[tuple[str, int]] = []
+        for block_hash, keys in list(self._by_block.items()):
+            for key in keys:
+                payment = self._tracked[key]
+                confirmations = tip_height - payment.block_height + 1
+                if confirmations == payment.confirmations:
+                    continue
+                payment.confirmations = confirmations
+                self._emit(PAYMENT_CONFIRMATION, payment)
+                if confirmations >= self._target_for(payment.address):
+                    self._emit(PAYMENT_CONFIRMED, payment)
+                    finalized.append(key)
+        for key in finalized:
+            payment = self._tracked.pop(key)
+            keys = self._by_block.get(payment.block_hash)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._by_block[payment.block_hash]
+
+    # ==================== EVENTS ====================
+
+    def _emit(self, event: str, payment: WatchedPayment) -> None:
+        tags = frozenset(self._watched.get(payment.address, ()))
+        for listener in self._listeners:
+            try:
+                listener(event, payment, tags)
+            except Exception as e:
+                logger.error(
+                    f"Watch-list listener failed for {event}",
+                    extra={"error": str(e), "txid": payment.txid}
+                )
+
+        webhook_event = _WEBHOOK_EVENT_NAMES.get(event)
+        if webhook_event and self.webhook_manager is not None:
+            try:
+                self.webhook_manager.dispatch_event(webhook_event, payment.to_dict())
+            except Exception as e:
+                logger.error(
+                    "Watch-list webhook dispatch failed",
+                    extra={"error": str(e), "event": webhook_event, "txid": payment.txid}
+                )
+
+    def get_statistics(self) -> dict[str, Any]:
+        """Get watch-list statistics"""
+        with self._lock:
+            return {
+                "watched_addresses": len(self._watched),
+                "tracked_payments": len(self._tracked),
+                "confirming_blocks": len(self._by_block),
+                "processed_height": self._processed[-1][0] if self._processed else None,
+            }
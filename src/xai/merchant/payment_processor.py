@@ -15,13 +15,26 @@ import hashlib
 import hmac
 import json
 import logging
-import threading
 import time
 from dataclasses import asdict, dataclass, field
 from enum import Enum
 from typing import Any, Callable
 from urllib.parse import urlparse
 
+from xai.core.api.webhook_delivery import (
+    DeliveryJob,
+    DeliveryResult,
+    WebhookDeliveryEngine,
+    get_delivery_engine,
+)
+from xai.merchant.address_watcher import (
+    PAYMENT_CONFIRMATION,
+    PAYMENT_REORGED,
+    PAYMENT_SEEN,
+    AddressWatchList,
+    WatchedPayment,
+)
+
 logger = logging.getLogger(__name__)
 
 try:
@@ -48,6 +61,10 @@ class WebhookEvent(Enum):
     PAYMENT_CANCELLED = "payment.cancelled"
     PAYMENT_FAILED = "payment.failed"
 
+# Retry backoff after the Nth failed attempt is WEBHOOK_RETRY_DELAYS[N - 1]:
+# 5min, 15min, 1hour, then 6hours for every later retry
+WEBHOOK_RETRY_DELAYS = (300, 900, 3600, 21600)
+
 class WebhookDeliveryStatus(Enum):
     """Webhook delivery status"""
     PENDING = "pending"
@@ -137,9 +154,8 @@ class WebhookDelivery:
 
     def calculate_next_attempt(self) -> int:
         """Calculate next retry time with exponential backoff"""
-        # Exponential backoff: 1min, 5min, 15min, 1hour, 6hours
-        delays = [60, 300, 900, 3600, 21600]
-        delay = delays[min(self.attempts, len(delays) - 1)]
+        index = max(self.attempts, 1) - 1
+        delay = WEBHOOK_RETRY_DELAYS[min(index, len(WEBHOOK_RETRY_DELAYS) - 1)]
         return int(time.time()) + delay
 
 class MerchantPaymentProcessor:
@@ -158,7 +174,9 @@ class MerchantPaymentProcessor:
         merchant_id: str,
         webhook_secret: str | None = None,
         default_expiry_minutes: int = 60,
-        required_confirmations: int = 6
+        required_confirmations: int = 6,
+        webhook_manager: Any | None = None,
+        delivery_engine: WebhookDeliveryEngine | None = None
     ):
         """
         Initialize merchant payment processor.
@@ -168,6 +186,8 @@ class MerchantPaymentProcessor:
             webhook_secret: Secret key for webhook signature verification
             default_expiry_minutes: Default payment expiry time in minutes
             required_confirmations: Required confirmations for payment finality
+            webhook_manager: Optional node WebhookManager for watch-list events
+            delivery_engine: Webhook delivery engine (shared process engine by default)
         """
         self.merchant_id = merchant_id
         self.webhook_secret = webhook_secret
@@ -181,12 +201,18 @@ class MerchantPaymentProcessor:
         # Event handlers
         self._event_handlers: dict[str, list[Callable]] = {}
 
-        # Background webhook delivery
-        self._webhook_thread: threading.Thread | None = None
-        self._webhook_queue: list[WebhookDelivery] = []
-        self._webhook_lock = threading.Lock()
+        # Background webhook delivery via the shared engine
+        self._delivery_engine = delivery_engine
         self._running = False
 
+        # Push-based payment detection for request addresses; each request is
+        # tracked until its own required_confirmations
+        self.watch_list = AddressWatchList(
+            confirmation_target=required_confirmations,
+            webhook_manager=webhook_manager,
+        )
+        self.watch_list.add_listener(self._on_watched_payment)
+
     def create_payment_request(
         self,
         address: str,
@@ -251,8 +277,11 @@ class MerchantPaymentProcessor:
             required_confirmations=required_confirmations or self.required_confirmations
         )
 
-        # Store payment request
+        # Store payment request and start watching its address
         self._payment_requests[request_id] = payment_request
+        self.watch_list.watch(
+            address, request_id, confirmation_target=payment_request.required_confirmations
+        )
 
         # Trigger payment created event
         self._trigger_event(WebhookEvent.PAYMENT_CREATED, payment_request)
@@ -323,11 +352,13 @@ class MerchantPaymentProcessor:
             payment_request.paid_at = int(time.time())
             self._trigger_event(WebhookEvent.PAYMENT_PENDING, payment_request)
 
-        # Confirmation milestone reached
+        # Confirmation milestone reached, or lost again after a reorg
         if confirmations >= payment_request.required_confirmations:
             if payment_request.confirmed_at is None:
                 payment_request.confirmed_at = int(time.time())
                 self._trigger_event(WebhookEvent.PAYMENT_CONFIRMED, payment_request)
+        elif payment_request.confirmed_at is not None:
+            self._revoke_confirmation(payment_request, txid)
 
         logger.info(
             "Payment status updated",
@@ -360,6 +391,7 @@ class MerchantPaymentProcessor:
             return False
 
         payment_request.status = PaymentStatus.CANCELLED
+        self.watch_list.unwatch(payment_request.address, request_id)
         self._trigger_event(WebhookEvent.PAYMENT_CANCELLED, payment_request)
 
         logger.info(
@@ -451,6 +483,98 @@ class MerchantPaymentProcessor:
             "confirmed": payment_request.is_confirmed()
         }
 
+    def attach_to_blockchain(self, blockchain: Any) -> None:
+        """
+        Subscribe the watch list to mempool admissions and tip changes.
+
+        Args:
+            blockchain: Blockchain exposing ``add_chain_observer``
+        """
+        blockchain.add_chain_observer(self.watch_list)
+        self.watch_list.sync_to_chain(blockchain.chain)
+
+    def _on_watched_payment(self, event: str, payment: WatchedPayment, tags: frozenset):
+        """
+        Apply watch-list matches to the payment requests watching the address.
+
+        Args:
+            event: Watch-list event name
+            payment: Matched output
+            tags: Request IDs watching the address
+        """
+        for request_id in tags:
+            payment_request = self._payment_requests.get(request_id)
+            if not payment_request:
+                continue
+            if payment_request.paid_txid not in (None, payment.txid):
+                continue
+
+            if event == PAYMENT_REORGED:
+                self.handle_payment_reorg(request_id, payment.txid)
+                continue
+            if event not in (PAYMENT_SEEN, PAYMENT_CONFIRMATION):
+                continue
+
+            if payment.amount + 0.000001 < payment_request.amount:
+                logger.warning(
+                    "Underpayment to watched address ignored",
+                    extra={
+                        "event": "payment.underpaid",
+                        "request_id": request_id,
+                        "txid": payment.txid,
+                        "expected": payment_request.amount,
+                        "received": payment.amount
+                    }
+                )
+                continue
+            self.update_payment_status(request_id, payment.txid, payment.confirmations)
+
+    def handle_payment_reorg(self, request_id: str, txid: str) -> bool:
+        """
+        Roll back confirmations for a payment whose block was reorganized out.
+
+        The payment stays PAID (the transaction normally returns to the
+        mempool) but confirmation tracking restarts from zero. A request that
+        had reached its confirmation target is no longer confirmed.
+
+        Args:
+            request_id: Payment request ID
+            txid: Transaction ID that lost its block
+
+        Returns:
+            True if the request was updated
+        """
+        payment_request = self._payment_requests.get(request_id)
+        if not payment_request or payment_request.paid_txid != txid:
+            return False
+
+        payment_request.confirmations = 0
+        if payment_request.confirmed_at is not None:
+            self._revoke_confirmation(payment_request, txid)
+        logger.warning(
+            "Payment reorganized out of chain",
+            extra={
+                "event": "payment.reorged",
+                "request_id": request_id,
+                "txid": txid
+            }
+        )
+        return True
+
+    def _revoke_confirmation(self, payment_request: PaymentRequest, txid: str) -> None:
+        """Move a confirmed request back to unconfirmed (PAID) after a reorg."""
+        payment_request.confirmed_at = None
+        logger.warning(
+            "Payment confirmation revoked",
+            extra={
+                "event": "payment.unconfirmed",
+                "request_id": payment_request.request_id,
+                "txid": txid,
+                "confirmations": payment_request.confirmations,
+                "required_confirmations": payment_request.required_confirmations
+            }
+        )
+
     def check_expired_payments(self) -> list[str]:
         """
         Check for expired payment requests and update their status.
@@ -467,6 +591,7 @@ class MerchantPaymentProcessor:
                 current_time > payment_request.expires_at):
 
                 payment_request.status = PaymentStatus.EXPIRED
+                self.watch_list.unwatch(payment_request.address, request_id)
                 self._trigger_event(WebhookEvent.PAYMENT_EXPIRED, payment_request)
                 expired_requests.append(request_id)
 
@@ -540,15 +665,29 @@ class MerchantPaymentProcessor:
             payload=payload
         )
 
-        # Store and queue for delivery
         self._webhook_deliveries[delivery_id] = delivery
-        with self._webhook_lock:
-            self._webhook_queue.append(delivery)
 
-        # Start webhook delivery thread if not running
+        # Start webhook delivery if not running
         if not self._running:
             self.start_webhook_delivery()
 
+        self._delivery_engine.enqueue(
+            DeliveryJob(
+                url=delivery.url,
+                event_type=delivery.event,
+                payload=payload,
+                headers={
+                    "User-Agent": "XAI-MerchantProcessor/1.0",
+                    "X-XAI-Event": delivery.event,
+                    "X-XAI-Delivery-ID": delivery.delivery_id
+                },
+                job_id=delivery_id,
+                max_attempts=delivery.max_attempts,
+                retry_delays=WEBHOOK_RETRY_DELAYS
+            ),
+            self._on_delivery_result
+        )
+
     def _generate_webhook_signature(self, payload: dict[str, Any], secret: str) -> str:
         """
         Generate HMAC signature for webhook payload.
@@ -584,120 +723,82 @@ class MerchantPaymentProcessor:
         return hmac.compare_digest(signature, expected_signature)
 
     def start_webhook_delivery(self):
-        """Start background webhook delivery thread"""
+        """Attach to the shared webhook delivery engine"""
         if self._running:
             return
 
+        if self._delivery_engine is None:
+            self._delivery_engine = get_delivery_engine()
+        elif not self._delivery_engine.running:
+            self._delivery_engine.start()
         self._running = True
-        self._webhook_thread = threading.Thread(target=self._webhook_delivery_worker, daemon=True)
-        self._webhook_thread.start()
-        logger.info("Webhook delivery thread started")
+        logger.info("Webhook delivery started")
 
     def stop_webhook_delivery(self):
-        """Stop background webhook delivery thread"""
+        """Stop queueing new webhooks (the shared engine keeps running)"""
         self._running = False
-        if self._webhook_thread:
-            self._webhook_thread.join(timeout=5)
-        logger.info("Webhook delivery thread stopped")
-
-    def _webhook_delivery_worker(self):
-        """Background worker for webhook delivery"""
-        while self._running:
-            try:
-                # Get pending webhooks
-                with self._webhook_lock:
-                    pending = [d for d in self._webhook_queue if d.should_retry()]
-                    if pending:
-                        delivery = pending[0]
-                        self._webhook_queue.remove(delivery)
-                    else:
-                        delivery = None
-
-                if delivery:
-                    self._deliver_webhook(delivery)
-                else:
-                    time.sleep(1)  # Sleep if no pending webhooks
-
-            except Exception as e:
-                logger.error(f"Webhook delivery worker error: {e}")
-                time.sleep(5)
+        logger.info("Webhook delivery stopped")
 
-    def _deliver_webhook(self, delivery: WebhookDelivery):
+    def _on_delivery_result(self, result: DeliveryResult):
         """
-        Deliver webhook to endpoint.
+        Record the outcome of a delivery attempt made by the engine.
 
         Args:
-            delivery: WebhookDelivery object
+            result: DeliveryResult for one attempt
         """
-        if not REQUESTS_AVAILABLE:
+        delivery = self._webhook_deliveries.get(result.job.job_id)
+        if delivery is None:
             return
 
-        delivery.attempts += 1
+        delivery.attempts = result.job.attempt
         delivery.last_attempt_at = int(time.time())
-        delivery.status = WebhookDeliveryStatus.RETRYING if delivery.attempts > 1 else WebhookDeliveryStatus.PENDING
-
-        try:
-            # Send webhook
-            response = requests.post(
-                delivery.url,
-                json=delivery.payload,
-                headers={
-                    "Content-Type": "application/json",
-                    "User-Agent": "XAI-MerchantProcessor/1.0",
-                    "X-XAI-Event": delivery.event,
-                    "X-XAI-Delivery-ID": delivery.delivery_id
-                },
-                timeout=10
+        delivery.response_code = result.status_code
+        delivery.response_body = result.response_body
+
+        if result.success:
+            delivery.status = WebhookDeliveryStatus.DELIVERED
+            delivery.next_attempt_at = None
+            logger.info(
+                "Webhook delivered successfully",
+                extra={
+                    "delivery_id": delivery.delivery_id,
+                    "request_id": delivery.request_id,
+                    "event": delivery.event,
+                    "attempts": delivery.attempts,
+                    "latency_ms": round(result.latency * 1000, 2)
+                }
             )
+            return
 
-            delivery.response_code = response.status_code
-            delivery.response_body = response.text[:1000]  # Store first 1000 chars
-
-            # Check success
-            if 200 <= response.status_code < 300:
-                delivery.status = WebhookDeliveryStatus.DELIVERED
-                logger.info(
-                    "Webhook delivered successfully",
-                    extra={
-                        "delivery_id": delivery.delivery_id,
-                        "request_id": delivery.request_id,
-                        "event": delivery.event,
-                        "attempts": delivery.attempts
-                    }
-                )
+        delivery.error_message = result.error
+        if not result.final:
+            delivery.status = WebhookDeliveryStatus.RETRYING
+            if result.retry_delay is not None:
+                # Record the time the engine actually scheduled the retry for
+                delivery.next_attempt_at = delivery.last_attempt_at + int(result.retry_delay)
             else:
-                raise Exception(f"HTTP {response.status_code}: {response.text[:200]}")
-
-        except Exception as e:
-            delivery.error_message = str(e)
-
-            # Retry logic
-            if delivery.attempts < delivery.max_attempts:
                 delivery.next_attempt_at = delivery.calculate_next_attempt()
-                with self._webhook_lock:
-                    self._webhook_queue.append(delivery)  # Re-queue for retry
-
-                logger.warning(
-                    "Webhook delivery failed, will retry",
-                    extra={
-                        "delivery_id": delivery.delivery_id,
-                        "request_id": delivery.request_id,
-                        "attempts": delivery.attempts,
-                        "next_attempt": delivery.next_attempt_at,
-                        "error": str(e)
-                    }
-                )
-            else:
-                delivery.status = WebhookDeliveryStatus.ABANDONED
-                logger.error(
-                    "Webhook delivery abandoned after max attempts",
-                    extra={
-                        "delivery_id": delivery.delivery_id,
-                        "request_id": delivery.request_id,
-                        "attempts": delivery.attempts,
-                        "error": str(e)
-                    }
-                )
+            logger.warning(
+                "Webhook delivery failed, will retry",
+                extra={
+                    "delivery_id": delivery.delivery_id,
+                    "request_id": delivery.request_id,
+                    "attempts": delivery.attempts,
+                    "next_attempt": delivery.next_attempt_at,
+                    "error": result.error
+                }
+            )
+        else:
+            delivery.status = WebhookDeliveryStatus.ABANDONED
+            logger.error(
+                "Webhook delivery abandoned after max attempts",
+                extra={
+                    "delivery_id": delivery.delivery_id,
+                    "request_id": delivery.request_id,
+                    "attempts": delivery.attempts,
+                    "error": result.error
+                }
+            )
 
     def on_event(self, event: WebhookEvent, handler: Callable):
         """
@@ -757,7 +858,8 @@ class MerchantPaymentProcessor:
                 "total": total_webhooks,
                 "delivered": webhooks_delivered,
                 "failed": webhooks_failed,
-                "pending": len(self._webhook_queue)
+                "pending": sum(1 for w in self._webhook_deliveries.values()
+                               if w.status in (WebhookDeliveryStatus.PENDING, WebhookDeliveryStatus.RETRYING))
             },
             "webhook_delivery_running": self._running
         }
@@ -3,6 +3,10 @@ Mobile Sync Manager
 
 Provides mobile-optimized state synchronization with:
 - Priority-based chunk downloading
+- A bounded window of concurrent chunk fetches
+- Chunks verified and spilled to disk as they arrive, and the payload
+  reconstructed by streaming them back, so memory does not grow with
+  snapshot size
 - Bandwidth throttling
 - Background sync support
 - Pause/resume capability
@@ -13,14 +17,17 @@ Provides mobile-optimized state synchronization with:
 from __future__ import annotations
 
 import asyncio
+import gzip
 import os
 import shutil
 import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
 from threading import Lock
-from typing import Any, Callable
+from typing import Any, Callable, Iterator
 
 from xai.core.consensus.checkpoint_payload import CheckpointPayload
 from xai.core.p2p.chunked_sync import (
@@ -159,6 +166,7 @@ class MobileSyncManager:
 
     Provides:
     - Priority-based chunk downloading
+    - Concurrent, pipelined chunk fetches
     - Bandwidth throttling
     - Background sync support
     - Pause/resume capability
@@ -171,6 +179,7 @@ class MobileSyncManager:
         storage_dir: str,
         min_free_space_mb: int = 100,
         enable_background_sync: bool = True,
+        max_concurrent_downloads: int = 4,
     ):
         """
         Initialize mobile sync manager.
@@ -180,11 +189,13 @@ class MobileSyncManager:
             storage_dir: Directory for storing sync data
             min_free_space_mb: Minimum free space required (MB)
             enable_background_sync: Enable background sync
+            max_concurrent_downloads: Upper bound on chunk fetches in flight
         """
         self.chunked_service = chunked_service
         self.storage_dir = Path(storage_dir)
         self.min_free_space_mb = min_free_space_mb
         self.enable_background_sync = enable_background_sync
+        self.max_concurrent_downloads = max(1, max_concurrent_downloads)
         self.logger = get_structured_logger()
 
         # State tracking
@@ -203,8 +214,9 @@ class MobileSyncManager:
         # Progress callback
         self.progress_callback: Callable[[dict[str, Any]], None] | None = None
 
-        # Ensure storage directory exists
+        # Ensure storage directory exists; verified chunks are spilled here
         self.storage_dir.mkdir(parents=True, exist_ok=True)
+        self.chunk_spill_dir = self.storage_dir / "sync_chunks"
 
     def set_network_condition(self, condition: NetworkCondition) -> None:
         """
@@ -317,6 +329,10 @@ class MobileSyncManager:
         with self.state_lock:
             self.state = new_state
 
+        self._notify_progress()
+
+    def _notify_progress(self) -> None:
+        """Send current state and statistics to the progress callback."""
         if self.progress_callback:
             try:
                 self.progress_callback({
@@ -337,6 +353,24 @@ class MobileSyncManager:
                     error_type=type(e).__name__,
                 )
 
+    def get_download_window(self, chunk_size: int) -> int:
+        """
+        Number of chunk fetches to keep in flight.
+
+        The recommended chunk size for the current network is used as the
+        budget of bytes in flight, so fast unmetered links pipeline several
+        requests while slow links fetch one chunk at a time.
+
+        Args:
+            chunk_size: Snapshot chunk size in bytes
+
+        Returns:
+            Window size between 1 and max_concurrent_downloads
+        """
+        budget = self.network_condition.get_recommended_chunk_size()
+        window = budget // max(1, chunk_size)
+        return max(1, min(self.max_concurrent_downloads, window))
+
     def _update_statistics(
         self,
         progress: SyncProgress,
@@ -422,74 +456,77 @@ class MobileSyncManager:
             self.start_time = progress.started_at
             self.statistics = SyncStatistics()
 
+            # Verified chunks already on disk from an interrupted sync are kept
+            spill_dir = self.chunk_spill_dir / snapshot_id
+            spill_dir.mkdir(parents=True, exist_ok=True)
+            for chunk_index in range(metadata.total_chunks):
+                spilled = self._spilled_chunk_path(spill_dir, chunk_index)
+                if spilled is None:
+                    progress.downloaded_chunks.discard(chunk_index)
+                else:
+                    progress.mark_downloaded(chunk_index)
+                    self.statistics.bytes_downloaded += self._spilled_chunk_size(spilled)
+            self._update_statistics(progress, metadata)
+
             # Start downloading
             self._update_state(SyncState.DOWNLOADING)
 
             # Get priority-ordered chunks
             remaining = progress.remaining_chunks
-            ordered_chunks = self.get_priority_ordered_chunks(
+            pending = deque(self.get_priority_ordered_chunks(
                 remaining,
                 metadata.priority_map,
-            )
-
-            # Download chunks
-            chunks: list[SyncChunk] = []
-            for chunk_index in range(metadata.total_chunks):
-                # Check if paused
-                while self.is_paused():
-                    time.sleep(0.5)
-
-                # Skip already downloaded chunks
-                if chunk_index in progress.downloaded_chunks:
-                    chunk = self.chunked_service.get_chunk(snapshot_id, chunk_index)
-                    if chunk:
-                        chunks.append(chunk)
-                        self.statistics.bytes_downloaded += chunk.size_bytes
-                    continue
-
-                # Download chunk
-                chunk = self._download_chunk_with_throttle(
-                    snapshot_id,
-                    chunk_index,
-                    chunk_fetcher,
-                )
-
-                if not chunk:
-                    progress.mark_failed(chunk_index)
-                    self.statistics.chunks_failed += 1
-                    self.logger.error(
-                        "Failed to download chunk",
-                        snapshot_id=snapshot_id,
-                        chunk_index=chunk_index,
-                    )
-                    # Save progress and continue
-                    self.chunked_service.save_sync_progress(progress)
-                    continue
-
-                # Verify chunk checksum
-                if not chunk.verify_checksum():
-                    progress.mark_failed(chunk_index)
-                    self.statistics.chunks_failed += 1
-                    self.logger.error(
-                        "Chunk checksum verification failed",
-                        snapshot_id=snapshot_id,
-                        chunk_index=chunk_index,
-                    )
-                    self.chunked_service.save_sync_progress(progress)
-                    continue
-
-                # Mark as downloaded
-                progress.mark_downloaded(chunk_index)
-                chunks.append(chunk)
-                self.statistics.bytes_downloaded += chunk.size_bytes
-
-                # Update statistics and notify
-                self._update_statistics(progress, metadata)
-                self._update_state(SyncState.DOWNLOADING)
-
-                # Save progress periodically
-                if chunk_index % 10 == 0:
-                    self.chunked_service.save_sync_progress(progress)
+            ))
+            window = self.get_download_window(metadata.chunk_size)
+
+            # Download chunks, keeping up to `window` fetches in flight
+            in_flight: dict[Future, int] = {}
+            completed = 0
+            with ThreadPoolExecutor(max_workers=window, thread_name_prefix="mobile-sync") as executor:
+                while pending or in_flight:
+                    while pending and len(in_flight) < window and not self.is_paused():
+                        chunk_index = pending.popleft()
+                        future = executor.submit(
+                            self._fetch_and_spill_chunk,
+                            snapshot_id,
+                            chunk_index,
+                            chunk_fetcher,
+                            spill_dir,
+                        )
+                        in_flight[future] = chunk_index
+
+                    if not in_flight:
+                        # Paused with nothing outstanding
+                        time.sleep(0.5)
+                        continue
+
+                    done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        chunk_index = in_flight.pop(future)
+                        size = future.result()
+
+                        if size is None:
+                            progress.mark_failed(chunk_index)
+                            self.statistics.chunks_failed += 1
+                            # Save progress and continue
+                            self.chunked_service.save_sync_progress(progress)
+                            continue
+
+                        # Mark as downloaded
+                        progress.mark_downloaded(chunk_index)
+                        self.statistics.bytes_downloaded += size
+                        completed += 1
+
+                        # Update statistics and notify
+                        self._update_statistics(progress, metadata)
+                        self._notify_progress()
+
+                        # Save progress periodically
+                        if completed % 10 == 0:
+                            self.chunked_service.save_sync_progress(progress)
+
+            # Save progress so an incomplete sync resumes where it stopped
+            self.chunked_service.save_sync_progress(progress)
 
             # Check if all chunks downloaded
             if len(progress.downloaded_chunks) != metadata.total_chunks:
@@ -502,14 +539,12 @@ class MobileSyncManager:
                 self._update_state(SyncState.FAILED)
                 return None
 
-            # Save final progress
-            self.chunked_service.save_sync_progress(progress)
-
-            # Verify and apply chunks
+            # Verify and apply chunks, streamed back from disk in order
             self._update_state(SyncState.VERIFYING)
-            success, payload = self.chunked_service.verify_and_apply_chunks(
-                chunks,
+            success, payload = self.chunked_service.apply_chunk_stream(
+                self._iter_spilled_chunks(spill_dir, metadata.total_chunks),
                 metadata.state_hash,
+                snapshot_id,
             )
 
             if not success or not payload:
@@ -520,8 +555,9 @@ class MobileSyncManager:
                 self._update_state(SyncState.FAILED)
                 return None
 
-            # Cleanup progress file
+            # Cleanup progress file and spilled chunks
             self.chunked_service.delete_progress(snapshot_id)
+            shutil.rmtree(spill_dir, ignore_errors=True)
 
             self.logger.info(
                 "Snapshot sync completed",
@@ -581,6 +617,95 @@ class MobileSyncManager:
             )
             return None
 
+    def _fetch_and_spill_chunk(
+        self,
+        snapshot_id: str,
+        chunk_index: int,
+        chunk_fetcher: Callable[[str, int], SyncChunk | None],
+        spill_dir: Path,
+    ) -> int | None:
+        """
+        Download a chunk, verify its checksum and write it to the spill directory.
+
+        Runs on a download worker; the chunk data is released once written.
+
+        Args:
+            snapshot_id: ID of snapshot
+            chunk_index: Index of chunk to download
+            chunk_fetcher: Function to fetch chunk
+            spill_dir: Directory holding this snapshot's verified chunks
+
+        Returns:
+            Downloaded size in bytes, or None if the chunk failed
+        """
+        chunk = self._download_chunk_with_throttle(snapshot_id, chunk_index, chunk_fetcher)
+        if not chunk:
+            self.logger.error(
+                "Failed to download chunk",
+                snapshot_id=snapshot_id,
+                chunk_index=chunk_index,
+            )
+            return None
+
+        if not chunk.verify_checksum():
+            self.logger.error(
+                "Chunk checksum verification failed",
+                snapshot_id=snapshot_id,
+                chunk_index=chunk_index,
+            )
+            return None
+
+        suffix = ".gz" if chunk.compressed else ".bin"
+        chunk_path = spill_dir / f"chunk_{chunk_index:06d}{suffix}"
+        temp_path = chunk_path.with_suffix(suffix + ".tmp")
+        try:
+            with open(temp_path, "wb") as f:
+                f.write(chunk.data)
+            os.replace(temp_path, chunk_path)
+        except (OSError, IOError) as e:
+            self.logger.error(
+                "Failed to write chunk",
+                snapshot_id=snapshot_id,
+                chunk_index=chunk_index,
+                error=str(e),
+                error_type=type(e).__name__,
+            )
+            return None
+
+        return chunk.size_bytes
+
+    @staticmethod
+    def _spilled_chunk_path(spill_dir: Path, chunk_index: int) -> Path | None:
+        """Path of a verified chunk on disk, if it has been downloaded."""
+        for suffix in (".bin", ".gz"):
+            path = spill_dir / f"chunk_{chunk_index:06d}{suffix}"
+            if path.exists():
+                return path
+        return None
+
+    @staticmethod
+    def _spilled_chunk_size(path: Path) -> int:
+        """Uncompressed size of a spilled chunk, as counted when it was downloaded."""
+        if path.suffix != ".gz":
+            return path.stat().st_size
+        with open(path, "rb") as f:
+            return len(gzip.decompress(f.read()))
+
+    def _iter_spilled_chunks(self, spill_dir: Path, total_chunks: int) -> Iterator[bytes]:
+        """
+        Read spilled chunks back in index order, one at a time.
+
+        Raises:
+            OSError: If a chunk is missing from the spill directory
+        """
+        for chunk_index in range(total_chunks):
+            path = self._spilled_chunk_path(spill_dir, chunk_index)
+            if path is None:
+                raise FileNotFoundError(f"Spilled chunk {chunk_index} missing from {spill_dir}")
+            with open(path, "rb") as f:
+                data = f.read()
+            yield gzip.decompress(data) if path.suffix == ".gz" else data
+
     def get_sync_state(self) -> dict[str, Any]:
         """
         Get current sync state and statistics.
@@ -2,7 +2,9 @@ from __future__ import annotations
 
 import logging
 import time
-from collections import defaultdict, deque
+from collections import defaultdict
+
+from xai.network.gcra_limiter import GCRALimiter
 
 logger = logging.getLogger(__name__)
 
@@ -36,15 +38,17 @@ class DDoSProtector:
         self.max_global_connections = max_global_connections
         self.adaptive_rate_limiting = adaptive_rate_limiting
 
-        # Stores requests: {ip_address: deque of timestamps}
-        self.request_timestamps: dict[str, deque[int]] = defaultdict(deque)
+        # Per-IP request limiting: one GCRA timestamp per IP in a bounded LRU table,
+        # allowing rate_limit_per_second requests per time_window_seconds
+        self.limiter = GCRALimiter(
+            rate=rate_limit_per_second,
+            period=time_window_seconds,
+            max_keys=max_tracked_ips,
+        )
 
         # Track active connections per IP
         self.active_connections: dict[str, int] = defaultdict(int)
 
-        # Track last activity time for each IP (for cleanup)
-        self.last_activity: dict[str, int] = {}
-
         # Adaptive rate limiting state
         self.total_requests_in_window = 0
         self.last_adjustment_time = int(time.time())
@@ -61,90 +65,12 @@ class DDoSProtector:
             }
         )
 
-    def _clean_old_requests(self, ip_address: str, current_time: int):
-        """Removes timestamps outside the current time window for a given IP."""
-        while self.request_timestamps[ip_address] and self.request_timestamps[ip_address][0] <= (
-            current_time - self.time_window_seconds
-        ):
-            self.request_timestamps[ip_address].popleft()
-
-    def _clean_old_ips(self, current_time: int):
-        """
-        Clean up inactive IPs to prevent unbounded memory growth.
-
-        This method is called when the number of tracked IPs exceeds the maximum.
-        It removes the oldest 10% of inactive IPs (IPs with no recent requests).
-
-        Security rationale:
-        - Prevents memory exhaustion attacks where attacker connects from many IPs
-        - Keeps memory usage bounded while still tracking legitimate active users
-        - Removes oldest inactive IPs first (least likely to reconnect soon)
-
-        Args:
-            current_time: Current timestamp for determining inactivity
-        """
-        num_tracked = len(self.request_timestamps)
-
-        if num_tracked <= self.max_tracked_ips:
-            return  # No cleanup needed
-
-        # Calculate how many IPs to remove (10% of tracked IPs)
-        num_to_remove = max(1, num_tracked // 10)
-
-        # Find inactive IPs (no requests in current time window)
-        inactive_ips = []
-        for ip_address in list(self.request_timestamps.keys()):
-            # IP is inactive if it has no recent requests
-            if not self.request_timestamps[ip_address]:
-                inactive_ips.append((ip_address, 0))
-            else:
-                # Get last activity time for this IP
-                last_request_time = self.request_timestamps[ip_address][-1]
-                if last_request_time <= (current_time - self.time_window_seconds):
-                    inactive_ips.append((ip_address, last_request_time))
-
-        # If we don't have enough inactive IPs, also consider least recently used
-        if len(inactive_ips) < num_to_remove:
-            # Get all IPs sorted by last activity (oldest first)
-            all_ips_with_time = []
-            for ip_address in self.request_timestamps.keys():
-                if self.request_timestamps[ip_address]:
-                    last_time = self.request_timestamps[ip_address][-1]
-                    all_ips_with_time.append((ip_address, last_time))
-
-            # Sort by last activity time (oldest first)
-            all_ips_with_time.sort(key=lambda x: x[1])
-            inactive_ips = all_ips_with_time[:num_to_remove]
-        else:
-            # Sort inactive IPs by last activity (oldest first)
-            inactive_ips.sort(key=lambda x: x[1])
-            inactive_ips = inactive_ips[:num_to_remove]
-
-        # Remove the selected IPs
-        removed_count = 0
-        for ip_address, _ in inactive_ips:
-            if ip_address in self.request_timestamps:
-                del self.request_timestamps[ip_address]
-                removed_count += 1
-
-            # Also clean up from other tracking dictionaries
-            if ip_address in self.active_connections:
-                del self.active_connections[ip_address]
-            if ip_address in self.last_activity:
-                del self.last_activity[ip_address]
-
-        if removed_count > 0:
-            logger.debug(
-                "Cleaned up inactive IPs",
-                extra={
-                    "event": "ddos_protector.cleanup",
-                    "removed_count": removed_count,
-                    "tracked_ips": len(self.request_timestamps),
-                    "max_tracked_ips": self.max_tracked_ips,
-                }
-            )
+    @property
+    def request_timestamps(self) -> GCRALimiter:
+        """Per-IP request state; supports len() and membership tests."""
+        return self.limiter
 
-    def _adjust_rate_limit(self, current_time: int):
+    def _adjust_rate_limit(self, current_time: float):
         """
         Adaptive rate limiting: Adjust rate limits based on network load.
 
@@ -178,7 +104,7 @@ class DDoSProtector:
                         "new_rate_limit": new_rate_limit,
                     }
                 )
-                self.rate_limit_per_second = new_rate_limit
+                self._set_rate_limit(new_rate_limit)
         elif connection_load < 0.5:  # Low load (<50%)
             # Restore normal rate limit during low load
             if self.rate_limit_per_second != self.base_rate_limit:
@@ -190,38 +116,36 @@ class DDoSProtector:
                         "rate_limit": self.base_rate_limit,
                     }
                 )
-                self.rate_limit_per_second = self.base_rate_limit
+                self._set_rate_limit(self.base_rate_limit)
 
         self.last_adjustment_time = current_time
 
-    def check_request(self, ip_address: str) -> bool:
+    def _set_rate_limit(self, rate_limit: int):
+        self.rate_limit_per_second = rate_limit
+        self.limiter.set_rate(rate_limit, self.time_window_seconds)
+
+    def check_request(self, ip_address: str, cost: int = 1) -> bool:
         """
         Checks if an incoming request from an IP address exceeds the rate limit.
 
         This method implements multiple layers of DoS protection:
-        1. Rate limiting per IP address
-        2. Memory cleanup when tracking too many IPs
-        3. Per-IP connection limits
-        4. Adaptive rate limiting based on network load
+        1. Rate limiting per IP address (GCRA, constant memory per IP)
+        2. Bounded IP tracking (least recently seen IPs are evicted)
+        3. Adaptive rate limiting based on network load
+
+        Args:
+            ip_address: IP address making the request
+            cost: Request weight; expensive requests may count as several
 
         Returns True if allowed, False if blocked.
         """
-        current_time = int(time.time())
+        current_time = time.time()
 
         # Adjust rate limits based on network load (adaptive)
         self._adjust_rate_limit(current_time)
 
-        # First, check if we need to clean up old IPs (prevent memory exhaustion)
-        self._clean_old_ips(current_time)
-
-        # Clean old requests for this specific IP
-        self._clean_old_requests(ip_address, current_time)
-
-        # Update last activity time
-        self.last_activity[ip_address] = current_time
-
-        # Check rate limit
-        if len(self.request_timestamps[ip_address]) >= self.rate_limit_per_second:
+        allowed, retry_after = self.limiter.check(ip_address, cost, now=current_time)
+        if not allowed:
             logger.warning(
                 "IP blocked due to rate limit exceeded",
                 extra={
@@ -229,21 +153,15 @@ class DDoSProtector:
                     "ip_address": ip_address,
                     "rate_limit": self.rate_limit_per_second,
                     "time_window": self.time_window_seconds,
-                    "requests_in_window": len(self.request_timestamps[ip_address]),
+                    "retry_after": round(retry_after, 3),
                 }
             )
             return False
-
-        # Add request timestamp
-        self.request_timestamps[ip_address].append(current_time)
-        # Enforce memory limit after adding a new IP
-        if len(self.request_timestamps) > self.max_tracked_ips:
-            self._clean_old_ips(current_time)
         return True
 
-    def check_rate_limit(self, ip_address: str) -> bool:
+    def check_rate_limit(self, ip_address: str, cost: int = 1) -> bool:
         """Backward-compatible alias for check_request."""
-        return self.check_request(ip_address)
+        return self.check_request(ip_address, cost)
 
     def register_connection(self, ip_address: str) -> bool:
         """
@@ -258,11 +176,6 @@ class DDoSProtector:
         Returns:
             True if connection allowed, False if blocked
         """
-        current_time = int(time.time())
-
-        # Clean up old IPs if needed
-        self._clean_old_ips(current_time)
-
         # Check global connection limit first
         total_connections = sum(self.active_connections.values())
         if total_connections >= self.max_global_connections:
@@ -292,7 +205,6 @@ class DDoSProtector:
 
         # Register the connection
         self.active_connections[ip_address] += 1
-        self.last_activity[ip_address] = current_time
         return True
 
     def add_connection(self, ip_address: str) -> bool:
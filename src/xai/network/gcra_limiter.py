@@ -0,0 +1,171 @@
+"""
+Generic cell rate algorithm (GCRA) limiter.
+
+Keeps one number per key, the theoretical arrival time (TAT) of the next
+request, instead of a log of request timestamps. A request costing ``cost``
+units is admitted while::
+
+    max(TAT, now) + cost * emission_interval - now <= burst * emission_interval
+
+so ``rate`` units per ``period`` are sustained and up to ``burst`` units can
+arrive at once. Memory and work per decision are constant regardless of
+request rate.
+
+Keys live in a bounded LRU table. A key whose TAT is in the past is in the
+same state as a key never seen, so evicting idle keys loses nothing; under a
+flood wider than the table only the least recently admitted keys are reset.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable
+
+# Slack for float rounding when a request lands exactly on the limit
+_EPSILON = 1e-9
+
+
+class GCRALimiter:
+    """
+    Weighted per-key rate limiter with constant memory per key.
+
+    Thread-safe. ``now`` may be passed explicitly so callers can share their
+    own clock; otherwise ``clock`` (time.monotonic by default) is used.
+
+    Example:
+        limiter = GCRALimiter(rate=10, period=1.0, max_keys=100_000)
+        if not limiter.allow(ip_address):
+            reject()
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        period: float = 1.0,
+        burst: float | None = None,
+        max_keys: int = 100_000,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize limiter.
+
+        Args:
+            rate: Units admitted per period
+            period: Period length in seconds
+            burst: Units that may arrive at once (default: rate)
+            max_keys: Maximum keys tracked before the least recently used are evicted
+            clock: Time source used when ``now`` is not given
+        """
+        if not isinstance(max_keys, int) or max_keys <= 0:
+            raise ValueError("max_keys must be a positive integer.")
+
+        self.max_keys = max_keys
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._tat: OrderedDict[Hashable, float] = OrderedDict()
+        # TATs are stored relative to the first time seen, keeping them small
+        # enough that adding emission intervals does not lose precision
+        self._epoch: float | None = None
+        self.evicted_keys = 0
+        self.evicted_active_keys = 0
+        self.period = period
+        self.set_rate(rate, period, burst)
+
+    def set_rate(self, rate: float, period: float | None = None, burst: float | None = None) -> None:
+        """
+        Change the limit; existing keys keep their state.
+
+        Args:
+            rate: Units admitted per period
+            period: Period length in seconds (default: unchanged)
+            burst: Units that may arrive at once (default: rate)
+        """
+        period = self.period if period is None else period
+        burst = rate if burst is None else burst
+        if rate <= 0:
+            raise ValueError("rate must be positive.")
+        if period <= 0:
+            raise ValueError("period must be positive.")
+        if burst <= 0:
+            raise ValueError("burst must be positive.")
+
+        with self._lock:
+            self.rate = rate
+            self.period = period
+            self.burst = burst
+            self.emission_interval = period / rate
+            self.tolerance = self.emission_interval * burst
+
+    def check(self, key: Hashable, cost: float = 1, now: float | None = None) -> tuple[bool, float]:
+        """
+        Admit or reject a request.
+
+        Args:
+            key: Client identity (IP address, client ID, ...)
+            cost: Units this request consumes
+            now: Current time (default: the limiter's clock)
+
+        Returns:
+            Tuple of (allowed, seconds until the request would be allowed)
+        """
+        if now is None:
+            now = self._clock()
+
+        with self._lock:
+            if self._epoch is None:
+                self._epoch = now
+            now -= self._epoch
+            tats = self._tat
+            tat = tats.get(key)
+            new_tat = (now if tat is None or tat < now else tat) + cost * self.emission_interval
+            excess = new_tat - now - self.tolerance
+            if excess > _EPSILON:
+                return False, excess
+
+            if tat is None:
+                if len(tats) >= self.max_keys:
+                    self._evict(now)
+            else:
+                tats.move_to_end(key)
+            tats[key] = new_tat
+            return True, 0.0
+
+    def allow(self, key: Hashable, cost: float = 1, now: float | None = None) -> bool:
+        """Admit or reject a request; see check()."""
+        return self.check(key, cost, now)[0]
+
+    def _evict(self, now: float) -> None:
+        """Drop the least recently admitted key (lock held)."""
+        _, tat = self._tat.popitem(last=False)  # Relative to the epoch, like now
+        self.evicted_keys += 1
+        if tat > now:
+            self.evicted_active_keys += 1
+
+    def forget(self, key: Hashable) -> None:
+        """Stop tracking a key (e.g. when its connection closes)."""
+        with self._lock:
+            self._tat.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._tat.clear()
+
+    def __len__(self) -> int:
+        return len(self._tat)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._tat
+
+    def stats(self) -> dict[str, Any]:
+        """Limiter statistics"""
+        return {
+            "rate": self.rate,
+            "period": self.period,
+            "burst": self.burst,
+            "tracked_keys": len(self._tat),
+            "max_keys": self.max_keys,
+            "evicted_keys": self.evicted_keys,
+            "evicted_active_keys": self.evicted_active_keys,
+        }
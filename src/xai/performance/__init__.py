@@ -9,6 +9,7 @@ Includes:
 - Stress testing framework (Task 267)
 - Performance benchmarking (Task 268)
 - Memory and CPU profiling (Tasks 269-270)
+- Node scenario benchmarks with baseline regression checks
 """
 
 from xai.performance.benchmarking import (
@@ -23,6 +24,7 @@ from xai.performance.fee_market_sim import (
     DynamicFeeEstimator,
     FeeMarketSimulator,
 )
+from xai.performance.node_benchmarks import FixtureConfig, NodeBenchmarks, SyntheticChain
 from xai.performance.node_modes import (
     ArchivalNode,
     FastSyncManager,
@@ -82,6 +84,9 @@ __all__ = [
     "BenchmarkSuite",
     "BenchmarkResult",
     "BlockchainBenchmarks",
+    "NodeBenchmarks",
+    "SyntheticChain",
+    "FixtureConfig",
     # Profiling
     "MemoryProfiler",
     "CPUProfiler",
@@ -44,7 +44,13 @@ class BenchmarkResult:
 class Benchmark:
     """Single benchmark"""
 
-    def __init__(self, name: str, func: Callable, iterations: int = 100):
+    def __init__(
+        self,
+        name: str,
+        func: Callable,
+        iterations: int = 100,
+        setup: Callable[[], Any] | None = None,
+    ):
         """
         Initialize benchmark
 
@@ -52,26 +58,38 @@ class Benchmark:
             name: Benchmark name
             func: Function to benchmark
             iterations: Number of iterations to run
+            setup: Optional untimed callable run before every iteration;
+                its return value is passed to ``func``
         """
         self.name = name
         self.func = func
         self.iterations = iterations
+        self.setup = setup
         self.measurements: list[float] = []
 
+    def _run_once(self) -> float:
+        """Run one iteration, returning its duration (setup excluded)"""
+        if self.setup is None:
+            start = time.perf_counter()
+            self.func()
+            return time.perf_counter() - start
+
+        state = self.setup()
+        start = time.perf_counter()
+        self.func(state)
+        return time.perf_counter() - start
+
     def run(self) -> BenchmarkResult:
         """Run benchmark and collect results"""
         self.measurements.clear()
 
         # Warmup
         for _ in range(min(10, self.iterations // 10)):
-            self.func()
+            self._run_once()
 
         # Actual measurements
         for _ in range(self.iterations):
-            start = time.perf_counter()
-            self.func()
-            elapsed = time.perf_counter() - start
-            self.measurements.append(elapsed)
+            self.measurements.append(self._run_once())
 
         return self._calculate_results()
 
@@ -106,9 +124,15 @@ class BenchmarkSuite:
         self.benchmarks: list[Benchmark] = []
         self.results: list[BenchmarkResult] = []
 
-    def add_benchmark(self, name: str, func: Callable, iterations: int = 100) -> None:
+    def add_benchmark(
+        self,
+        name: str,
+        func: Callable,
+        iterations: int = 100,
+        setup: Callable[[], Any] | None = None,
+    ) -> None:
         """Add benchmark to suite"""
-        self.benchmarks.append(Benchmark(name, func, iterations))
+        self.benchmarks.append(Benchmark(name, func, iterations, setup))
 
     def run_all(self) -> list[BenchmarkResult]:
         """Run all benchmarks"""
@@ -127,49 +151,84 @@ class BenchmarkSuite:
 
         return self.results
 
-    def export_results(self, filename: str) -> None:
-        """Export results to JSON"""
+    def export_results(self, filename: str, metadata: dict[str, Any] | None = None) -> None:
+        """
+        Export results to JSON
+
+        The exported file can be used as a baseline for compare_with_baseline().
+
+        Args:
+            filename: Output path
+            metadata: Optional context recorded with the results (fixture sizes, versions)
+        """
         data = {
             "suite_name": self.name,
             "benchmarks": [r.to_dict() for r in self.results]
         }
+        if metadata:
+            data["metadata"] = metadata
 
         with open(filename, 'w') as f:
             json.dump(data, f, indent=2)
 
-    def compare_with_baseline(self, baseline_file: str) -> dict[str, Any]:
-        """Compare current results with baseline"""
-        try:
-            with open(baseline_file, 'r') as f:
-                baseline = json.load(f)
-
-            comparisons = []
-
-            for current in self.results:
-                # Find matching baseline
-                baseline_result = None
-                for b in baseline.get('benchmarks', []):
-                    if b['name'] == current.name:
-                        baseline_result = b
-                        break
-
-                if baseline_result:
-                    current_ops = current.operations_per_second
-                    baseline_ops = baseline_result['ops_per_second']
-                    diff_percent = ((current_ops - baseline_ops) / baseline_ops) * 100
+    def compare_with_baseline(self, baseline_file: str, threshold_percent: float = 0.0) -> dict[str, Any]:
+        """
+        Compare current results with baseline
 
-                    comparisons.append({
-                        "name": current.name,
-                        "current_ops": current_ops,
-                        "baseline_ops": baseline_ops,
-                        "difference_percent": diff_percent,
-                        "status": "improved" if diff_percent > 0 else "regressed"
-                    })
+        Throughput is derived from the median iteration time when both sides
+        record it, so a single slow outlier does not fail a run.
 
-            return {"comparisons": comparisons}
+        Args:
+            baseline_file: JSON file written by export_results()
+            threshold_percent: Throughput change tolerated before a benchmark
+                counts as regressed (or improved)
 
+        Returns:
+            Dictionary with per-benchmark comparisons and the names of
+            regressed benchmarks
+        """
+        try:
+            with open(baseline_file, 'r') as f:
+                baseline = json.load(f)
         except FileNotFoundError:
             return {"error": "Baseline file not found"}
+        except json.JSONDecodeError as e:
+            return {"error": f"Baseline file is not valid JSON: {e}"}
+
+        baseline_by_name = {b['name']: b for b in baseline.get('benchmarks', [])}
+        comparisons = []
+        regressions = []
+
+        for current in self.results:
+            baseline_result = baseline_by_name.get(current.name)
+            if not baseline_result:
+                continue
+
+            if current.median_time > 0 and baseline_result.get('median_time_ms'):
+                current_ops = 1.0 / current.median_time
+                baseline_ops = 1000.0 / baseline_result['median_time_ms']
+            else:
+                current_ops = current.operations_per_second
+                baseline_ops = baseline_result['ops_per_second']
+            diff_percent = ((current_ops - baseline_ops) / baseline_ops) * 100
+
+            if diff_percent < -threshold_percent:
+                status = "regressed"
+                regressions.append(current.name)
+            elif diff_percent > threshold_percent:
+                status = "improved"
+            else:
+                status = "unchanged"
+
+            comparisons.append({
+                "name": current.name,
+                "current_ops": current_ops,
+                "baseline_ops": baseline_ops,
+                "difference_percent": diff_percent,
+                "status": status
+            })
+
+        return {"comparisons": comparisons, "regressions": regressions}
 
 class BlockchainBenchmarks:
     """Predefined blockchain benchmarks"""
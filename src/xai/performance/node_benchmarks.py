@@ -0,0 +1,367 @@
+"""
+Node Benchmark Harness
+
+Scenario benchmarks for the operations that bound node throughput, run
+against a deterministic synthetic chain, with JSON baselines and a
+regression gate.
+
+Scenarios:
+- Block connect: Blockchain.add_block() for a block of signed transfers
+- Mempool admission: Blockchain.add_transaction() for the same transfers
+- Block template build: fee-ordered selection of one block from a full mempool
+- Chain load: Blockchain construction from a data directory on disk
+- UTXO snapshot: UTXOManager.snapshot() of the fixture UTXO set
+- History query: the paginated address history behind the wallet API
+
+Usage:
+    python -m xai.performance.node_benchmarks --output baseline.json
+    python -m xai.performance.node_benchmarks --baseline baseline.json --threshold 15
+
+The second form exits with status 1 when any scenario's throughput drops
+by more than the threshold.
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import itertools
+import logging
+import os
+import platform
+import shutil
+import sys
+import tempfile
+from contextlib import closing
+from dataclasses import asdict, dataclass
+from typing import Any
+
+from xai.performance.benchmarking import BenchmarkSuite
+
+# Transfer amounts are exact binary fractions so change outputs and fees add
+# up without float rounding rejecting fixture transactions
+TRANSFER_AMOUNT = 0.5
+TRANSFER_FEE = 0.25
+
+
+@dataclass
+class FixtureConfig:
+    """Shape of the synthetic chain"""
+    accounts: int = 64
+    history_rounds: int = 8
+    seed: str = "xai-node-benchmarks"
+
+
+@dataclass(frozen=True)
+class BenchmarkAccount:
+    """Deterministic key pair and the address transactions are verified against"""
+    private_key: str
+    public_key: str
+    address: str
+
+
+def derive_accounts(count: int, seed: str) -> list[BenchmarkAccount]:
+    """
+    Derive ``count`` accounts from ``seed``
+
+    Args:
+        count: Number of accounts
+        seed: Seed string; the same seed always yields the same accounts
+
+    Returns:
+        List of accounts
+    """
+    from xai.core.config import NETWORK
+    from xai.core.security.crypto_utils import deterministic_keypair_from_seed
+    from xai.core.transaction import _derive_sender_address
+
+    # Same derivation Transaction.verify_signature() checks the sender against
+    prefix = "XAI" if NETWORK.lower() == "mainnet" else "TXAI"
+    accounts = []
+    for i in range(count):
+        private_key, public_key = deterministic_keypair_from_seed(
+            hashlib.sha256(f"{seed}:{i}".encode()).digest()
+        )
+        accounts.append(BenchmarkAccount(private_key, public_key, _derive_sender_address(public_key, prefix)))
+    return accounts
+
+
+class SyntheticChain:
+    """
+    Deterministic chain and mempool fixtures
+
+    Builds, once, a chain where every account mined one block and then
+    took part in ``history_rounds`` rounds of transfers (each account pays
+    the next one per round). The resulting data directory is the base
+    state; scenarios work on copies of it so every iteration starts from
+    the same chain.
+
+    The workload is one more round of transfers, signed against the base
+    state, kept as serialized transactions plus the block that mines them.
+    Keys, amounts and block contents are the same on every build; hashes
+    differ between builds only through timestamps.
+    """
+
+    def __init__(self, work_dir: str, config: FixtureConfig | None = None):
+        """
+        Initialize fixtures
+
+        Args:
+            work_dir: Directory for the base chain and per-iteration copies
+            config: Fixture shape (default: FixtureConfig())
+        """
+        self.work_dir = work_dir
+        self.config = config or FixtureConfig()
+        self.accounts = derive_accounts(self.config.accounts, self.config.seed)
+        self.base_dir = os.path.join(work_dir, "base")
+        self.workload_transactions: list[dict[str, Any]] = []
+        self.workload_block: dict[str, Any] | None = None
+        self._copies = 0
+
+    def build(self) -> None:
+        """Build the base chain and the workload"""
+        from xai.core.blockchain import Blockchain
+
+        chain = Blockchain(data_dir=self.base_dir)
+        for account in self.accounts:
+            chain.mine_pending_transactions(account.address)
+        for round_index in range(self.config.history_rounds):
+            self._queue_transfers(chain)
+            chain.mine_pending_transactions(self.accounts[round_index % len(self.accounts)].address)
+
+        # Workload is signed on a scratch copy so the base keeps an empty mempool
+        scratch = self.load()
+        self.workload_transactions = [tx.to_dict() for tx in self._queue_transfers(scratch)]
+        block = scratch.mine_pending_transactions(self.accounts[0].address)
+        if block is None or len(block.transactions) != len(self.workload_transactions) + 1:
+            raise RuntimeError("Synthetic workload block did not include every workload transaction")
+        self.workload_block = block.to_dict()
+
+    def _queue_transfers(self, chain) -> list:
+        """Add one transfer per account (to the next account) to the mempool"""
+        transactions = []
+        for i, sender in enumerate(self.accounts):
+            recipient = self.accounts[(i + 1) % len(self.accounts)]
+            tx = chain.create_transaction(
+                sender.address,
+                recipient.address,
+                TRANSFER_AMOUNT,
+                TRANSFER_FEE,
+                sender.private_key,
+                sender.public_key,
+            )
+            if tx is None or not chain.add_transaction(tx):
+                raise RuntimeError(f"Synthetic transfer from account {i} was rejected")
+            transactions.append(tx)
+        return transactions
+
+    def copy_data_dir(self) -> str:
+        """Copy the base data directory, returning the copy's path"""
+        self._copies += 1
+        path = os.path.join(self.work_dir, f"copy-{self._copies}")
+        shutil.copytree(self.base_dir, path)
+        return path
+
+    def load(self):
+        """Load a fresh Blockchain from a copy of the base state"""
+        from xai.core.blockchain import Blockchain
+
+        return Blockchain(data_dir=self.copy_data_dir())
+
+    def workload(self) -> list:
+        """Fresh Transaction objects for the workload"""
+        from xai.core.blockchain import Blockchain
+
+        return [Blockchain._transaction_from_dict(tx) for tx in self.workload_transactions]
+
+    def next_block(self):
+        """Fresh Block object mining the workload on top of the base state"""
+        from xai.core.blockchain import Blockchain
+
+        return Blockchain.deserialize_block(self.workload_block)
+
+
+class NodeBenchmarks:
+    """Scenario benchmarks for node operations"""
+
+    SCENARIOS = (
+        "block_connect",
+        "mempool_admission",
+        "block_template",
+        "chain_load",
+        "utxo_snapshot",
+        "history_query",
+    )
+
+    def __init__(self, fixture: SyntheticChain, iterations: int = 5):
+        """
+        Initialize node benchmarks
+
+        Args:
+            fixture: Built SyntheticChain
+            iterations: Iterations for scenarios that need a fresh chain per
+                iteration; cheap read-only scenarios run 20x as many
+        """
+        self.fixture = fixture
+        self.iterations = iterations
+        self.suite = BenchmarkSuite("Node Scenario Benchmarks")
+        self._loaded = None
+        self._history_cursor = 0
+
+    def setup_benchmarks(self, scenarios: list[str] | None = None) -> BenchmarkSuite:
+        """
+        Setup scenario benchmarks
+
+        Args:
+            scenarios: Scenario keys to include (default: all)
+
+        Returns:
+            The configured suite
+        """
+        selected = list(scenarios or self.SCENARIOS)
+        unknown = set(selected) - set(self.SCENARIOS)
+        if unknown:
+            raise ValueError(f"Unknown scenarios: {', '.join(sorted(unknown))}")
+
+        txs = len(self.fixture.workload_transactions)
+        scenario_args = {
+            "block_connect": (f"Block Connect ({txs} txs)", self._bench_block_connect,
+                              self.iterations, self._fresh_chain_with_block),
+            "mempool_admission": (f"Mempool Admission ({txs} txs)", self._bench_mempool_admission,
+                                  self.iterations, self._fresh_chain_with_workload),
+            "block_template": (f"Block Template Build ({txs} txs)", self._bench_block_template,
+                               self.iterations * 20, None),
+            "chain_load": ("Chain Load From Disk", self._bench_chain_load,
+                           self.iterations, self.fixture.copy_data_dir),
+            "utxo_snapshot": ("UTXO Snapshot", self._bench_utxo_snapshot,
+                              self.iterations * 20, None),
+            "history_query": ("Address History Query", self._bench_history_query,
+                              self.iterations * 20, None),
+        }
+        for key in selected:
+            name, func, iterations, setup = scenario_args[key]
+            self.suite.add_benchmark(name, func, iterations=iterations, setup=setup)
+        return self.suite
+
+    def _loaded_chain(self):
+        """Chain shared by read-only scenarios, with the workload in its mempool"""
+        if self._loaded is None:
+            chain, transactions = self._fresh_chain_with_workload()
+            for tx in transactions:
+                if not chain.add_transaction(tx):
+                    raise RuntimeError("Workload transaction rejected while filling the mempool")
+            self._loaded = chain
+        return self._loaded
+
+    def _fresh_chain_with_block(self):
+        return self.fixture.load(), self.fixture.next_block()
+
+    def _fresh_chain_with_workload(self):
+        return self.fixture.load(), self.fixture.workload()
+
+    def _bench_block_connect(self, state) -> None:
+        """Benchmark connecting a full block to the tip"""
+        chain, block = state
+        if not chain.add_block(block):
+            raise RuntimeError("Workload block was rejected")
+
+    def _bench_mempool_admission(self, state) -> None:
+        """Benchmark admitting signed transfers to the mempool"""
+        chain, transactions = state
+        for tx in transactions:
+            if not chain.add_transaction(tx):
+                raise RuntimeError("Workload transaction was rejected")
+
+    def _bench_block_template(self) -> None:
+        """Benchmark selecting one block's transactions, as block assembly does"""
+        chain = self._loaded_chain()
+        with closing(chain._iter_prioritized_transactions()) as candidates:
+            for _ in itertools.islice(candidates, chain._max_transactions_per_block):
+                pass
+
+    def _bench_chain_load(self, data_dir: str) -> None:
+        """Benchmark loading chain state from disk"""
+        from xai.core.blockchain import Blockchain
+
+        Blockchain(data_dir=data_dir)
+
+    def _bench_utxo_snapshot(self) -> None:
+        """Benchmark snapshotting the UTXO set"""
+        self._loaded_chain().utxo_manager.snapshot()
+
+    def _bench_history_query(self) -> None:
+        """Benchmark one page of address history"""
+        accounts = self.fixture.accounts
+        account = accounts[self._history_cursor % len(accounts)]
+        self._history_cursor += 1
+        self._loaded_chain().get_transaction_history_window(account.address, 50, 0)
+
+
+def _print_comparison(comparison: dict[str, Any], threshold: float) -> None:
+    print(f"Baseline comparison (threshold {threshold:g}%):")
+    for entry in comparison["comparisons"]:
+        print(f"  {entry['status']:>10}  {entry['difference_percent']:+7.1f}%  {entry['name']}")
+    print()
+
+
+def main(argv: list[str] | None = None) -> int:
+    """
+    Run the node benchmarks
+
+    Returns:
+        0 on success, 1 if a scenario regressed past the threshold,
+        2 if the baseline could not be read
+    """
+    parser = argparse.ArgumentParser(description="Run node scenario benchmarks")
+    parser.add_argument("--iterations", type=int, default=5,
+                        help="Iterations for fresh-chain scenarios (default: 5)")
+    parser.add_argument("--accounts", type=int, default=FixtureConfig.accounts,
+                        help="Synthetic accounts; also transactions per workload block")
+    parser.add_argument("--history-rounds", type=int, default=FixtureConfig.history_rounds,
+                        help="Blocks of transfers in the synthetic history")
+    parser.add_argument("--scenario", action="append", choices=NodeBenchmarks.SCENARIOS,
+                        help="Scenario to run (repeatable; default: all)")
+    parser.add_argument("--output", help="Write results JSON (usable as a baseline)")
+    parser.add_argument("--baseline", help="Baseline JSON to compare against")
+    parser.add_argument("--threshold", type=float, default=10.0,
+                        help="Throughput drop in percent that fails the run (default: 10)")
+    parser.add_argument("--work-dir", help="Directory for fixtures (default: a temporary directory)")
+    args = parser.parse_args(argv)
+
+    config = FixtureConfig(accounts=args.accounts, history_rounds=args.history_rounds)
+    logging.disable(logging.CRITICAL)
+    work_dir = args.work_dir or tempfile.mkdtemp(prefix="xai-node-bench-")
+    try:
+        print(f"Building synthetic chain: {config.accounts} accounts, {config.history_rounds} rounds...")
+        fixture = SyntheticChain(work_dir, config)
+        fixture.build()
+
+        suite = NodeBenchmarks(fixture, iterations=args.iterations).setup_benchmarks(args.scenario)
+        suite.run_all()
+    finally:
+        logging.disable(logging.NOTSET)
+        if not args.work_dir:
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+    if args.output:
+        suite.export_results(args.output, metadata={
+            "fixture": asdict(config),
+            "iterations": args.iterations,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+        })
+
+    if args.baseline:
+        comparison = suite.compare_with_baseline(args.baseline, threshold_percent=args.threshold)
+        if "error" in comparison:
+            print(comparison["error"], file=sys.stderr)
+            return 2
+        _print_comparison(comparison, args.threshold)
+        if comparison["regressions"]:
+            print(f"Regressed: {', '.join(comparison['regressions'])}", file=sys.stderr)
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -24,12 +24,13 @@ import sys
 import sysconfig
 import tempfile
 import time
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field
 from pathlib import Path
 from typing import Any
 
 from xai.sandbox.ast_validator import ASTValidator
 from xai.sandbox.ast_validator import SecurityError as ASTSecurityError
+from xai.sandbox.worker_pool import SandboxWorkerPool
 from xai.security.module_attachment_guard import ModuleAttachmentError, ModuleAttachmentGuard
 
 logger = logging.getLogger(__name__)
@@ -108,7 +109,21 @@ class SecureExecutor:
         self,
         limits: ResourceLimits | None = None,
         use_subprocess: bool = False,
+        use_worker_pool: bool = True,
+        worker_pool_size: int = 2,
+        max_executions_per_worker: int = 100,
     ):
+        """
+        Initialize secure executor
+
+        Args:
+            limits: Resource limits per execution
+            use_subprocess: Run code in a separate sandboxed process
+            use_worker_pool: In subprocess mode, run code on warm sandboxed
+                workers instead of starting an interpreter per call (POSIX)
+            worker_pool_size: Unassigned warm workers kept ready
+            max_executions_per_worker: Jobs before a worker is replaced
+        """
         self.limits = limits or ResourceLimits()
         self.use_subprocess = use_subprocess
 
@@ -129,6 +144,26 @@ class SecureExecutor:
         # Create AST validator for pre-execution validation
         self.ast_validator = ASTValidator(allowed_functions=self.SAFE_BUILTINS)
 
+        self.worker_pool: SandboxWorkerPool | None = None
+        if use_subprocess and use_worker_pool and os.name == 'posix':
+            self.worker_pool = SandboxWorkerPool(
+                {
+                    "limits": asdict(self.limits),
+                    # Hard CPU limit for a worker's whole life; each job gets
+                    # max_cpu_seconds of it via the soft limit
+                    "cpu_budget": self.limits.max_cpu_seconds * (max_executions_per_worker + 1),
+                    "seccomp": self.has_seccomp,
+                },
+                size=worker_pool_size,
+                max_executions_per_worker=max_executions_per_worker,
+            )
+
+    def close(self) -> None:
+        """Stop the subprocess worker pool, if any"""
+        if self.worker_pool is not None:
+            self.worker_pool.shutdown()
+            self.worker_pool = None
+
     def execute(self, context: ExecutionContext) -> ExecutionResult:
         """
         Execute code in secure environment
@@ -452,6 +487,9 @@ class SecureExecutor:
         except SecurityViolation as exc:
             return ExecutionResult(success=False, error=str(exc))
 
+        if self.worker_pool is not None:
+            return self._execute_in_worker(context, allowed_imports)
+
         with tempfile.TemporaryDirectory() as temp_dir:
             temp_path = Path(temp_dir)
 
@@ -533,6 +571,60 @@ class SecureExecutor:
                     error=f"Subprocess execution failed: {str(e)}",
                 )
 
+    def _execute_in_worker(
+        self, context: ExecutionContext, allowed_imports: set[str]
+    ) -> ExecutionResult:
+        """
+        Execute code on a warm sandboxed worker
+
+        Same validation layers and result format as the spawn-per-call path;
+        the worker applies rlimits and seccomp once at startup instead of in
+        preexec_fn, and is recycled after any failure (see worker_pool).
+        """
+        job = {
+            "code": context.code,
+            "entry_point": context.entry_point,
+            "allowed_imports": sorted(allowed_imports),
+        }
+        try:
+            outcome = self.worker_pool.run(
+                context.app_id, job, self.limits.max_wall_time_seconds
+            )
+        except (OSError, ValueError) as e:
+            logger.error(f"Sandbox worker error: {type(e).__name__}: {e}")
+            return ExecutionResult(success=False, error=f"System error: {str(e)}")
+
+        if outcome.response is not None:
+            exit_code = outcome.response.get("exit_code", 1)
+            return ExecutionResult(
+                success=exit_code == 0,
+                output=str(outcome.response.get("stdout", ""))[:self.limits.max_output_bytes],
+                error=str(outcome.response.get("stderr", ""))[:self.limits.max_output_bytes],
+                exit_code=exit_code,
+            )
+
+        if outcome.timed_out:
+            return ExecutionResult(
+                success=False,
+                error="Execution timeout exceeded",
+                resource_exceeded=True,
+                killed_by_signal=signal.SIGKILL,
+            )
+
+        # Worker died: killed by a limit or the seccomp filter, or failed to start
+        returncode = outcome.returncode
+        killed_by = -returncode if returncode is not None and returncode < 0 else None
+        return ExecutionResult(
+            success=False,
+            error=(
+                f"Sandbox worker terminated by {signal.Signals(killed_by).name}"
+                if killed_by else "Sandbox worker exited unexpectedly"
+            ),
+            exit_code=returncode if returncode is not None else -1,
+            killed_by_signal=killed_by,
+            resource_exceeded=killed_by in (signal.SIGXCPU, signal.SIGKILL),
+        )
+
     def _wrap_code_for_subprocess(self, context: ExecutionContext, allowed_imports: set[str]) -> str:
         """Wrap user code with safety checks and API stubs"""
         runtime_allowed = set(allowed_imports) | {"sys", "json"}
@@ -582,11 +674,18 @@ if __name__ == "__main__":
 '''
         return wrapper
 
-    def _prepare_subprocess(self) -> None:
+    def _prepare_subprocess(self, cpu_seconds: int | None = None, zygote: bool = False) -> None:
         """
         Prepare subprocess with security restrictions
 
-        Called via preexec_fn before subprocess exec (POSIX only).
+        Called via preexec_fn before subprocess exec (POSIX only), and by
+        pool workers on themselves at startup.
+
+        Args:
+            cpu_seconds: CPU limit (default: limits.max_cpu_seconds); pool
+                workers pass their lifetime budget
+            zygote: Pool worker that forks a child per job: RLIMIT_NPROC is
+                left for each child to set, and the filter also allows wait4
 
         SECURITY NOTE: This runs in the child process AFTER fork() but BEFORE exec().
         Any limits set here apply to the sandboxed code only, not the parent.
@@ -607,10 +706,9 @@ if __name__ == "__main__":
             resource.setrlimit(resource.RLIMIT_AS, (mem_bytes, mem_bytes))
 
             # CPU time limit
-            resource.setrlimit(
-                resource.RLIMIT_CPU,
-                (self.limits.max_cpu_seconds, self.limits.max_cpu_seconds)
-            )
+            if cpu_seconds is None:
+                cpu_seconds = self.limits.max_cpu_seconds
+            resource.setrlimit(resource.RLIMIT_CPU, (cpu_seconds, cpu_seconds))
 
             # File descriptor limit
             resource.setrlimit(
@@ -622,7 +720,8 @@ if __name__ == "__main__":
             resource.setrlimit(resource.RLIMIT_CORE, (0, 0))
 
             # Number of processes (limit to 1)
-            resource.setrlimit(resource.RLIMIT_NPROC, (1, 1))
+            if not zygote:
+                resource.setrlimit(resource.RLIMIT_NPROC, (1, 1))
 
         except (OSError, ValueError) as e:
             # OSError: permission denied or unsupported limit
@@ -633,9 +732,9 @@ if __name__ == "__main__":
 
         # Apply seccomp filter if available
         if self.has_seccomp:
-            self._apply_seccomp_filter()
+            self._apply_seccomp_filter(extra_syscalls=("wait4",) if zygote else ())
 
-    def _apply_seccomp_filter(self) -> None:
+    def _apply_seccomp_filter(self, extra_syscalls: tuple[str, ...] = ()) -> None:
         """
         Apply seccomp-bpf syscall filter (Linux only)
 
@@ -690,11 +789,11 @@ if __name__ == "__main__":
           - Filter load failure: Logs error, raises SecurityViolation if strict mode
         """
         # Try python-seccomp first (cleaner API)
-        if self._apply_seccomp_pyseccomp():
+        if self._apply_seccomp_pyseccomp(extra_syscalls):
             return
 
         # Fall back to ctypes-based libseccomp
-        if self._apply_seccomp_libseccomp():
+        if self._apply_seccomp_libseccomp(extra_syscalls):
             return
 
         # Neither method worked - log and continue with reduced security
@@ -704,7 +803,7 @@ if __name__ == "__main__":
             extra={"event": "sandbox.seccomp_unavailable"}
         )
 
-    def _apply_seccomp_pyseccomp(self) -> bool:
+    def _apply_seccomp_pyseccomp(self, extra_syscalls: tuple[str, ...] = ()) -> bool:
         """
         Apply seccomp filter using python-seccomp (pyseccomp) library.
 
@@ -855,6 +954,9 @@ if __name__ == "__main__":
             # ===== Memory mapping with restrictions =====
             f.add_rule(seccomp.ALLOW, "rseq")  # Restartable sequences
 
+            for syscall in extra_syscalls:
+                f.add_rule(seccomp.ALLOW, syscall)
+
             # Load the filter
             f.load()
 
@@ -896,7 +998,7 @@ if __name__ == "__main__":
             )
             return False
 
-    def _apply_seccomp_libseccomp(self) -> bool:
+    def _apply_seccomp_libseccomp(self, extra_syscalls: tuple[str, ...] = ()) -> bool:
         """
         Apply seccomp filter using ctypes bindings to libseccomp.
 
@@ -998,7 +1100,7 @@ if __name__ == "__main__":
                 "rseq",
             ]
 
-            for syscall in allowed_syscalls:
+            for syscall in [*allowed_syscalls, *extra_syscalls]:
                 allow_syscall(syscall)
 
             # Load the filter
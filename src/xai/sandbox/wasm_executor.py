@@ -12,6 +12,9 @@ Supports multiple WASM runtimes:
 - wasmer (preferred)
 - wasmtime (alternative)
 - wasm3 (lightweight interpreter)
+
+Compiled modules are cached by content hash (see wasm_module_cache), so a
+repeated call only instantiates and executes.
 """
 
 from __future__ import annotations
@@ -20,9 +23,12 @@ import logging
 import secrets
 import time
 from dataclasses import dataclass
+from importlib import metadata
 from pathlib import Path
 from typing import Any
 
+from xai.sandbox.wasm_module_cache import CompiledModuleCache
+
 logger = logging.getLogger(__name__)
 
 class WasmExecutionError(Exception):
@@ -56,10 +62,16 @@ class WasmExecutor:
     Provides secure, sandboxed execution of WASM modules.
     """
 
+    # Engine settings for wasmtime; part of the compiled-module cache key
+    WASMTIME_MAX_STACK = 1024 * 1024  # 1MB stack
+
     def __init__(
         self,
         limits: WasmLimits | None = None,
         runtime: str = "auto",
+        cache_dir: str | Path | None = None,
+        max_cached_modules: int = 64,
+        max_cache_bytes: int = 256 * 1024 * 1024,
     ):
         """
         Initialize WASM executor
@@ -67,6 +79,9 @@ class WasmExecutor:
         Args:
             limits: Resource limits for execution
             runtime: WASM runtime to use ("wasmer", "wasmtime", "wasm3", "auto")
+            cache_dir: Directory for serialized compiled modules (None = memory only)
+            max_cached_modules: Compiled modules kept in memory
+            max_cache_bytes: Total size of serialized modules kept on disk
         """
         self.limits = limits or WasmLimits()
         self.runtime_name = runtime
@@ -74,6 +89,11 @@ class WasmExecutor:
         # Detect and initialize runtime
         self.runtime = self._initialize_runtime(runtime)
 
+        # Engine (wasmtime) or store (wasmer) shared by all executions;
+        # compiled modules are only valid within it
+        self._engine: Any = None
+        self.module_cache = self._create_module_cache(cache_dir, max_cached_modules, max_cache_bytes)
+
     def execute(
         self,
         wasm_bytes: bytes,
@@ -223,6 +243,57 @@ class WasmExecutor:
 
         return None
 
+    def _create_module_cache(
+        self, cache_dir: str | Path | None, max_entries: int, max_disk_bytes: int
+    ) -> CompiledModuleCache | None:
+        """
+        Compiled-module cache for the selected runtime
+
+        wasm3 is an interpreter whose parsed modules are consumed when loaded
+        into a runtime, so it has nothing reusable to cache.
+        """
+        if self.runtime is None or self.runtime_name not in ("wasmtime", "wasmer"):
+            return None
+
+        try:
+            version = metadata.version(self.runtime_name)
+        except metadata.PackageNotFoundError:
+            version = getattr(self.runtime, "__version__", "unknown")
+
+        if self.runtime_name == "wasmtime":
+            import wasmtime
+
+            config = wasmtime.Config()
+            config.max_wasm_stack = self.WASMTIME_MAX_STACK
+            config.consume_fuel = True  # Enable fuel metering
+            engine = self._engine = wasmtime.Engine(config)
+            return CompiledModuleCache(
+                "wasmtime",
+                version,
+                compile=lambda wasm_bytes: wasmtime.Module(engine, wasm_bytes),
+                serialize=lambda module: module.serialize(),
+                deserialize=lambda data: wasmtime.Module.deserialize(engine, data),
+                config_tag=f"fuel-stack{self.WASMTIME_MAX_STACK}",
+                cache_dir=cache_dir,
+                max_entries=max_entries,
+                max_disk_bytes=max_disk_bytes,
+            )
+
+        from wasmer import Module, Store, engine
+
+        store = self._engine = Store(engine.JIT())
+        return CompiledModuleCache(
+            "wasmer",
+            version,
+            compile=lambda wasm_bytes: Module(store, wasm_bytes),
+            serialize=lambda module: module.serialize(),
+            deserialize=lambda data: Module.deserialize(store, data),
+            config_tag="jit",
+            cache_dir=cache_dir,
+            max_entries=max_entries,
+            max_disk_bytes=max_disk_bytes,
+        )
+
     def _execute_with_runtime(
         self,
         wasm_bytes: bytes,
@@ -261,11 +332,8 @@ class WasmExecutor:
                 engine,
             )
 
-            # Create store with engine
-            store = Store(engine.JIT())
-
-            # Compile module with limits
-            module = Module(store, wasm_bytes)
+            # Compiled once per module bytes, in the executor's store
+            module = self.module_cache.get(wasm_bytes)
 
             # Create import object
             import_object = ImportObject()
@@ -355,19 +423,18 @@ class WasmExecutor:
         try:
             import wasmtime
 
-            # Create engine with limits
-            config = wasmtime.Config()
-            config.max_wasm_stack = 1024 * 1024  # 1MB stack
-            config.consume_fuel = True  # Enable fuel metering
-
-            engine = wasmtime.Engine(config)
+            # Engine has stack limit and fuel metering; see _create_module_cache
+            engine = self._engine
             store = wasmtime.Store(engine)
 
-            # Set fuel limit
-            store.add_fuel(self.limits.max_execution_fuel)
+            # Set fuel limit (set_fuel replaced add_fuel in wasmtime 16)
+            if hasattr(store, "set_fuel"):
+                store.set_fuel(self.limits.max_execution_fuel)
+            else:
+                store.add_fuel(self.limits.max_execution_fuel)
 
-            # Compile module
-            module = wasmtime.Module(engine, wasm_bytes)
+            # Compiled once per module bytes
+            module = self.module_cache.get(wasm_bytes)
 
             # Create linker for imports
             linker = wasmtime.Linker(engine)
@@ -395,7 +462,10 @@ class WasmExecutor:
                 result = func(store, *arguments)
 
                 # Get fuel consumed
-                fuel_consumed = self.limits.max_execution_fuel - store.fuel_consumed()
+                if hasattr(store, "get_fuel"):
+                    fuel_consumed = self.limits.max_execution_fuel - store.get_fuel()
+                else:
+                    fuel_consumed = store.fuel_consumed()
 
                 return WasmResult(
                     success=True,
@@ -518,12 +588,9 @@ class WasmExecutor:
         """Validate module with wasmer"""
         try:
             import wasmer
-            from wasmer import Module, Store, engine
-
-            store = Store(engine.JIT())
-            module = Module(store, wasm_bytes)
 
-            # Basic validation - module compiled successfully
+            # Basic validation - module compiled successfully (and is now cached)
+            self.module_cache.get(wasm_bytes)
             return True
 
         except ImportError:
@@ -541,8 +608,8 @@ class WasmExecutor:
         try:
             import wasmtime
 
-            engine = wasmtime.Engine()
-            module = wasmtime.Module(engine, wasm_bytes)
+            # Compiling validates the module (and caches it)
+            self.module_cache.get(wasm_bytes)
 
             # Check exports don't exceed limits
             # (would inspect module exports here)
@@ -0,0 +1,256 @@
+"""
+Compiled Module Cache for the WASM Executor
+
+Compiling a module dominates the cost of calling it. Compiled modules are
+cached by the SHA-256 of their bytes:
+- In memory, as runtime module objects, with LRU eviction by entry count
+- Optionally on disk, as serialized native artifacts for runtimes that
+  support them, with LRU eviction by total size
+
+Disk artifacts live under ``<cache_dir>/<runtime>-<version>/``; directories
+left by other versions of the same runtime are deleted on startup, since
+their artifacts cannot be loaded. The cache directory must be private to
+the node: deserializing an artifact runs its native code.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import shutil
+import tempfile
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable
+
+logger = logging.getLogger(__name__)
+
+ARTIFACT_SUFFIX = ".cwasm"
+
+class CompiledModuleCache:
+    """
+    Content-hash keyed cache of compiled WASM modules
+
+    Thread-safe. A module is compiled at most once per process as long as it
+    stays in memory, and loaded from its serialized artifact rather than
+    recompiled after a restart.
+    """
+
+    def __init__(
+        self,
+        runtime: str,
+        runtime_version: str,
+        compile: Callable[[bytes], Any],
+        serialize: Callable[[Any], bytes] | None = None,
+        deserialize: Callable[[bytes], Any] | None = None,
+        config_tag: str = "",
+        cache_dir: str | Path | None = None,
+        max_entries: int = 64,
+        max_disk_bytes: int = 256 * 1024 * 1024,
+    ):
+        """
+        Initialize cache
+
+        Args:
+            runtime: Runtime name
+            runtime_version: Runtime version; artifacts of other versions are discarded
+            compile: Compiles module bytes into a runtime module
+            serialize: Serializes a compiled module (None = no disk cache)
+            deserialize: Loads a serialized module
+            config_tag: Engine settings that affect compiled code
+            cache_dir: Directory for serialized artifacts (None = memory only)
+            max_entries: Compiled modules kept in memory
+            max_disk_bytes: Total size of artifacts kept on disk
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self.runtime = runtime
+        self.runtime_version = runtime_version
+        self.config_tag = config_tag
+        self.max_entries = max_entries
+        self.max_disk_bytes = max_disk_bytes
+        self._compile = compile
+        self._serialize = serialize
+        self._deserialize = deserialize
+
+        self._lock = threading.Lock()
+        self._modules: OrderedDict[str, Any] = OrderedDict()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self.artifact_dir: Path | None = None
+        self._disk_bytes = 0
+        if cache_dir is not None and serialize is not None and deserialize is not None:
+            self.artifact_dir = self._prepare_artifact_dir(Path(cache_dir))
+
+    def get(self, wasm_bytes: bytes) -> Any:
+        """
+        Compiled module for ``wasm_bytes``, compiling it on a miss
+
+        Args:
+            wasm_bytes: WASM module bytes
+
+        Returns:
+            Runtime module object
+
+        Raises:
+            Whatever the runtime's compile raises for invalid modules
+        """
+        key = self._key(wasm_bytes)
+        with self._lock:
+            module = self._modules.get(key)
+            if module is not None:
+                self._modules.move_to_end(key)
+                self.hits += 1
+                return module
+
+        module = self._load_artifact(key)
+        if module is None:
+            module = self._compile(wasm_bytes)
+            self._store_artifact(key, module)
+            with self._lock:
+                self.misses += 1
+        else:
+            with self._lock:
+                self.disk_hits += 1
+
+        with self._lock:
+            self._modules[key] = module
+            self._modules.move_to_end(key)
+            while len(self._modules) > self.max_entries:
+                self._modules.popitem(last=False)
+                self.evictions += 1
+        return module
+
+    def clear(self) -> None:
+        """Drop all cached modules, in memory and on disk"""
+        with self._lock:
+            self._modules.clear()
+            if self.artifact_dir is not None:
+                for path in self.artifact_dir.glob(f"*{ARTIFACT_SUFFIX}"):
+                    path.unlink(missing_ok=True)
+                self._disk_bytes = 0
+
+    def stats(self) -> dict[str, Any]:
+        """Cache statistics"""
+        with self._lock:
+            return {
+                "runtime": f"{self.runtime}-{self.runtime_version}",
+                "entries": len(self._modules),
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "disk_bytes": self._disk_bytes,
+            }
+
+    def _key(self, wasm_bytes: bytes) -> str:
+        digest = hashlib.sha256(wasm_bytes).hexdigest()
+        return f"{self.config_tag}-{digest}" if self.config_tag else digest
+
+    def _prepare_artifact_dir(self, cache_dir: Path) -> Path | None:
+        """Create this version's artifact directory and remove stale versions"""
+        artifact_dir = cache_dir / f"{self.runtime}-{self.runtime_version}"
+        try:
+            artifact_dir.mkdir(parents=True, exist_ok=True)
+            os.chmod(cache_dir, 0o700)
+            for stale in cache_dir.glob(f"{self.runtime}-*"):
+                if stale != artifact_dir and stale.is_dir():
+                    logger.info(
+                        "Removing WASM artifacts of another runtime version",
+                        extra={"event": "wasm.cache_invalidated", "path": str(stale)},
+                    )
+                    shutil.rmtree(stale, ignore_errors=True)
+            self._disk_bytes = sum(
+                path.stat().st_size for path in artifact_dir.glob(f"*{ARTIFACT_SUFFIX}")
+            )
+        except OSError as e:
+            logger.warning(f"WASM artifact cache disabled: {e}")
+            return None
+        return artifact_dir
+
+    def _load_artifact(self, key: str) -> Any | None:
+        if self.artifact_dir is None:
+            return None
+        path = self.artifact_dir / f"{key}{ARTIFACT_SUFFIX}"
+        try:
+            data = path.read_bytes()
+        except FileNotFoundError:
+            return None
+        except OSError as e:
+            logger.warning(f"Failed to read WASM artifact {path.name}: {e}")
+            return None
+
+        try:
+            module = self._deserialize(data)
+        except Exception as e:
+            # Corrupt or incompatible artifact: drop it and recompile
+            logger.warning(
+                f"Discarding unloadable WASM artifact {path.name}: {type(e).__name__}: {e}"
+            )
+            self._remove_artifact(path)
+            return None
+
+        try:
+            os.utime(path)  # Recency for LRU eviction
+        except OSError:
+            pass
+        return module
+
+    def _store_artifact(self, key: str, module: Any) -> None:
+        if self.artifact_dir is None:
+            return
+        try:
+            data = self._serialize(module)
+        except Exception as e:
+            logger.debug(f"WASM module not serializable: {type(e).__name__}: {e}")
+            return
+        if len(data) > self.max_disk_bytes:
+            return
+
+        path = self.artifact_dir / f"{key}{ARTIFACT_SUFFIX}"
+        try:
+            fd, temp_path = tempfile.mkstemp(dir=self.artifact_dir, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(temp_path, path)
+        except OSError as e:
+            logger.warning(f"Failed to write WASM artifact {path.name}: {e}")
+            return
+
+        with self._lock:
+            self._disk_bytes += len(data)
+            if self._disk_bytes > self.max_disk_bytes:
+                self._evict_artifacts()
+
+    def _evict_artifacts(self) -> None:
+        """Delete least recently used artifacts until under the size bound (lock held)"""
+        entries = []
+        for path in self.artifact_dir.glob(f"*{ARTIFACT_SUFFIX}"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        entries.sort()
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if total <= self.max_disk_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+        self._disk_bytes = total
+
+    def _remove_artifact(self, path: Path) -> None:
+        try:
+            size = path.stat().st_size
+            path.unlink()
+        except OSError:
+            return
+        with self._lock:
+            self._disk_bytes = max(0, self._disk_bytes - size)
@@ -0,0 +1,443 @@
+"""
+Warm Worker Pool for SecureExecutor Subprocess Mode
+
+Starting a Python interpreter per call dominates the latency of small
+mini-app snippets. This pool keeps sandboxed interpreters running and sends
+them jobs over a pipe instead.
+
+Each worker is a fresh interpreter (never a fork of the node, so it holds
+none of the node's memory or file descriptors). After starting, it applies
+the executor's resource limits and seccomp filter to itself and becomes a
+zygote: it never runs submitted code itself, but forks a child per job
+from its clean, already-sandboxed state. Per-job isolation:
+  - Every job runs in its own forked child, so module objects, builtins
+    and interpreter state changed by one job are gone before the next
+  - The child drops the ability to fork further and gets its own CPU limit;
+    wall time is enforced by the parent, which kills the worker on timeout
+    (the child dies with it)
+  - A worker only ever runs code for one app; other apps get other workers
+  - A worker is retired after a configurable number of executions, or after
+    any job that fails, times out or kills its child
+"""
+
+from __future__ import annotations
+
+import builtins
+import io
+import json
+import logging
+import os
+import select
+import shutil
+import signal
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import traceback
+import weakref
+from collections import OrderedDict
+from contextlib import redirect_stderr, redirect_stdout
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Directory containing the xai package, prepended to the worker's sys.path
+_PACKAGE_ROOT = str(Path(__file__).resolve().parents[2])
+
+_BOOTSTRAP = (
+    f"import sys; sys.path.insert(0, {_PACKAGE_ROOT!r}); "
+    "from xai.sandbox.worker_pool import worker_main; worker_main()"
+)
+
+# Seconds a new worker may take to start and sandbox itself
+WORKER_START_TIMEOUT = 10.0
+
+# prctl option delivering a signal to a child when its parent dies
+_PR_SET_PDEATHSIG = 1
+
+@dataclass
+class WorkerOutcome:
+    """Result of sending one job to a worker"""
+    response: dict[str, Any] | None  # None if the worker gave no valid reply
+    timed_out: bool = False
+    returncode: int | None = None  # Set if the worker or the job's child exited
+
+class _Worker:
+    """Parent-side handle for one sandboxed worker process"""
+
+    def __init__(self, env: dict[str, str], config: dict[str, Any]):
+        self.temp_dir = tempfile.mkdtemp(prefix="xai_sandbox_")
+        self.process = subprocess.Popen(
+            [sys.executable, "-S", "-c", _BOOTSTRAP],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            env=env,
+            cwd=self.temp_dir,
+        )
+        self.ready = False
+        self.executions = 0
+        self._buffer = b""
+        self._send(config)
+
+    def run(self, job: dict[str, Any], timeout: float) -> WorkerOutcome:
+        """Send a job and wait up to ``timeout`` seconds for its result"""
+        try:
+            if not self.ready:
+                hello = self._read_message(time.monotonic() + WORKER_START_TIMEOUT)
+                if not hello or not hello.get("ready"):
+                    raise EOFError("worker did not start")
+                self.ready = True
+
+            self.executions += 1
+            self._send(job)
+            response = self._read_message(time.monotonic() + timeout)
+        except (EOFError, OSError, ValueError):
+            # Worker exited or sent garbage; collect its exit status
+            try:
+                self.process.wait(timeout=1)
+            except subprocess.TimeoutExpired:
+                pass
+            return WorkerOutcome(None, returncode=self.process.poll())
+
+        if response is None:
+            return WorkerOutcome(None, timed_out=True)
+        if "exit_code" not in response:
+            # The job's child died before replying (CPU limit, seccomp kill)
+            return WorkerOutcome(None, returncode=response.get("returncode"))
+        return WorkerOutcome(response)
+
+    def close(self) -> None:
+        """Kill the worker and remove its working directory"""
+        if self.process.poll() is None:
+            self.process.kill()
+        try:
+            self.process.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            logger.warning("Sandbox worker did not exit after SIGKILL", extra={"pid": self.process.pid})
+        for stream in (self.process.stdin, self.process.stdout):
+            try:
+                stream.close()
+            except OSError:
+                pass
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _send(self, message: dict[str, Any]) -> None:
+        self.process.stdin.write(json.dumps(message).encode("utf-8") + b"\n")
+        self.process.stdin.flush()
+
+    def _read_message(self, deadline: float) -> dict[str, Any] | None:
+        """
+        Read one newline-terminated JSON object
+
+        Returns:
+            The message, or None if the deadline passed first
+
+        Raises:
+            EOFError: Worker closed its end of the pipe
+            ValueError: Malformed message
+        """
+        fd = self.process.stdout.fileno()
+        while b"\n" not in self._buffer:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or not select.select([fd], [], [], remaining)[0]:
+                return None
+            data = os.read(fd, 65536)
+            if not data:
+                raise EOFError("worker closed its output")
+            self._buffer += data
+        line, self._buffer = self._buffer.split(b"\n", 1)
+        message = json.loads(line)
+        if not isinstance(message, dict):
+            raise ValueError("worker message is not an object")
+        return message
+
+class SandboxWorkerPool:
+    """
+    Pool of warm, sandboxed interpreters bound to one app each
+
+    Thread-safe: concurrent run() calls use different workers.
+    """
+
+    def __init__(
+        self,
+        config: dict[str, Any],
+        size: int = 2,
+        max_executions_per_worker: int = 100,
+        max_idle_workers: int = 16,
+    ):
+        """
+        Initialize and start the pool
+
+        Args:
+            config: Sandbox settings sent to each worker at startup
+                (limits, cpu_budget, seccomp)
+            size: Unassigned workers kept started ahead of demand
+            max_executions_per_worker: Jobs before a worker is replaced
+            max_idle_workers: Cap on idle app-bound workers (least recently
+                used are retired first)
+        """
+        if max_executions_per_worker < 1:
+            raise ValueError("max_executions_per_worker must be at least 1")
+        self.config = config
+        self.size = size
+        self.max_executions_per_worker = max_executions_per_worker
+        self.max_idle_workers = max_idle_workers
+        self.env = {"PYTHONDONTWRITEBYTECODE": "1", "PYTHONUNBUFFERED": "1"}
+
+        self._lock = threading.Lock()
+        self._fresh: list[_Worker] = []
+        self._idle: OrderedDict[str, list[_Worker]] = OrderedDict()
+        self._live: set[_Worker] = set()
+        self._closed = False
+        self.workers_started = 0
+        self.workers_retired = 0
+        self._finalizer = weakref.finalize(self, SandboxWorkerPool._close_all, self._live)
+
+        with self._lock:
+            self._top_up()
+
+    def run(self, app_id: str, job: dict[str, Any], timeout: float) -> WorkerOutcome:
+        """
+        Run a job on a worker for ``app_id``
+
+        Args:
+            app_id: App the code belongs to
+            job: Job message (code, entry_point, allowed_imports)
+            timeout: Wall-clock limit in seconds
+
+        Returns:
+            WorkerOutcome for the job
+        """
+        worker = self._acquire(app_id)
+        outcome = worker.run(job, timeout)
+
+        healthy = (
+            outcome.response is not None
+            and outcome.response.get("exit_code") == 0
+            and worker.executions < self.max_executions_per_worker
+        )
+        if outcome.timed_out:
+            logger.warning(
+                "Sandbox worker timed out, recycling",
+                extra={"event": "sandbox.worker_timeout", "app_id": app_id},
+            )
+        self._release(app_id, worker, healthy)
+        return outcome
+
+    def shutdown(self) -> None:
+        """Stop all workers"""
+        with self._lock:
+            self._closed = True
+            self._fresh.clear()
+            self._idle.clear()
+        self._finalizer()
+
+    def stats(self) -> dict[str, int]:
+        """Worker counts for monitoring"""
+        with self._lock:
+            return {
+                "workers_started": self.workers_started,
+                "workers_retired": self.workers_retired,
+                "fresh_workers": len(self._fresh),
+                "idle_workers": sum(len(workers) for workers in self._idle.values()),
+                "live_workers": len(self._live),
+            }
+
+    def _acquire(self, app_id: str) -> _Worker:
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("Sandbox worker pool is shut down")
+            workers = self._idle.get(app_id)
+            if workers:
+                worker = workers.pop()
+                if not workers:
+                    del self._idle[app_id]
+                return worker
+            if self._fresh:
+                return self._fresh.pop(0)
+            return self._start_worker()
+
+    def _release(self, app_id: str, worker: _Worker, healthy: bool) -> None:
+        retire = [] if healthy else [worker]
+        with self._lock:
+            if healthy and not self._closed:
+                self._idle.setdefault(app_id, []).append(worker)
+                self._idle.move_to_end(app_id)
+                while sum(len(workers) for workers in self._idle.values()) > self.max_idle_workers:
+                    oldest_app, workers = next(iter(self._idle.items()))
+                    retire.append(workers.pop(0))
+                    if not workers:
+                        del self._idle[oldest_app]
+            elif healthy:
+                retire.append(worker)
+            for retired in retire:
+                self._live.discard(retired)
+                self.workers_retired += 1
+            if not self._closed:
+                self._top_up()
+        for retired in retire:
+            retired.close()
+
+    def _top_up(self) -> None:
+        """Start workers until ``size`` unassigned ones are waiting (lock held)"""
+        while len(self._fresh) < self.size:
+            self._fresh.append(self._start_worker())
+
+    def _start_worker(self) -> _Worker:
+        """Start one worker (lock held); it finishes booting in the background"""
+        worker = _Worker(self.env, self.config)
+        self._live.add(worker)
+        self.workers_started += 1
+        return worker
+
+    @staticmethod
+    def _close_all(workers: set[_Worker]) -> None:
+        for worker in list(workers):
+            worker.close()
+        workers.clear()
+
+# ==================== Worker Process ====================
+
+class _API:
+    """Stub API object exposed to sandboxed code"""
+    pass
+
+def worker_main() -> None:
+    """
+    Entry point of a worker process
+
+    Reads its sandbox config, sandboxes itself, then serves jobs from stdin
+    until EOF, forking a child for each one. The protocol uses private copies
+    of fds 0 and 1; the originals point at /dev/null, and children close the
+    copies, so sandboxed code cannot reach the protocol streams.
+    """
+    import ctypes
+    import resource
+
+    from xai.sandbox.secure_executor import ResourceLimits, SecureExecutor
+
+    proto_in = os.fdopen(os.dup(0), "rb")
+    proto_out = os.fdopen(os.dup(1), "wb")
+    devnull = os.open(os.devnull, os.O_RDWR)
+    os.dup2(devnull, 0)
+    os.dup2(devnull, 1)
+    os.close(devnull)
+    encode = json.JSONEncoder().encode
+    libc = ctypes.CDLL(None, use_errno=True)
+
+    config = json.loads(proto_in.readline())
+    limits = ResourceLimits(**config["limits"])
+    executor = SecureExecutor(limits=limits)
+    executor.has_seccomp = executor.has_seccomp and config.get("seccomp", True)
+    executor._prepare_subprocess(cpu_seconds=config["cpu_budget"], zygote=True)
+
+    def enter_child() -> None:
+        """Finish sandboxing a job's child before it runs any submitted code"""
+        proto_in.close()
+        os.close(proto_out.fileno())
+        # Die with the worker, which is what the parent kills on timeout
+        libc.prctl(_PR_SET_PDEATHSIG, signal.SIGKILL)
+        if os.getppid() == 1:
+            os._exit(1)
+        resource.setrlimit(resource.RLIMIT_NPROC, (1, 1))
+        resource.setrlimit(resource.RLIMIT_CPU, (limits.max_cpu_seconds, limits.max_cpu_seconds))
+
+    proto_out.write(encode({"ready": True}).encode("utf-8") + b"\n")
+    proto_out.flush()
+
+    for line in proto_in:
+        response = _fork_job(json.loads(line), limits, enter_child)
+        proto_out.write(encode(response).encode("utf-8") + b"\n")
+        proto_out.flush()
+
+def _fork_job(job: dict[str, Any], limits: Any, enter_child: Any) -> dict[str, Any]:
+    """
+    Run one job in a forked child and collect its response
+
+    Returns:
+        The child's response, or ``{"returncode": ...}`` (negative signal
+        number, as for subprocess) if it died without sending one
+    """
+    read_fd, write_fd = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        exit_status = 1
+        try:
+            os.close(read_fd)
+            enter_child()
+            response = _run_job(job, limits)
+            data = json.JSONEncoder().encode(response).encode("utf-8")
+            while data:
+                data = data[os.write(write_fd, data):]
+            exit_status = 0
+        finally:
+            os._exit(exit_status)
+
+    os.close(write_fd)
+    chunks = []
+    while chunk := os.read(read_fd, 65536):
+        chunks.append(chunk)
+    os.close(read_fd)
+    _, status = os.waitpid(pid, 0)
+
+    if os.WIFEXITED(status) and os.WEXITSTATUS(status) == 0:
+        try:
+            response = json.loads(b"".join(chunks))
+        except ValueError:
+            response = None
+        if isinstance(response, dict):
+            return response
+    return {"returncode": os.waitstatus_to_exitcode(status)}
+
+def _run_job(job: dict[str, Any], limits: Any) -> dict[str, Any]:
+    """Execute one job like the spawn-per-call wrapper script would"""
+    allowed = set(job.get("allowed_imports", [])) | {"sys", "json"}
+
+    def guarded_import(name, globals=None, locals=None, fromlist=(), level=0):
+        root = name.split(".")[0]
+        if root not in allowed:
+            raise ImportError(f"Import '{name}' not permitted in sandbox")
+        return builtins.__import__(name, globals, locals, fromlist, level)
+
+    sandbox_builtins = dict(vars(builtins))
+    sandbox_builtins["__import__"] = guarded_import
+    namespace = {
+        "__name__": "__main__",
+        "__builtins__": sandbox_builtins,
+        "sys": sys,
+        "json": json,
+        "api": _API(),
+    }
+
+    stdout, stderr = io.StringIO(), io.StringIO()
+    exit_code = 0
+    entry_point = job.get("entry_point", "main")
+    with redirect_stdout(stdout), redirect_stderr(stderr):
+        try:
+            exec(compile(job["code"], "<sandbox>", "exec"), namespace)
+            try:
+                if entry_point in namespace:
+                    result = namespace[entry_point]()
+                    print(json.dumps({"success": True, "result": str(result)}))
+                else:
+                    print(json.dumps({"success": True, "result": None}))
+            except Exception as e:
+                print(json.dumps({"success": False, "error": str(e)}), file=sys.stderr)
+                exit_code = 1
+        except SystemExit as e:
+            exit_code = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+        except BaseException:
+            traceback.print_exc()
+            exit_code = 1
+
+    max_bytes = limits.max_output_bytes
+    return {
+        "stdout": stdout.getvalue()[:max_bytes],
+        "stderr": stderr.getvalue()[:max_bytes],
+        "exit_code": exit_code,
+    }
@@ -10,13 +10,17 @@ import os
 import json
 import hashlib
 import time
+from unittest import mock
 
+from xai.core.config import NETWORK
+from xai.core.consensus import chain_validator
 from xai.core.consensus.chain_validator import (
     ChainValidator,
     ValidationReport,
     ValidationIssue,
     validate_blockchain_on_startup,
 )
+from xai.core.security.crypto_utils import deterministic_keypair_from_seed, sign_message_hex
 
 
 class TestValidationReport(unittest.TestCase):
@@ -318,6 +322,115 @@ class TestUTXOReconstruction(unittest.TestCase):
         self.assertIn("MINER", utxo_set)
 
 
+def _signed_transfer(keys, recipient, amount, timestamp):
+    """Transaction signed the way _verify_transaction_signature expects"""
+    private_key, public_key = keys
+    prefix = "XAI" if NETWORK.lower() == "mainnet" else "TXAI"
+    tx = {
+        "sender": f"{prefix}{hashlib.sha256(bytes.fromhex(public_key)).hexdigest()[:40]}",
+        "recipient": recipient,
+        "amount": amount,
+        "fee": 0.5,
+        "timestamp": timestamp,
+        "nonce": None,
+    }
+    tx["txid"] = hashlib.sha256(json.dumps(tx, sort_keys=True).encode()).hexdigest()
+    tx["public_key"] = public_key
+    tx["signature"] = sign_message_hex(private_key, tx["txid"].encode())
+    return tx
+
+
+def _mined_chain(num_blocks):
+    """Chain with difficulty 1 where every block after genesis spends from one key"""
+    validator = ChainValidator(verbose=False)
+    keys = deterministic_keypair_from_seed(b"chain-validator-test")
+    owner = _signed_transfer(keys, "X", 0.0, 0.0)["sender"]
+
+    chain = []
+    for index in range(num_blocks):
+        timestamp = 1_700_000_000.0 + index
+        transactions = [{
+            "txid": hashlib.sha256(f"coinbase{index}".encode()).hexdigest(),
+            "sender": "COINBASE", "recipient": owner, "amount": 50.0, "fee": 0.0,
+        }]
+        if index > 0:
+            transactions.append(_signed_transfer(keys, f"ADDR_{index}", 10.0, timestamp))
+        block = {
+            "index": index,
+            "timestamp": timestamp,
+            "transactions": transactions,
+            "previous_hash": chain[-1]["hash"] if chain else "0",
+            "merkle_root": validator._calculate_merkle_root(transactions),
+            "difficulty": 1,
+            "nonce": 0,
+        }
+        while not validator._calculate_block_hash(block).startswith("0"):
+            block["nonce"] += 1
+        block["hash"] = validator._calculate_block_hash(block)
+        chain.append(block)
+    return chain
+
+
+class TestSinglePassValidation(unittest.TestCase):
+    """Test that inline and worker-pool validation give identical reports"""
+
+    def setUp(self):
+        """Mine a small chain and force the worker pool with tiny batches"""
+        self.chain = _mined_chain(12)
+        patcher = mock.patch.multiple(
+            chain_validator, PARALLEL_MIN_BLOCKS=0, VALIDATION_BATCH_SIZE=2
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _reports(self, chain):
+        reports = []
+        for workers in (1, 2):
+            validator = ChainValidator(max_supply=10_000.0, verbose=False, workers=workers)
+            report = validator.validate_chain({"chain": chain}).to_dict()
+            report.pop("validation_time")
+            reports.append(report)
+        return reports
+
+    def test_valid_chain(self):
+        """Test a valid chain passes with the same totals either way"""
+        inline, parallel = self._reports(self.chain)
+
+        self.assertEqual(inline, parallel)
+        self.assertTrue(inline["success"])
+        self.assertEqual(inline["total_transactions"], 23)
+        self.assertEqual(inline["total_supply"], 12 * 50.0 - 11 * 0.5)
+
+    def test_issues_reported_in_check_order(self):
+        """Test every failure is reported, grouped by check as before"""
+        chain = json.loads(json.dumps(self.chain))
+        chain[7]["merkle_root"] = "00" * 32
+        chain[5]["transactions"][1]["signature"] = chain[6]["transactions"][1]["signature"]
+        chain[4]["transactions"][1]["public_key"] = None
+        chain[3]["hash"] = "0" + "f" * 63
+        chain[2]["difficulty"] = 64
+
+        inline, parallel = self._reports(chain)
+
+        self.assertEqual(inline, parallel)
+        self.assertFalse(inline["success"])
+        self.assertEqual(
+            [(issue["type"], issue["block"]) for issue in inline["issue_details"]],
+            [
+                ("block_hash", 3),
+                ("previous_hash", 4),
+                # Hashes cover transactions and merkle root
+                ("block_hash", 4),
+                ("block_hash", 5),
+                ("block_hash", 7),
+                ("proof_of_work", 2),
+                ("missing_public_key", 4),
+                ("invalid_signature", 5),
+                ("merkle_root", 7),
+            ],
+        )
+
+
 def run_tests():
     """Run all tests"""
     # Create test suite
@@ -329,6 +442,7 @@ def run_tests():
     suite.addTests(loader.loadTestsFromTestCase(TestChainValidator))
     suite.addTests(loader.loadTestsFromTestCase(TestValidationFunctions))
     suite.addTests(loader.loadTestsFromTestCase(TestUTXOReconstruction))
+    suite.addTests(loader.loadTestsFromTestCase(TestSinglePassValidation))
 
     # Run tests
     runner = unittest.TextTestRunner(verbosity=2)
@@ -0,0 +1,218 @@
+"""
+Unit tests for the merchant address watch-list matcher
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from xai.merchant import AddressWatchList, MerchantPaymentProcessor, PaymentStatus
+from xai.merchant.address_watcher import (
+    PAYMENT_CONFIRMATION,
+    PAYMENT_CONFIRMED,
+    PAYMENT_REORGED,
+    PAYMENT_SEEN,
+)
+
+WATCHED = "XAI" + "a" * 40
+OTHER = "XAI" + "b" * 40
+
+
+def _tx(txid, outputs):
+    return SimpleNamespace(
+        txid=txid,
+        outputs=[{"address": addr, "amount": amount} for addr, amount in outputs],
+    )
+
+
+def _block(block_hash, txs=()):
+    return SimpleNamespace(hash=block_hash, transactions=list(txs))
+
+
+class RecordingWebhooks:
+    def __init__(self):
+        self.events = []
+
+    def dispatch_event(self, event_type, payload):
+        self.events.append((event_type, payload["txid"]))
+        return 1
+
+
+@pytest.fixture
+def watch_list():
+    wl = AddressWatchList(confirmation_target=3)
+    wl.events = []
+    wl.add_listener(lambda event, payment, tags: wl.events.append((event, payment.txid, payment.confirmations, tags)))
+    wl.watch(WATCHED, "req-1")
+    return wl
+
+
+@pytest.fixture
+def chain(watch_list):
+    blocks = [_block("h0")]
+    watch_list.sync_to_chain(blocks)
+    return blocks
+
+
+class TestMatching:
+    """Test mempool and block matching"""
+
+    def test_mempool_admission_emits_seen(self, watch_list):
+        matched = watch_list.on_transaction_admitted(_tx("tx1", [(OTHER, 1), (WATCHED, 5)]))
+        assert matched == 1
+        assert watch_list.events == [(PAYMENT_SEEN, "tx1", 0, frozenset({"req-1"}))]
+
+    def test_unwatched_outputs_ignored(self, watch_list):
+        assert watch_list.on_transaction_admitted(_tx("tx1", [(OTHER, 1)])) == 0
+        assert watch_list.events == []
+
+    def test_duplicate_admission_not_reported_twice(self, watch_list):
+        watch_list.on_transaction_admitted(_tx("tx1", [(WATCHED, 5)]))
+        watch_list.on_transaction_admitted(_tx("tx1", [(WATCHED, 5)]))
+        assert len(watch_list.events) == 1
+
+    def test_confirmations_counted_until_final(self, watch_list, chain):
+        chain.append(_block("h1", [_tx("tx1", [(WATCHED, 5)])]))
+        watch_list.sync_to_chain(chain)
+        chain.append(_block("h2"))
+        watch_list.sync_to_chain(chain)
+        chain.append(_block("h3"))
+        watch_list.sync_to_chain(chain)
+
+        events = [(e, c) for e, _, c, _ in watch_list.events]
+        assert events == [
+            (PAYMENT_SEEN, 0),
+            (PAYMENT_CONFIRMATION, 1),
+            (PAYMENT_CONFIRMATION, 2),
+            (PAYMENT_CONFIRMATION, 3),
+            (PAYMENT_CONFIRMED, 3),
+        ]
+        assert watch_list.get_statistics()["tracked_payments"] == 0
+
+    def test_tracked_until_highest_tag_target(self, watch_list, chain):
+        watch_list.watch(WATCHED, "req-2", confirmation_target=5)
+        chain.append(_block("h1", [_tx("tx1", [(WATCHED, 5)])]))
+        for height in range(2, 6):
+            watch_list.sync_to_chain(chain)
+            assert watch_list.get_statistics()["tracked_payments"] == 1
+            chain.append(_block(f"h{height}"))
+        watch_list.sync_to_chain(chain)
+
+        events = [(e, c) for e, _, c, _ in watch_list.events]
+        assert events[-2:] == [(PAYMENT_CONFIRMATION, 5), (PAYMENT_CONFIRMED, 5)]
+        assert watch_list.get_statistics()["tracked_payments"] == 0
+
+    def test_first_sync_does_not_rescan_history(self):
+        wl = AddressWatchList()
+        seen = []
+        wl.add_listener(lambda *args: seen.append(args))
+        wl.watch(WATCHED, "req")
+        wl.sync_to_chain([_block("h0", [_tx("old", [(WATCHED, 1)])])])
+        assert seen == []
+
+
+class TestReorgs:
+    """Test reorg handling"""
+
+    def test_reorg_rolls_back_and_reconfirms(self, watch_list, chain):
+        payment_tx = _tx("tx1", [(WATCHED, 5)])
+        chain.append(_block("h1", [payment_tx]))
+        watch_list.sync_to_chain(chain)
+
+        # Competing branch replaces h1 without the payment, then includes it later
+        chain[1:] = [_block("h1b"), _block("h2b", [payment_tx])]
+        watch_list.sync_to_chain(chain)
+
+        events = [(e, c) for e, _, c, _ in watch_list.events]
+        assert (PAYMENT_REORGED, 0) in events
+        assert events[-1] == (PAYMENT_CONFIRMATION, 1)
+
+    def test_webhook_manager_receives_events(self, chain):
+        webhooks = RecordingWebhooks()
+        wl = AddressWatchList(confirmation_target=1, webhook_manager=webhooks)
+        wl.watch(WATCHED, "req")
+        wl.sync_to_chain(chain)
+        wl.on_transaction_admitted(_tx("tx1", [(WATCHED, 5)]))
+        chain.append(_block("h1", [_tx("tx1", [(WATCHED, 5)])]))
+        wl.sync_to_chain(chain)
+        assert webhooks.events == [("payment_seen", "tx1"), ("payment_confirmed", "tx1")]
+
+
+class TestProcessorIntegration:
+    """Test MerchantPaymentProcessor wiring"""
+
+    def test_payment_detected_and_confirmed(self):
+        processor = MerchantPaymentProcessor(merchant_id="m1", required_confirmations=2)
+        request = processor.create_payment_request(address=WATCHED, amount=5.0)
+        chain = [_block("h0")]
+        processor.watch_list.sync_to_chain(chain)
+
+        processor.watch_list.on_transaction_admitted(_tx("tx1", [(WATCHED, 5.0)]))
+        assert request.status == PaymentStatus.PAID
+        assert request.paid_txid == "tx1"
+
+        chain.append(_block("h1", [_tx("tx1", [(WATCHED, 5.0)])]))
+        processor.watch_list.sync_to_chain(chain)
+        chain.append(_block("h2"))
+        processor.watch_list.sync_to_chain(chain)
+        assert request.confirmations == 2
+        assert request.is_confirmed()
+
+    def test_underpayment_ignored(self):
+        processor = MerchantPaymentProcessor(merchant_id="m1")
+        request = processor.create_payment_request(address=WATCHED, amount=5.0)
+        processor.watch_list.on_transaction_admitted(_tx("tx1", [(WATCHED, 1.0)]))
+        assert request.status == PaymentStatus.PENDING
+
+    def test_cancel_stops_watching(self):
+        processor = MerchantPaymentProcessor(merchant_id="m1")
+        request = processor.create_payment_request(address=WATCHED, amount=5.0)
+        processor.cancel_payment_request(request.request_id)
+        assert not processor.watch_list.is_watched(WATCHED)
+
+    def test_reorg_resets_confirmations(self):
+        processor = MerchantPaymentProcessor(merchant_id="m1", required_confirmations=6)
+        request = processor.create_payment_request(address=WATCHED, amount=5.0)
+        chain = [_block("h0")]
+        processor.watch_list.sync_to_chain(chain)
+        chain.append(_block("h1", [_tx("tx1", [(WATCHED, 5.0)])]))
+        processor.watch_list.sync_to_chain(chain)
+        assert request.confirmations == 1
+
+        chain[1] = _block("h1b")
+        processor.watch_list.sync_to_chain(chain)
+        assert request.confirmations == 0
+        assert request.status == PaymentStatus.PAID
+
+    def test_request_target_above_processor_default(self):
+        processor = MerchantPaymentProcessor(merchant_id="m1", required_confirmations=2)
+        request = processor.create_payment_request(address=WATCHED, amount=5.0, required_confirmations=4)
+        chain = [_block("h0")]
+        processor.watch_list.sync_to_chain(chain)
+        chain.append(_block("h1", [_tx("tx1", [(WATCHED, 5.0)])]))
+        for height in range(2, 5):
+            processor.watch_list.sync_to_chain(chain)
+            assert request.confirmed_at is None
+            chain.append(_block(f"h{height}"))
+        processor.watch_list.sync_to_chain(chain)
+
+        assert request.confirmations == 4
+        assert request.is_confirmed()
+        assert request.confirmed_at is not None
+
+    def test_reorg_revokes_confirmation(self):
+        processor = MerchantPaymentProcessor(merchant_id="m1", required_confirmations=2)
+        request = processor.create_payment_request(address=WATCHED, amount=5.0)
+        processor.create_payment_request(address=WATCHED, amount=5.0, required_confirmations=6)
+        chain = [_block("h0")]
+        processor.watch_list.sync_to_chain(chain)
+        chain.extend([_block("h1", [_tx("tx1", [(WATCHED, 5.0)])]), _block("h2")])
+        processor.watch_list.sync_to_chain(chain)
+        assert request.confirmed_at is not None
+
+        chain[1:] = [_block("h1b"), _block("h2b"), _block("h3b")]
+        processor.watch_list.sync_to_chain(chain)
+        assert request.confirmations == 0
+        assert request.confirmed_at is None
+        assert not request.is_confirmed()
+        assert request.status == PaymentStatus.PAID
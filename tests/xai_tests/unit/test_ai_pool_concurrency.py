@@ -0,0 +1,139 @@
+"""
+Tests for concurrent task execution in StrictAIPoolManager.
+
+Tasks run through the in-process LocalStubProvider: parallel tasks must
+never oversubscribe a key, per-provider concurrency limits must hold, and
+usage must survive a restart through the journal.
+"""
+
+import json
+import os
+from unittest.mock import Mock
+
+import pytest
+
+from xai.core.security.ai_pool_with_strict_limits import (
+    AIProvider,
+    LocalStubProvider,
+    StrictAIPoolManager,
+)
+
+
+def _key_manager():
+    manager = Mock()
+    manager.submit_api_key.side_effect = lambda **kwargs: {
+        "success": True,
+        "key_id": f"key_{manager.submit_api_key.call_count}",
+    }
+    manager.get_api_key_for_task.return_value = ("key", "sk-stub", 100000)
+    return manager
+
+
+def _pool(tmp_path, stub, **kwargs):
+    pool = StrictAIPoolManager(_key_manager(), state_path=str(tmp_path / "ai_pool_usage.json"))
+    pool.provider_rate_limits[AIProvider.ANTHROPIC] = (10_000, 60)
+    pool.register_provider_backend(AIProvider.ANTHROPIC, stub)
+    for attr, value in kwargs.items():
+        setattr(pool, attr, value)
+    return pool
+
+
+def _donate(pool, tokens):
+    result = pool.submit_api_key_donation(
+        donor_address="XAI_donor",
+        provider=AIProvider.ANTHROPIC,
+        api_key="sk-stub",
+        donated_tokens=tokens,
+    )
+    assert result["success"]
+    return result["key_id"]
+
+
+class TestConcurrentTasks:
+    """Test queued execution and token reservations."""
+
+    def test_parallel_tasks_never_oversubscribe_a_key(self, tmp_path):
+        stub = LocalStubProvider(latency=0.02, output_tokens=297)  # Uses the full estimate
+        pool = _pool(tmp_path, stub)
+        key_id = _donate(pool, 1000)
+
+        futures = [
+            pool.submit_ai_task("summarize the block", 300, AIProvider.ANTHROPIC)
+            for _ in range(10)
+        ]
+        results = [future.result(timeout=10) for future in futures]
+        pool.shutdown()
+
+        succeeded = [r for r in results if r["success"]]
+        assert len(succeeded) == 3  # 3 x 300 fits in 1000, a fourth does not
+        assert {r["error"] for r in results if not r["success"]} == {"INSUFFICIENT_DONATED_CREDITS"}
+
+        key = pool.donated_keys[key_id]
+        assert key.used_tokens == stub.tokens_charged == sum(r["tokens_used"] for r in succeeded)
+        assert key.used_tokens <= key.donated_tokens
+        assert key.reserved_tokens == 0
+        assert pool.total_tokens_used == key.used_tokens
+
+    def test_per_provider_concurrency_limit(self, tmp_path):
+        stub = LocalStubProvider(latency=0.05)
+        pool = _pool(tmp_path, stub)
+        pool.provider_concurrency_limits[AIProvider.ANTHROPIC] = 3
+        _donate(pool, 1_000_000)
+
+        futures = [pool.submit_ai_task("task", 100, AIProvider.ANTHROPIC) for _ in range(12)]
+        assert all(future.result(timeout=10)["success"] for future in futures)
+        pool.shutdown()
+
+        assert stub.calls == 12
+        assert 1 < stub.max_in_flight <= 3
+
+    def test_failed_call_releases_reservation(self, tmp_path):
+        pool = _pool(tmp_path, Mock(side_effect=RuntimeError("provider down")))
+        key_id = _donate(pool, 500)
+
+        result = pool.execute_ai_task_with_limits("task", 400, AIProvider.ANTHROPIC)
+        assert result["error"] == "API_CALL_FAILED"
+        key = pool.donated_keys[key_id]
+        assert (key.used_tokens, key.reserved_tokens) == (0, 0)
+
+
+class TestUsageJournal:
+    """Test append-only persistence and compaction."""
+
+    def test_usage_survives_restart(self, tmp_path):
+        stub = LocalStubProvider(output_tokens=20)
+        pool = _pool(tmp_path, stub)
+        key_id = _donate(pool, 10_000)
+        for _ in range(5):
+            assert pool.execute_ai_task_with_limits("one two three", 100, AIProvider.ANTHROPIC)["success"]
+
+        journal = tmp_path / "ai_pool_usage.journal"
+        assert len(journal.read_text().splitlines()) == 11  # Donation, then usage + totals per task
+
+        restarted = StrictAIPoolManager(_key_manager(), state_path=str(tmp_path / "ai_pool_usage.json"))
+        assert restarted.donated_keys[key_id].used_tokens == 5 * 23
+        assert restarted.total_tokens_used == 5 * 23
+        assert journal.read_text() == ""  # Folded into the state file on load
+
+    def test_journal_compacted_periodically(self, tmp_path):
+        pool = _pool(tmp_path, LocalStubProvider(), journal_compact_every=4)
+        key_id = _donate(pool, 10_000)
+        for _ in range(3):
+            pool.execute_ai_task_with_limits("task", 100, AIProvider.ANTHROPIC)
+
+        with open(tmp_path / "ai_pool_usage.json", encoding="utf-8") as f:
+            state = json.load(f)
+        assert state["keys"][0]["key_id"] == key_id
+        assert state["keys"][0]["used_tokens"] > 0
+        assert len((tmp_path / "ai_pool_usage.journal").read_text().splitlines()) < 4
+
+    def test_torn_journal_line_ignored(self, tmp_path):
+        pool = _pool(tmp_path, LocalStubProvider(output_tokens=9))
+        key_id = _donate(pool, 10_000)
+        pool.execute_ai_task_with_limits("task", 100, AIProvider.ANTHROPIC)
+        with open(tmp_path / "ai_pool_usage.journal", "a", encoding="utf-8") as f:
+            f.write('{"totals": {"tokens_us')
+
+        restarted = StrictAIPoolManager(_key_manager(), state_path=str(tmp_path / "ai_pool_usage.json"))
+        assert restarted.donated_keys[key_id].used_tokens == 10
+        assert os.path.getsize(tmp_path / "ai_pool_usage.journal") == 0
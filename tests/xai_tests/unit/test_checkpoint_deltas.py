@@ -0,0 +1,240 @@
+"""
+Tests for delta-encoded checkpoints.
+
+Checkpoints between periodic full checkpoints store only the UTXO delta
+recorded by the UTXO manager; loading any of them must rebuild exactly the
+UTXO set that was checkpointed.
+"""
+
+import json
+import os
+import random
+import shutil
+import tempfile
+from types import SimpleNamespace
+
+import pytest
+
+from xai.core.consensus.checkpoints import (
+    CHECKPOINT_ENCRYPTION_AVAILABLE,
+    Checkpoint,
+    CheckpointManager,
+    DeltaCheckpoint,
+)
+from xai.core.transactions.utxo_manager import UTXOManager
+from xai.core.transactions.utxo_store import MemoryUTXOStore
+
+
+def _digest(utxo_set):
+    """Digest of the unspent entries; rebuilt deltas omit spent ones."""
+    store = MemoryUTXOStore()
+    store.load_from_dict({
+        address: [utxo for utxo in utxos if not utxo.get("spent")]
+        for address, utxos in json.loads(json.dumps(utxo_set)).items()
+    })
+    return store.snapshot_digest()
+
+
+def _block(height):
+    return SimpleNamespace(
+        index=height,
+        hash=f"{height:064x}",
+        previous_hash=f"{height - 1:064x}",
+        timestamp=1_700_000_000.0 + height,
+        difficulty=4,
+        merkle_root="ab" * 32,
+        nonce=height,
+    )
+
+
+def _advance(state, rng, height):
+    """Create a few UTXOs and spend two, like a block would."""
+    unspent = [
+        (address, utxo["txid"], utxo["vout"])
+        for address, utxos in state.to_dict().items() for utxo in utxos if not utxo.get("spent")
+    ]
+    for vout in range(3):
+        address = f"addr{rng.randint(0, 30)}"
+        state.add_utxo(address, f"tx{height}", vout, rng.randint(1, 100), "script")
+    # One spend cancels an output of this block, one spends an older UTXO
+    state.mark_utxo_spent(address, f"tx{height}", 2)
+    state.mark_utxo_spent(*rng.choice(unspent))
+
+
+def _no_snapshot(*args, **kwargs):
+    raise AssertionError("delta checkpoint took a full UTXO snapshot")
+
+
+@pytest.fixture
+def temp_dir():
+    path = tempfile.mkdtemp()
+    yield path
+    shutil.rmtree(path, ignore_errors=True)
+
+
+@pytest.fixture
+def state():
+    state = UTXOManager()
+    for i in range(200):
+        state.add_utxo(f"addr{i % 30}", f"genesis{i}", 0, 50.0, "script")
+    return state
+
+
+class TestDeltaCheckpoints:
+    """Test delta checkpoint creation, rebuild and retention."""
+
+    def test_rebuild_matches_every_checkpoint(self, temp_dir, state):
+        manager = CheckpointManager(temp_dir, checkpoint_interval=1, max_checkpoints=50, full_checkpoint_every=4)
+        rng = random.Random(2)
+        digests = {}
+        kinds = []
+        for height in range(1, 11):
+            _advance(state, rng, height)
+            checkpoint = manager.create_checkpoint(_block(height), state, 1000.0)
+            kinds.append(type(checkpoint))
+            digests[height] = _digest(state.to_dict())
+
+        assert kinds == [Checkpoint, DeltaCheckpoint, DeltaCheckpoint, DeltaCheckpoint] * 2 + [
+            Checkpoint, DeltaCheckpoint
+        ]
+        for height in range(1, 11):
+            loaded = manager.load_checkpoint(height)
+            assert _digest(loaded.utxo_snapshot["utxo_set"]) == digests[height]
+            assert loaded.utxo_snapshot["total_utxos"] == len(
+                [1 for utxos in loaded.utxo_snapshot["utxo_set"].values() for u in utxos if not u.get("spent")]
+            )
+
+    def test_delta_file_is_small_encrypted_and_root_checked(self, temp_dir, state):
+        manager = CheckpointManager(temp_dir, checkpoint_interval=1, full_checkpoint_every=10)
+        rng = random.Random(3)
+        for i in range(2000):
+            state.add_utxo(f"addr{i}", f"{rng.getrandbits(256):064x}", 0, rng.random(), "script")
+        for height in (1, 2):
+            _advance(state, rng, height)
+            manager.create_checkpoint(_block(height), state, 1000.0)
+
+        full_path = os.path.join(manager.checkpoints_dir, "cp_1.json")
+        delta_path = os.path.join(manager.checkpoints_dir, "cpd_2_1.json")
+        assert os.path.getsize(delta_path) * 5 < os.path.getsize(full_path)
+
+        with open(delta_path) as f:
+            data = json.load(f)
+        assert data["parent_height"] == 1 and data["base_height"] == 1
+        if CHECKPOINT_ENCRYPTION_AVAILABLE:
+            assert data["utxo_delta"].get("_encrypted")
+
+        data["delta_root"] = "00" * 32
+        with open(delta_path, "w") as f:
+            json.dump(data, f)
+        assert manager.load_checkpoint(2) is None
+
+    def test_checkpoint_hash_independent_of_storage(self, temp_dir, state):
+        full = CheckpointManager(os.path.join(temp_dir, "full"), checkpoint_interval=1)
+        delta = CheckpointManager(os.path.join(temp_dir, "delta"), checkpoint_interval=1, full_checkpoint_every=5)
+        rng = random.Random(4)
+        for height in (1, 2, 3):
+            _advance(state, rng, height)
+            a = full.create_checkpoint(_block(height), state, 1000.0)
+            b = delta.create_checkpoint(_block(height), state, 1000.0)
+            assert a.checkpoint_hash == b.checkpoint_hash
+
+    def test_pruning_keeps_delta_dependencies(self, temp_dir, state):
+        manager = CheckpointManager(temp_dir, checkpoint_interval=1, max_checkpoints=3, full_checkpoint_every=5)
+        rng = random.Random(5)
+        for height in range(1, 9):
+            _advance(state, rng, height)
+            manager.create_checkpoint(_block(height), state, 1000.0)
+
+        # 6..8 are deltas on base 6 -> nothing older needed; 1..5 pruned
+        assert manager.list_checkpoints() == [6, 7, 8]
+        assert manager.load_checkpoint(8) is not None
+        assert manager.delete_checkpoint(7) is False
+
+        _advance(state, rng, 9)
+        manager.create_checkpoint(_block(9), state, 1000.0)
+        # Newest three are 7..9, which depend on 6
+        assert manager.list_checkpoints() == [6, 7, 8, 9]
+
+    def test_restart_continues_delta_chain(self, temp_dir, state):
+        rng = random.Random(6)
+        manager = CheckpointManager(temp_dir, checkpoint_interval=1, full_checkpoint_every=3)
+        for height in (1, 2):
+            _advance(state, rng, height)
+            manager.create_checkpoint(_block(height), state, 1000.0)
+
+        restarted = CheckpointManager(temp_dir, checkpoint_interval=1, full_checkpoint_every=3)
+        latest = restarted.load_latest_checkpoint()
+        state = UTXOManager()
+        state.restore(latest.utxo_snapshot)
+        restarted.resume_delta_chain(latest, state)
+        state.snapshot = _no_snapshot
+
+        # Height 2 was the first delta on base 1; 3 completes the chain of three
+        _advance(state, rng, 3)
+        checkpoint = restarted.create_checkpoint(_block(3), state, 1000.0)
+        assert isinstance(checkpoint, DeltaCheckpoint)
+        assert checkpoint.parent_height == 2
+        assert _digest(restarted.load_checkpoint(3).utxo_snapshot["utxo_set"]) == _digest(state.to_dict())
+
+        del state.snapshot
+        _advance(state, rng, 4)
+        assert type(restarted.create_checkpoint(_block(4), state, 1000.0)) is Checkpoint
+
+    def test_delta_uses_tracked_changes_without_snapshot(self, temp_dir, state):
+        manager = CheckpointManager(temp_dir, checkpoint_interval=1, full_checkpoint_every=4)
+        rng = random.Random(7)
+        _advance(state, rng, 1)
+        manager.create_checkpoint(_block(1), state, 1000.0)
+
+        state.snapshot = _no_snapshot
+        for height in (2, 3, 4):
+            _advance(state, rng, height)
+            checkpoint = manager.create_checkpoint(_block(height), state, 1000.0)
+            assert isinstance(checkpoint, DeltaCheckpoint)
+            assert len(checkpoint.utxo_delta["created"]) == 2
+            assert len(checkpoint.utxo_delta["spent"]) == 1
+        assert _digest(manager.load_checkpoint(4).utxo_snapshot["utxo_set"]) == _digest(state.to_dict())
+
+    def test_bulk_load_forces_full_checkpoint(self, temp_dir, state):
+        manager = CheckpointManager(temp_dir, checkpoint_interval=1, full_checkpoint_every=10)
+        rng = random.Random(8)
+        _advance(state, rng, 1)
+        manager.create_checkpoint(_block(1), state, 1000.0)
+
+        state.restore(state.snapshot())
+        _advance(state, rng, 2)
+        assert type(manager.create_checkpoint(_block(2), state, 1000.0)) is Checkpoint
+        _advance(state, rng, 3)
+        assert isinstance(manager.create_checkpoint(_block(3), state, 1000.0), DeltaCheckpoint)
+
+    def test_failed_save_forces_full_checkpoint(self, temp_dir, state, monkeypatch):
+        manager = CheckpointManager(temp_dir, checkpoint_interval=1, full_checkpoint_every=10)
+        rng = random.Random(9)
+        _advance(state, rng, 1)
+        manager.create_checkpoint(_block(1), state, 1000.0)
+
+        _advance(state, rng, 2)
+        monkeypatch.setattr(manager, "_save_checkpoint_atomic", lambda checkpoint: False)
+        assert manager.create_checkpoint(_block(2), state, 1000.0) is None
+        monkeypatch.undo()
+
+        # Block 2's changes were consumed by the failed write
+        _advance(state, rng, 3)
+        checkpoint = manager.create_checkpoint(_block(3), state, 1000.0)
+        assert type(checkpoint) is Checkpoint
+        assert _digest(manager.load_checkpoint(3).utxo_snapshot["utxo_set"]) == _digest(state.to_dict())
+
+    def test_full_every_one_does_not_track_changes(self, temp_dir, state):
+        manager = CheckpointManager(temp_dir, checkpoint_interval=1)
+        _advance(state, random.Random(10), 1)
+        manager.create_checkpoint(_block(1), state, 1000.0)
+        assert state.take_changes() is None
+
+
+def test_blockchain_uses_configured_full_checkpoint_every(temp_dir, monkeypatch):
+    from xai.core.blockchain import Blockchain
+    from xai.core.config import Config
+
+    monkeypatch.setattr(Config, "CHECKPOINT_FULL_EVERY", 7, raising=False)
+    blockchain = Blockchain(data_dir=temp_dir)
+    assert blockchain.checkpoint_manager.full_checkpoint_every == 7
@@ -7,6 +7,8 @@ Tests cover:
 - Resume capability
 - Priority-based chunk ordering
 - Compression
+- Streaming serialization and content-defined chunk reuse
+- Streaming reconstruction
 - API endpoints
 """
 
@@ -14,6 +16,7 @@ import pytest
 import json
 import tempfile
 import shutil
+from concurrent.futures import Future
 from pathlib import Path
 from unittest.mock import Mock, patch
 
@@ -24,6 +27,12 @@ from xai.core.p2p.chunked_sync import (
     SyncProgress,
     ChunkPriority,
 )
+from xai.core.p2p.snapshot_stream import (
+    content_defined_chunks,
+    iter_json_records,
+    load_json_stream,
+    state_digest,
+)
 from xai.core.consensus.checkpoint_payload import CheckpointPayload
 
 
@@ -463,6 +472,174 @@ class TestChunkedSyncWithCompression:
         assert payload.height == sample_payload.height
 
 
+def _utxo_payload(height, utxo_set):
+    """Checkpoint payload wrapping a UTXO set."""
+    import hashlib
+    data = {"utxo_snapshot": utxo_set, "account_balances": {"addr3": 300}}
+    serialized = json.dumps(data, sort_keys=True).encode("utf-8")
+    return CheckpointPayload(
+        height=height,
+        block_hash=f"{height:064x}",
+        state_hash=hashlib.sha256(serialized).hexdigest(),
+        data=data,
+    )
+
+
+def _utxo_set(count, seed=0):
+    import random
+    rng = random.Random(seed)
+    return {
+        f"XAI{i:040x}": [{"txid": f"{rng.getrandbits(256):064x}", "vout": 0, "amount": rng.random() * 100}]
+        for i in range(count)
+    }
+
+
+def _done(result):
+    future = Future()
+    future.set_result(result)
+    return future
+
+
+class TestStreamingSnapshot:
+    """Test streaming serialization and content-defined chunking."""
+
+    def test_records_match_json_dumps(self, sample_payload):
+        payload = sample_payload.to_dict()
+        payload["data"]["int_keys"] = {2: "b", 1: "a"}
+        payload["data"]["mixed"] = {"nested": {"\u00e9": [], "x": {}}, "list": [1, [2, 3], {"b": 1, "a": 2}]}
+        payload["data"]["empty"] = {}
+
+        records = list(iter_json_records(payload))
+
+        assert len(records) > 5
+        assert b"".join(records) == json.dumps(payload, sort_keys=True).encode("utf-8")
+
+    def test_chunks_bounded_and_lossless(self):
+        stream = json.dumps({"data": {"utxo_snapshot": _utxo_set(500)}}, sort_keys=True).encode()
+        records = list(iter_json_records({"data": {"utxo_snapshot": _utxo_set(500)}}))
+
+        chunks = list(content_defined_chunks(records, max_size=4096))
+
+        assert b"".join(chunks) == stream
+        assert max(len(c) for c in chunks) <= 4096
+        assert len(chunks) > len(stream) // 4096
+
+    def test_unchanged_regions_keep_chunk_hashes(self):
+        import hashlib
+        utxos = _utxo_set(2000)
+        before = [
+            hashlib.sha256(c).digest()
+            for c in content_defined_chunks(iter_json_records({"data": {"u": utxos}}), max_size=4096)
+        ]
+        utxos.pop(sorted(utxos)[1000])
+        utxos["XAI" + "f" * 40] = []
+        after = [
+            hashlib.sha256(c).digest()
+            for c in content_defined_chunks(iter_json_records({"data": {"u": utxos}}), max_size=4096)
+        ]
+
+        shared = set(before) & set(after)
+        assert len(shared) >= len(before) - 4
+
+    def test_later_snapshot_reuses_compressed_chunks(self, temp_storage):
+        service = ChunkedStateSyncService(
+            storage_dir=temp_storage,
+            chunk_size=4096,
+            enable_compression=True,
+            compression_workers=2,
+        )
+        utxos = _utxo_set(1000)
+        first, chunks = service.create_state_snapshot_chunks(100, _utxo_payload(100, utxos))
+        assert service.verify_and_apply_chunks(chunks, first.state_hash)[0]
+
+        utxos["XAI" + "0" * 39 + "g"] = []
+        second = service.stream_state_snapshot(101, _utxo_payload(101, utxos))
+
+        reloaded = [service.get_chunk(second.snapshot_id, i) for i in range(second.total_chunks)]
+        success, payload = service.verify_and_apply_chunks(reloaded, second.state_hash)
+        assert success
+        assert payload.data["utxo_snapshot"] == utxos
+
+        first_checksums = {c.checksum for c in chunks}
+        assert sum(c.checksum in first_checksums for c in reloaded) >= second.total_chunks - 3
+        assert len(list(service.chunk_store_dir.iterdir())) < first.total_chunks + 4
+
+    def test_old_snapshots_pruned_and_chunk_store_collected(self, temp_storage):
+        service = ChunkedStateSyncService(
+            storage_dir=temp_storage,
+            chunk_size=4096,
+            compression_workers=0,
+            max_snapshots=2,
+        )
+        snapshots = [
+            service.stream_state_snapshot(height, _utxo_payload(height, _utxo_set(300, seed=height)))
+            for height in (100, 101, 102)
+        ]
+
+        assert service.get_snapshot_metadata(snapshots[0].snapshot_id) is None
+        live = {
+            service.get_chunk(metadata.snapshot_id, i).checksum
+            for metadata in snapshots[1:]
+            for i in range(metadata.total_chunks)
+        }
+        assert {path.stem for path in service.chunk_store_dir.iterdir()} == live
+
+        reloaded = [service.get_chunk(snapshots[1].snapshot_id, i) for i in range(snapshots[1].total_chunks)]
+        assert service.verify_and_apply_chunks(reloaded, snapshots[1].state_hash)[0]
+
+    def test_compression_executor_shared_across_snapshots(self, temp_storage):
+        service = ChunkedStateSyncService(storage_dir=temp_storage, chunk_size=4096, compression_workers=2)
+        with patch("xai.core.p2p.chunked_sync.ProcessPoolExecutor") as pool_class:
+            pool_class.return_value.submit.side_effect = lambda fn, data: _done(fn(data))
+            service.stream_state_snapshot(100, _utxo_payload(100, _utxo_set(200)))
+            service.stream_state_snapshot(101, _utxo_payload(101, _utxo_set(200, seed=1)))
+            service.close()
+
+        assert pool_class.call_count == 1
+        pool_class.return_value.shutdown.assert_called_once()
+
+
+class TestStreamingReconstruction:
+    """Test parsing snapshots back from chunk streams."""
+
+    def test_load_json_stream_any_split(self):
+        document = {
+            "height": 7,
+            "data": {"u": _utxo_set(50), "mixed": [1.5e-7, -12, True, None, "\u00e9\"", {}, []]},
+            "work": 123456789,
+        }
+        stream = json.dumps(document, sort_keys=True).encode("utf-8")
+
+        for size in (1, 2, 7, 64, len(stream)):
+            pieces = [stream[i:i + size] for i in range(0, len(stream), size)]
+            assert load_json_stream(pieces) == document
+        assert load_json_stream([b"[1.", b"5e", b"-3, 12", b"34]"]) == [1.5e-3, 1234]
+
+    @pytest.mark.parametrize("stream", [b'{"a": 1', b'{"a": 1}x', b"[1 2]", b'{"a" 1}', b""])
+    def test_load_json_stream_rejects_invalid(self, stream):
+        with pytest.raises(ValueError):
+            load_json_stream([stream])
+
+    def test_state_digest_matches_verify_integrity(self):
+        payload = _utxo_payload(5, _utxo_set(200))
+        assert state_digest(payload.data) == payload.state_hash
+        assert payload.verify_integrity()
+
+    def test_apply_chunk_stream(self, temp_storage):
+        service = ChunkedStateSyncService(storage_dir=temp_storage, chunk_size=2048)
+        payload = _utxo_payload(100, _utxo_set(300))
+        metadata, chunks = service.create_state_snapshot_chunks(100, payload)
+
+        success, applied = service.apply_chunk_stream(
+            (chunk.decompress() for chunk in chunks), metadata.state_hash
+        )
+        assert success
+        assert applied.data == payload.data
+
+        truncated = [chunk.decompress() for chunk in chunks][:-1]
+        assert service.apply_chunk_stream(iter(truncated), metadata.state_hash) == (False, None)
+
+
 class TestCheckpointSyncIntegration:
     """Test integration with CheckpointSyncManager."""
 
@@ -174,18 +174,16 @@ class TestDDoSMemoryLimits:
         assert successful_connections == 10
         assert blocked_connections == 90
 
-    def test_last_activity_tracking(self):
-        """Test that last activity time is tracked correctly"""
-        protector = DDoSProtector()
+    def test_request_tracking_is_constant_per_ip(self):
+        """Test that an IP's state does not grow with its request count"""
+        protector = DDoSProtector(rate_limit_per_second=1000)
 
         ip = "192.168.1.1"
-        start_time = int(time.time())
-
-        protector.check_request(ip)
+        for _ in range(500):
+            protector.check_request(ip)
 
-        # Last activity should be recent
-        assert ip in protector.last_activity
-        assert protector.last_activity[ip] >= start_time
+        assert ip in protector.request_timestamps
+        assert len(protector.request_timestamps) == 1
 
     def test_cleanup_removes_from_all_dictionaries(self):
         """Test that cleanup removes IPs from all tracking dictionaries"""
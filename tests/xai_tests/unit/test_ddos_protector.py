@@ -8,8 +8,6 @@ Coverage targets:
 - Cleanup of inactive IPs to bound memory
 """
 
-from collections import deque
-
 import pytest
 
 from xai.network.ddos_protector import DDoSProtector
@@ -56,20 +54,31 @@ def test_adaptive_rate_limit_reduces_and_restores(monkeypatch):
 
 
 def test_cleanup_inactive_ips(monkeypatch):
-    """Inactive IPs pruned when max tracked exceeded."""
+    """Least recently seen IPs pruned when max tracked exceeded."""
     protector = DDoSProtector(max_tracked_ips=2, time_window_seconds=1)
-    protector.request_timestamps = {
-        "old1": deque(),
-        "old2": deque([0]),
-        "active": deque([100]),
-    }
-    protector.active_connections = {"old1": 0, "old2": 0, "active": 1}
-    protector.last_activity = {"old1": 0, "old2": 0, "active": 100}
-    protector.request_timestamps.setdefault("new", deque())
-    monkeypatch.setattr("time.time", lambda: 200)
-
+    now = [0]
+    monkeypatch.setattr("time.time", lambda: now[0])
+
+    protector.check_request("old1")
+    protector.check_request("old2")
+    now[0] = 100
+    protector.check_request("active")
+    now[0] = 200
+    protector.check_request("active")
     protector.check_request("new")
 
     assert "old1" not in protector.request_timestamps  # removed as inactive
+    assert "old2" not in protector.request_timestamps
     assert "active" in protector.request_timestamps
     assert "new" in protector.request_timestamps
+
+
+def test_weighted_requests(monkeypatch):
+    """Expensive requests consume several units of the per-IP budget."""
+    protector = DDoSProtector(rate_limit_per_second=10, time_window_seconds=1)
+    monkeypatch.setattr("time.time", lambda: 0)
+
+    assert protector.check_request("1.1.1.1", cost=8) is True
+    assert protector.check_request("1.1.1.1", cost=3) is False
+    assert protector.check_request("1.1.1.1", cost=2) is True
+    assert protector.check_request("1.1.1.1") is False
@@ -7,9 +7,11 @@ Tests the complete reward distribution flow:
 - Reward claiming
 - Dust handling
 """
+import random
+
 import pytest
 
-from xai.core.defi.staking import StakingPool, Validator, Delegation, ValidatorStatus
+from xai.core.defi.staking import REWARD_PRECISION, StakingPool, Validator, Delegation, ValidatorStatus
 
 
 class TestDelegatorRewardDistribution:
@@ -387,3 +389,171 @@ class TestDelegatorRewardDistribution:
 
         info = pool.get_delegation_info("0xNonExistent", val_addr)
         assert info["accumulated_rewards"] == 0
+
+
+def _reference_distribution(pool, total_rewards):
+    """Per-delegation loop the accumulator replaced: floor shares, dust to validator."""
+    delegator_rewards = {}
+    validator_rewards = {}
+    for val_addr, validator in pool.validators.items():
+        if validator.total_stake == 0:
+            continue
+        val_share = (total_rewards * validator.total_stake) // pool.total_staked
+        commission = (val_share * validator.commission) // pool.BASIS_POINTS
+        remaining = val_share - commission
+        distributed = 0
+        if remaining > 0 and validator.delegated_stake > 0:
+            for delegator, del_map in pool.delegations.items():
+                if val_addr in del_map:
+                    share = (remaining * del_map[val_addr].amount) // validator.delegated_stake
+                    delegator_rewards[(delegator, val_addr)] = share
+                    distributed += share
+        validator_rewards[val_addr] = commission + remaining - distributed
+    return delegator_rewards, validator_rewards
+
+
+def _assert_accumulator_balances(pool):
+    """Outstanding rewards equal pending accruals plus remainder and dust, exactly."""
+    for val_addr, validator in pool.validators.items():
+        accrued = 0
+        reward_stake = 0
+        for del_map in pool.delegations.values():
+            delegation = del_map.get(val_addr)
+            if delegation is not None:
+                accrued += delegation.reward_amount * validator.acc_reward_per_share - delegation.reward_debt
+                reward_stake += delegation.reward_amount
+        assert validator.reward_stake == reward_stake
+        assert validator.outstanding_delegator_rewards * REWARD_PRECISION == (
+            accrued + validator.reward_remainder + validator.reward_dust
+        )
+
+
+class TestRewardAccumulator:
+    """Test the per-share reward accumulator and its dust accounting."""
+
+    def _pool_with_delegators(self, rng, count):
+        pool = StakingPool(owner="0xOwner")
+        validators = ["0xValidatorA", "0xValidatorB"]
+        pool.register_validator(validators[0], "A", 700, 10_000 * 10**18 + rng.randrange(10**18))
+        pool.register_validator(validators[1], "B", 333, 25_000 * 10**18 + rng.randrange(10**18))
+        for i in range(count):
+            amount = pool.min_delegation + rng.randrange(10**24)
+            pool.delegate(f"0xDelegator{i}", rng.choice(validators), amount)
+        return pool
+
+    def test_single_distribution_within_one_unit_of_per_delegation_loop(self):
+        rng = random.Random(11)
+        pool = self._pool_with_delegators(rng, 60)
+        total_rewards = 12_345 * 10**18 + 6789
+        expected_delegators, expected_validators = _reference_distribution(pool, total_rewards)
+
+        pool.distribute_rewards("0xOwner", total_rewards)
+        _assert_accumulator_balances(pool)
+
+        for delegator, del_map in pool.delegations.items():
+            for val_addr, delegation in list(del_map.items()):
+                expected = expected_delegators[(delegator, val_addr)]
+                claimed = pool.claim_rewards(delegator, val_addr)
+                assert expected - 1 <= claimed <= expected
+                expected_validators[val_addr] += expected - claimed
+                pool.undelegate(delegator, val_addr, delegation.amount)
+        # Every unit a delegator did not receive ends up with the validator
+        for val_addr, validator in pool.validators.items():
+            assert validator.accumulated_rewards == expected_validators[val_addr]
+            assert validator.outstanding_delegator_rewards == 0
+            assert validator.reward_remainder == validator.reward_dust == 0
+
+    def test_rewards_conserved_across_distributions_and_stake_changes(self):
+        rng = random.Random(5)
+        pool = self._pool_with_delegators(rng, 40)
+        # Several delegators share an amount
+        for i in range(10):
+            pool.delegate(f"0xTwin{i}", "0xValidatorA", pool.min_delegation)
+        distributed = 0
+        claimed = 0
+        for round_number in range(60):
+            amount = rng.randrange(1, 10**6) if round_number % 2 else rng.randrange(10**21)
+            pool.distribute_rewards("0xOwner", amount)
+            distributed += amount
+            delegator = rng.choice(list(pool.delegations))
+            val_addr = rng.choice(list(pool.delegations[delegator]))
+            action = rng.random()
+            if action < 0.3:
+                claimed += pool.claim_rewards(delegator, val_addr)
+            elif action < 0.6:
+                pool.delegate(delegator, val_addr, pool.min_delegation)
+            elif action < 0.9:
+                delegation = pool.delegations[delegator][val_addr]
+                pool.undelegate(delegator, val_addr, delegation.amount // 2)
+            else:
+                pool.slash_validator("0xOwner", val_addr, "downtime", 100)
+            _assert_accumulator_balances(pool)
+            validator_total = sum(v.accumulated_rewards for v in pool.validators.values())
+            outstanding = sum(v.outstanding_delegator_rewards for v in pool.validators.values())
+            assert claimed + validator_total + outstanding <= distributed
+
+        for delegator, del_map in pool.delegations.items():
+            for val_addr, delegation in del_map.items():
+                claimed += pool.claim_rewards(delegator, val_addr)
+                pool.undelegate(delegator, val_addr, delegation.amount)
+
+        validator_total = sum(v.accumulated_rewards for v in pool.validators.values())
+        for validator in pool.validators.values():
+            assert validator.outstanding_delegator_rewards == 0
+            assert validator.reward_remainder == validator.reward_dust == 0
+        # Only the validator-level split across validators may round down
+        assert distributed - len(pool.validators) * 60 <= claimed + validator_total <= distributed
+
+    def test_small_distributions_accumulate_for_delegators(self):
+        pool = StakingPool(owner="0xOwner")
+        pool.register_validator("0xValidator1", "Val1", 0, 10_000 * 10**18)
+        for i in range(3):
+            pool.delegate(f"0xDelegator{i}", "0xValidator1", pool.min_delegation)
+        validator = pool.validators["0xvalidator1"]
+        delegations = [pool.delegations[f"0xdelegator{i}"]["0xvalidator1"] for i in range(3)]
+
+        for _ in range(5):
+            pool._distribute_delegator_rewards("0xvalidator1", validator, 1)
+
+        # The remainder is carried instead of being lost to dust each time
+        assert [d.accumulated_rewards for d in delegations] == [1, 1, 1]
+        assert validator.accumulated_rewards == 0
+        assert validator.outstanding_delegator_rewards == 5
+        _assert_accumulator_balances(pool)
+
+        for i in range(3):
+            assert pool.claim_rewards(f"0xDelegator{i}", "0xValidator1") == 1
+            pool.undelegate(f"0xDelegator{i}", "0xValidator1", pool.min_delegation)
+        # Fractional dust is paid out to the validator in whole units
+        assert validator.accumulated_rewards == 2
+        assert validator.outstanding_delegator_rewards == 0
+
+    def test_distribution_is_constant_time(self):
+        pool = StakingPool(owner="0xOwner")
+        pool.register_validator("0xValidator1", "Val1", 500, 10_000 * 10**18)
+        for i in range(50):
+            pool.delegate(f"0xDelegator{i}", "0xValidator1", pool.min_delegation + i)
+        validator = pool.validators["0xvalidator1"]
+
+        class _NoIteration(dict):
+            def __iter__(self):
+                raise AssertionError("distribution iterated delegations")
+
+            items = values = keys = __iter__
+
+        pool.delegations = _NoIteration(pool.delegations)
+        assert pool._distribute_delegator_rewards("0xvalidator1", validator, 10**18) == 10**18
+        assert validator.outstanding_delegator_rewards == 10**18
+
+    def test_distribution_does_not_touch_delegations(self):
+        pool = StakingPool(owner="0xOwner")
+        pool.register_validator("0xValidator1", "Val1", 500, 10_000 * 10**18)
+        pool.delegate("0xDelegator1", "0xValidator1", 10_000 * 10**18)
+        delegation = pool.delegations["0xdelegator1"]["0xvalidator1"]
+        debt = delegation.reward_debt
+
+        pool.distribute_rewards("0xOwner", 1000 * 10**18)
+
+        assert delegation.reward_debt == debt
+        assert delegation.settled_rewards == 0
+        assert delegation.accumulated_rewards == 950 * 10**18
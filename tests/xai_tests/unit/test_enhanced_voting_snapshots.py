@@ -0,0 +1,128 @@
+"""
+Tests for height-pinned voting power in EnhancedVotingSystem.
+
+Voting power comes from a balance snapshot taken once per proposal and
+address, verification sweeps only re-check voters touched by new blocks,
+and proposal totals are running sums.
+"""
+
+import pytest
+
+from xai.core.governance.enhanced_voting_system import EnhancedVotingSystem
+
+NO_DONATIONS = {"total_minutes_donated": 0, "total_tokens_donated": 0, "total_usd_value": 0}
+
+
+class _Chain:
+    """Blocks are dicts; balances are set directly and their reads counted."""
+
+    def __init__(self, balances):
+        self.balances = dict(balances)
+        self.blocks = [{"index": 0, "hash": "h0", "transactions": []}]
+        self.balance_reads = 0
+
+    def get_balance(self, address):
+        self.balance_reads += 1
+        return self.balances.get(address, 0)
+
+    def get_height(self):
+        return len(self.blocks) - 1
+
+    def get_block(self, index):
+        return self.blocks[index] if 0 <= index < len(self.blocks) else None
+
+    def mine(self, *transfers):
+        index = len(self.blocks)
+        transactions = []
+        for sender, recipient, amount in transfers:
+            self.balances[sender] -= amount
+            self.balances[recipient] = self.balances.get(recipient, 0) + amount
+            transactions.append({"sender": sender, "recipient": recipient, "amount": amount})
+        self.blocks.append({"index": index, "hash": f"h{index}", "transactions": transactions})
+
+
+@pytest.fixture
+def chain():
+    return _Chain({f"voter{i}": 100.0 for i in range(10)})
+
+
+def _vote_all(voting, chain, proposal_id="p1", vote="for"):
+    for address in list(chain.balances):
+        assert voting.submit_vote(proposal_id, address, vote, NO_DONATIONS)["success"]
+
+
+class TestVotingSnapshots:
+    """Test snapshot balances, incremental sweeps and running totals."""
+
+    def test_balance_read_once_per_voter(self, chain):
+        voting = EnhancedVotingSystem(chain)
+        _vote_all(voting, chain)
+        _vote_all(voting, chain, vote="against")  # Re-votes reuse the snapshot
+
+        assert chain.balance_reads == 10
+        proposal = voting.proposals["p1"]
+        assert proposal["votes_for"] == pytest.approx(0)
+        assert proposal["votes_against"] == pytest.approx(10 * 100.0 * voting.coin_weight)
+        assert proposal["snapshot_height"] == 0
+
+    def test_historical_balance_used_when_available(self, chain):
+        chain.get_balance_at_height = lambda address, height: 40.0 if height == 0 else 0.0
+        voting = EnhancedVotingSystem(chain)
+        chain.mine()
+        assert voting.open_proposal("p1", snapshot_height=0) == 0
+
+        result = voting.submit_vote("p1", "voter0", "for", NO_DONATIONS)
+        assert result["breakdown"]["xai_balance"] == 40.0
+        assert chain.balance_reads == 0
+
+    def test_sweep_checks_only_touched_voters(self, chain):
+        voting = EnhancedVotingSystem(chain)
+        _vote_all(voting, chain)
+
+        first = voting.verify_all_votes_for_proposal("p1")["results"]
+        assert first["full_sweep"] and first["checked"] == 10
+
+        chain.mine(("voter3", "outsider", 60.0), ("outsider", "voter4", 1.0))
+        chain.balance_reads = 0
+        second = voting.verify_all_votes_for_proposal("p1")["results"]
+
+        assert not second["full_sweep"]
+        assert second["checked"] == chain.balance_reads == 1
+        assert [v["address"] for v in second["invalid_voters"]] == ["voter3"]
+        assert second["verified"] == 9
+        assert voting.proposals["p1"]["votes_for"] == pytest.approx(9 * 100.0 * voting.coin_weight)
+
+    def test_late_vote_checked_on_next_sweep(self, chain):
+        voting = EnhancedVotingSystem(chain)
+        voting.submit_vote("p1", "voter0", "for", NO_DONATIONS)
+        voting.verify_all_votes_for_proposal("p1")
+
+        # voter1's snapshot balance is read, then they sell before the sweep
+        voting.submit_vote("p1", "voter1", "for", NO_DONATIONS)
+        chain.balances["voter1"] = 10.0
+        results = voting.verify_all_votes_for_proposal("p1")["results"]
+
+        assert results["checked"] == 1
+        assert results["invalidated"] == 1
+
+    def test_reorg_forces_full_sweep(self, chain):
+        voting = EnhancedVotingSystem(chain)
+        _vote_all(voting, chain)
+        chain.mine()
+        voting.verify_all_votes_for_proposal("p1")
+
+        chain.blocks[1]["hash"] = "replaced"
+        results = voting.verify_all_votes_for_proposal("p1")["results"]
+        assert results["full_sweep"] and results["checked"] == 10
+
+    def test_invalidation_subtracts_once(self, chain):
+        voting = EnhancedVotingSystem(chain)
+        _vote_all(voting, chain)
+        chain.balances["voter0"] = 0.0
+
+        for _ in range(3):
+            voting.verify_voter_still_holds_coins("p1", "voter0")
+            voting.verify_all_votes_for_proposal("p1")
+
+        assert voting.proposals["p1"]["votes_for"] == pytest.approx(9 * 100.0 * voting.coin_weight)
+        assert voting.proposals["p1"]["voters"]["voter0"]["voting_power"] == 0
@@ -0,0 +1,192 @@
+"""
+Tests for memoized elliptic-curve precompile results.
+
+Repeated calls with the same input must return exactly what the uncached
+precompile returns and charge the same gas, gas must still be checked on
+every call, and deterministic failures must be cached and re-raised.
+"""
+
+import pytest
+from py_ecc.optimized_bn128 import FQ, G1, G2, add, multiply, neg, normalize
+
+from xai.core.vm.evm.executor import EVMPrecompiles, PrecompileCache
+from xai.core.vm.exceptions import VMExecutionError
+
+
+def _g1(point) -> bytes:
+    x, y = normalize(point)
+    return int(x).to_bytes(32, "big") + int(y).to_bytes(32, "big")
+
+
+def _g2(point) -> bytes:
+    x, y = normalize(point)
+    # EIP-197 encodes the imaginary coefficient first
+    return b"".join(int(c).to_bytes(32, "big") for c in (x.coeffs[1], x.coeffs[0], y.coeffs[1], y.coeffs[0]))
+
+
+def _g2_coeff_order(point) -> bytes:
+    """G2 encoding the pairing precompile decodes as a point on the curve."""
+    x, y = normalize(point)
+    return b"".join(int(c).to_bytes(32, "big") for c in (x.coeffs[0], x.coeffs[1], y.coeffs[0], y.coeffs[1]))
+
+
+def _affine(point):
+    x, y = normalize(point)
+    return (FQ(int(x)), FQ(int(y)), FQ(1))
+
+
+def _projective(point) -> bytes:
+    return b"".join(int(c).to_bytes(32, "big") for c in point[:2])
+
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    EVMPrecompiles.clear_caches()
+    yield
+    EVMPrecompiles.clear_caches()
+
+
+def _count_calls(monkeypatch, name):
+    calls = []
+    original = getattr(EVMPrecompiles, name)
+    monkeypatch.setattr(EVMPrecompiles, name, lambda data: calls.append(data) or original(data))
+    return calls
+
+
+class TestPairingCache:
+    """Test ECPAIRING results and decoded G2 points are reused."""
+
+    def test_repeated_pairing_is_computed_once(self, monkeypatch):
+        calls = _count_calls(monkeypatch, "_ecpairing_uncached")
+        data = bytes(64) + _g2_coeff_order(multiply(G2, 5)) + bytes(64) + _g2_coeff_order(G2)
+
+        first = EVMPrecompiles.execute_precompile(EVMPrecompiles.ECPAIRING, data, gas=200_000)
+        second = EVMPrecompiles.execute_precompile(EVMPrecompiles.ECPAIRING, data, gas=200_000)
+
+        assert first == second == ((1).to_bytes(32, "big"), 160_000)
+        assert len(calls) == 1
+        assert EVMPrecompiles.get_cache_stats()["results"]["hits"] == 1
+
+    def test_gas_checked_before_cache(self):
+        data = bytes(64) + _g2(G2)
+        assert EVMPrecompiles.execute_precompile(EVMPrecompiles.ECPAIRING, data, gas=80_000)[0] == bytes(32)
+        with pytest.raises(VMExecutionError, match="Out of gas for ECPAIRING"):
+            EVMPrecompiles.execute_precompile(EVMPrecompiles.ECPAIRING, data, gas=79_999)
+
+    def test_g2_points_decoded_once(self):
+        pair = bytes(64) + _g2_coeff_order(G2)
+        for pairs in (1, 2):
+            EVMPrecompiles.execute_precompile(EVMPrecompiles.ECPAIRING, pair * pairs, gas=160_000)
+
+        stats = EVMPrecompiles.get_cache_stats()
+        assert stats["results"]["misses"] == 2  # Different inputs
+        g2_stats = stats["bn128_g2_points"]
+        assert (g2_stats["hits"], g2_stats["misses"]) == (2, 1)
+
+    def test_invalid_g2_point_fails_pairing(self):
+        bad_g2 = bytearray(_g2_coeff_order(G2))
+        bad_g2[-1] ^= 1
+        output, _ = EVMPrecompiles.execute_precompile(
+            EVMPrecompiles.ECPAIRING, bytes(64) + bytes(bad_g2), gas=80_000
+        )
+        assert output == bytes(32)
+
+    def test_uncached_errors_still_propagate(self, monkeypatch):
+        calls = _count_calls(monkeypatch, "_ecpairing_uncached")
+        data = _g1(G1) + _g2_coeff_order(G2)
+        # Finite G1 points are rejected with a TypeError by the precompile itself
+        for _ in range(2):
+            with pytest.raises(TypeError):
+                EVMPrecompiles.execute_precompile(EVMPrecompiles.ECPAIRING, data, gas=80_000)
+        assert len(calls) == 2
+
+
+class TestCurveArithmeticCache:
+    """Test ECADD/ECMUL outputs and cache keys."""
+
+    def test_cached_outputs_match_uncached(self):
+        p = _affine(multiply(G1, 5))
+        for _ in range(2):
+            assert EVMPrecompiles.execute_precompile(EVMPrecompiles.ECADD, _g1(p) + _g1(p), gas=150) == (
+                _projective(add(p, p)),
+                150,
+            )
+            assert EVMPrecompiles.execute_precompile(
+                EVMPrecompiles.ECMUL, _g1(p) + (3).to_bytes(32, "big"), gas=6000
+            ) == (_projective(multiply(p, 3)), 6000)
+        assert EVMPrecompiles.get_cache_stats()["results"]["hits"] == 2
+
+    def test_padded_inputs_share_entry(self, monkeypatch):
+        calls = _count_calls(monkeypatch, "_ecmul_uncached")
+        short = _g1(G1) + b"\x07"
+        EVMPrecompiles.execute_precompile(EVMPrecompiles.ECMUL, short, gas=6000)
+        EVMPrecompiles.execute_precompile(EVMPrecompiles.ECMUL, short + bytes(31) + b"trailing", gas=6000)
+        assert len(calls) == 1
+
+
+class TestPointEvaluationCache:
+    """Test valid proofs and deterministic failures are cached."""
+
+    def test_valid_proof_verified_once(self, monkeypatch):
+        calls = _count_calls(monkeypatch, "_point_evaluation_uncached")
+        commitment = bytes.fromhex(
+            "b0e7791fb972fe014159aa33a98622da3cdc98ff707965e536d8636b5fcc5ac7a91a8c46e59a00dca575af0f18fb13dc"
+        )
+        payload = (
+            EVMPrecompiles._kzg_to_versioned_hash(commitment)
+            + (3).to_bytes(32, "big")
+            + (5).to_bytes(32, "big")
+            + commitment
+            + bytes.fromhex("c0" + "0" * 94)
+        )
+
+        results = [
+            EVMPrecompiles.execute_precompile(EVMPrecompiles.POINT_EVALUATION, payload, gas=50_000)
+            for _ in range(2)
+        ]
+        assert results[0] == results[1]
+        assert results[0][0][32:] == EVMPrecompiles._KZG_BLS_MODULUS.to_bytes(32, "big")
+        assert len(calls) == 1
+
+    def test_failed_verification_cached_and_reraised(self, monkeypatch):
+        calls = _count_calls(monkeypatch, "_point_evaluation_uncached")
+        commitment = bytes.fromhex(
+            "b0e7791fb972fe014159aa33a98622da3cdc98ff707965e536d8636b5fcc5ac7a91a8c46e59a00dca575af0f18fb13dc"
+        )
+        payload = (
+            EVMPrecompiles._kzg_to_versioned_hash(commitment)
+            + (3).to_bytes(32, "big")
+            + (6).to_bytes(32, "big")  # Wrong evaluation, valid proof is for y = 5
+            + commitment
+            + bytes.fromhex("c0" + "0" * 94)
+        )
+
+        for _ in range(2):
+            with pytest.raises(VMExecutionError, match="proof verification failed"):
+                EVMPrecompiles.execute_precompile(EVMPrecompiles.POINT_EVALUATION, payload, gas=50_000)
+        assert len(calls) == 1
+
+    def test_cached_error_keeps_type_and_args(self):
+        class ProofError(VMExecutionError):
+            pass
+
+        def fail(data):
+            raise ProofError("bad proof", revert_data=b"\x01")
+
+        for _ in range(2):
+            with pytest.raises(ProofError) as excinfo:
+                EVMPrecompiles._memoized("0x0a", b"input", fail)
+            assert excinfo.value.args == ("bad proof",)
+            assert excinfo.value.revert_data == b"\x01"
+
+
+def test_precompile_cache_evicts_least_recently_used():
+    cache = PrecompileCache(max_size=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+    cache.put("c", 3)
+
+    assert (cache.get("a"), cache.get("c")) == (1, 3)
+    cache.get("b")  # Evicted
+    assert cache.stats() == {"hits": 3, "misses": 1, "hit_rate": 0.75, "size": 2, "max_size": 2}
@@ -0,0 +1,170 @@
+"""
+Tests for the EVM pre-decoded execution mode.
+
+The pre-decoded loop must be observably identical to the per-instruction
+loop: same stack, memory, storage, output and remaining gas, and the same
+failures.
+"""
+
+import random
+
+import pytest
+
+from xai.core.vm.evm.context import BlockContext, CallContext, CallType, ExecutionContext
+from xai.core.vm.evm.decoder import KIND_PUSH, decode_program
+from xai.core.vm.evm.interpreter import EVMInterpreter
+from xai.core.vm.evm.opcodes import Opcode
+from xai.core.vm.exceptions import VMExecutionError
+
+CONTRACT = "0x" + "2" * 40
+
+
+def _context() -> ExecutionContext:
+    block = BlockContext(
+        number=1,
+        timestamp=1000,
+        coinbase="0x" + "0" * 40,
+        gas_limit=10_000_000,
+        chain_id=1,
+        prevrandao=0,
+        base_fee=1000,
+    )
+    return ExecutionContext(
+        block=block,
+        tx_origin="0x" + "1" * 40,
+        tx_gas_price=1,
+        tx_gas_limit=1_000_000,
+        tx_value=0,
+    )
+
+
+def _run(code: bytes, predecode: bool, gas: int = 1_000_000):
+    context = _context()
+    call = CallContext(
+        call_type=CallType.CALL,
+        depth=0,
+        address=CONTRACT,
+        caller="0x" + "1" * 40,
+        origin="0x" + "1" * 40,
+        value=0,
+        gas=gas,
+        code=code,
+        calldata=b"",
+    )
+    context.push_call(call)
+    interpreter = EVMInterpreter(context, predecode=predecode)
+    try:
+        interpreter.execute(call)
+        error = None
+    except VMExecutionError as e:
+        error = type(e)
+    return {
+        "error": error,
+        "stack": list(call.stack._stack) if error is None else None,
+        "gas": call.gas if error is None else None,
+        "output": call.output,
+        "reverted": call.reverted,
+        "storage": {k: v.current for k, v in context.get_storage(CONTRACT)._slots.items()} if error is None else None,
+    }
+
+
+def _push(value: int) -> bytes:
+    size = max(1, (value.bit_length() + 7) // 8)
+    return bytes([0x5F + size]) + value.to_bytes(size, "big")
+
+
+def _loop(iterations: int) -> bytes:
+    """Count down from ``iterations`` with a JUMPI back-edge, then RETURN the counter slot."""
+    code = bytearray()
+    code += _push(iterations)
+    loop_start = len(code)
+    code += bytes([Opcode.JUMPDEST])
+    code += _push(1) + bytes([Opcode.SWAP1, Opcode.SUB])  # counter - 1
+    code += bytes([Opcode.DUP1, Opcode.GAS, Opcode.POP])
+    code += _push(loop_start) + bytes([Opcode.JUMPI])
+    code += _push(0) + bytes([Opcode.SSTORE])
+    code += _push(0) + _push(0) + bytes([Opcode.MSTORE])
+    code += _push(32) + _push(0) + bytes([Opcode.RETURN])
+    return bytes(code)
+
+
+@pytest.fixture(autouse=True)
+def _clear_caches():
+    EVMInterpreter.clear_cache()
+    yield
+    EVMInterpreter.clear_cache()
+
+
+class TestDecoder:
+    """Tests for bytecode decoding."""
+
+    def test_push_immediates_and_truncated_push(self):
+        code = bytes([0x61, 0x01, 0x02, 0x62, 0xFF])  # PUSH2 0x0102, PUSH3 truncated
+        program = decode_program(code, set(), lambda op: None)
+        assert [i[0] for i in program.instructions] == [KIND_PUSH, KIND_PUSH]
+        assert program.instructions[0][1] == 0x0102
+        assert program.instructions[1][1] == 0xFF0000
+
+    def test_blocks_split_at_jumpdest_and_gas_observers(self):
+        # PUSH1 1, JUMPDEST, GAS, ADD, STOP
+        code = bytes([0x60, 0x01, 0x5B, 0x5A, 0x01, 0x00])
+        program = decode_program(code, {2}, lambda op: (lambda *_: None))
+        leaders = [(i[3], i[4], i[5]) for i in program.instructions if i[5]]
+        # [PUSH1] | [JUMPDEST, GAS] | [ADD, STOP]
+        assert leaders == [(0, 3, 1), (2, 1 + 2, 2), (4, 3, 2)]
+        assert program.block_count == 3
+
+    def test_program_cached_per_code_hash(self):
+        code = _loop(3)
+        _run(code, predecode=True)
+        _run(code, predecode=True)
+        stats = EVMInterpreter.get_cache_stats()
+        assert stats["program_misses"] == 1
+        assert stats["program_hits"] == 1
+
+
+class TestEquivalence:
+    """Pre-decoded and per-instruction execution must agree."""
+
+    @pytest.mark.parametrize(
+        "code",
+        [
+            _loop(1),
+            _loop(25),
+            bytes([0x60, 0x05, 0x60, 0x07, 0x02, 0x58, 0x00]),  # MUL, PC
+            bytes([0x60, 0x10, 0x56, 0x00]),  # invalid jump
+            bytes([0x60, 0x01, 0x0C]),  # undefined opcode
+            bytes([0x01]),  # stack underflow
+            bytes([0x60, 0x00, 0x60, 0x00, 0xFD]),  # REVERT
+            bytes([0x60, 0x01, 0x60, 0x00, 0x55, 0x5F, 0x54]),  # SSTORE, PUSH0, SLOAD
+            bytes([0x60, 0x01, 0x60, 0x00, 0xA0]),  # LOG0
+        ],
+    )
+    def test_same_outcome(self, code):
+        assert _run(code, predecode=True) == _run(code, predecode=False)
+
+    def test_out_of_gas_inside_loop(self):
+        code = _loop(1000)
+        for gas in (50, 5_000, 30_000):
+            assert _run(code, True, gas=gas) == _run(code, False, gas=gas)
+
+    def test_random_straight_line_programs(self):
+        rng = random.Random(3)
+        pool = [0x01, 0x02, 0x03, 0x04, 0x06, 0x10, 0x11, 0x14, 0x15, 0x16, 0x17, 0x18, 0x19,
+                0x1B, 0x1C, 0x50, 0x58, 0x5A, 0x5F, 0x80, 0x81, 0x90, 0x91]
+        for _ in range(200):
+            code = bytearray()
+            for _ in range(rng.randint(1, 40)):
+                if rng.random() < 0.4:
+                    code += _push(rng.getrandbits(rng.choice((8, 64, 256))))
+                else:
+                    code.append(rng.choice(pool))
+            code = bytes(code)
+            gas = rng.randint(10, 400)
+            assert _run(code, True, gas=gas) == _run(code, False, gas=gas)
+
+
+def test_instruction_limit_enforced(monkeypatch):
+    monkeypatch.setattr(EVMInterpreter, "MAX_INSTRUCTIONS", 100)
+    result = _run(_loop(1000), predecode=True)
+    assert result["error"] is VMExecutionError
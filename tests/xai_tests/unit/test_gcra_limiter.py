@@ -0,0 +1,118 @@
+"""
+Tests for the GCRA rate limiter and the limiters built on it.
+
+Per-key state is a single timestamp in a bounded LRU table; limits must
+hold exactly at their boundary, support weighted costs and rate changes,
+and stay bounded under floods of distinct keys.
+"""
+
+import time
+
+import pytest
+
+from xai.core.api.api_websocket import WebSocketLimiter
+from xai.network.gcra_limiter import GCRALimiter
+
+
+class TestGCRALimiter:
+    """Test admission, weights, adaptivity and eviction."""
+
+    @pytest.mark.parametrize("rate, period", [(1, 1), (3, 1), (10, 1), (100, 60), (7, 0.5)])
+    def test_burst_then_sustained_rate(self, rate, period):
+        limiter = GCRALimiter(rate=rate, period=period)
+
+        assert sum(limiter.allow("k", now=10.0) for _ in range(rate + 3)) == rate
+        assert not limiter.allow("k", now=10.0 + period / rate * 0.9)
+        assert limiter.allow("k", now=10.0 + period / rate)
+        assert not limiter.allow("k", now=10.0 + period / rate)
+
+    def test_wall_clock_timestamps(self):
+        """Large absolute timestamps must not cost precision."""
+        limiter = GCRALimiter(rate=1000, period=1)
+        now = time.time()
+        for i in range(5000):
+            assert limiter.allow("k", now=now + i / 1000 + 1e-6)
+
+    def test_retry_after(self):
+        limiter = GCRALimiter(rate=4, period=1)
+        for _ in range(4):
+            assert limiter.check("k", now=0) == (True, 0.0)
+        allowed, retry_after = limiter.check("k", now=0)
+        assert not allowed
+        assert retry_after == pytest.approx(0.25)
+
+    def test_weighted_costs(self):
+        limiter = GCRALimiter(rate=10, period=1)
+        assert limiter.allow("k", cost=7, now=0)
+        assert not limiter.allow("k", cost=4, now=0)
+        assert limiter.allow("k", cost=3, now=0)
+        assert not limiter.allow("k", cost=1, now=0)
+        assert not limiter.allow("other", cost=11, now=0)  # More than the burst ever allows
+        assert "other" not in limiter
+
+    def test_set_rate_keeps_state(self):
+        limiter = GCRALimiter(rate=10, period=1)
+        for _ in range(10):
+            assert limiter.allow("k", now=0)
+
+        limiter.set_rate(5)
+        assert not limiter.allow("k", now=0.1)  # Would pass at the old rate
+        assert limiter.allow("k", now=0.2)
+        limiter.set_rate(20)
+        assert limiter.allow("k", now=0.25)  # Drains at the new rate
+        assert not limiter.allow("k", now=0.25)
+
+    def test_keys_bounded_least_recently_used_evicted(self):
+        limiter = GCRALimiter(rate=1, period=1, max_keys=3)
+        for key in ("a", "b", "c"):
+            limiter.allow(key, now=0)
+        limiter.allow("a", now=5)  # Refresh "a"
+        limiter.allow("d", now=5)
+
+        assert len(limiter) == 3
+        assert "b" not in limiter
+        assert {"a", "c", "d"} <= {k for k in ("a", "b", "c", "d") if k in limiter}
+        assert limiter.stats()["evicted_keys"] == 1
+        assert limiter.stats()["evicted_active_keys"] == 0  # "b" was idle
+
+    def test_flood_of_distinct_keys_stays_bounded(self):
+        limiter = GCRALimiter(rate=5, period=1, max_keys=1000)
+        for i in range(20_000):
+            assert limiter.allow(f"10.{i >> 16}.{(i >> 8) & 255}.{i & 255}", now=i * 1e-4)
+        assert len(limiter) == 1000
+
+    def test_forget(self):
+        limiter = GCRALimiter(rate=1, period=60)
+        assert limiter.allow("k", now=0)
+        assert not limiter.allow("k", now=0)
+        limiter.forget("k")
+        assert limiter.allow("k", now=0)
+
+    def test_rejects_invalid_limits(self):
+        with pytest.raises(ValueError, match="rate"):
+            GCRALimiter(rate=0)
+        with pytest.raises(ValueError, match="max_keys"):
+            GCRALimiter(rate=1, max_keys=0)
+
+
+class TestWebSocketMessageRate:
+    """Test WebSocketLimiter message rate limiting."""
+
+    def test_message_rate_limit(self):
+        limiter = WebSocketLimiter()
+        limiter.MESSAGE_RATE_LIMIT = 3
+
+        assert [limiter.check_message_rate("c1")[0] for _ in range(4)] == [True, True, True, False]
+        assert limiter.check_message_rate("c2") == (True, None)
+
+        limiter.register_connection("c1", "127.0.0.1")
+        limiter.unregister_connection("c1", "127.0.0.1")
+        assert limiter.check_message_rate("c1") == (True, None)
+
+    def test_limit_above_previous_history_cap(self):
+        """Limits over 100/minute are enforced (the old per-client log held 100 entries)."""
+        limiter = WebSocketLimiter()
+        limiter.MESSAGE_RATE_LIMIT = 150
+
+        results = [limiter.check_message_rate("c1")[0] for _ in range(200)]
+        assert results.count(True) == 150
@@ -0,0 +1,167 @@
+"""
+Tests for the lending pool liquidation index.
+
+Verifies that the batch liquidation query returns exactly the positions a
+full health-factor scan finds, and that the index follows position changes
+and price updates.
+"""
+
+import random
+
+import pytest
+
+from xai.core.defi.lending import AssetConfig, LendingPool
+from xai.core.defi.liquidation_index import LiquidationIndex
+
+OWNER = "owner_address"
+ETH_PRICE = 2000_000_000_000
+USD_PRICE = 1_000_000_000
+
+
+def _scan(pool):
+    """Full scan over borrowers that the index replaces."""
+    return {
+        user for user, position in pool.positions.items()
+        if any(position.borrowed.values()) and pool.get_health_factor(user) < pool.RAY
+    }
+
+
+@pytest.fixture
+def pool():
+    pool = LendingPool(name="Test Pool", owner=OWNER)
+    pool.add_asset(OWNER, AssetConfig(
+        symbol="ETH", address="0xETH", ltv=7500, liquidation_threshold=8000, liquidation_bonus=500,
+    ))
+    pool.add_asset(OWNER, AssetConfig(
+        symbol="USDC", address="0xUSDC", ltv=8000, liquidation_threshold=8500, liquidation_bonus=400,
+    ))
+    pool.set_price_oracle(OWNER, "ETH", ETH_PRICE)
+    pool.set_price_oracle(OWNER, "USDC", USD_PRICE)
+    pool.supply("lp", "USDC", 10**26)
+    return pool
+
+
+def _open(pool, user, eth, usdc_debt):
+    pool.supply(user, "ETH", eth)
+    pool.borrow(user, "USDC", usdc_debt)
+
+
+class TestLiquidationIndex:
+    """Test the standalone bucketed index."""
+
+    def test_candidates_below_threshold(self):
+        index = LiquidationIndex(bucket_bps=100)
+        index.update("a", "ETH", "USDC", 1.50)
+        index.update("b", "ETH", "USDC", 1.90)
+        index.update("c", "ETH", "USDC", 5.00)
+        index.update("d", "BTC", "USDC", 1.00)
+
+        assert index.ratio("a") == 1.50
+        assert index.candidates("ETH", "USDC", 1.50) == set()
+        assert index.candidates("ETH", "USDC", 1.501) == {"a"}
+        assert index.candidates("ETH", "USDC", 1.91) == {"a", "b"}
+        assert index.candidates("ETH", "USDC", 100.0) == {"a", "b", "c"}
+        assert index.candidates("ETH", "DAI", 100.0) == set()
+        assert sorted(index.pairs()) == [("BTC", "USDC"), ("ETH", "USDC")]
+        assert index.pairs("BTC") == [("BTC", "USDC")]
+
+    def test_update_moves_and_remove_drops(self):
+        index = LiquidationIndex()
+        index.update("u", "ETH", "USDC", 1.0)
+        index.update("u", "BTC", "USDC", 2.0)
+        assert index.pairs() == [("BTC", "USDC")]
+        assert len(index) == 1
+
+        index.update_unbucketed("u")
+        assert index.ratio("u") is None
+        assert index.pairs() == []
+        assert index.unbucketed() == {"u"}
+
+        index.remove("u")
+        assert "u" not in index
+        assert index.unbucketed() == set()
+
+
+class TestLendingPoolLiquidationQuery:
+    """Test get_liquidatable_positions against a full scan."""
+
+    def test_price_drop_finds_exactly_unhealthy_positions(self, pool):
+        rng = random.Random(3)
+        for i in range(200):
+            eth = rng.randint(1, 50) * 10**18
+            max_debt = eth * 2000 * 7500 // 10000
+            _open(pool, f"user{i}", eth, rng.randint(max_debt // 10, max_debt))
+
+        assert pool.get_liquidatable_positions() == []
+        for price in (1900, 1800, 1700, 1500, 1200):
+            pool.set_price_oracle(OWNER, "ETH", price * 10**9)
+            found = pool.get_liquidatable_positions()
+            assert {entry["user"] for entry in found} == _scan(pool)
+            health_factors = [entry["health_factor"] for entry in found]
+            assert health_factors == sorted(health_factors)
+
+    def test_debt_price_rise_without_reindexing(self, pool):
+        _open(pool, "alice", 10 * 10**18, 15_000 * 10**18)
+        _open(pool, "bob", 10 * 10**18, 5_000 * 10**18)
+
+        reindexed = []
+        pool._index_position = reindexed.append
+        pool.set_price_oracle(OWNER, "USDC", USD_PRICE * 12 // 10)
+
+        assert reindexed == []
+        assert [entry["user"] for entry in pool.get_liquidatable_positions("ETH")] == ["alice"]
+
+    def test_repay_and_liquidate_update_index(self, pool):
+        _open(pool, "alice", 10 * 10**18, 15_000 * 10**18)
+        _open(pool, "bob", 10 * 10**18, 15_000 * 10**18)
+        pool.set_price_oracle(OWNER, "ETH", 1800 * 10**9)
+        assert {entry["user"] for entry in pool.get_liquidatable_positions()} == {"alice", "bob"}
+
+        pool.repay("bob", "USDC", 2**256 - 1)
+        assert "bob" not in pool.liquidation_index
+
+        pool.liquidate("keeper", "alice", "USDC", "ETH", 7_000 * 10**18)
+        assert {entry["user"] for entry in pool.get_liquidatable_positions()} == _scan(pool)
+
+    def test_limit_and_rebuild(self, pool):
+        for i in range(5):
+            _open(pool, f"user{i}", 10 * 10**18, (14_000 + i * 200) * 10**18)
+        pool.set_price_oracle(OWNER, "ETH", 1500 * 10**9)
+
+        worst = pool.get_liquidatable_positions(limit=2)
+        assert [entry["user"] for entry in worst] == ["user4", "user3"]
+
+        assert pool.rebuild_liquidation_index() == 5
+        assert len(pool.get_liquidatable_positions()) == 5
+
+    def test_interest_accrual_found_without_reindexing(self, pool):
+        rng = random.Random(5)
+        for i in range(100):
+            eth = rng.randint(1, 50) * 10**18
+            max_debt = eth * 2000 * 7500 // 10000
+            _open(pool, f"user{i}", eth, rng.randint(max_debt // 2, max_debt))
+        _open(pool, "tiny", 100, 100_000)  # Rounding-sensitive: checked exactly
+        assert pool.liquidation_index.unbucketed() == {"tiny"}
+
+        ratios = {user: pool.liquidation_index.ratio(user) for user in pool.positions}
+        for _ in range(4):
+            for asset in ("ETH", "USDC"):
+                pool.pool_states[asset].last_update -= 2 * pool.SECONDS_PER_YEAR
+                pool._update_indices(asset)
+            found = {entry["user"] for entry in pool.get_liquidatable_positions()}
+            assert found == _scan(pool)
+        assert found
+        assert {user: pool.liquidation_index.ratio(user) for user in pool.positions} == ratios
+
+    def test_multi_asset_positions_checked_exactly(self, pool):
+        pool.add_asset(OWNER, AssetConfig(
+            symbol="BTC", address="0xBTC", ltv=7000, liquidation_threshold=7500, liquidation_bonus=500,
+        ))
+        pool.set_price_oracle(OWNER, "BTC", 40_000 * 10**9)
+        pool.supply("carol", "BTC", 10**17)
+        _open(pool, "carol", 5 * 10**18, 9_000 * 10**18)
+        assert pool.liquidation_index.unbucketed() == {"carol"}
+
+        pool.set_price_oracle(OWNER, "ETH", 1000 * 10**9)
+        assert [entry["user"] for entry in pool.get_liquidatable_positions()] == ["carol"]
+        assert pool.get_liquidatable_positions("USDC") == []
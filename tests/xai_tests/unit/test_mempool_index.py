@@ -0,0 +1,234 @@
+"""
+Unit tests for the fee-rate mempool index used for block template assembly.
+
+Coverage targets:
+- Fee-rate ordering of independent transactions
+- Nonce chains and in-mempool UTXO dependencies
+- Ancestor-package (CPFP) selection
+- Lazy selection that stops once the caller's block is full
+- Incremental maintenance against an authoritative pending list
+"""
+
+import itertools
+import random
+
+from xai.core.blockchain_components.mempool_index import MempoolFeeIndex
+
+
+class _Tx:
+    def __init__(self, txid, sender, nonce=0, fee=0.0, size=250, parents=()):
+        self.txid = txid
+        self.sender = sender
+        self.nonce = nonce
+        self.fee = fee
+        self.size = size
+        self.inputs = [{"txid": parent, "vout": 0} for parent in parents]
+
+    def get_size(self):
+        return self.size
+
+
+def _ids(txs):
+    return [tx.txid for tx in txs]
+
+
+def _assert_dependency_order(order):
+    position = {tx.txid: i for i, tx in enumerate(order)}
+    last_nonce = {}
+    for tx in order:
+        for tx_input in tx.inputs:
+            parent = tx_input["txid"]
+            assert position.get(parent, -1) < position[tx.txid]
+        assert last_nonce.get(tx.sender, -1) < tx.nonce
+        last_nonce[tx.sender] = tx.nonce
+
+
+def _reference_order(index):
+    """Select by brute force: best remaining ancestor package each round."""
+    index._flush()
+    selected, order = set(), []
+    while len(selected) < len(index._entries):
+        best = None
+        for entry in index._entries.values():
+            if entry.txid in selected:
+                continue
+            package = [a for a in index._ancestors(entry) if a.txid not in selected] + [entry]
+            key = (-sum(e.fee for e in package) / sum(e.size for e in package), entry.seq)
+            if best is None or key < best[0]:
+                best = (key, entry)
+        for member in index._ancestors_in_order(best[1], selected) + [best[1]]:
+            selected.add(member.txid)
+            order.append(member.txid)
+    return order
+
+
+def _assert_packages_consistent(index):
+    index._flush()
+    for entry in index._entries.values():
+        ancestors = index._ancestors(entry)
+        assert abs(entry.anc_fee - entry.fee - sum(a.fee for a in ancestors)) < 1e-9
+        assert entry.anc_size == entry.size + sum(a.size for a in ancestors)
+
+
+def test_independent_transactions_ordered_by_fee_rate():
+    index = MempoolFeeIndex()
+    txs = [_Tx("low", "A", fee=0.5), _Tx("high", "B", fee=2.0), _Tx("big", "C", fee=3.0, size=2000)]
+    assert _ids(index.prioritize(txs)) == ["high", "low", "big"]
+
+
+def test_nonce_chain_kept_in_order():
+    index = MempoolFeeIndex()
+    txs = [_Tx("n2", "S", nonce=2, fee=0.2), _Tx("n1", "S", nonce=1, fee=3.0), _Tx("n0", "S", nonce=0, fee=0.1)]
+    assert _ids(index.prioritize(txs)) == ["n0", "n1", "n2"]
+
+
+def test_child_pays_for_parent():
+    index = MempoolFeeIndex()
+    txs = [
+        _Tx("other", "A", fee=1.0),
+        _Tx("child", "B", fee=5.0, parents=["parent"]),
+        _Tx("parent", "C", fee=0.01),
+    ]
+    # The child arrives before its parent; the package still ranks first
+    assert _ids(index.prioritize(txs, max_count=2)) == ["parent", "child"]
+
+
+def test_package_that_does_not_fit_is_skipped():
+    index = MempoolFeeIndex()
+    txs = [
+        _Tx("parent", "A", fee=0.01),
+        _Tx("child", "B", fee=5.0, parents=["parent"]),
+        _Tx("single", "C", fee=1.0),
+    ]
+    assert _ids(index.prioritize(txs, max_count=1)) == ["single"]
+
+
+def test_sync_applies_mined_and_replaced_transactions():
+    index = MempoolFeeIndex()
+    a, b, c = _Tx("a", "A", fee=1.0), _Tx("b", "B", fee=2.0), _Tx("c", "C", fee=3.0)
+    index.prioritize([a, b, c])
+    d = _Tx("d", "D", fee=2.5)
+    assert _ids(index.prioritize([a, d])) == ["d", "a"]
+    assert len(index) == 2
+
+
+def test_removing_mid_chain_transaction_relinks_nonces():
+    index = MempoolFeeIndex()
+    for nonce in range(3):
+        index.add(_Tx(f"n{nonce}", "S", nonce=nonce, fee=1.0))
+    index.remove("n1")
+    assert index._entries["n2"].nonce_parent == "n0"
+    _assert_packages_consistent(index)
+
+
+def test_shuffled_nonce_chain_uses_prefix_sums():
+    rng = random.Random(3)
+    chain = [_Tx(f"n{nonce}", "S", nonce=nonce, fee=rng.random()) for nonce in range(500)]
+    rng.shuffle(chain)
+    index = MempoolFeeIndex()
+    walks = []
+    original = index._ancestors
+    index._ancestors = lambda entry: walks.append(entry.txid) or original(entry)
+    for tx in chain:
+        index.add(tx)
+    order = index.select()
+
+    assert _ids(order) == [f"n{nonce}" for nonce in range(500)]
+    assert walks == []  # Plain nonce chains never walk the ancestor graph
+    index._ancestors = original
+    _assert_packages_consistent(index)
+
+
+def test_cross_sender_parent_updates_chain_suffix():
+    index = MempoolFeeIndex()
+    for nonce in range(3):
+        index.add(_Tx(f"s{nonce}", "S", nonce=nonce, fee=0.1, parents=["p"] if nonce == 1 else ()))
+    index.select()
+    index.add(_Tx("p", "P", fee=0.2))
+    _assert_packages_consistent(index)
+    assert index._entries["s2"].anc_fee == index._entries["s1"].anc_fee + 0.1
+
+    index.remove("p")
+    _assert_packages_consistent(index)
+    assert _ids(index.select()) == ["s0", "s1", "s2"]
+
+
+def test_randomized_template_is_valid_and_packages_stay_consistent():
+    rng = random.Random(7)
+    txs = []
+    nonces = {}
+    for i in range(2000):
+        sender = f"s{rng.randrange(300)}"
+        nonce = nonces.get(sender, 0)
+        nonces[sender] = nonce + 1
+        parents = [rng.choice(txs).txid] if txs and rng.random() < 0.1 else []
+        txs.append(_Tx(f"t{i}", sender, nonce, rng.random(), rng.randint(200, 800), parents))
+    rng.shuffle(txs)
+
+    index = MempoolFeeIndex()
+    block = index.prioritize(txs, max_count=200)
+    assert len(block) == 200
+    _assert_dependency_order(block)
+
+    mined = set(_ids(block))
+    remaining = [tx for tx in txs if tx.txid not in mined]
+    for tx in rng.sample(remaining, 100):
+        remaining.remove(tx)
+    full = index.prioritize(remaining)
+    assert len(full) == len(remaining)
+    _assert_dependency_order(full)
+    _assert_packages_consistent(index)
+
+
+def test_selection_matches_brute_force_reference():
+    for seed in range(20):
+        rng = random.Random(seed)
+        txs = []
+        nonces = {}
+        for i in range(60):
+            sender = f"s{rng.randrange(8)}" if rng.random() < 0.9 else None
+            nonce = nonces.get(sender, 0)
+            nonces[sender] = nonce + 1
+            parents = [rng.choice(txs).txid] if txs and rng.random() < 0.2 else []
+            txs.append(_Tx(f"t{i}", sender, nonce, rng.random(), rng.randint(200, 800), parents))
+        rng.shuffle(txs)
+
+        index = MempoolFeeIndex()
+        index.sync(txs)
+        assert _ids(index.select()) == _reference_order(index)
+
+
+def test_long_nonce_chain_is_not_rewalked_per_selection():
+    index = MempoolFeeIndex()
+    for nonce in range(2000):
+        # Falling fees: every transaction is selected as its own package
+        index.add(_Tx(f"n{nonce}", "S", nonce=nonce, fee=1.0 / (nonce + 1)))
+    walked = []
+    original = index._linked_descendants
+    index._linked_descendants = lambda *args: walked.extend(original(*args)) or []
+
+    assert _ids(index.select()) == [f"n{nonce}" for nonce in range(2000)]
+    assert walked == []
+
+
+def test_lazy_selection_stops_early_and_restores_heap():
+    rng = random.Random(5)
+    txs = [_Tx(f"t{i}", f"s{i % 40}", i // 40, rng.random()) for i in range(400)]
+    index = MempoolFeeIndex()
+    index.sync(txs)
+    full = index.select()
+    index._template_key = None
+
+    selection = index.iter_select()
+    assert list(itertools.islice(selection, 25)) == full[:25]
+    selection.close()
+    assert index.select() == full
+
+
+def test_unchanged_mempool_reuses_template():
+    index = MempoolFeeIndex()
+    txs = [_Tx(f"t{i}", f"s{i}", fee=float(i)) for i in range(10)]
+    first = index.prioritize(txs, max_count=5)
+    generation = index.generation
+    assert index.prioritize(txs, max_count=5) == first
+    assert index.generation == generation
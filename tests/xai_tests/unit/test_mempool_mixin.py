@@ -4,8 +4,11 @@ Unit tests for BlockchainMempoolMixin helpers.
 Coverage targets:
 - Expiration pruning of pending and orphan pools
 - Sender ban tracking for invalid transactions
+- Mempool generation tracking of direct pending-list mutations
 """
 
+import copy
+import pickle
 import time
 from collections import defaultdict
 
@@ -382,6 +385,27 @@ def test_prioritize_transactions_preserves_sender_nonce_order():
     assert [t.txid for t in ordered] == ["a0", "a1"]
 
 
+def test_prioritize_pending_list_applies_mutations_without_resync():
+    """Once the index mirrors pending_transactions, list changes are applied as they happen."""
+    now = time.time()
+    mp = DummyMempool(now)
+    mp.pending_transactions = [
+        _Tx(sender=s, txid=s, timestamp=now, fee=fee, size_bytes=100) for s, fee in (("A", 1.0), ("B", 2.0))
+    ]
+    assert [t.txid for t in mp._prioritize_transactions(mp.pending_transactions)] == ["B", "A"]
+
+    index = mp._get_mempool_index()
+    index.sync = lambda _txs: pytest.fail("pending list should not be reconciled again")
+    mp.pending_transactions.append(_Tx(sender="C", txid="C", timestamp=now, fee=3.0, size_bytes=100))
+    mp.pending_transactions.remove(mp.pending_transactions[0])
+    assert [t.txid for t in mp._prioritize_transactions(mp.pending_transactions)] == ["C", "B"]
+
+    del index.sync  # Reassignment is reconciled once on the next prioritization
+    mp.pending_transactions = [_Tx(sender="D", txid="D", timestamp=now, fee=1.0, size_bytes=100)]
+    assert [t.txid for t in mp._prioritize_transactions(mp.pending_transactions)] == ["D"]
+    assert len(index) == 1
+
+
 def test_prioritize_transactions_respects_max_count():
     """max_count limits returned transactions after ordering."""
     mp = DummyMempool(time.time())
@@ -428,6 +452,69 @@ def test_get_mempool_overview_and_size_kb():
     assert size_kb == (tx1.get_size() + tx2.get_size()) / 1024.0
 
 
+def test_every_pending_list_mutation_bumps_generation():
+    """Direct mutations of pending_transactions change the mempool generation."""
+    now = time.time()
+    mp = DummyMempool(now)
+    txs = [_Tx(sender="A", txid=f"t{i}", timestamp=now) for i in range(4)]
+    mutations = [
+        lambda p: p.append(txs[0]),
+        lambda p: p.extend(txs[1:3]),
+        lambda p: p.insert(0, txs[3]),
+        lambda p: p.__setitem__(0, txs[0]),  # Same length, different contents
+        lambda p: p.__setitem__(slice(None), [tx for tx in p if tx.txid != "t1"]),
+        lambda p: p.remove(txs[2]),
+        lambda p: p.pop(),
+        lambda p: p.__delitem__(0),
+        lambda p: p.clear(),
+    ]
+    for mutate in mutations:
+        before = mp.get_mempool_generation()
+        mutate(mp.pending_transactions)
+        assert mp.get_mempool_generation() > before
+
+    before = mp.get_mempool_generation()
+    mp.pending_transactions = [txs[0]]
+    assert mp.get_mempool_generation() > before
+
+
+def test_replaced_pending_list_stops_reporting():
+    """Mutating a list the owner has replaced leaves the mempool untouched."""
+    now = time.time()
+    mp = DummyMempool(now)
+    old = mp.pending_transactions
+    mp.pending_transactions = []
+    before = mp.get_mempool_generation()
+    old.append(_Tx(sender="A", txid="t1", timestamp=now))
+    assert mp.get_mempool_generation() == before
+
+
+def test_pending_list_copies_are_plain_lists():
+    """Snapshots, deep copies and pickles do not drag the owner along."""
+    mp = DummyMempool(time.time())
+    mp.pending_transactions = ["t1", "t2"]
+    for snapshot in (copy.copy(mp.pending_transactions), copy.deepcopy(mp.pending_transactions),
+                     pickle.loads(pickle.dumps(mp.pending_transactions))):
+        assert type(snapshot) is list
+        assert snapshot == ["t1", "t2"]
+
+
+def test_age_mempool_overview_advances_wall_clock_fields():
+    """A kept overview can be served with current timestamp and ages."""
+    now = time.time()
+    mp = DummyMempool(now)
+    mp.pending_transactions = [_Tx(sender="A", txid="t1", timestamp=now - 5, fee=1.0)]
+    overview = mp.get_mempool_overview(limit=1)
+
+    aged = mp.age_mempool_overview(overview, 30.0)
+    assert aged["timestamp"] == overview["timestamp"] + 30.0
+    assert aged["cache_age_seconds"] == overview["cache_age_seconds"] + 30.0
+    assert aged["oldest_transaction_age_seconds"] == overview["oldest_transaction_age_seconds"] + 30.0
+    assert aged["transactions"][0]["age_seconds"] == overview["transactions"][0]["age_seconds"] + 30.0
+    assert aged["transactions"][0]["txid"] == "t1"
+    assert overview["transactions"][0]["age_seconds"] < 6.0  # Original left untouched
+
+
 def test_prioritize_transactions_max_per_block_limits():
     """max_count trims prioritized list after fee/nonce ordering."""
     now = time.time()
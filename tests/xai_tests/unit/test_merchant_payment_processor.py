@@ -30,7 +30,9 @@ from xai.merchant.payment_processor import (
     WebhookEvent,
     WebhookDeliveryStatus,
     WebhookDelivery,
+    WEBHOOK_RETRY_DELAYS,
 )
+from xai.core.api.webhook_delivery import DeliveryJob, DeliveryResult
 
 
 class TestPaymentRequestCreation:
@@ -446,6 +448,45 @@ class TestEventHandlers:
         assert payment_request.request_id in handler2_called
 
 
+class TestWebhookRetrySchedule:
+    """Test webhook retry timing."""
+
+    def _delivery(self, processor):
+        delivery = WebhookDelivery(
+            delivery_id="d1",
+            request_id="r1",
+            event="payment.confirmed",
+            url="https://merchant.example/hook",
+            payload={},
+        )
+        processor._webhook_deliveries[delivery.delivery_id] = delivery
+        return delivery
+
+    def test_first_retry_after_five_minutes(self, processor):
+        """Test backoff schedule starts at 5 minutes after the first failure."""
+        delivery = self._delivery(processor)
+        delivery.attempts = 1
+        now = int(time.time())
+
+        assert delivery.calculate_next_attempt() - now in (300, 301)
+        delivery.attempts = 9
+        assert delivery.calculate_next_attempt() - now in (21600, 21601)
+
+    def test_records_engine_retry_time(self, processor):
+        """Test next_attempt_at matches the delay the engine scheduled."""
+        delivery = self._delivery(processor)
+        job = DeliveryJob(
+            url=delivery.url, event_type=delivery.event, payload={},
+            job_id=delivery.delivery_id, attempt=1, retry_delays=WEBHOOK_RETRY_DELAYS,
+        )
+        processor._on_delivery_result(
+            DeliveryResult(job=job, success=False, status_code=500, final=False, retry_delay=WEBHOOK_RETRY_DELAYS[0])
+        )
+
+        assert delivery.status == WebhookDeliveryStatus.RETRYING
+        assert delivery.next_attempt_at - delivery.last_attempt_at == 300
+
+
 class TestStatistics:
     """Test statistics tracking."""
 
@@ -4,7 +4,7 @@ Unit tests for BlockchainMiningMixin block assembly.
 Coverage targets:
 - Requires node identity for mining
 - Respects max_transactions_per_block and block size limit when selecting txs
-- Skips transactions with nonce mismatch
+- Skips transactions with nonce mismatch without under-filling the block
 """
 
 from types import SimpleNamespace
@@ -104,8 +104,8 @@ class DummyMining(BlockchainMiningMixin):
     def calculate_next_difficulty(self):
         return self.difficulty
 
-    def _prioritize_transactions(self, txs, max_count=None):
-        return txs
+    def _iter_prioritized_transactions(self):
+        return (tx for tx in self.pending_transactions)
 
     def validate_transaction(self, tx):
         return True
@@ -162,3 +162,14 @@ def test_respects_max_transactions_and_nonce_order():
     # Only coinbase + 1 tx included
     assert len(block.transactions) == 2
     assert block.transactions[1].nonce == 1
+
+
+def test_skipped_candidates_do_not_under_fill_block():
+    miner = DummyMining()
+    miner.pending_transactions = [
+        _Tx(miner._valid_address, miner._valid_address, 1, fee=0.3, nonce=7),  # stale, skipped
+        _Tx(miner._valid_address, miner._valid_address, 1, fee=0.2, nonce=5),  # stale, skipped
+        _Tx(miner._valid_address, miner._valid_address, 1, fee=0.1, nonce=1),
+    ]
+    block = miner.mine_pending_transactions(miner_address=miner._valid_address)
+    assert [tx.nonce for tx in block.transactions[1:]] == [1]
@@ -8,6 +8,7 @@ Tests cover:
 - Disk space checking
 - Network condition adaptation
 - Statistics tracking
+- Pipelined downloads, disk spilling and resume
 """
 
 import pytest
@@ -408,6 +409,128 @@ class TestMobileSyncManager:
         assert len(progress_updates) > 0
 
 
+@pytest.fixture
+def large_payload():
+    """Checkpoint payload spanning many 1000-byte chunks."""
+    import json
+    import hashlib
+
+    data = {
+        "utxo_snapshot": {f"XAI{i:040x}": [{"vout": 0, "amount": i * 1.5}] for i in range(300)},
+        "account_balances": {"addr3": 300},
+    }
+    serialized = json.dumps(data, sort_keys=True).encode("utf-8")
+    return CheckpointPayload(
+        height=200,
+        block_hash="f" * 64,
+        state_hash=hashlib.sha256(serialized).hexdigest(),
+        data=data,
+    )
+
+
+class TestPipelinedSync:
+    """Test concurrent chunk fetches, disk spilling and resume."""
+
+    def test_download_window_follows_network(self, sync_manager):
+        sync_manager.set_network_condition(NetworkCondition(connection_type="wifi"))
+        assert sync_manager.get_download_window(1_000_000) == 4  # max_concurrent_downloads
+        assert sync_manager.get_download_window(2_000_000) == 2
+
+        sync_manager.set_network_condition(NetworkCondition(connection_type="3g"))
+        assert sync_manager.get_download_window(1_000_000) == 1
+
+    def test_fetches_run_concurrently(self, sync_manager, chunked_service, large_payload):
+        import threading
+
+        metadata, _ = chunked_service.create_state_snapshot_chunks(200, large_payload)
+        assert metadata.total_chunks > 8
+
+        lock = threading.Lock()
+        active = [0, 0]  # current, peak
+
+        def fetcher(snapshot_id, chunk_index):
+            with lock:
+                active[0] += 1
+                active[1] = max(active[1], active[0])
+            time.sleep(0.01)
+            with lock:
+                active[0] -= 1
+            return chunked_service.get_chunk(snapshot_id, chunk_index)
+
+        result = sync_manager.sync_snapshot(metadata.snapshot_id, fetcher)
+        assert result is not None
+        assert result.data == large_payload.data
+        assert 1 < active[1] <= sync_manager.max_concurrent_downloads
+
+    def test_chunks_spilled_then_removed(self, sync_manager, chunked_service, large_payload):
+        metadata, _ = chunked_service.create_state_snapshot_chunks(200, large_payload)
+        spill_dir = sync_manager.chunk_spill_dir / metadata.snapshot_id
+        spilled = []
+
+        def fetcher(snapshot_id, chunk_index):
+            spilled.append(len(list(spill_dir.glob("chunk_*.bin"))))
+            return chunked_service.get_chunk(snapshot_id, chunk_index)
+
+        assert sync_manager.sync_snapshot(metadata.snapshot_id, fetcher) is not None
+        assert max(spilled) >= metadata.total_chunks - sync_manager.max_concurrent_downloads
+        assert not spill_dir.exists()
+
+    def test_resume_fetches_only_missing_chunks(self, sync_manager, chunked_service, large_payload):
+        metadata, _ = chunked_service.create_state_snapshot_chunks(200, large_payload)
+        fetched = []
+
+        def flaky_fetcher(snapshot_id, chunk_index):
+            if chunk_index == 3:
+                return None
+            return chunked_service.get_chunk(snapshot_id, chunk_index)
+
+        def fetcher(snapshot_id, chunk_index):
+            fetched.append(chunk_index)
+            return chunked_service.get_chunk(snapshot_id, chunk_index)
+
+        assert sync_manager.sync_snapshot(metadata.snapshot_id, flaky_fetcher) is None
+        result = sync_manager.sync_snapshot(metadata.snapshot_id, fetcher)
+        assert result is not None
+        assert fetched == [3]
+
+    def test_resume_counts_spilled_bytes(self, sync_manager, large_payload):
+        # Compressed chunks are spilled as .gz but counted uncompressed
+        sync_manager.chunked_service.enable_compression = True
+        metadata, _ = sync_manager.chunked_service.create_state_snapshot_chunks(200, large_payload)
+        service = sync_manager.chunked_service
+
+        def flaky_fetcher(snapshot_id, chunk_index):
+            if chunk_index == 3:
+                return None
+            return service.get_chunk(snapshot_id, chunk_index)
+
+        assert sync_manager.sync_snapshot(metadata.snapshot_id, flaky_fetcher) is None
+        reported = []
+        sync_manager.set_progress_callback(lambda progress: reported.append(
+            (progress["state"], progress["statistics"]["bytes_downloaded"])
+        ))
+
+        assert sync_manager.sync_snapshot(metadata.snapshot_id, service.get_chunk) is not None
+        assert sync_manager.statistics.bytes_downloaded == metadata.total_size
+        downloading = [size for state, size in reported if state == "downloading"]
+        missing = service.get_chunk(metadata.snapshot_id, 3).size_bytes
+        assert downloading == [metadata.total_size - missing, metadata.total_size]
+
+    def test_corrupt_chunk_not_spilled(self, sync_manager, chunked_service, large_payload):
+        metadata, _ = chunked_service.create_state_snapshot_chunks(200, large_payload)
+
+        def fetcher(snapshot_id, chunk_index):
+            chunk = chunked_service.get_chunk(snapshot_id, chunk_index)
+            if chunk_index == 1:
+                chunk.data = b"x" + chunk.data[1:]
+            return chunk
+
+        assert sync_manager.sync_snapshot(metadata.snapshot_id, fetcher) is None
+        spill_dir = sync_manager.chunk_spill_dir / metadata.snapshot_id
+        assert not (spill_dir / "chunk_000001.bin").exists()
+        assert (spill_dir / "chunk_000000.bin").exists()
+
+
 class TestSyncStatistics:
     """Test SyncStatistics dataclass."""
 
@@ -0,0 +1,112 @@
+"""
+Tests for the node scenario benchmarks and the baseline regression gate.
+
+Setup callables must stay out of timings, baseline comparisons must respect
+the threshold, and the harness must exit non-zero on a regression.
+"""
+
+import json
+import time
+
+import pytest
+
+from xai.performance.benchmarking import Benchmark, BenchmarkSuite
+from xai.performance.node_benchmarks import FixtureConfig, SyntheticChain, main
+
+
+def _suite_with_ops(ops):
+    suite = BenchmarkSuite("test")
+    for name in ops:
+        suite.add_benchmark(name, lambda: None, iterations=1)
+    suite.run_all()
+    for result in suite.results:
+        result.ops_per_second = ops[result.name]
+        result.median_time = 1 / ops[result.name]
+    return suite
+
+
+def _write_baseline(path, ops):
+    _suite_with_ops(ops).export_results(str(path))
+
+
+class TestBenchmarkSetup:
+    """Test per-iteration setup."""
+
+    def test_setup_excluded_from_timing(self):
+        states = []
+        benchmark = Benchmark(
+            "setup",
+            states.append,
+            iterations=3,
+            setup=lambda: time.sleep(0.05) or len(states),
+        )
+        result = benchmark.run()
+
+        assert states == [0, 1, 2]  # Fresh state passed to every iteration
+        assert result.max_time < 0.025
+
+
+class TestBaselineComparison:
+    """Test threshold handling in compare_with_baseline()."""
+
+    def test_threshold_statuses(self, tmp_path):
+        baseline = tmp_path / "baseline.json"
+        _write_baseline(baseline, {"slower": 100.0, "noise": 100.0, "faster": 100.0})
+        suite = _suite_with_ops({"slower": 80.0, "noise": 95.0, "faster": 150.0})
+
+        comparison = suite.compare_with_baseline(str(baseline), threshold_percent=10)
+        statuses = {c["name"]: c["status"] for c in comparison["comparisons"]}
+        assert statuses == {"slower": "regressed", "noise": "unchanged", "faster": "improved"}
+        assert comparison["regressions"] == ["slower"]
+
+    def test_baseline_errors(self, tmp_path):
+        suite = _suite_with_ops({"a": 1.0})
+        assert "error" in suite.compare_with_baseline(str(tmp_path / "missing.json"))
+
+        corrupt = tmp_path / "corrupt.json"
+        corrupt.write_text("{not json")
+        assert "error" in suite.compare_with_baseline(str(corrupt))
+
+    def test_export_includes_metadata(self, tmp_path):
+        path = tmp_path / "out.json"
+        _suite_with_ops({"a": 1.0}).export_results(str(path), metadata={"iterations": 5})
+        assert json.loads(path.read_text())["metadata"] == {"iterations": 5}
+
+
+class TestNodeBenchmarks:
+    """End-to-end run on a tiny synthetic chain."""
+
+    ARGS = ["--accounts", "3", "--history-rounds", "1", "--iterations", "1"]
+
+    def test_fixture_is_deterministic(self, tmp_path):
+        config = FixtureConfig(accounts=3, history_rounds=1)
+        first = SyntheticChain(str(tmp_path / "a"), config)
+        second = SyntheticChain(str(tmp_path / "b"), config)
+        assert first.accounts == second.accounts
+
+        first.build()
+        assert len(first.workload_transactions) == 3
+        assert len(first.next_block().transactions) == 4  # Coinbase plus the workload
+
+    def test_regression_fails_run(self, tmp_path, capsys):
+        output = tmp_path / "results.json"
+        assert main(self.ARGS + ["--output", str(output)]) == 0
+        results = json.loads(output.read_text())
+        assert len(results["benchmarks"]) == 6
+
+        # A baseline 100x faster than this machine must trip the gate
+        for entry in results["benchmarks"]:
+            entry["ops_per_second"] *= 100
+            entry["median_time_ms"] /= 100
+        baseline = tmp_path / "baseline.json"
+        baseline.write_text(json.dumps(results))
+        assert main(self.ARGS + ["--scenario", "utxo_snapshot", "--baseline", str(baseline)]) == 1
+        assert "Regressed: UTXO Snapshot" in capsys.readouterr().err
+
+    def test_missing_baseline(self, tmp_path):
+        args = self.ARGS + ["--scenario", "utxo_snapshot", "--baseline", str(tmp_path / "none.json")]
+        assert main(args) == 2
+
+    def test_unknown_scenario_rejected(self):
+        with pytest.raises(SystemExit):
+            main(["--scenario", "bogus"])
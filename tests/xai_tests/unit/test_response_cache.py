@@ -0,0 +1,161 @@
+"""
+Tests for the tip-keyed API response cache.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from xai.core.api.response_cache import TipKeyedResponseCache
+
+
+class FakeChain:
+    """Minimal blockchain exposing the state the cache keys on."""
+
+    def __init__(self):
+        self.chain = [SimpleNamespace(hash="aa" * 32)]
+        self.pending_transactions = []
+        self._mempool_generation = 0
+
+    def get_mempool_generation(self):
+        return self._mempool_generation
+
+    def connect_block(self, block_hash):
+        self.chain.append(SimpleNamespace(hash=block_hash))
+
+    def admit(self, tx):
+        self.pending_transactions.append(tx)
+        self._mempool_generation += 1
+
+
+class RecordingMetrics:
+    def __init__(self):
+        self.events = []
+
+    def record_api_cache(self, route, hit):
+        self.events.append((route, hit))
+
+
+@pytest.fixture
+def chain():
+    return FakeChain()
+
+
+@pytest.fixture
+def metrics():
+    return RecordingMetrics()
+
+
+@pytest.fixture
+def cache(chain, metrics):
+    return TipKeyedResponseCache(chain, max_entries=8, metrics=metrics)
+
+
+def test_repeat_lookup_is_served_from_cache(cache, metrics):
+    calls = []
+
+    def build():
+        calls.append(1)
+        return {"value": len(calls)}
+
+    first = cache.get_or_compute("stats", (), build)
+    second = cache.get_or_compute("stats", (), build)
+
+    assert first.payload == second.payload == {"value": 1}
+    assert len(calls) == 1
+    assert metrics.events == [("stats", False), ("stats", True)]
+    assert cache.get_stats()["hits"] == 1
+
+
+def test_params_are_part_of_key(cache):
+    a = cache.get_or_compute("blocks", (10, 0), lambda: {"page": 0})
+    b = cache.get_or_compute("blocks", (10, 10), lambda: {"page": 1})
+    assert a.payload != b.payload
+    assert a.etag != b.etag
+
+
+def test_block_connect_invalidates(cache, chain):
+    cache.get_or_compute("stats", (), lambda: {"height": 1})
+    chain.connect_block("bb" * 32)
+    entry = cache.get_or_compute("stats", (), lambda: {"height": 2})
+    assert entry.payload == {"height": 2}
+    assert cache.get_stats()["invalidations"] == 1
+
+
+def test_reorg_to_different_tip_invalidates(cache, chain):
+    chain.connect_block("bb" * 32)
+    cache.get_or_compute("stats", (), lambda: {"tip": "bb"})
+    chain.chain[-1] = SimpleNamespace(hash="cc" * 32)
+    assert cache.get_or_compute("stats", (), lambda: {"tip": "cc"}).payload == {"tip": "cc"}
+
+
+def test_mempool_change_invalidates(cache, chain):
+    first = cache.get_or_compute("mempool", (100,), lambda: {"count": 0})
+    chain.admit(object())
+    second = cache.get_or_compute("mempool", (100,), lambda: {"count": 1})
+    assert second.payload == {"count": 1}
+    assert first.etag != second.etag
+
+
+def test_mempool_change_keeps_tip_only_entries(cache, chain):
+    calls = []
+    blocks = cache.get_or_compute("blocks", (10, 0), lambda: calls.append(1) or {"page": 0}, depends_on_mempool=False)
+    cache.get_or_compute("mempool", (100,), lambda: {"count": 0})
+
+    chain.admit(object())
+    again = cache.get_or_compute("blocks", (10, 0), lambda: calls.append(1) or {"page": 0}, depends_on_mempool=False)
+    assert calls == [1]
+    assert again.etag == blocks.etag
+    assert cache.get_or_compute("mempool", (100,), lambda: {"count": 1}).payload == {"count": 1}
+    assert cache.get_stats()["entries"] == 2
+
+
+def test_block_connect_drops_tip_only_entries(cache, chain):
+    cache.get_or_compute("balance", ("a",), lambda: {"balance": 1}, depends_on_mempool=False)
+    chain.connect_block("bb" * 32)
+    entry = cache.get_or_compute("balance", ("a",), lambda: {"balance": 2}, depends_on_mempool=False)
+    assert entry.payload == {"balance": 2}
+
+
+def test_wholesale_mempool_replacement_invalidates(cache, chain):
+    cache.get_or_compute("mempool", (100,), lambda: {"count": 0})
+    chain.pending_transactions = [object()]
+    assert cache.get_or_compute("mempool", (100,), lambda: {"count": 1}).payload == {"count": 1}
+
+
+def test_lru_eviction_bounds_entries(chain):
+    cache = TipKeyedResponseCache(chain, max_entries=2, use_global_metrics=False)
+    for address in ("a", "b", "c"):
+        cache.get_or_compute("balance", (address,), lambda: {"balance": 0})
+    assert cache.get_stats()["entries"] == 2
+    calls = []
+    cache.get_or_compute("balance", ("a",), lambda: calls.append(1) or {"balance": 0})
+    assert calls == [1]
+
+
+def test_etag_conditional_matching(cache):
+    entry = cache.get_or_compute("stats", (), lambda: {"ok": True})
+    assert entry.etag.startswith('W/"')
+    assert cache.etag_matches(entry.etag, entry.etag)
+    assert cache.etag_matches(entry.etag[2:], entry.etag)
+    assert cache.etag_matches(f'"other", {entry.etag}', entry.etag)
+    assert cache.etag_matches("*", entry.etag)
+    assert not cache.etag_matches('"other"', entry.etag)
+    assert not cache.etag_matches(None, entry.etag)
+
+
+def test_body_serialized_once(cache):
+    entry = cache.get_or_compute("stats", (), lambda: {"ok": True})
+    assert entry.body() is entry.body()
+    assert entry.body() == b'{"ok": true}'
+
+
+def test_rejects_non_positive_capacity(chain):
+    with pytest.raises(ValueError):
+        TipKeyedResponseCache(chain, max_entries=0)
+
+
+def test_entry_age_counts_from_build_time(cache):
+    entry = cache.get_or_compute("mempool", (100,), lambda: {"count": 0})
+    assert entry.age(entry.built_at + 2.5) == 2.5
+    assert cache.get_or_compute("mempool", (100,), lambda: {"count": 1}).built_at == entry.built_at
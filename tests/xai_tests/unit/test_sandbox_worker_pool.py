@@ -0,0 +1,100 @@
+"""
+Tests for the SecureExecutor warm worker pool.
+
+Workers are reused for the same app, never shared between apps, and
+replaced after their execution budget or after any failed job. Each job
+runs in its own child, so nothing it changes reaches the next job.
+"""
+
+import os
+import signal
+
+import pytest
+
+from xai.sandbox.secure_executor import ExecutionContext, ResourceLimits, SecureExecutor
+
+pytestmark = pytest.mark.skipif(os.name != "posix", reason="Worker pool is POSIX only")
+
+SNIPPET = """
+def main():
+    return 6 * 7
+"""
+
+
+def _run(executor, code=SNIPPET, app_id="app"):
+    return executor.execute(ExecutionContext(app_id=app_id, code=code))
+
+
+@pytest.fixture
+def executor():
+    executor = SecureExecutor(
+        limits=ResourceLimits(max_cpu_seconds=1, max_wall_time_seconds=3),
+        use_subprocess=True,
+        worker_pool_size=1,
+        max_executions_per_worker=3,
+    )
+    yield executor
+    executor.close()
+
+
+class TestSandboxWorkerPool:
+    """Test warm worker reuse and recycling."""
+
+    def test_same_result_as_spawn_per_call(self, executor):
+        spawn = SecureExecutor(use_subprocess=True, use_worker_pool=False)
+        spawn.has_seccomp = False  # Filter applied before exec() blocks execve
+
+        pooled = _run(executor)
+        expected = _run(spawn)
+
+        assert pooled.success and expected.success
+        assert pooled.output == expected.output == '{"success": true, "result": "42"}\n'
+
+    def test_worker_reused_then_recycled(self, executor):
+        for _ in range(3):
+            assert _run(executor).success
+        stats = executor.worker_pool.stats()
+        # One initial worker, one started to replace it as the fresh spare
+        assert stats["workers_started"] == 2
+        assert stats["workers_retired"] == 1  # Hit max_executions_per_worker
+
+        assert _run(executor).success
+        assert executor.worker_pool.stats()["idle_workers"] == 1
+
+    def test_module_state_does_not_carry_between_jobs(self, executor):
+        stash = _run(executor, "def main():\n    sys.stash = 'secret'\n    return 1\n")
+        assert stash.success
+        leaked = _run(executor, "def main():\n    return sys.stash\n")
+        assert not leaked.success
+        assert "has no attribute 'stash'" in leaked.error
+
+        hijack = "def main():\n    json.dumps = lambda *a, **k: 'HIJACKED'\n    return 1\n"
+        assert _run(executor, hijack).success
+        result = _run(executor)
+        assert result.output == '{"success": true, "result": "42"}\n'
+
+    def test_apps_never_share_a_worker(self, executor):
+        assert _run(executor, app_id="a").success
+        assert _run(executor, app_id="b").success
+        assert sorted(executor.worker_pool._idle) == ["a", "b"]
+
+    def test_failed_job_recycles_worker(self, executor):
+        result = _run(executor, "def main():\n    raise ValueError('boom')\n")
+        assert not result.success
+        assert "boom" in result.error
+        assert executor.worker_pool.stats()["workers_retired"] == 1
+        assert _run(executor).success
+
+    def test_limits_enforced(self, executor):
+        result = _run(executor, "while True:\n    pass\n")
+        assert not result.success
+        assert result.resource_exceeded
+        assert result.killed_by_signal in (signal.SIGXCPU, signal.SIGKILL)
+
+        assert _run(executor).success
+        assert executor.worker_pool.stats()["live_workers"] == 2
+
+    def test_validation_still_runs_before_dispatch(self, executor):
+        assert not _run(executor, "import os\n").success
+        assert not _run(executor, "def main():\n    return __import__('os')\n").success
+        assert executor.worker_pool.stats()["workers_started"] == 1
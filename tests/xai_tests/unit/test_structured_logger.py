@@ -1,11 +1,19 @@
 """
-Unit tests for structured logger sanitization and correlation handling.
+Unit tests for structured logger sanitization, correlation handling and
+hot-path sampling.
 """
 
 import json
+import logging
 from pathlib import Path
 
-from xai.core.api.structured_logger import StructuredLogger, correlation_id
+from xai.core.api.structured_logger import (
+    HotPathLogger,
+    StructuredLogger,
+    correlation_id,
+    flush_hot_path_logs,
+    get_hot_path_logger,
+)
 
 
 def _read_json_log(log_dir: Path, name: str) -> dict:
@@ -44,3 +52,86 @@ def test_correlation_id_propagates_into_log(tmp_path):
 
     entry = _read_json_log(tmp_path, name)
     assert entry["correlation_id"] == "corr-123"
+
+
+def _read_json_logs(log_dir: Path, name: str) -> list[dict]:
+    log_path = log_dir / f"{name.lower()}.json.log"
+    with log_path.open("r", encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def test_hot_path_disabled_level_is_not_counted(tmp_path):
+    """Events below the logger level are rejected before any bookkeeping."""
+    logger = StructuredLogger(name="HotLevelLogger", log_dir=str(tmp_path), log_level="INFO")
+    hot = HotPathLogger(logger)
+
+    assert not hot.enabled("DEBUG", "utxo.added")
+    hot.debug("utxo.added", "Added UTXO %s", "tx:0", txid="tx")
+    assert hot.get_stats() == {}
+    assert not logger.is_enabled_for("DEBUG")
+
+
+def test_hot_path_cap_and_block_summary(tmp_path):
+    """Events beyond the per-block cap are counted and summarised once."""
+    name = "HotCapLogger"
+    logger = StructuredLogger(name=name, log_dir=str(tmp_path))
+    hot = HotPathLogger(logger, max_per_block=3)
+
+    for i in range(10):
+        hot.info("mempool.added", "Transaction %s added", i, txid=str(i))
+    hot.info("mempool.orphaned", "Orphaned")
+    assert hot.get_stats()["mempool.added"] == {"occurrences": 10, "emitted": 3, "suppressed": 7}
+
+    assert hot.flush_suppressed(block_index=42) == {"mempool.added": 7}
+    assert hot.flush_suppressed() == {}
+    for handler in logger.logger.handlers:
+        handler.flush()
+
+    entries = _read_json_logs(tmp_path, name)
+    assert [e["message"] for e in entries[:3]] == ["Transaction 0 added", "Transaction 1 added", "Transaction 2 added"]
+    assert entries[0]["event"] == "mempool.added"
+    summary = entries[-1]
+    assert summary["event"] == "logging.hot_path_suppressed"
+    assert summary["suppressed"] == {"mempool.added": 7}
+    assert summary["block_index"] == 42
+
+    # The cap applies per block
+    hot.info("mempool.added", "Transaction added")
+    assert hot.get_stats()["mempool.added"]["emitted"] == 1
+
+
+def test_hot_path_sampling(tmp_path):
+    logger = StructuredLogger(name="HotSampleLogger", log_dir=str(tmp_path))
+    hot = HotPathLogger(logger, max_per_block=None)
+    hot.configure("utxo.spent", sample_every=10)
+
+    emitted = sum(hot.enabled("INFO", "utxo.spent") for _ in range(100))
+    assert emitted == 10
+    assert sum(hot.enabled("INFO", "utxo.added") for _ in range(100)) == 100
+
+
+def test_hot_path_window_expiry_flushes_without_blocks(tmp_path):
+    """Caps reopen after the window even when no block triggers a summary."""
+    logger = StructuredLogger(name="HotWindowLogger", log_dir=str(tmp_path))
+    hot = HotPathLogger(logger, max_per_block=1, window_seconds=0.0)
+
+    assert hot.enabled("WARN", "tx.invalid")
+    assert not hot.enabled("WARN", "tx.invalid")  # Suppressed, then summarised
+    assert hot.enabled("WARN", "tx.invalid")
+
+
+def test_hot_path_standard_logger(caplog):
+    std_logger = logging.getLogger("xai.tests.hot_path")
+    hot = get_hot_path_logger(std_logger)
+    assert get_hot_path_logger(std_logger) is hot
+    hot.configure("staking.rewards", max_per_block=2)
+
+    with caplog.at_level(logging.INFO, logger="xai.tests.hot_path"):
+        for i in range(5):
+            hot.info("staking.rewards", "Rewards for %s", i, validator=str(i))
+        assert flush_hot_path_logs(block_index=7)["staking.rewards"] == 3
+
+    messages = [r.getMessage() for r in caplog.records]
+    assert messages == ["Rewards for 0", "Rewards for 1", "Suppressed 3 hot-path log events"]
+    assert caplog.records[0].event == "staking.rewards"
+    assert caplog.records[-1].block_index == 7
@@ -0,0 +1,103 @@
+"""
+Tests for the SwapRouter limit-order book.
+
+Verifies that get_fillable_orders() reads the per-pair price-ordered book
+and returns the same orders, in the same order, as a scan of every order.
+"""
+
+import random
+import time
+
+import pytest
+
+from xai.core.defi.swap_router import LimitOrder, OrderStatus, SwapRouter
+
+
+def _order(order_id, token_in="ETH", token_out="USDC", amount_in=1000, min_amount_out=2000, expiry=None):
+    return LimitOrder(
+        id=order_id,
+        maker="0xmaker",
+        token_in=token_in,
+        token_out=token_out,
+        amount_in=amount_in,
+        min_amount_out=min_amount_out,
+        expiry=expiry if expiry is not None else int(time.time()) + 3600,
+        nonce=0,
+        signature=b"x" * 64,
+        status=OrderStatus.OPEN,
+    )
+
+
+def _scan(router, token_in, token_out, limit=100):
+    """Full scan that the order book replaces."""
+    current_time = time.time()
+    fillable = [
+        order for order in router.orders.values()
+        if order.token_in == token_in and order.token_out == token_out
+        and order.status in (OrderStatus.OPEN, OrderStatus.PARTIALLY_FILLED)
+        and current_time <= order.expiry
+    ]
+    fillable.sort(key=lambda o: o.effective_price(), reverse=True)
+    return fillable[:limit]
+
+
+@pytest.fixture
+def router():
+    return SwapRouter(owner="0xowner123", chain_id=1)
+
+
+class TestLimitOrderBook:
+    """Test the indexed limit-order book."""
+
+    def test_matches_full_scan(self, router):
+        rng = random.Random(5)
+        now = int(time.time())
+        pairs = [("ETH", "USDC"), ("USDC", "ETH"), ("ETH", "DAI")]
+        for i in range(300):
+            token_in, token_out = rng.choice(pairs)
+            order = _order(
+                f"order{i}", token_in, token_out,
+                amount_in=rng.randint(1, 100) * 1000,
+                min_amount_out=rng.randint(1, 50) * 1000,
+                expiry=now + rng.choice([-10, 3600]),
+            )
+            router.orders[order.id] = order
+
+        for i in rng.sample(range(300), 60):
+            order = router.orders[f"order{i}"]
+            if order.expiry > now:
+                router.cancel_limit_order(order.maker, order.id)
+
+        for token_in, token_out in pairs:
+            for limit in (5, 100):
+                assert router.get_fillable_orders(token_in, token_out, limit) == _scan(
+                    router, token_in, token_out, limit
+                )
+
+    def test_best_price_first_and_ties_keep_creation_order(self, router):
+        for order_id, min_out in (("a", 2000), ("b", 3000), ("c", 2000), ("d", 1000)):
+            router.orders[order_id] = _order(order_id, min_amount_out=min_out)
+
+        assert [o.id for o in router.get_fillable_orders("eth", "usdc")] == ["b", "a", "c", "d"]
+
+    def test_terminal_orders_leave_the_book(self, router):
+        router.orders["full"] = _order("full")
+        router.orders["part"] = _order("part")
+        router.orders["gone"] = _order("gone", expiry=int(time.time()) + 3600)
+        router.get_fillable_orders("ETH", "USDC")
+
+        router.fill_limit_order("0xfiller", "full")
+        router.fill_limit_order("0xfiller", "part", amount_to_fill=400)
+        router.orders["gone"].expiry = int(time.time()) - 1
+
+        assert [o.id for o in router.get_fillable_orders("ETH", "USDC")] == ["part"]
+        assert set(router._book_entries) == {"part"}
+
+    def test_expiry_heap_evicts_expired_orders(self, router):
+        now = int(time.time())
+        router.orders["soon"] = _order("soon", expiry=now - 5)
+        router.orders["later"] = _order("later", expiry=now + 3600)
+
+        assert [o.id for o in router.get_fillable_orders("ETH", "USDC")] == ["later"]
+        assert "soon" not in router._book_entries
+        assert set(router.to_dict()) == {"name", "address", "chain_id", "pools", "stats"}
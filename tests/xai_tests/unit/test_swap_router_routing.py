@@ -0,0 +1,166 @@
+"""
+Tests for SwapRouter route search, quote memoization and split routing.
+
+The reference below is the original breadth-first search, which evaluated
+every path on each call; the cached route engine must pick the same path.
+"""
+
+import random
+import time
+
+import pytest
+
+from xai.core.defi.swap_router import SplitRoute, SwapRouter
+
+TOKENS = ["ETH", "USDC", "DAI", "WBTC", "XAI"]
+
+
+def _reference_best(router, token_in, token_out, amount_in, max_hops=4):
+    """Original BFS: best (pools, output), first path winning ties."""
+    best = None
+    queue = [(token_in, amount_in, [], [token_in], set())]
+    while queue:
+        current_token, current_amount, path_pools, path_tokens, visited = queue.pop(0)
+        if len(path_pools) >= max_hops:
+            continue
+        for pool_addr in router.token_to_pools.get(current_token, []):
+            if pool_addr in visited:
+                continue
+            pool = router.pools[pool_addr]
+            next_token = pool.get_other_token(current_token)
+            if next_token in path_tokens and next_token != token_out:
+                continue
+            output = pool.get_output(current_token, current_amount)
+            if output <= 0:
+                continue
+            if next_token == token_out:
+                if best is None or output > best[1]:
+                    best = (path_pools + [pool_addr], output)
+            else:
+                queue.append((
+                    next_token, output, path_pools + [pool_addr], path_tokens + [next_token],
+                    visited | {pool_addr},
+                ))
+    return best
+
+
+@pytest.fixture
+def router():
+    router = SwapRouter(owner="0xowner", chain_id=1)
+    rng = random.Random(11)
+    for i in range(12):
+        token0, token1 = rng.sample(TOKENS, 2)
+        router.register_pool(f"pool{i}", token0, token1, fee=rng.choice([10, 30, 100]))
+        router.update_pool_reserves(f"pool{i}", rng.randint(10**6, 10**9), rng.randint(10**6, 10**9))
+    return router
+
+
+class TestRouteCache:
+    """Test memoized path finding."""
+
+    def test_matches_reference_search(self, router):
+        for token_in in TOKENS:
+            for token_out in TOKENS:
+                if token_in == token_out:
+                    continue
+                for amount in (1_000, 10**6, 10**8):
+                    expected = _reference_best(router, token_in, token_out, amount)
+                    path = router.find_best_path(token_in, token_out, amount)
+                    if expected is None:
+                        assert path is None
+                    else:
+                        assert (path.pools, path.expected_output) == tuple(expected)
+
+    def test_reserve_update_invalidates_quotes(self, router):
+        first = router.get_quote("ETH", "USDC", 10**6)
+        assert router.get_quote("ETH", "USDC", 10**6) == first
+
+        pool = router.pools[first["pools"][0]]
+        router.update_pool_reserves(pool.address, pool.reserve0 // 2, pool.reserve1 // 2)
+
+        path = router.find_best_path("ETH", "USDC", 10**6)
+        assert (path.pools, path.expected_output) == tuple(_reference_best(router, "ETH", "USDC", 10**6))
+
+    def test_swap_and_register_invalidate_routes(self, router):
+        quote = router.get_quote("ETH", "DAI", 10**6)
+        out = router.swap_exact_input("0xtrader", "ETH", "DAI", 10**6, 0, time.time() + 60)
+        assert out == quote["expected_output"]
+
+        path = router.find_best_path("ETH", "DAI", 10**6)
+        assert (path.pools, path.expected_output) == tuple(_reference_best(router, "ETH", "DAI", 10**6))
+
+        router.register_pool("deep", "ETH", "DAI", fee=10)
+        router.update_pool_reserves("deep", 10**12, 10**14)
+        path = router.find_best_path("ETH", "DAI", 10**6)
+        assert path.pools == ["deep"]
+        assert (path.pools, path.expected_output) == tuple(_reference_best(router, "ETH", "DAI", 10**6))
+
+    def test_reserve_update_keeps_unrelated_best_routes(self):
+        router = SwapRouter(owner="0xowner", chain_id=1)
+        for name, token0, token1 in (("eth_usdc", "ETH", "USDC"), ("dai_wbtc", "DAI", "WBTC")):
+            router.register_pool(name, token0, token1)
+            router.update_pool_reserves(name, 10**9, 10**9)
+        router.find_best_path("ETH", "USDC", 10**6)
+        router.find_best_path("DAI", "WBTC", 10**6)
+
+        router.update_pool_reserves("eth_usdc", 10**8, 10**9)
+        assert ("DAI", "WBTC", 10**6, router.MAX_HOPS) in router._best_route_cache
+        assert ("ETH", "USDC", 10**6, router.MAX_HOPS) not in router._best_route_cache
+
+    def test_random_reserve_updates_match_reference(self, router):
+        rng = random.Random(12)
+        pairs = [(a, b) for a in TOKENS for b in TOKENS if a != b]
+        for _ in range(200):
+            if rng.random() < 0.3:
+                pool = rng.choice(list(router.pools))
+                router.update_pool_reserves(pool, rng.randint(10**6, 10**9), rng.randint(10**6, 10**9))
+            token_in, token_out = rng.choice(pairs)
+            amount = rng.choice((1_000, 10**6, 10**8))
+            expected = _reference_best(router, token_in, token_out, amount)
+            path = router.find_best_path(token_in, token_out, amount)
+            assert (path and (path.pools, path.expected_output)) == (expected and tuple(expected))
+
+
+class TestSplitRouting:
+    """Test dividing trades across pool-disjoint paths."""
+
+    @pytest.fixture
+    def parallel_router(self):
+        router = SwapRouter(owner="0xowner", chain_id=1)
+        router.register_pool("direct_a", "ETH", "USDC", fee=30)
+        router.update_pool_reserves("direct_a", 10**6, 2 * 10**9)
+        router.register_pool("direct_b", "ETH", "USDC", fee=30)
+        router.update_pool_reserves("direct_b", 5 * 10**5, 10**9)
+        return router
+
+    def test_large_trade_splits_for_more_output(self, parallel_router):
+        amount = 3 * 10**5
+        single = parallel_router.find_best_path("ETH", "USDC", amount)
+        route = parallel_router.find_split_route("ETH", "USDC", amount)
+
+        assert isinstance(route, SplitRoute)
+        assert sorted(p.pools[0] for p in route.paths) == ["direct_a", "direct_b"]
+        assert sum(route.amounts) == amount
+        assert route.expected_output > single.expected_output
+
+        quote = parallel_router.get_quote("ETH", "USDC", amount, split=True)
+        assert quote["expected_output"] == route.expected_output
+        assert len(quote["splits"]) == 2
+
+        out = parallel_router.swap_exact_input(
+            "0xtrader", "ETH", "USDC", amount, route.expected_output, time.time() + 60, split=True
+        )
+        assert out == route.expected_output
+
+    def test_single_path_when_split_does_not_help(self, parallel_router):
+        parallel_router.update_pool_reserves("direct_b", 10, 10)
+        route = parallel_router.find_split_route("ETH", "USDC", 1_000)
+        best = parallel_router.find_best_path("ETH", "USDC", 1_000)
+
+        assert [p.pools for p in route.paths] == [["direct_a"]]
+        assert route.amounts == [1_000]
+        assert route.expected_output == best.expected_output
+
+    def test_no_path(self, parallel_router):
+        assert parallel_router.find_split_route("ETH", "DAI", 1_000) is None
+        assert parallel_router.get_quote("ETH", "DAI", 1_000, split=True)["success"] is False
@@ -0,0 +1,107 @@
+"""
+Tests for memoized transaction hashing and sender derivation.
+
+The cached txid must be reused while the transaction is unchanged and
+recomputed as soon as any hashed field is reassigned or an input or output
+is edited in place.
+"""
+
+import pytest
+
+from xai.core.transaction import Transaction, _derive_sender_address
+from xai.core.wallet import Wallet
+
+
+@pytest.fixture
+def signed_tx():
+    sender = Wallet()
+    tx = Transaction(
+        sender.address,
+        Wallet().address,
+        5.0,
+        0.1,
+        public_key=sender.public_key,
+        nonce=1,
+        inputs=[{"txid": "a" * 64, "vout": 0}],
+        outputs=[{"address": sender.address, "amount": 5.0}],
+    )
+    tx.sign_transaction(sender.private_key)
+    return tx
+
+
+def _uncached_hash(tx):
+    tx._hash_cache = None
+    return tx.calculate_hash()
+
+
+class TestTransactionHashCache:
+    """Test preimage and txid memoization."""
+
+    def test_repeated_hash_reuses_cache(self, signed_tx, monkeypatch):
+        txid = signed_tx.calculate_hash()
+        monkeypatch.setattr(
+            "xai.core.transaction.canonical_json",
+            lambda data: pytest.fail("preimage rebuilt for an unchanged transaction"),
+        )
+        monkeypatch.setattr(
+            Transaction,
+            "_resolve_chain_context",
+            staticmethod(lambda: pytest.fail("chain context resolved on a cache hit")),
+        )
+        assert signed_tx.calculate_hash() == txid
+        assert signed_tx.verify_signature()
+
+    @pytest.mark.parametrize(
+        "field, value",
+        [("amount", 6.0), ("amount", 5), ("fee", 0.2), ("nonce", 2), ("timestamp", 1.0)],
+    )
+    def test_reassigned_field_invalidates(self, signed_tx, field, value):
+        txid = signed_tx.calculate_hash()
+        setattr(signed_tx, field, value)
+
+        assert signed_tx.calculate_hash() != txid
+        assert signed_tx.calculate_hash() == _uncached_hash(signed_tx)
+        assert not signed_tx.verify_signature()
+
+    def test_reassigned_inputs_and_outputs_invalidate(self, signed_tx):
+        txid = signed_tx.calculate_hash()
+
+        signed_tx.outputs = [dict(signed_tx.outputs[0], amount=1_000_000.0)]
+        assert signed_tx.calculate_hash() != txid
+        assert not signed_tx.verify_signature()
+
+        signed_tx.outputs = [dict(signed_tx.outputs[0], amount=5.0)]
+        assert signed_tx.calculate_hash() == txid
+        signed_tx.inputs = signed_tx.inputs + [{"txid": "b" * 64, "vout": 1}]
+        assert signed_tx.calculate_hash() != txid
+
+    def test_in_place_edits_invalidate(self, signed_tx):
+        txid = signed_tx.calculate_hash()
+
+        signed_tx.outputs[0]["amount"] = 1_000_000.0
+        assert signed_tx.calculate_hash() != txid
+        assert signed_tx.calculate_hash() == _uncached_hash(signed_tx)
+        assert not signed_tx.verify_signature()
+
+        signed_tx.outputs[0]["amount"] = 5.0
+        assert signed_tx.calculate_hash() == txid
+        signed_tx.inputs.append({"txid": "b" * 64, "vout": 1})
+        assert signed_tx.calculate_hash() != txid
+        signed_tx.inputs.pop()
+        assert signed_tx.calculate_hash() == txid
+        assert signed_tx.verify_signature()
+
+    def test_chain_context_change_invalidates(self, signed_tx, monkeypatch):
+        txid = signed_tx.calculate_hash()
+        monkeypatch.setattr(Transaction, "_CHAIN_CONTEXT", "other-chain")
+        monkeypatch.setattr(Transaction, "_resolve_chain_context", staticmethod(lambda: "other-chain"))
+
+        assert signed_tx.calculate_hash() != txid
+
+    def test_sender_derivation_memoized(self, signed_tx):
+        _derive_sender_address.cache_clear()
+        for _ in range(3):
+            assert signed_tx.verify_signature()
+
+        info = _derive_sender_address.cache_info()
+        assert (info.misses, info.hits) == (1, 2)
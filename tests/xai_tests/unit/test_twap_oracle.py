@@ -6,9 +6,11 @@ Coverage targets:
 - Window-based cleaning and TWAP calculation
 """
 
+import random
+
 import pytest
 
-from xai.blockchain.twap_oracle import TWAPOracle
+from xai.blockchain.twap_oracle import InsufficientHistoryError, TWAPOracle
 
 
 def test_record_and_twap_simple_window():
@@ -46,3 +48,118 @@ def test_price_spike_has_bounded_effect():
     twap = oracle.get_twap(current_timestamp=11)
     # Spike should be diluted over the window (~280 in this setup)
     assert 200 < twap < 400
+
+
+class _ListTWAP:
+    """Reference: the sorted-list implementation the ring buffer replaced."""
+
+    def __init__(self, window_size_seconds):
+        self.window_size_seconds = window_size_seconds
+        self.price_data = []
+
+    def record_price(self, price, timestamp):
+        self._clean_old_data(timestamp)
+        self.price_data.append((timestamp, price))
+        self.price_data.sort(key=lambda x: x[0])
+
+    def _clean_old_data(self, current_timestamp):
+        cutoff_time = current_timestamp - self.window_size_seconds
+        self.price_data = [data for data in self.price_data if data[0] >= cutoff_time]
+
+    def get_twap(self, current_timestamp):
+        self._clean_old_data(current_timestamp)
+        total_weighted_price = 0.0
+        total_time_weight = 0.0
+        for i, (timestamp_i, price_i) in enumerate(self.price_data):
+            if i < len(self.price_data) - 1:
+                timestamp_j = self.price_data[i + 1][0]
+            else:
+                timestamp_j = current_timestamp
+            segment_start = max(timestamp_i, current_timestamp - self.window_size_seconds)
+            segment_end = min(timestamp_j, current_timestamp)
+            if segment_end > segment_start:
+                total_weighted_price += price_i * (segment_end - segment_start)
+                total_time_weight += segment_end - segment_start
+        if total_time_weight == 0:
+            return 0.0
+        return total_weighted_price / total_time_weight
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_matches_sorted_list_implementation(seed):
+    rng = random.Random(seed)
+    window = rng.choice((5, 60, 600))
+    oracle = TWAPOracle(window_size_seconds=window)
+    reference = _ListTWAP(window)
+    latest = 1
+    now = 1
+    for _ in range(400):
+        if rng.random() < 0.7:
+            if rng.random() < 0.1:
+                timestamp = max(1, latest - rng.randint(0, 3 * window))  # late or duplicate report
+            else:
+                timestamp = latest + rng.randint(0, window // 2 + 1)
+            latest = max(latest, timestamp)
+            price = rng.choice((rng.randint(1, 10_000), rng.uniform(0.5, 2.0)))
+            oracle.record_price(price, timestamp=timestamp)
+            reference.record_price(price, timestamp)
+        else:
+            now = max(now, latest) + rng.randint(0, window)
+            assert oracle.get_twap(current_timestamp=now) == pytest.approx(reference.get_twap(now), rel=1e-9)
+
+
+def test_multi_window_query():
+    oracle = TWAPOracle(window_size_seconds=300)
+    for t in range(0, 86_400, 60):
+        oracle.record_price(100 if t < 86_400 - 3600 else 200, timestamp=t + 1)
+    now = 86_400
+
+    twaps = oracle.get_twaps([300, 3600, 86_400], current_timestamp=now)
+
+    assert twaps[300] == 200
+    assert twaps[3600] == pytest.approx(200, rel=1e-3)
+    assert twaps[86_400] == pytest.approx(100 + 100 * 3600 / 86_400, rel=1e-3)
+    assert twaps[300] == oracle.get_twap(current_timestamp=now)
+
+
+def test_ring_buffer_keeps_newest_observations():
+    oracle = TWAPOracle(window_size_seconds=100, max_observations=4)
+    for t, price in enumerate((10, 20, 30, 40, 50, 60), start=1):
+        oracle.record_price(price, timestamp=t * 10)
+    assert len(oracle) == 4
+    assert oracle.price_data == [(30, 30), (40, 40), (50, 50), (60, 60)]
+    assert oracle.get_twap(current_timestamp=70, window_seconds=40) == pytest.approx((30 + 40 + 50 + 60) / 4)
+    # Window reaches past the evicted history
+    with pytest.raises(InsufficientHistoryError):
+        oracle.get_twap(current_timestamp=70)
+    with pytest.raises(InsufficientHistoryError):
+        oracle.get_twaps([40, 100], current_timestamp=70)
+
+
+def test_window_before_first_observation_without_eviction():
+    oracle = TWAPOracle(window_size_seconds=100, max_observations=4)
+    for t in (30, 40):
+        oracle.record_price(t, timestamp=t)
+    # Nothing was evicted, so the first observation is the start of history
+    assert oracle.get_twap(current_timestamp=50) == pytest.approx(35)
+
+
+def test_dropped_late_observation_counts_as_eviction():
+    oracle = TWAPOracle(window_size_seconds=100, max_observations=2)
+    oracle.record_price(10, timestamp=20)
+    oracle.record_price(20, timestamp=30)
+    oracle.record_price(5, timestamp=10)
+    assert oracle.price_data == [(20, 10), (30, 20)]
+    with pytest.raises(InsufficientHistoryError):
+        oracle.get_twap(current_timestamp=40)
+
+
+def test_manipulation_detector_skips_twap_check_without_history():
+    from xai.blockchain.oracle_manipulation_detection import OracleManipulationDetector
+    from xai.security.circuit_breaker import CircuitBreaker
+
+    oracle = TWAPOracle(window_size_seconds=100, max_observations=2)
+    for t in (10, 20, 30):
+        oracle.record_price(100, timestamp=t)
+    detector = OracleManipulationDetector(oracle, CircuitBreaker("twap-test"))
+    assert detector.check_for_manipulation({"a": 500.0}, current_timestamp=40) is False
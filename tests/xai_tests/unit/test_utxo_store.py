@@ -19,6 +19,7 @@ import tempfile
 import threading
 import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from decimal import Decimal
 from typing import Any
 from unittest.mock import MagicMock, patch
 
@@ -515,6 +516,26 @@ class TestMemoryUTXOStoreConcurrency:
         assert len(errors) == 0
 
 
+def _assert_balance_matches_utxo_sum(store):
+    """Add and spend amounts that drift under float summation, checking each step."""
+    amounts = [0.1, 0.2, 0.3, 0.6, 1.7, 0.05, 2.35, 0.15, 0.7, 0.45]
+    for i, amount in enumerate(amounts):
+        store.add_utxo("addr", f"tx{i}", 0, amount, "s")
+    for i in (1, 4, 7, 8):
+        store.mark_spent(f"tx{i}", 0)
+    store.add_utxo("addr", "tx_extra", 0, 0.6, "s")
+    for i in (0, 2):
+        store.mark_spent(f"tx{i}", 0)
+
+    expected = sum(Decimal(str(utxo["amount"])) for utxo in store.get_utxos_for_address("addr"))
+    assert expected == Decimal("4.05")
+    assert store.get_balance("addr") == float(expected)
+
+    store.add_utxo("pair", "p1", 0, 0.3, "s")
+    store.add_utxo("pair", "p2", 0, 0.6, "s")
+    assert store.get_balance("pair") == 0.9
+
+
 class TestMemoryUTXOStoreEdgeCases:
     """Test edge cases and boundary conditions for MemoryUTXOStore."""
 
@@ -539,6 +560,10 @@ class TestMemoryUTXOStoreEdgeCases:
         balance = memory_store.get_balance("addr")
         assert abs(balance - 0.00000003) < 1e-12
 
+    def test_balance_matches_utxo_sum_after_adds_and_spends(self, memory_store):
+        """Test the balance equals the exact sum of unspent amounts."""
+        _assert_balance_matches_utxo_sum(memory_store)
+
     def test_empty_address(self, memory_store):
         """Test handling of empty address string."""
         result = memory_store.add_utxo("", "tx", 0, 10.0, "script")
@@ -730,6 +755,100 @@ class TestLevelDBUTXOStoreErrorHandling:
                     store_module.LEVELDB_AVAILABLE = original_available
 
 
+@pytest.mark.skipif(not LEVELDB_AVAILABLE, reason="plyvel not installed")
+class TestLevelDBUTXOStoreFormat:
+    """Test binary values, balance records and legacy migration."""
+
+    def test_spent_utxo_deleted(self, leveldb_store):
+        """Test spending removes the entry instead of flagging it."""
+        leveldb_store.add_utxo("addr1", "tx1", 0, 10.0, "s")
+        leveldb_store.mark_spent("tx1", 0)
+
+        assert list(leveldb_store._db.iterator(prefix=b"utxo:")) == []
+        assert leveldb_store.to_dict() == {}
+        assert leveldb_store.mark_spent("tx1", 0) is False
+
+    def test_balance_record_tracks_adds_and_spends(self, leveldb_store):
+        """Test get_balance reads the per-address aggregate."""
+        leveldb_store.add_utxo("addr1", "tx1", 0, 100.0, "s")
+        leveldb_store.add_utxo("addr1", "tx2", 1, 50.0, "s")
+        leveldb_store.mark_spent("tx1", 0)
+
+        assert leveldb_store._balance_record("addr1") == (50 * 10**18, 1)
+        assert leveldb_store.get_balance("addr1") == 50.0
+
+        leveldb_store.mark_spent("tx2", 1)
+        assert leveldb_store._db.get(b"bal:addr1") is None
+
+    def test_balance_matches_utxo_sum_after_adds_and_spends(self, leveldb_store):
+        """Test the balance record does not drift from the UTXOs it sums."""
+        _assert_balance_matches_utxo_sum(leveldb_store)
+
+    def test_float_balance_records_migrated(self, tmp_path):
+        """Test a database with float balance records is rebuilt in base units."""
+        import struct
+
+        db_path = str(tmp_path / "v2.db")
+        store = LevelDBUTXOStore(db_path)
+        store.add_utxo("addr1", "tx1", 0, 0.3, "s")
+        store.add_utxo("addr1", "tx2", 0, 0.6, "s")
+        store._db.put(b"bal:addr1", struct.pack(">dQ", 0.3 + 0.6, 2))
+        store._db.put(b"meta:format_version", b"2")
+        store.close()
+
+        store = LevelDBUTXOStore(db_path)
+        try:
+            assert store.get_balance("addr1") == 0.9
+            assert store._balance_record("addr1") == (9 * 10**17, 2)
+        finally:
+            store.close()
+
+    def test_address_scan_decodes_index_values(self, leveldb_store):
+        """Test address scans return full UTXOs from the index alone."""
+        leveldb_store.add_utxo("addr1", "tx1", 3, 1.5, "script_x")
+        assert leveldb_store.get_utxos_for_address("addr1") == [{
+            "txid": "tx1",
+            "vout": 3,
+            "amount": 1.5,
+            "script_pubkey": "script_x",
+            "address": "addr1",
+            "spent": False,
+        }]
+
+    def test_legacy_json_database_migrated(self, tmp_path):
+        """Test a database written with JSON values is converted on open."""
+        import plyvel
+
+        db_path = str(tmp_path / "legacy.db")
+        db = plyvel.DB(db_path, create_if_missing=True)
+        legacy = [
+            {"txid": "tx1", "vout": 0, "amount": 100.0, "script_pubkey": "s", "address": "addr1", "spent": False},
+            {"txid": "tx2", "vout": 0, "amount": 30.0, "script_pubkey": "s", "address": "addr1", "spent": True},
+            {"txid": "tx3", "vout": 1, "amount": 20.0, "script_pubkey": "s", "address": "addr2", "spent": False},
+        ]
+        for utxo in legacy:
+            db.put(f"utxo:{utxo['txid']}:{utxo['vout']}".encode(), json.dumps(utxo).encode())
+            if not utxo["spent"]:
+                db.put(f"addr:{utxo['address']}:{utxo['txid']}:{utxo['vout']}".encode(), b"1")
+        db.close()
+
+        store = LevelDBUTXOStore(db_path)
+        try:
+            assert store.get_balance("addr1") == 100.0
+            assert store.get_balance("addr2") == 20.0
+            assert store.get_utxo("tx2", 0) is None
+            assert len(store.get_utxos_for_address("addr1")) == 1
+            assert store.get_stats()["total_utxos"] == 2
+            assert store.get_stats()["total_value"] == 120.0
+
+            memory = MemoryUTXOStore()
+            memory.add_utxo("addr1", "tx1", 0, 100.0, "s")
+            memory.add_utxo("addr2", "tx3", 1, 20.0, "s")
+            assert store.snapshot_digest() == memory.snapshot_digest()
+        finally:
+            store.close()
+
+
 # -----------------------------------------------------------------------------
 # Factory Function Tests
 # -----------------------------------------------------------------------------
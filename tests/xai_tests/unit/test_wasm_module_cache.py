@@ -0,0 +1,128 @@
+"""
+Tests for the compiled WASM module cache.
+
+The cache itself is runtime-agnostic and is exercised with a counting
+compiler; the WasmExecutor integration runs only when wasmtime is installed.
+"""
+
+import pytest
+
+from xai.sandbox.wasm_module_cache import ARTIFACT_SUFFIX, CompiledModuleCache
+
+
+class _Compiler:
+    """Stands in for a runtime: modules are tuples, artifacts are bytes."""
+
+    def __init__(self):
+        self.compiled = 0
+        self.loaded = 0
+
+    def compile(self, wasm_bytes):
+        self.compiled += 1
+        return ("module", wasm_bytes)
+
+    def serialize(self, module):
+        return b"artifact:" + module[1]
+
+    def deserialize(self, data):
+        if not data.startswith(b"artifact:"):
+            raise ValueError("incompatible artifact")
+        self.loaded += 1
+        return ("module", data[len(b"artifact:"):])
+
+
+def _cache(compiler, tmp_path=None, version="1.0", **kwargs):
+    return CompiledModuleCache(
+        "testrt",
+        version,
+        compile=compiler.compile,
+        serialize=compiler.serialize,
+        deserialize=compiler.deserialize,
+        cache_dir=tmp_path,
+        **kwargs,
+    )
+
+
+class TestCompiledModuleCache:
+    """Test memory and disk caching of compiled modules."""
+
+    def test_compiles_once_and_evicts_lru(self):
+        compiler = _Compiler()
+        cache = _cache(compiler, max_entries=2)
+
+        assert cache.get(b"a") == ("module", b"a")
+        cache.get(b"b")
+        cache.get(b"a")  # a is now most recent
+        cache.get(b"c")  # evicts b
+        assert compiler.compiled == 3
+
+        cache.get(b"a")
+        assert compiler.compiled == 3
+        cache.get(b"b")
+        assert compiler.compiled == 4
+        assert cache.stats()["evictions"] == 2
+
+    def test_artifacts_survive_restart(self, tmp_path):
+        first = _Compiler()
+        _cache(first, tmp_path).get(b"module")
+
+        second = _Compiler()
+        cache = _cache(second, tmp_path)
+        assert cache.get(b"module") == ("module", b"module")
+        assert (second.compiled, second.loaded) == (0, 1)
+        assert cache.stats()["disk_hits"] == 1
+
+    def test_runtime_upgrade_discards_artifacts(self, tmp_path):
+        _cache(_Compiler(), tmp_path, version="1.0").get(b"module")
+        assert (tmp_path / "testrt-1.0").is_dir()
+
+        compiler = _Compiler()
+        _cache(compiler, tmp_path, version="2.0").get(b"module")
+        assert compiler.compiled == 1
+        assert not (tmp_path / "testrt-1.0").exists()
+
+    def test_unloadable_artifact_is_recompiled(self, tmp_path):
+        cache = _cache(_Compiler(), tmp_path)
+        cache.get(b"module")
+        (artifact,) = cache.artifact_dir.glob(f"*{ARTIFACT_SUFFIX}")
+        artifact.write_bytes(b"garbage")
+
+        compiler = _Compiler()
+        assert _cache(compiler, tmp_path).get(b"module") == ("module", b"module")
+        assert compiler.compiled == 1
+        assert artifact.read_bytes().startswith(b"artifact:")
+
+    def test_disk_size_bound(self, tmp_path):
+        cache = _cache(_Compiler(), tmp_path, max_disk_bytes=3 * len(b"artifact:") + 30)
+        for name in (b"a" * 10, b"b" * 10, b"c" * 10, b"d" * 10):
+            cache.get(name)
+
+        artifacts = list(cache.artifact_dir.glob(f"*{ARTIFACT_SUFFIX}"))
+        assert len(artifacts) == 3
+        assert cache.stats()["disk_bytes"] == sum(p.stat().st_size for p in artifacts)
+
+
+class TestWasmExecutorCache:
+    """Test WasmExecutor reuses compiled modules."""
+
+    @pytest.fixture
+    def wasm(self):
+        wasmtime = pytest.importorskip("wasmtime")
+        return wasmtime.wat2wasm(
+            '(module (func (export "add") (param i32 i32) (result i32) '
+            "local.get 0 local.get 1 i32.add))"
+        )
+
+    def test_repeat_calls_hit_cache(self, wasm, tmp_path):
+        from xai.sandbox.wasm_executor import WasmExecutor
+
+        executor = WasmExecutor(runtime="wasmtime", cache_dir=tmp_path)
+        for _ in range(3):
+            result = executor.execute(wasm, "add", [2, 3])
+            assert result.success and result.return_value == 5
+        assert executor.module_cache.stats()["misses"] == 1
+        assert executor.module_cache.stats()["hits"] == 2
+
+        restarted = WasmExecutor(runtime="wasmtime", cache_dir=tmp_path)
+        assert restarted.execute(wasm, "add", [4, 5]).return_value == 9
+        assert restarted.module_cache.stats()["disk_hits"] == 1
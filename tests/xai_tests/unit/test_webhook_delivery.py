@@ -0,0 +1,397 @@
+"""
+Unit tests for the shared webhook delivery engine
+"""
+
+import json
+import threading
+import time
+
+import pytest
+import requests
+
+from xai.core.api import webhook_manager
+from xai.core.api.webhook_delivery import (
+    DeliveryJob,
+    DeliveryOutbox,
+    TimerWheel,
+    WebhookDeliveryEngine,
+    default_outbox_path,
+)
+from xai.core.api.webhook_manager import WebhookManager
+
+URL = "https://merchant.example/hook"
+
+
+class StubResponse:
+    def __init__(self, status_code):
+        self.status_code = status_code
+        self.text = "ok"
+
+
+class StubSession:
+    """Records posts instead of touching the network."""
+
+    def __init__(self, statuses=None, delay=0.0):
+        self.statuses = list(statuses or [])
+        self.delay = delay
+        self.posts = []
+        self.active = 0
+        self.max_active = 0
+        self.closed = False
+        self._lock = threading.Lock()
+
+    def post(self, url, data=None, headers=None, timeout=None, json=None):
+        with self._lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+            self.posts.append((url, data, headers))
+            status = self.statuses.pop(0) if self.statuses else 200
+        time.sleep(self.delay)
+        with self._lock:
+            self.active -= 1
+        if isinstance(status, Exception):
+            raise status
+        return StubResponse(status)
+
+    def close(self):
+        self.closed = True
+
+
+def _install_session(engine, endpoint_id, session, **config):
+    engine.configure_endpoint(endpoint_id, **config)
+    key = endpoint_id if "://" not in endpoint_id else engine.endpoint_key(endpoint_id)
+    engine._endpoints[key].session = session
+
+
+def _wait_for(predicate, timeout=5.0):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+@pytest.fixture
+def engine():
+    engine = WebhookDeliveryEngine(workers=4, tick_seconds=0.01, retry_base_delay=0.01)
+    yield engine
+    engine.stop()
+
+
+class TestTimerWheel:
+    """Test retry scheduling"""
+
+    def test_items_expire_after_delay(self):
+        wheel = TimerWheel(tick_seconds=1.0, slots=8)
+        origin = wheel._origin
+        wheel.schedule(2.0, "a")
+        wheel.schedule(5.0, "b")
+        assert wheel.advance(origin + 1.0) == []
+        assert wheel.advance(origin + 2.0) == ["a"]
+        assert wheel.advance(origin + 5.0) == ["b"]
+        assert len(wheel) == 0
+
+    def test_delays_longer_than_one_revolution(self):
+        wheel = TimerWheel(tick_seconds=1.0, slots=4)
+        origin = wheel._origin
+        wheel.schedule(10.0, "late")
+        assert wheel.advance(origin + 9.0) == []
+        assert wheel.advance(origin + 10.0) == ["late"]
+
+
+class TestOutbox:
+    """Test durable outbox replay and compaction"""
+
+    def test_undelivered_jobs_replayed(self, tmp_path):
+        path = str(tmp_path / "outbox.jsonl")
+        outbox = DeliveryOutbox(path, fsync=False)
+        outbox.add(DeliveryJob(url=URL, event_type="a", payload={"n": 1}, job_id="j1"))
+        outbox.add(DeliveryJob(url=URL, event_type="b", payload={"n": 2}, job_id="j2"))
+        outbox.done("j1")
+        outbox.close()
+
+        pending = DeliveryOutbox(path, fsync=False).load_pending()
+        assert [job.job_id for job in pending] == ["j2"]
+        assert pending[0].payload == {"n": 2}
+
+    def test_replay_compacts_and_skips_torn_record(self, tmp_path):
+        path = tmp_path / "outbox.jsonl"
+        outbox = DeliveryOutbox(str(path), fsync=False)
+        outbox.add(DeliveryJob(url=URL, event_type="a", payload={}, job_id="j1"))
+        outbox.done("j1")
+        outbox.add(DeliveryJob(url=URL, event_type="b", payload={}, job_id="j2"))
+        outbox.close()
+        with open(path, "a", encoding="utf-8") as f:
+            f.write('{"op": "add", "job": {')
+
+        outbox = DeliveryOutbox(str(path), fsync=False)
+        assert [job.job_id for job in outbox.load_pending()] == ["j2"]
+        assert len(path.read_text().splitlines()) == 1
+
+    def test_engine_recovers_pending_jobs_on_start(self, tmp_path):
+        path = str(tmp_path / "outbox.jsonl")
+        outbox = DeliveryOutbox(path, fsync=False)
+        outbox.add(DeliveryJob(url=URL, event_type="a", payload={"n": 1}, job_id="j1"))
+        outbox.close()
+
+        engine = WebhookDeliveryEngine(outbox_path=path, tick_seconds=0.01)
+        session = StubSession()
+        _install_session(engine, URL, session)
+        results = []
+        try:
+            assert engine.start(on_recovered=results.append) == 1
+            assert _wait_for(lambda: results)
+            assert results[0].success
+            assert engine.get_metrics()["outbox_pending"] == 0
+        finally:
+            engine.stop()
+
+
+class TestDelivery:
+    """Test pooled delivery, retries and batching"""
+
+    def test_delivers_and_reports_latency(self, engine):
+        session = StubSession()
+        _install_session(engine, URL, session)
+        engine.start()
+        results = []
+        engine.enqueue(DeliveryJob(url=URL, event_type="e", payload={"x": 1}, headers={"X-Test": "1"}), results.append)
+
+        assert _wait_for(lambda: results)
+        assert results[0].success and results[0].final
+        _, body, headers = session.posts[0]
+        assert json.loads(body) == {"x": 1}
+        assert headers["X-Test"] == "1"
+        metrics = engine.get_metrics()
+        assert metrics["endpoints"][URL]["delivered"] == 1
+        assert metrics["latency_p95_seconds"] >= 0.0
+
+    def test_failed_delivery_retried_until_success(self, engine):
+        session = StubSession(statuses=[500, requests.ConnectionError("down"), 200])
+        _install_session(engine, URL, session)
+        engine.start()
+        results = []
+        engine.enqueue(DeliveryJob(url=URL, event_type="e", payload={}, max_attempts=5), results.append)
+
+        assert _wait_for(lambda: results and results[-1].success)
+        assert [r.final for r in results] == [False, False, True]
+        assert results[-1].job.attempt == 3
+
+    def test_abandoned_after_max_attempts(self, engine):
+        session = StubSession(statuses=[500, 500])
+        _install_session(engine, URL, session)
+        engine.start()
+        results = []
+        engine.enqueue(DeliveryJob(url=URL, event_type="e", payload={}, max_attempts=2), results.append)
+
+        assert _wait_for(lambda: len(results) == 2)
+        assert results[-1].final and not results[-1].success
+
+    def test_queued_events_are_batched(self, engine):
+        session = StubSession()
+        _install_session(
+            engine, "sub-1", session, batch_size=10,
+            batch_signer=lambda body: {"X-Signature": "sig"},
+        )
+        results = []
+        for i in range(5):
+            engine.enqueue(
+                DeliveryJob(url=URL, event_type="e", payload={"n": i}, endpoint_id="sub-1"),
+                results.append,
+            )
+        engine.start()
+
+        assert _wait_for(lambda: len(results) == 5)
+        _, body, headers = session.posts[0]
+        decoded = json.loads(body)
+        assert decoded["batch"] is True
+        assert [event["n"] for event in decoded["events"]] == list(range(5))
+        assert headers["X-Webhook-Batch-Size"] == "5"
+        assert headers["X-Signature"] == "sig"
+
+    def test_slow_endpoint_bounded_and_isolated(self, engine):
+        slow = StubSession(delay=0.2)
+        fast = StubSession()
+        _install_session(engine, "slow", slow, max_concurrency=1)
+        _install_session(engine, "fast", fast, max_concurrency=2)
+        engine.start()
+
+        fast_results = []
+        for _ in range(4):
+            engine.enqueue(DeliveryJob(url=URL, event_type="e", payload={}, endpoint_id="slow"))
+        for _ in range(3):
+            engine.enqueue(DeliveryJob(url=URL, event_type="e", payload={}, endpoint_id="fast"), fast_results.append)
+
+        assert _wait_for(lambda: len(fast_results) == 3, timeout=0.5)
+        assert _wait_for(lambda: len(slow.posts) == 4)
+        assert slow.max_active == 1
+
+    def test_retry_delay_indexed_by_failed_attempts(self, engine):
+        session = StubSession(statuses=[500, 500, 200])
+        _install_session(engine, URL, session)
+        engine.start()
+        results = []
+        job = DeliveryJob(url=URL, event_type="e", payload={}, max_attempts=5, retry_delays=(0.02, 0.05))
+        engine.enqueue(job, results.append)
+
+        assert _wait_for(lambda: results and results[-1].success)
+        assert [r.retry_delay for r in results] == [0.02, 0.05, None]
+
+
+    def test_signer_called_on_every_attempt(self, engine):
+        session = StubSession(statuses=[500, 200])
+        attempts = []
+
+        def _sign(job):
+            attempts.append(job.attempt)
+            return {"X-Attempt": str(job.attempt)}
+
+        _install_session(engine, "sub-1", session, signer=_sign)
+        engine.start()
+        results = []
+        engine.enqueue(
+            DeliveryJob(url=URL, event_type="e", payload={}, endpoint_id="sub-1", max_attempts=3),
+            results.append,
+        )
+
+        assert _wait_for(lambda: results and results[-1].success)
+        assert attempts == [1, 2]
+        assert [headers["X-Attempt"] for _, _, headers in session.posts] == ["1", "2"]
+
+    def test_unexpected_error_is_a_failed_attempt(self, engine):
+        session = StubSession(statuses=[ValueError("bad adapter"), 200])
+        _install_session(engine, URL, session)
+        engine.start()
+        results = []
+        engine.enqueue(DeliveryJob(url=URL, event_type="e", payload={}, max_attempts=3), results.append)
+
+        assert _wait_for(lambda: results and results[-1].success)
+        assert not results[0].success and not results[0].final
+        assert "ValueError" in results[0].error
+
+    def test_disabled_endpoint_abandons_retries_and_new_jobs(self, tmp_path):
+        engine = WebhookDeliveryEngine(
+            outbox_path=str(tmp_path / "outbox.jsonl"), tick_seconds=0.01, retry_base_delay=0.01
+        )
+        session = StubSession(statuses=[500] * 5)
+        _install_session(engine, "sub-1", session)
+        results = []
+
+        def _on_result(result):
+            results.append(result)
+            if not result.success and len(results) == 1:
+                engine.set_endpoint_enabled("sub-1", False)
+
+        engine.start()
+        try:
+            engine.enqueue(
+                DeliveryJob(url=URL, event_type="e", payload={}, endpoint_id="sub-1", max_attempts=5),
+                _on_result,
+            )
+            assert _wait_for(lambda: len(results) == 2)
+            engine.enqueue(DeliveryJob(url=URL, event_type="e", payload={}, endpoint_id="sub-1"), _on_result)
+
+            assert len(session.posts) == 1
+            assert [(r.final, r.error) for r in results] == [
+                (False, "HTTP 500"), (True, "endpoint disabled"), (True, "endpoint disabled")
+            ]
+            assert engine.get_metrics()["outbox_pending"] == 0
+        finally:
+            engine.stop()
+
+    def test_default_outbox_path(self, monkeypatch, tmp_path):
+        monkeypatch.delenv("XAI_WEBHOOK_OUTBOX_PATH", raising=False)
+        monkeypatch.setenv("XAI_DATA_DIR", str(tmp_path))
+        assert default_outbox_path() == str(tmp_path / "webhook_outbox.jsonl")
+        monkeypatch.setenv("XAI_WEBHOOK_OUTBOX_PATH", "")
+        assert default_outbox_path() is None
+
+
+class TestWebhookManagerDelivery:
+    """Test WebhookManager use of the delivery engine"""
+
+    def _register(self, engine, session):
+        manager = WebhookManager(delivery_engine=engine)
+        registration = manager.register_webhook(URL, ["new_block"], owner="owner")
+        engine._endpoints[registration["webhook_id"]].session = session
+        return manager, registration["webhook_id"]
+
+    def test_headers_signed_per_attempt(self, engine, monkeypatch):
+        clock = iter(range(1000, 2000, 100))
+        monkeypatch.setattr(webhook_manager, "time", type("Clock", (), {"time": staticmethod(lambda: next(clock))}))
+        session = StubSession(statuses=[500, 200])
+        manager, webhook_id = self._register(engine, session)
+
+        assert manager.dispatch_event("new_block", {"height": 1}) == 1
+        assert _wait_for(lambda: len(session.posts) == 2)
+        first, second = (headers for _, _, headers in session.posts)
+        assert first["X-Webhook-Timestamp"] != second["X-Webhook-Timestamp"]
+        assert first["X-Webhook-Event"] == "new_block"
+        payload = json.loads(session.posts[1][1])
+        assert manager.verify_signature(webhook_id, second["X-Webhook-Signature"], payload)
+
+    def test_auto_disable_stops_retries(self, engine, monkeypatch):
+        session = StubSession(statuses=[500] * 5)
+        manager, webhook_id = self._register(engine, session)
+        manager.MAX_FAILURE_COUNT = 1
+
+        manager.dispatch_event("new_block", {"height": 1})
+        assert _wait_for(lambda: manager.get_delivery_stats(webhook_id)["total_deliveries"] == 1)
+        time.sleep(0.1)
+
+        assert len(session.posts) == 1
+        assert manager.get_webhook(webhook_id)["active"] is False
+        assert manager.get_webhook(webhook_id)["failure_count"] == 1
+
+
+class TestEndpointEviction:
+    """Test release of idle endpoint resources"""
+
+    def test_idle_adhoc_endpoint_dropped_and_session_closed(self):
+        engine = WebhookDeliveryEngine(workers=1, tick_seconds=0.01, endpoint_idle_seconds=60)
+        session = StubSession()
+        key = engine.endpoint_key(URL)
+        engine._endpoint_for(key).session = session
+
+        assert engine.evict_idle_endpoints() == 0
+        assert engine.evict_idle_endpoints(now=time.monotonic() + 61) == 1
+        assert key not in engine._endpoints
+        assert session.closed
+        assert engine.get_metrics()["endpoints_evicted"] == 1
+
+    def test_idle_configured_endpoint_keeps_settings(self):
+        engine = WebhookDeliveryEngine(workers=1, tick_seconds=0.01, endpoint_idle_seconds=60)
+        session = StubSession()
+        _install_session(engine, "sub-1", session, batch_size=10)
+
+        assert engine.evict_idle_endpoints(now=time.monotonic() + 61) == 0
+        endpoint = engine._endpoints["sub-1"]
+        assert session.closed
+        assert endpoint.batch_size == 10
+        assert endpoint.session is not session
+        engine.stop()
+
+    def test_endpoint_with_pending_retry_not_evicted(self, engine):
+        session = StubSession(statuses=[500])
+        _install_session(engine, URL, session)
+        engine.endpoint_idle_seconds = 0
+        engine.start()
+        results = []
+        job = DeliveryJob(url=URL, event_type="e", payload={}, max_attempts=2, retry_delays=(60,))
+        engine.enqueue(job, results.append)
+
+        assert _wait_for(lambda: len(results) == 1)
+        engine.evict_idle_endpoints(now=time.monotonic() + 3600)
+        assert not session.closed
+        assert engine._endpoints[engine.endpoint_key(URL)].retries_pending == 1
+
+    def test_remove_endpoint_closes_session(self):
+        engine = WebhookDeliveryEngine(workers=1, tick_seconds=0.01)
+        session = StubSession()
+        _install_session(engine, "sub-1", session)
+
+        assert engine.remove_endpoint("sub-1")
+        assert "sub-1" not in engine._endpoints
+        assert session.closed
+        assert not engine.remove_endpoint("sub-1")
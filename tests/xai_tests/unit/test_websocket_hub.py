@@ -0,0 +1,138 @@
+"""
+Tests for the WebSocket subscription hub.
+
+Broadcasts are serialized once, only reach subscribers of their channel,
+and are delivered by per-client writers so a stalled client cannot hold up
+the broadcaster or other clients.
+"""
+
+import json
+import threading
+import time
+
+import pytest
+
+from xai.core.api.websocket_hub import WebSocketSubscriptionHub
+
+
+class _Socket:
+    """Records sent payloads; blocks in send() while ``gate`` is cleared."""
+
+    def __init__(self, gate=None):
+        self.sent = []
+        self.closed = False
+        self.gate = gate
+
+    def send(self, payload):
+        if self.gate is not None:
+            self.gate.wait()
+        self.sent.append(payload)
+
+    def close(self):
+        self.closed = True
+
+
+def _wait_for(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "condition not met"
+        time.sleep(0.005)
+
+
+@pytest.fixture
+def hub():
+    hub = WebSocketSubscriptionHub(max_queue_size=2)
+    yield hub
+    hub.close()
+
+
+class TestWebSocketSubscriptionHub:
+    """Test channel fan-out and slow client handling."""
+
+    def test_publish_reaches_only_subscribers(self, hub):
+        sockets = {name: _Socket() for name in ("a", "b", "c")}
+        for name, ws in sockets.items():
+            hub.register(name, ws, "127.0.0.1")
+        hub.subscribe("a", "blocks")
+        hub.subscribe("b", "blocks")
+        hub.subscribe("c", "stats")
+
+        assert hub.publish({"channel": "blocks", "height": 7}) == 2
+        _wait_for(lambda: sockets["a"].sent and sockets["b"].sent)
+        assert json.loads(sockets["a"].sent[0]) == {"channel": "blocks", "height": 7}
+        assert sockets["c"].sent == []
+
+        assert hub.unsubscribe("b", "blocks")
+        assert hub.publish({"channel": "blocks", "height": 8}) == 1
+        assert hub.stats()["channels"] == {"blocks": 1, "stats": 1}
+
+    def test_serializes_once_per_broadcast(self, hub, monkeypatch):
+        calls = []
+        real_dumps = json.dumps
+        monkeypatch.setattr(
+            "xai.core.api.websocket_hub.json.dumps",
+            lambda message: calls.append(message) or real_dumps(message),
+        )
+        for i in range(20):
+            hub.register(f"c{i}", _Socket(), "127.0.0.1")
+            hub.subscribe(f"c{i}", "txs")
+
+        assert hub.publish({"channel": "txs"}) == 20
+        assert len(calls) == 1
+
+    def test_stalled_client_does_not_block_others(self, hub):
+        gate = threading.Event()
+        slow, fast = _Socket(gate), _Socket()
+        hub.register("slow", slow, "127.0.0.1")
+        hub.register("fast", fast, "127.0.0.1")
+        hub.subscribe("slow", "stats")
+        hub.subscribe("fast", "stats")
+
+        for i in range(10):
+            start = time.monotonic()
+            assert hub.publish({"channel": "stats", "seq": i}) == 2
+            assert time.monotonic() - start < 0.5
+            _wait_for(lambda: len(fast.sent) == i + 1)
+
+        # drop_oldest keeps the newest messages queued for the slow client
+        gate.set()
+        _wait_for(lambda: hub.get_client("slow").queued() == 0 and len(slow.sent) >= 3)
+        assert json.loads(slow.sent[-1])["seq"] == 9
+        assert hub.get_client("slow").dropped >= 7
+
+    def test_drop_newest_policy(self):
+        hub = WebSocketSubscriptionHub(max_queue_size=1, slow_client_policy="drop_newest")
+        gate = threading.Event()
+        ws = _Socket(gate)
+        hub.register("c", ws, "127.0.0.1")
+        hub.subscribe("c", "stats")
+        try:
+            hub.publish({"channel": "stats", "seq": 0})
+            _wait_for(lambda: hub.get_client("c").queued() == 0)  # In flight
+            hub.publish({"channel": "stats", "seq": 1})
+            assert hub.publish({"channel": "stats", "seq": 2}) == 0
+
+            gate.set()
+            _wait_for(lambda: len(ws.sent) == 2)
+            assert [json.loads(p)["seq"] for p in ws.sent] == [0, 1]
+        finally:
+            hub.close()
+
+    def test_disconnect_policy(self):
+        hub = WebSocketSubscriptionHub(max_queue_size=1, slow_client_policy="disconnect")
+        gate = threading.Event()
+        ws = _Socket(gate)
+        hub.register("c", ws, "127.0.0.1")
+        hub.subscribe("c", "stats")
+
+        for i in range(3):
+            hub.publish({"channel": "stats", "seq": i})
+        assert hub.get_client("c") is None
+        assert hub.stats()["channels"] == {}
+
+        gate.set()
+        _wait_for(lambda: ws.closed)
+
+    def test_rejects_unknown_policy(self):
+        with pytest.raises(ValueError, match="slow client policy"):
+            WebSocketSubscriptionHub(slow_client_policy="block")